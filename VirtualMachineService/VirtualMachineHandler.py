@@ -11,10 +11,51 @@ from uuid import uuid4
 from typing import List
 
 try:
-    from ancon.Playbook import ALL_TEMPLATES, Playbook
+    from ancon.Playbook import (
+        ALL_TEMPLATES,
+        STDERR,
+        STDOUT,
+        LOG_READ_AHEAD,
+        Playbook,
+        decode_log_chunk,
+    )
+    from ancon.PlaybookExecutor import (
+        DEFAULT_MAX_CONCURRENT_PLAYBOOKS,
+        PlaybookExecutor,
+    )
+    from ancon.PlaybookTemplates import PlaybookTemplates
+    from ancon.StateStore import KEY, NAME, PROJECT_ID, StateStore
+    from ancon.PlaybookSupervisor import (
+        DEFAULT_PLAYBOOK_EVENTS_CHANNEL,
+        PlaybookSupervisor,
+    )
     from ancon.ResearchEnvironmentMetadata import ResearchEnvironmentMetadata
 
     from constants import VERSION
+    from image_catalog import DEFAULT_IMAGE_CATALOG_TTL, ImageCatalog
+    from reachability_prober import (
+        DEFAULT_REACHABILITY_TIMEOUT,
+        DEFAULT_REACHABILITY_TTL,
+        ReachabilityProber,
+    )
+    from port_formula import PortFormula
+    from script_templates import ScriptTemplates
+    from rate_limiter import DEFAULT_BATCH_LAUNCH_RATE, RateLimiter
+    from job_manager import DEFAULT_JOB_TTL, DEFAULT_JOB_WORKERS, JobManager
+    from security_group_index import (
+        DEFAULT_SECURITY_GROUP_INDEX_TTL,
+        SecurityGroupIndex,
+    )
+    from resource_resolver import (
+        DEFAULT_RESOLVER_NEGATIVE_TTL,
+        DEFAULT_RESOLVER_TTL,
+        ResourceResolver,
+    )
+    from http_session_pool import (
+        DEFAULT_BACKOFF_FACTOR,
+        DEFAULT_RETRIES,
+        HttpSessionPool,
+    )
     from ttypes import (
         VM,
         Backend,
@@ -47,10 +88,48 @@ except Exception:
     from .ttypes import conflictException
     from .ttypes import Flavor, Image, VM, PlaybookResult, Backend, ClusterInfo, Volume
     from .constants import VERSION
+    from .image_catalog import DEFAULT_IMAGE_CATALOG_TTL, ImageCatalog
+    from .reachability_prober import (
+        DEFAULT_REACHABILITY_TIMEOUT,
+        DEFAULT_REACHABILITY_TTL,
+        ReachabilityProber,
+    )
+    from .port_formula import PortFormula
+    from .script_templates import ScriptTemplates
+    from .rate_limiter import DEFAULT_BATCH_LAUNCH_RATE, RateLimiter
+    from .job_manager import DEFAULT_JOB_TTL, DEFAULT_JOB_WORKERS, JobManager
+    from .security_group_index import (
+        DEFAULT_SECURITY_GROUP_INDEX_TTL,
+        SecurityGroupIndex,
+    )
+    from .resource_resolver import (
+        DEFAULT_RESOLVER_NEGATIVE_TTL,
+        DEFAULT_RESOLVER_TTL,
+        ResourceResolver,
+    )
+    from .http_session_pool import (
+        DEFAULT_BACKOFF_FACTOR,
+        DEFAULT_RETRIES,
+        HttpSessionPool,
+    )
+    from .ancon.PlaybookExecutor import (
+        DEFAULT_MAX_CONCURRENT_PLAYBOOKS,
+        PlaybookExecutor,
+    )
+    from .ancon.PlaybookTemplates import PlaybookTemplates
+    from .ancon.StateStore import KEY, NAME, PROJECT_ID, StateStore
+    from .ancon.PlaybookSupervisor import (
+        DEFAULT_PLAYBOOK_EVENTS_CHANNEL,
+        PlaybookSupervisor,
+    )
     from .ancon.ResearchEnvironmentMetadata import ResearchEnvironmentMetadata
     from .ancon.Playbook import (
         Playbook,
         ALL_TEMPLATES,
+        STDOUT,
+        STDERR,
+        LOG_READ_AHEAD,
+        decode_log_chunk,
     )
 import datetime
 import glob
@@ -59,9 +138,14 @@ from logger import setup_logger
 import os
 import shutil
 import socket
+import threading
+import time
 import urllib
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import closing
 from distutils.version import LooseVersion
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
 import redis
 import requests as req
 import yaml
@@ -72,7 +156,7 @@ from keystoneclient.v3 import client
 from openstack import connection
 import openstack
 from openstack.compute.v2.server import Server
-from openstack.exceptions import ConflictException, ResourceNotFound
+from openstack.exceptions import ConflictException, HttpException, ResourceNotFound
 from oslo_utils import encodeutils
 from requests.exceptions import Timeout
 
@@ -90,6 +174,8 @@ TEMPLATE_NAME = "template_name"
 INFORMATION_FOR_DISPLAY = "information_for_display"
 NEEDS_FORC_SUPPORT = "needs_forc_support"
 FORC_VERSIONS = "forc_versions"
+FORC_ENDPOINT = "forc"
+BIBIGRID_ENDPOINT = "bibigrid"
 
 openstack.enable_logging(debug=False)
 
@@ -117,14 +203,24 @@ class VirtualMachineHandler(Iface):
     BACKENDS_BY_TEMPLATE_URL = f"{BACKENDS_URL}/byTemplate"
     USERS_URL = "users"
     ALL_TEMPLATES = ALL_TEMPLATES
+    FORC_TEMPLATES_CACHE_TTL = 60
+    MAX_LOG_CHUNK_SIZE = 1024 * 1024
+    KEY_INJECTION_KEYPAIR = "keypair"
+    KEY_INJECTION_USERDATA = "userdata"
+    FAN_OUT_WORKERS = 10
+    BATCH_LAUNCH_WORKERS = 10
+    # from this number of ids on, resources are listed instead of fetched one by one
+    BULK_LIST_MIN_IDS = 5
+    # callable returning the statistics of the Thrift server, set by the server
+    server_stats = None
     loaded_resenv_metadata = {}
 
     def keyboard_interrupt_handler_playbooks(self):
         global active_playbooks
         for k, v in active_playbooks.items():
             self.LOG.info(f"Clearing traces of Playbook-VM for (openstack_id): {k}")
-            self.delete_keypair(key_name=self.redis.hget(k, "name").decode("utf-8"))
-            v.stop(k)
+            self.delete_keypair(key_name=self.state_store.get_fields(k, NAME)[NAME])
+            self.playbook_supervisor.stop(k, v)
             self.delete_server(openstack_id=k)
         raise SystemExit(0)
 
@@ -171,6 +267,9 @@ class VirtualMachineHandler(Iface):
         Read all config variables and creates a connection to OpenStack.
         """
 
+        self.script_templates = ScriptTemplates(
+            os.path.join(os.path.dirname(os.path.abspath(__file__)), "scripts/bash")
+        )
         self.USERNAME = os.environ["OS_USERNAME"]
         self.PASSWORD = os.environ["OS_PASSWORD"]
         self.PROJECT_NAME = os.environ["OS_PROJECT_NAME"]
@@ -211,6 +310,45 @@ class VirtualMachineHandler(Iface):
                 "floating_ip_network"
             ]
             self.PRODUCTION = cfg["openstack_connection"]["production"]
+            self.KEY_INJECTION_MODE = cfg["openstack_connection"].get(
+                "key_injection_mode", self.KEY_INJECTION_KEYPAIR
+            )
+            self.IMAGE_CATALOG_TTL = cfg["openstack_connection"].get(
+                "image_catalog_ttl", DEFAULT_IMAGE_CATALOG_TTL
+            )
+            self.RESOLVER_TTL = cfg["openstack_connection"].get(
+                "resolver_ttl", DEFAULT_RESOLVER_TTL
+            )
+            self.RESOLVER_NEGATIVE_TTL = cfg["openstack_connection"].get(
+                "resolver_negative_ttl", DEFAULT_RESOLVER_NEGATIVE_TTL
+            )
+            self.SECURITY_GROUP_INDEX_TTL = cfg["openstack_connection"].get(
+                "security_group_index_ttl", DEFAULT_SECURITY_GROUP_INDEX_TTL
+            )
+            self.reachability_prober = ReachabilityProber(
+                logger=self.LOG,
+                ttl=cfg["openstack_connection"].get(
+                    "reachability_ttl", DEFAULT_REACHABILITY_TTL
+                ),
+                timeout=cfg["openstack_connection"].get(
+                    "reachability_timeout", DEFAULT_REACHABILITY_TIMEOUT
+                ),
+            )
+            self.reachability_prober.start()
+            self.fan_out_executor = ThreadPoolExecutor(
+                max_workers=cfg["openstack_connection"].get(
+                    "fan_out_workers", self.FAN_OUT_WORKERS
+                ),
+                thread_name_prefix="fan-out",
+            )
+            self.BATCH_LAUNCH_WORKERS = cfg["openstack_connection"].get(
+                "batch_launch_workers", self.BATCH_LAUNCH_WORKERS
+            )
+            self.launch_rate_limiter = RateLimiter(
+                rate=cfg["openstack_connection"].get(
+                    "batch_launch_rate", DEFAULT_BATCH_LAUNCH_RATE
+                )
+            )
             self.CLOUD_SITE = cfg["cloud_site"]
             # connection to redis. Uses a pool with 10 connections.
             self.REDIS_HOST = cfg["redis"]["host"]
@@ -230,6 +368,44 @@ class VirtualMachineHandler(Iface):
             except redis.ConnectionError:
                 self.LOG.exception("Could not connect to Redis!")
                 sys.exit(1)
+            self.state_store = StateStore(pool=self.pool)
+            self.playbook_supervisor = PlaybookSupervisor(
+                pool=self.pool,
+                logger=self.LOG,
+                channel=cfg["redis"].get(
+                    "playbook_events_channel", DEFAULT_PLAYBOOK_EVENTS_CHANNEL
+                ),
+            )
+            self.playbook_templates = PlaybookTemplates(
+                playbooks_dir=PLAYBOOKS_DIR,
+                snapshots_dir=os.path.dirname(PLAYBOOKS_DIR.rstrip("/")),
+                logger=self.LOG,
+            )
+            self.playbook_executor = PlaybookExecutor(
+                pool=self.pool,
+                logger=self.LOG,
+                supervisor=self.playbook_supervisor,
+                max_concurrent_playbooks=cfg.get("playbooks", {}).get(
+                    "max_concurrent", DEFAULT_MAX_CONCURRENT_PLAYBOOKS
+                ),
+            )
+            self.job_manager = JobManager(
+                pool=self.pool,
+                logger=self.LOG,
+                workers=cfg.get("jobs", {}).get("workers", DEFAULT_JOB_WORKERS),
+                ttl=cfg.get("jobs", {}).get("ttl", DEFAULT_JOB_TTL),
+            )
+
+            http_config = cfg.get("http_client", {})
+            self.http = HttpSessionPool(
+                pool_size=http_config.get(
+                    "pool_size", cfg["openstack_connection"]["threads"]
+                ),
+                retries=http_config.get("retries", DEFAULT_RETRIES),
+                backoff_factor=http_config.get(
+                    "backoff_factor", DEFAULT_BACKOFF_FACTOR
+                ),
+            )
 
             # try to initialize forc connection
             try:
@@ -251,8 +427,10 @@ class VirtualMachineHandler(Iface):
                     self.BIBIGIRD_EP = (
                         f"http://{self.BIBIGRID_HOST}:{self.BIBIGRID_PORT}"
                     )
-                self.BIBIGRID_DEACTIVATE_UPRADES_SCRIPT = (
-                    self.create_deactivate_update_script()
+                self.http.register(
+                    BIBIGRID_ENDPOINT,
+                    headers={"content-Type": "application/json"},
+                    verify=self.PRODUCTION,
                 )
                 self.BIBIGRID_ANSIBLE_ROLES = cfg["bibigrid"].get(
                     "ansibleGalaxyRoles", []
@@ -282,6 +460,9 @@ class VirtualMachineHandler(Iface):
                 self.FORC_API_KEY = os.environ.get("FORC_API_KEY", None)
                 self.FORC_ALLOWED = {}
                 self.FORC_HTTPS = cfg["forc"].get("forc_https", True)
+                self.FORC_TEMPLATES_CACHE_TTL = cfg["forc"].get(
+                    "templates_cache_ttl", self.FORC_TEMPLATES_CACHE_TTL
+                )
                 self.FORC_REMOTE_ID = cfg["forc"]["forc_remote_id"]
                 self.GITHUB_PLAYBOOKS_REPO = cfg["forc"]["github_playbooks_repo"]
                 if (
@@ -290,6 +471,11 @@ class VirtualMachineHandler(Iface):
                     or not self.GITHUB_PLAYBOOKS_REPO
                 ):
                     raise ValueError
+                self.http.register(
+                    FORC_ENDPOINT,
+                    headers={"X-API-KEY": self.FORC_API_KEY},
+                    verify=self.FORC_HTTPS,
+                )
                 self.LOG.info(msg=f"Forc-Backend url loaded: {self.RE_BACKEND_URL}")
                 self.LOG.info(msg=f"Forc-Frontend Url loaded: {self.FORC_URL}")
             except ValueError as ve:
@@ -308,6 +494,9 @@ class VirtualMachineHandler(Iface):
                 self.FORC_API_KEY = None
                 self.FORC_ALLOWED = None
                 self.GITHUB_PLAYBOOKS_REPO = None
+            self.forc_templates = frozenset()
+            self.forc_templates_loaded_at = None
+            self.forc_templates_lock = threading.Lock()
             if self.USE_GATEWAY:
                 self.GATEWAY_IP = cfg["openstack_connection"]["gateway_ip"]
                 self.SSH_FORMULAR = cfg["openstack_connection"][
@@ -316,9 +505,33 @@ class VirtualMachineHandler(Iface):
                 self.UDP_FORMULAR = cfg["openstack_connection"][
                     "udp_port_calc_formular"
                 ]
+                self.SSH_PORT_FORMULA = PortFormula(self.SSH_FORMULAR)
+                self.UDP_PORT_FORMULA = PortFormula(self.UDP_FORMULAR)
 
                 self.LOG.info(f"Gateway IP is {self.GATEWAY_IP}")
         self.conn = self.create_connection()
+        self.image_catalog = ImageCatalog(
+            list_images=self.conn.list_images,
+            logger=self.LOG,
+            ttl=self.IMAGE_CATALOG_TTL,
+            negative_ttl=self.RESOLVER_NEGATIVE_TTL,
+        )
+        self.image_catalog.start()
+        self.flavor_resolver = self.create_resolver(
+            self.conn.compute.find_flavor, "Flavor"
+        )
+        self.network_resolver = self.create_resolver(
+            self.conn.network.find_network, "Network"
+        )
+        # sizes of the volumes attached to single polled servers
+        self.volume_resolver = self.create_resolver(
+            self.conn.block_storage.find_volume, "Volume"
+        )
+        self.security_group_index = SecurityGroupIndex(
+            list_security_groups=self.conn.list_security_groups,
+            logger=self.LOG,
+            ttl=self.SECURITY_GROUP_INDEX_TTL,
+        )
         self._validate_forc_security_group()
         self.update_playbooks()
         self.validate_gateway_security_group()
@@ -422,6 +635,17 @@ class VirtualMachineHandler(Iface):
         # self.LOG.info("Get Version of Client: {}".format(VERSION))
         return str(VERSION)
 
+    def get_server_stats(self):
+        """
+        Get the statistics of the Thrift server.
+
+        :return: {'server_mode', 'queue_depth', 'max_queue_size', 'rejected'},
+                the queue statistics are only known in the nonblocking mode
+        """
+        if self.server_stats is None:
+            return {}
+        return {key: str(value) for key, value in self.server_stats().items()}
+
     def get_Images(self):
         """
         Get Images.
@@ -431,12 +655,7 @@ class VirtualMachineHandler(Iface):
         self.LOG.info("Get Images")
         images = list()
         try:
-            for img in filter(
-                lambda x: "tags" in x
-                and len(x["tags"]) > 0
-                and x["status"] == "active",
-                self.conn.list_images(),
-            ):
+            for img in self.image_catalog.active_tagged_images():
                 properties = img.get("properties")
                 if not properties:
                     properties = {}
@@ -526,11 +745,8 @@ class VirtualMachineHandler(Iface):
         images = list()
         try:
             for img in filter(
-                lambda x: "tags" in x
-                and len(x["tags"]) > 0
-                and x["status"] == "active"
-                and x["visibility"] == "public",
-                self.conn.list_images(),
+                lambda x: x.get("tags") and x["status"] == "active",
+                self.image_catalog.by_visibility("public"),
             ):
                 image = self.prepare_image(img)
                 if image is None:
@@ -552,11 +768,8 @@ class VirtualMachineHandler(Iface):
         images = list()
         try:
             for img in filter(
-                lambda x: "tags" in x
-                and len(x["tags"]) > 0
-                and x["status"] == "active"
-                and x["visibility"] == "private",
-                self.conn.list_images(),
+                lambda x: x.get("tags") and x["status"] == "active",
+                self.image_catalog.by_visibility("private"),
             ):
                 image = self.prepare_image(img)
                 if image is None:
@@ -577,33 +790,45 @@ class VirtualMachineHandler(Iface):
         """
         self.LOG.info(f"Get Image {id} with tags")
         try:
-            img = self.conn.get_image(name_or_id=id)
+            # the catalog lists all images, an image missing from it, e.g. a
+            # deleted base image, is not looked up with another listing
+            img = self.image_catalog.get(id)
             if not img:
+                self.LOG.warning(f"Image {id} not found")
                 return Image()
-            properties = img.get("properties")
-            if not properties:
-                properties = {}
-                self.LOG.warning(f"Could not get properties for image: {img}")
-            description = properties.get("description", "")
-            tags = img.get("tags", [])
-            image = Image(
-                name=img["name"],
-                min_disk=img["min_disk"],
-                min_ram=img["min_ram"],
-                status=img["status"],
-                os_version=img.get("os_version", ""),
-                os_distro=img.get("os_distro", ""),
-                created_at=img["created_at"],
-                updated_at=img["updated_at"],
-                openstack_id=img["id"],
-                description=description,
-                tag=tags,
-            )
-            return image
+            return self.openstack_image_to_thrift_image(img)
         except Exception as e:
             self.LOG.exception(f"Get Image {id} with Tag Error: {e}")
             return Image()
 
+    def openstack_image_to_thrift_image(self, img):
+        """
+        Convert an OpenStack image to a thrift image.
+
+        :param img: The OpenStack image
+        :return: Image instance
+        """
+        properties = img.get("properties")
+        if not properties:
+            properties = {}
+            self.LOG.warning(f"Could not get properties for image: {img}")
+        description = properties.get("description", "")
+        tags = img.get("tags", [])
+        image = Image(
+            name=img["name"],
+            min_disk=img["min_disk"],
+            min_ram=img["min_ram"],
+            status=img["status"],
+            os_version=img.get("os_version", ""),
+            os_distro=img.get("os_distro", ""),
+            created_at=img["created_at"],
+            updated_at=img["updated_at"],
+            openstack_id=img["id"],
+            description=description,
+            tag=tags,
+        )
+        return image
+
     def get_Images_by_filter(self, filter_list):
         """
         Get filtered Images.
@@ -613,12 +838,7 @@ class VirtualMachineHandler(Iface):
         self.LOG.info(f"Get filtered Images: {filter_list}")
         images = list()
         try:
-            for img in filter(
-                lambda x: "tags" in x
-                and len(x["tags"]) > 0
-                and x["status"] == "active",
-                self.conn.list_images(),
-            ):
+            for img in self.image_catalog.active_tagged_images():
                 tags = img.get("tags", [])
                 if "resenv" in filter_list:
                     modes = filter_list["resenv"].split(",")
@@ -658,9 +878,7 @@ class VirtualMachineHandler(Iface):
             return []
 
     def delete_keypair(self, key_name):
-        key_pair = self.conn.compute.find_keypair(key_name)
-        if key_pair:
-            self.conn.compute.delete_keypair(key_pair)
+        self.conn.compute.delete_keypair(key_name, ignore_missing=True)
 
     def import_keypair(self, keyname, public_key):
         """
@@ -735,7 +953,7 @@ class VirtualMachineHandler(Iface):
             if not server:
                 self.LOG.exception(f"No Server found {openstack_id}")
                 return VM(status=self.NOT_FOUND)
-            return self.openstack_server_to_thrift_server(server=server)
+            return self.openstack_servers_to_thrift_servers([server])[0]
 
         except ResourceNotFound:
             self.LOG.exception(f"Could not find server {id}")
@@ -744,24 +962,73 @@ class VirtualMachineHandler(Iface):
             self.LOG.exception(f"Could get server {openstack_id}")
             return VM(status=self.CHECKING_STATUS)
 
-    def get_servers_by_ids(self, ids):
-        servers = []
-        for id in ids:
-            self.LOG.info(f"Get server {id}")
+    def fan_out(self, function, ids):
+        """
+        Call a function for many ids concurrently.
+
+        :param function: Function taking an id
+        :param ids: Ids to call the function with
+        :return: {id: (result, exception)}, exception is None on success
+        """
+        futures = {id: self.fan_out_executor.submit(function, id) for id in set(ids)}
+        results = {}
+        for id, future in futures.items():
             try:
-                server = self.conn.get_server_by_id(id)
-                if server:
-                    servers.append(server)
-                else:
-                    self.LOG.exception(f"No Server found {openstack_id}")
+                results[id] = (future.result(), None)
+            except Exception as e:
+                results[id] = (None, e)
+        return results
 
+    def get_servers_by_ids(self, ids):
+        """
+        Get many servers.
+
+        Many ids are resolved with a single list of the servers, few ids and
+        the ids missing from the list are fetched concurrently.
+
+        :param ids: Ids of the servers
+        :return: List of server instances in the order of ids. Missing servers
+                have the status NOT_FOUND, servers which could not be fetched
+                the status CHECKING_STATUS.
+        """
+        self.LOG.info(f"Get servers {ids}")
+        servers = {}
+        if len(ids) >= self.BULK_LIST_MIN_IDS:
+            wanted_ids = set(ids)
+            try:
+                servers = {
+                    server.id: server
+                    for server in self.conn.list_servers()
+                    if server.id in wanted_ids
+                }
             except Exception as e:
-                self.LOG.exception(f"Requested VM {id} not found!\n {e}")
-        server_list = []
-        for server in servers:
+                self.LOG.exception(f"Could not list servers: {e}")
+        errors = {}
+        missing_ids = [id for id in ids if id not in servers]
+        for id, (server, error) in self.fan_out(
+            self.conn.get_server_by_id, missing_ids
+        ).items():
             if server:
-                server_list.append(self.openstack_server_to_thrift_server(server))
-        return server_list
+                servers[id] = server
+            elif error is not None and not isinstance(error, ResourceNotFound):
+                self.LOG.error(f"Could not get server {id}: {error}")
+                errors[id] = error
+            else:
+                self.LOG.error(f"Requested VM {id} not found!")
+        thrift_servers = {
+            thrift_server.openstack_id: thrift_server
+            for thrift_server in self.openstack_servers_to_thrift_servers(
+                list(servers.values())
+            )
+        }
+        return [
+            thrift_servers.get(id, None)
+            or VM(
+                openstack_id=id,
+                status=self.CHECKING_STATUS if id in errors else self.NOT_FOUND,
+            )
+            for id in ids
+        ]
 
     def check_server_task_state(self, openstack_id):
         self.LOG.info(f"Checking Task State: {openstack_id}")
@@ -775,43 +1042,112 @@ class VirtualMachineHandler(Iface):
         else:
             return "No active task"
 
-    def get_image(self, image):
-        image = self.conn.get_image(name_or_id=image)
+    def create_resolver(self, resolve, kind):
+        return ResourceResolver(
+            resolve=resolve,
+            logger=self.LOG,
+            kind=kind,
+            ttl=self.RESOLVER_TTL,
+            negative_ttl=self.RESOLVER_NEGATIVE_TTL,
+        )
+
+    def refresh_resolvers(self):
+        """Drop the cached images, flavors, networks and security groups."""
+        self.image_catalog.invalidate()
+        self.flavor_resolver.invalidate()
+        self.network_resolver.invalidate()
+        self.security_group_index.invalidate()
+
+    @staticmethod
+    def is_outdated_resource_error(error):
+        """
+        :param error: Exception of a failed OpenStack request
+        :return: If the request may have failed because a cached image,
+                flavor, network or security group was deleted or changed
+        """
+        if isinstance(error, (ResourceNotFound, ConflictException)):
+            return True
+        # nova answers unknown images, flavors and networks of a new server with 400
+        return isinstance(error, HttpException) and any(
+            text in str(error).lower() for text in ("not found", "could not be found")
+        )
+
+    def refresh_resolvers_after(self, error):
+        """Drop the cached resources if error may be caused by outdated ones."""
+        if self.is_outdated_resource_error(error):
+            self.refresh_resolvers()
 
-        if image is None:
-            self.LOG.exception(f"Image {image} not found!")
+    def get_image(self, image):
+        os_image = self.image_catalog.find(image)
+        if os_image is None and not self.image_catalog.is_missing(image):
+            # the image may be newer than the catalog, it is looked up by id
+            # and name only, the background refresh adds it to the catalog
+            os_image = self.conn.image.find_image(image, ignore_missing=True)
+            if os_image is None:
+                self.image_catalog.set_missing(image)
+
+        if os_image is None:
+            self.LOG.error(f"Image {image} not found!")
             raise imageNotFoundException(Reason=f"Image {image} not found")
-        return image
+        return os_image
 
     def get_flavor(self, flavor):
-        flavor = self.conn.compute.find_flavor(flavor)
-        if flavor is None:
-            self.LOG.exception(f"Flavor {flavor} not found!")
+        os_flavor = self.flavor_resolver.get(flavor)
+        if os_flavor is None:
+            self.LOG.error(f"Flavor {flavor} not found!")
             raise flavorNotFoundException(Reason=f"Flavor {flavor} not found!")
-        return flavor
+        return os_flavor
 
     def get_network(self):
-        network = self.conn.network.find_network(self.NETWORK)
+        network = self.network_resolver.get(self.NETWORK)
         if network is None:
-            self.LOG.exception(f"Network {network} not found!")
-            raise networkNotFoundException(Reason=f"Network {network} not found!")
+            self.LOG.error(f"Network {self.NETWORK} not found!")
+            raise networkNotFoundException(Reason=f"Network {self.NETWORK} not found!")
         return network
 
+    def inject_public_key(self, key_name, public_key, init_script):
+        """
+        Make a public key available on a new server.
+
+        By default the key is imported as keypair, which is deleted after the
+        server was created. With key_injection_mode userdata the key is passed
+        to cloud-init as cloud-config for the default user of the image and
+        no keypair is needed.
+
+        :param key_name: Unique name for the keypair
+        :param public_key: The Key
+        :param init_script: User data of the server, may be None
+        :return: (name of the imported keypair or None, user data)
+        """
+        if self.KEY_INJECTION_MODE == self.KEY_INJECTION_USERDATA:
+            # cloud-init adds the key before sshd starts, a user data script
+            # would run only at the end of the boot
+            cloud_config = "#cloud-config\n" + yaml.safe_dump(
+                {"ssh_authorized_keys": [public_key]}
+            )
+            if not init_script:
+                return None, encodeutils.safe_encode(cloud_config.encode("utf-8"))
+            user_data = MIMEMultipart()
+            user_data.attach(MIMEText(cloud_config, "cloud-config"))
+            user_data.attach(MIMEText(init_script.decode("utf-8"), "x-shellscript"))
+            return None, encodeutils.safe_encode(user_data.as_string().encode("utf-8"))
+        try:
+            # the name is new, so there is no keypair to look up
+            key_pair = self.conn.compute.create_keypair(
+                name=key_name, public_key=public_key
+            )
+        except ConflictException:
+            key_pair = self.import_keypair(key_name, public_key)
+            if key_pair is None:
+                raise otherException(Reason=f"Could not import keypair {key_name}")
+        return key_pair.name, init_script
+
     def create_add_keys_script(self, keys):
         self.LOG.info("create add key script")
-        fileDir = os.path.dirname(os.path.abspath(__file__))
-        key_script = os.path.join(fileDir, "scripts/bash/add_keys_to_authorized.sh")
-        bash_keys_array = "("
-        for key in keys:
-            bash_keys_array += f'"{key}" '
-        bash_keys_array += ")"
-
-        with open(key_script, "r") as file:
-            text = file.read()
-            text = text.replace("KEYS_TO_ADD", bash_keys_array)
-            text = encodeutils.safe_encode(text.encode("utf-8"))
-        key_script = text
-        return key_script
+        return self.script_templates.render(
+            "add_keys_to_authorized.sh",
+            KEYS_TO_ADD=ScriptTemplates.bash_array(f'"{key}"' for key in keys),
+        )
 
     def create_mount_init_script(
         self, volume_ids_path_new=None, volume_ids_path_attach=None
@@ -819,54 +1155,24 @@ class VirtualMachineHandler(Iface):
         self.LOG.info(f"create init script for volume ids:{volume_ids_path_new}")
         if not volume_ids_path_new and not volume_ids_path_attach:
             return None
-
-        fileDir = os.path.dirname(os.path.abspath(__file__))
-        mount_script = os.path.join(fileDir, "scripts/bash/mount.sh")
-
-        if volume_ids_path_new:
-            volume_ids_new = [vol["openstack_id"] for vol in volume_ids_path_new]
-            paths_new = [vol["path"] for vol in volume_ids_path_new]
-        else:
-            volume_ids_new = []
-            paths_new = []
-
-        if volume_ids_path_attach:
-            volume_ids_attach = [vol["openstack_id"] for vol in volume_ids_path_attach]
-            paths_attach = [vol["path"] for vol in volume_ids_path_attach]
-        else:
-            volume_ids_attach = []
-            paths_attach = []
-
-        bash_volume_path_new_array_string = "("
-        for path in paths_new:
-            bash_volume_path_new_array_string += path + " "
-        bash_volume_path_new_array_string += ")"
-
-        bash_volume_path_attach_array_string = "("
-        for path in paths_attach:
-            bash_volume_path_attach_array_string += path + " "
-        bash_volume_path_attach_array_string += ")"
-
-        bash_volume_id_new_array_string = "("
-        for volume_id in volume_ids_new:
-            bash_volume_id_new_array_string += "virtio-" + volume_id[0:20] + " "
-        bash_volume_id_new_array_string += ")"
-
-        bash_volume_id_attach_array_string = "("
-        for volume_id in volume_ids_attach:
-            bash_volume_id_attach_array_string += "virtio-" + volume_id[0:20] + " "
-        bash_volume_id_attach_array_string += ")"
-
-        with open(mount_script, "r") as file:
-            text = file.read()
-            text = text.replace("VOLUME_IDS_NEW", bash_volume_id_new_array_string)
-            text = text.replace("VOLUME_PATHS_NEW", bash_volume_path_new_array_string)
-            text = text.replace("VOLUME_IDS_ATTACH", bash_volume_id_attach_array_string)
-            text = text.replace(
-                "VOLUME_PATHS_ATTACH", bash_volume_path_attach_array_string
-            )
-            text = encodeutils.safe_encode(text.encode("utf-8"))
-        init_script = text
+        volume_ids_path_new = volume_ids_path_new or []
+        volume_ids_path_attach = volume_ids_path_attach or []
+
+        init_script = self.script_templates.render(
+            "mount.sh",
+            VOLUME_IDS_NEW=ScriptTemplates.bash_array(
+                "virtio-" + vol["openstack_id"][0:20] for vol in volume_ids_path_new
+            ),
+            VOLUME_PATHS_NEW=ScriptTemplates.bash_array(
+                vol["path"] for vol in volume_ids_path_new
+            ),
+            VOLUME_IDS_ATTACH=ScriptTemplates.bash_array(
+                "virtio-" + vol["openstack_id"][0:20] for vol in volume_ids_path_attach
+            ),
+            VOLUME_PATHS_ATTACH=ScriptTemplates.bash_array(
+                vol["path"] for vol in volume_ids_path_attach
+            ),
+        )
         self.LOG.info(init_script)
         return init_script
 
@@ -930,6 +1236,7 @@ class VirtualMachineHandler(Iface):
     def resize_volume(self, volume_id, size):
         try:
             self.conn.block_storage.extend_volume(volume_id, size)
+            self.volume_resolver.invalidate(volume_id)
         except Exception as e:
             self.LOG.exception(e)
             return 1
@@ -976,11 +1283,13 @@ class VirtualMachineHandler(Iface):
         network = self.get_network()
         key_name = f"{metadata.get('elixir_id')[:-18]}{str(uuid4())[0:5]}"
         public_key = urllib.parse.unquote(public_key)
-        key_pair = self.import_keypair(key_name, public_key)
         init_script = self.create_mount_init_script(
             volume_ids_path_new=volume_ids_path_new,
             volume_ids_path_attach=volume_ids_path_attach,
         )
+        key_name, init_script = self.inject_public_key(
+            key_name, public_key, init_script
+        )
         custom_security_groups = self.get_research_environment_security_groups(
             research_environment_names=resenv
         )
@@ -998,20 +1307,24 @@ class VirtualMachineHandler(Iface):
                 image=image.id,
                 flavor=flavor.id,
                 network=[network.id],
-                key_name=key_pair.name,
+                key_name=key_name,
                 meta=metadata,
                 userdata=init_script,
                 security_groups=self.DEFAULT_SECURITY_GROUPS + custom_security_groups,
             )
             openstack_id = server["id"]
-            self.delete_keypair(key_name)
+            if key_name:
+                self.delete_keypair(key_name)
 
             return {"openstack_id": openstack_id}
 
         except Exception as e:
-            self.delete_keypair(key_name)
+            if key_name:
+                self.delete_keypair(key_name)
 
             self.LOG.exception(f"Start Server {servername} error:{e}")
+            # the cached image, flavor or network may be outdated
+            self.refresh_resolvers_after(e)
             return {}
 
     def _validate_forc_security_group(self):
@@ -1028,29 +1341,31 @@ class VirtualMachineHandler(Iface):
         self.LOG.info(
             f"Check if Security Group for project - [{project_name}-{project_id}] exists... "
         )
-        sec = self.conn.get_security_group(name_or_id=security_group_name)
-        if sec:
+        with self.security_group_index.lock(security_group_name):
+            sec = self.security_group_index.get(security_group_name)
+            if sec:
+                self.LOG.info(
+                    f"Security group [{project_name}-{project_id}]  already exists."
+                )
+                return sec["id"]
+
             self.LOG.info(
-                f"Security group [{project_name}-{project_id}]  already exists."
+                f"No security Group for [{project_name}-{project_id}]  exists. Creating.. "
             )
-            return sec["id"]
-
-        self.LOG.info(
-            f"No security Group for [{project_name}-{project_id}]  exists. Creating.. "
-        )
-        new_security_group = self.conn.create_security_group(
-            name=security_group_name, description=f"{project_name} Security Group"
-        )
+            new_security_group = self.conn.create_security_group(
+                name=security_group_name, description=f"{project_name} Security Group"
+            )
+            self.security_group_index.add(new_security_group)
 
-        self.conn.network.create_security_group_rule(
-            direction="ingress",
-            protocol="tcp",
-            port_range_max=22,
-            port_range_min=22,
-            security_group_id=new_security_group["id"],
-            remote_group_id=new_security_group["id"],
-        )
-        return new_security_group["id"]
+            self.create_security_group_rules(
+                self.security_group_rules(
+                    security_group_id=new_security_group["id"],
+                    protocol="tcp",
+                    port=22,
+                    remote_group_id=new_security_group["id"],
+                )
+            )
+            return new_security_group["id"]
 
     def get_research_environment_security_groups(
         self, research_environment_names: list[str]
@@ -1119,10 +1434,10 @@ class VirtualMachineHandler(Iface):
             image = self.get_image(image=image)
             flavor = self.get_flavor(flavor=flavor)
             network = self.get_network()
-            key_name = f"{metadata.get('elixir_id')[:-18]}{str(uuid4())[0:5]}"
+            # key_name is only set once the keypair was created by this call
+            new_key_name = f"{metadata.get('elixir_id')[:-18]}{str(uuid4())[0:5]}"
 
             public_key = urllib.parse.unquote(public_key)
-            key_pair = self.import_keypair(key_name, public_key)
             volume_ids = []
             volumes = []
 
@@ -1158,13 +1473,16 @@ class VirtualMachineHandler(Iface):
                         + encodeutils.safe_encode("\n".encode("utf-8"))
                         + unlock_ubuntu_user_script
                     )
+            key_name, init_script = self.inject_public_key(
+                new_key_name, public_key, init_script
+            )
 
             server = self.conn.create_server(
                 name=servername,
                 image=image.id,
                 flavor=flavor.id,
                 network=[network.id],
-                key_name=key_pair.name,
+                key_name=key_name,
                 meta=metadata,
                 volumes=volumes,
                 userdata=init_script,
@@ -1172,13 +1490,16 @@ class VirtualMachineHandler(Iface):
             )
 
             openstack_id = server["id"]
-            self.delete_keypair(key_name)
+            if key_name:
+                self.delete_keypair(key_name)
 
             return {"openstack_id": openstack_id}
         except Exception as e:
             if key_name:
                 self.delete_keypair(key_name)
             self.LOG.exception(f"Start Server {servername} error:{e}")
+            # the cached image, flavor or network may be outdated
+            self.refresh_resolvers_after(e)
             return {}
 
     def start_server(
@@ -1226,22 +1547,27 @@ class VirtualMachineHandler(Iface):
             image = self.get_image(image=image)
             flavor = self.get_flavor(flavor=flavor)
             network = self.get_network()
-            key_name = f"{metadata.get('elixir_id')[:-18]}{str(uuid4())[0:5]}"
+            # key_name is only set once the keypair was created by this call
+            new_key_name = f"{metadata.get('elixir_id')[:-18]}{str(uuid4())[0:5]}"
             public_key = urllib.parse.unquote(public_key)
-            key_pair = self.import_keypair(key_name, public_key)
+            key_name, init_script = self.inject_public_key(
+                new_key_name, public_key, None
+            )
 
             server = self.conn.create_server(
                 name=servername,
                 image=image.id,
                 flavor=flavor.id,
                 network=[network.id],
-                key_name=key_pair.name,
+                key_name=key_name,
                 meta=metadata,
+                userdata=init_script,
                 security_groups=self.DEFAULT_SECURITY_GROUPS + custom_security_groups,
             )
 
             openstack_id = server["id"]
-            self.delete_keypair(key_name)
+            if key_name:
+                self.delete_keypair(key_name)
 
             return {"openstack_id": openstack_id}
         except Exception as e:
@@ -1249,6 +1575,8 @@ class VirtualMachineHandler(Iface):
                 self.delete_keypair(key_name)
 
             self.LOG.exception(f"Start Server {servername} error:{e}")
+            # the cached image, flavor or network may be outdated
+            self.refresh_resolvers_after(e)
             return {}
 
     def create_resenv_security_group_and_attach_to_server(
@@ -1269,9 +1597,7 @@ class VirtualMachineHandler(Iface):
                 resenv_metadata=resenv_metadata
             )
         )
-        resenv_security_group = self.conn.get_security_group(
-            name_or_id=resenv_security_group_id
-        )
+        resenv_security_group = self.security_group_index.get(resenv_security_group_id)
 
         self.LOG.info(
             f"Add {resenv_security_group} Security Groups to Instance: {server_id}"
@@ -1321,7 +1647,6 @@ class VirtualMachineHandler(Iface):
             image = self.get_image(image=image)
             flavor = self.get_flavor(flavor=flavor)
             network = self.get_network()
-            key_creation = self.conn.create_keypair(name=servername)
             init_script = self.create_mount_init_script(
                 volume_ids_path_new=volume_ids_path_new,
                 volume_ids_path_attach=volume_ids_path_attach,
@@ -1339,6 +1664,45 @@ class VirtualMachineHandler(Iface):
                 volumes.append(self.conn.get_volume_by_id(id=id))
             self.LOG.info(volumes)
 
+            return self.create_server_with_custom_key(
+                servername=servername,
+                metadata=metadata,
+                image=image,
+                flavor=flavor,
+                network=network,
+                security_groups=self.DEFAULT_SECURITY_GROUPS + custom_security_groups,
+                userdata=init_script,
+                volumes=volumes,
+            )
+        except Exception as e:
+            self.LOG.exception(f"Start Server {servername} error:{e}")
+            # the cached image, flavor or network may be outdated
+            self.refresh_resolvers_after(e)
+            return {}
+
+    def create_server_with_custom_key(
+        self,
+        servername,
+        metadata,
+        image,
+        flavor,
+        network,
+        security_groups,
+        userdata=None,
+        volumes=None,
+    ):
+        """
+        Create a keypair named like the server and the server using it.
+
+        :param image: Resolved image, see get_image
+        :param flavor: Resolved flavor, see get_flavor
+        :param network: Resolved network, see get_network
+        :param security_groups: Names or ids of all security groups of the server
+        :return: {'openstackid': serverId, 'private_key': private key}
+        """
+        key_creation = self.conn.create_keypair(name=servername)
+        # from here on the keypair is ours and deleted if the server fails
+        try:
             try:
                 private_key = key_creation["private_key"]
             except Exception:
@@ -1350,26 +1714,284 @@ class VirtualMachineHandler(Iface):
                 flavor=flavor.id,
                 network=[network.id],
                 key_name=servername,
-                userdata=init_script,
-                volumes=volumes,
+                userdata=userdata,
+                volumes=volumes or [],
                 meta=metadata,
-                security_groups=self.DEFAULT_SECURITY_GROUPS + custom_security_groups,
+                security_groups=security_groups,
             )
+        except Exception:
+            self.delete_keypair(key_name=servername)
+            raise
 
-            openstack_id = server["id"]
+        openstack_id = server["id"]
 
-            self.redis.hmset(
-                openstack_id,
-                dict(
-                    key=private_key, name=servername, status=self.PREPARE_PLAYBOOK_BUILD
-                ),
+        self.state_store.create(
+            openstack_id,
+            key=private_key,
+            name=servername,
+            status=self.PREPARE_PLAYBOOK_BUILD,
+            project_id=metadata.get("project_id", None) or "",
+        )
+        return {"openstackid": openstack_id, "private_key": private_key}
+
+    def start_servers_with_custom_key(
+        self, flavor, image, servernames, metadatas, http, https, resenv
+    ):
+        """
+        Start many servers with custom keys from one spec, e.g. for a course.
+
+        The image, flavor, network and security groups are resolved once,
+        the servers are created concurrently at a limited rate.
+
+        :param flavor: Name of flavor which should be used
+        :param image: Name of image which should be used
+        :param servernames: Names of the new servers
+        :param metadatas: Metadata of the new servers, in the order of servernames
+        :param http: bool for http rule in security group
+        :param https: bool for https rule in security group
+        :param resenv: array with names of requested resenvs
+        :return: List in the order of servernames, with
+                {'servername', 'openstackid', 'private_key'} for started servers
+                and {'servername', 'error'} for servers which failed to start
+        """
+        self.LOG.info(f"Start {len(servernames)} Servers with custom key")
+        if len(metadatas) != len(servernames):
+            raise otherException(
+                Reason=f"Got {len(metadatas)} metadata for {len(servernames)} servers"
             )
-            return {"openstackid": openstack_id, "private_key": private_key}
+        if not servernames:
+            return []
+        image = self.get_image(image=image)
+        flavor = self.get_flavor(flavor=flavor)
+        network = self.get_network()
+        project_security_groups = {}
+        try:
+            custom_security_groups = self.get_research_environment_security_groups(
+                research_environment_names=resenv
+            )
+            for metadata in metadatas:
+                project_name = metadata.get("project_name")
+                project_id = metadata.get("project_id")
+                if project_name and project_id:
+                    if (project_name, project_id) not in project_security_groups:
+                        project_security_groups[(project_name, project_id)] = (
+                            self.get_or_create_project_security_group(
+                                project_name=project_name, project_id=project_id
+                            )
+                        )
         except Exception as e:
-            self.delete_keypair(key_name=servername)
+            self.LOG.exception(f"Could not set up security groups: {e}")
+            self.refresh_resolvers_after(e)
+            raise otherException(Reason=f"Could not set up security groups: {e}")
+
+        errors = []
+
+        def start(servername, metadata):
+            security_groups = self.DEFAULT_SECURITY_GROUPS + custom_security_groups
+            project = (metadata.get("project_name"), metadata.get("project_id"))
+            if project in project_security_groups:
+                security_groups = security_groups + [project_security_groups[project]]
+            self.launch_rate_limiter.acquire()
+            try:
+                result = self.create_server_with_custom_key(
+                    servername=servername,
+                    metadata=metadata,
+                    image=image,
+                    flavor=flavor,
+                    network=network,
+                    security_groups=security_groups,
+                )
+                return dict(result, servername=servername)
+            except Exception as e:
+                self.LOG.exception(f"Start Server {servername} error:{e}")
+                errors.append(e)
+                return {"servername": servername, "error": str(e)}
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.BATCH_LAUNCH_WORKERS, len(servernames)),
+            thread_name_prefix="batch-launch",
+        ) as executor:
+            results = list(executor.map(start, servernames, metadatas))
+        if any(self.is_outdated_resource_error(error) for error in errors):
+            self.refresh_resolvers()
+        return results
+
+    def submit_launch_job(self, function, request, idempotency_key):
+        """
+        Start a server in the background.
+
+        A private key in the result is returned by get_job_status until the
+        job is acknowledged with acknowledge_job.
+
+        :param function: Launch method, e.g. self.start_server
+        :param request: Keyword arguments for the launch method
+        :param idempotency_key: Retries with the same key get the job of the
+                first request instead of starting another server
+        :return: Id of the launch job, see get_job_status
+        """
+        return self.job_manager.submit(
+            job_type=function.__name__,
+            target=request["servername"],
+            function=self.run_launch_job,
+            args=(function, request),
+            request=request,
+            idempotency_key=idempotency_key,
+            secret_fields=("private_key",),
+        )
 
-            self.LOG.exception(f"Start Server {servername} error:{e}")
-            return {}
+    def run_launch_job(self, function, request):
+        result = function(**request)
+        if not result:
+            raise otherException(Reason=f"Start Server {request['servername']} failed")
+        return result
+
+    def start_server_async(
+        self,
+        flavor,
+        image,
+        public_key,
+        servername,
+        metadata,
+        diskspace,
+        volumename,
+        https,
+        http,
+        resenv,
+        idempotency_key,
+    ):
+        """
+        Start a new server in the background, see start_server.
+
+        :return: Id of the launch job, its result is the result of start_server
+        """
+        return self.submit_launch_job(
+            self.start_server,
+            dict(
+                flavor=flavor,
+                image=image,
+                public_key=public_key,
+                servername=servername,
+                metadata=metadata,
+                diskspace=diskspace,
+                volumename=volumename,
+                https=https,
+                http=http,
+                resenv=resenv,
+            ),
+            idempotency_key,
+        )
+
+    def start_server_with_custom_key_async(
+        self,
+        flavor,
+        image,
+        servername,
+        metadata,
+        http,
+        https,
+        resenv,
+        volume_ids_path_new,
+        volume_ids_path_attach,
+        idempotency_key,
+    ):
+        """
+        Start a new server with a custom key in the background,
+        see start_server_with_custom_key.
+
+        :return: Id of the launch job, its result is the result of
+                start_server_with_custom_key. The private key is part of the
+                result until the job is acknowledged with acknowledge_job.
+        """
+        return self.submit_launch_job(
+            self.start_server_with_custom_key,
+            dict(
+                flavor=flavor,
+                image=image,
+                servername=servername,
+                metadata=metadata,
+                http=http,
+                https=https,
+                resenv=resenv,
+                volume_ids_path_new=volume_ids_path_new,
+                volume_ids_path_attach=volume_ids_path_attach,
+            ),
+            idempotency_key,
+        )
+
+    def start_server_without_playbook_async(
+        self,
+        flavor,
+        image,
+        public_key,
+        servername,
+        metadata,
+        https,
+        http,
+        resenv,
+        volume_ids_path_new,
+        volume_ids_path_attach,
+        additional_keys,
+        idempotency_key,
+    ):
+        """
+        Start a new server in the background, see start_server_without_playbook.
+
+        :return: Id of the launch job, its result is the result of
+                start_server_without_playbook
+        """
+        return self.submit_launch_job(
+            self.start_server_without_playbook,
+            dict(
+                flavor=flavor,
+                image=image,
+                public_key=public_key,
+                servername=servername,
+                metadata=metadata,
+                https=https,
+                http=http,
+                resenv=resenv,
+                volume_ids_path_new=volume_ids_path_new,
+                volume_ids_path_attach=volume_ids_path_attach,
+                additional_keys=additional_keys,
+            ),
+            idempotency_key,
+        )
+
+    def start_server_with_mounted_volume_async(
+        self,
+        flavor,
+        image,
+        public_key,
+        servername,
+        metadata,
+        https,
+        http,
+        resenv,
+        volume_ids_path_new,
+        volume_ids_path_attach,
+        idempotency_key,
+    ):
+        """
+        Start a new server with volumes in the background, see volume_ids.
+
+        :return: Id of the launch job, its result is the result of volume_ids
+        """
+        return self.submit_launch_job(
+            self.volume_ids,
+            dict(
+                flavor=flavor,
+                image=image,
+                public_key=public_key,
+                servername=servername,
+                metadata=metadata,
+                https=https,
+                http=http,
+                resenv=resenv,
+                volume_ids_path_new=volume_ids_path_new,
+                volume_ids_path_attach=volume_ids_path_attach,
+            ),
+            idempotency_key,
+        )
 
     def create_and_deploy_playbook(
         self, public_key, playbooks_information, openstack_id
@@ -1379,21 +2001,26 @@ class VirtualMachineHandler(Iface):
             msg=f"Starting Playbook for (openstack_id): {openstack_id} --> {playbooks_information}"
         )
         port = self.get_vm_ports(openstack_id=openstack_id)
-        key = self.redis.hget(openstack_id, "key").decode("utf-8")
+        state = self.state_store.get_fields(openstack_id, KEY, PROJECT_ID)
         playbook = Playbook(
             ip=self.GATEWAY_IP,
             port=port["port"],
             playbooks_information=playbooks_information,
-            osi_private_key=key,
+            osi_private_key=state[KEY],
             public_key=public_key,
             pool=self.pool,
             loaded_metadata_keys=list(self.loaded_resenv_metadata.keys()),
             cloud_site=self.CLOUD_SITE,
             logger=self.LOG,
+            templates=self.playbook_templates,
         )
-        self.redis.hset(openstack_id, "status", self.BUILD_PLAYBOOK)
-        playbook.run_it()
+        self.state_store.set_status(openstack_id, self.BUILD_PLAYBOOK)
         active_playbooks[openstack_id] = playbook
+        self.playbook_executor.submit(
+            openstack_id=openstack_id,
+            playbook=playbook,
+            project_id=state[PROJECT_ID] or "",
+        )
         return 0
 
     def has_forc(self):
@@ -1409,30 +2036,66 @@ class VirtualMachineHandler(Iface):
     def get_forc_url(self):
         return self.FORC_URL
 
-    def cross_check_forc_image(self, tags):
+    def get_forc_templates(self):
+        """
+        Get the templates FORC offers.
+
+        The FORC template list is fetched at most once per
+        FORC_TEMPLATES_CACHE_TTL seconds.
+
+        :return: Set of (name, version) pairs
+        """
+        with self.forc_templates_lock:
+            loaded_at = self.forc_templates_loaded_at
+            if (
+                loaded_at is not None
+                and time.monotonic() - loaded_at < self.FORC_TEMPLATES_CACHE_TTL
+            ):
+                return self.forc_templates
+            forc_templates = self.forc_templates
+        # the request is sent without the lock, callers in the meantime may
+        # fetch the list as well
         get_url = f"{self.RE_BACKEND_URL}{self.TEMPLATES_URL}"
         try:
-            response = req.get(
+            response = self.http.get(
+                FORC_ENDPOINT,
                 get_url,
                 timeout=(30, 30),
-                headers={"X-API-KEY": self.FORC_API_KEY},
-                verify=self.FORC_HTTPS,
             )
             if response.status_code != 200:
-                return ()
+                self.LOG.error(
+                    f"Could not get templates from FORC: {response.status_code}"
+                )
             else:
-                templates = response.json()
+                forc_templates = frozenset(
+                    (template["name"], template["version"])
+                    for template in response.json()
+                )
         except Exception as e:
             self.LOG.error(f"Could not get templates from FORC.\n {e}")
-        cross_tags = list(set(self.ALL_TEMPLATES).intersection(tags))
-        for template_dict in templates:
-            if (
-                template_dict["name"] in self.FORC_ALLOWED
-                and template_dict["name"] in cross_tags
-            ):
-                if template_dict["version"] in self.FORC_ALLOWED[template_dict["name"]]:
-                    return True
-        return False
+        with self.forc_templates_lock:
+            self.forc_templates = forc_templates
+            # failed requests are cached as well, so an unreachable FORC is not
+            # asked again for every single image
+            self.forc_templates_loaded_at = time.monotonic()
+        return forc_templates
+
+    def invalidate_forc_templates(self):
+        with self.forc_templates_lock:
+            self.forc_templates_loaded_at = None
+
+    def cross_check_forc_image(self, tags):
+        if not self.RE_BACKEND_URL:
+            return False
+        cross_tags = set(self.ALL_TEMPLATES).intersection(tags)
+        if not cross_tags:
+            return False
+        forc_templates = self.get_forc_templates()
+        return any(
+            (name, version) in forc_templates
+            for name in cross_tags
+            for version in self.FORC_ALLOWED.get(name, [])
+        )
 
     def create_backend(self, elixir_id, user_key_url, template, upstream_url):
         template_version = self.get_template_version_for(template)
@@ -1456,12 +2119,11 @@ class VirtualMachineHandler(Iface):
             self.LOG.exception(e)
             return {}
         try:
-            response = req.post(
+            response = self.http.post(
+                FORC_ENDPOINT,
                 post_url,
                 json=backend_info,
                 timeout=(30, 30),
-                headers={"X-API-KEY": self.FORC_API_KEY},
-                verify=self.FORC_HTTPS,
             )
             try:
                 data = response.json()
@@ -1486,11 +2148,10 @@ class VirtualMachineHandler(Iface):
     def get_backends(self):
         get_url = f"{self.RE_BACKEND_URL}{self.BACKENDS_URL}"
         try:
-            response = req.get(
+            response = self.http.get(
+                FORC_ENDPOINT,
                 get_url,
                 timeout=(30, 30),
-                headers={"X-API-KEY": self.FORC_API_KEY},
-                verify=self.FORC_HTTPS,
             )
             if response.status_code == 401:
                 return [response.json()]
@@ -1514,11 +2175,10 @@ class VirtualMachineHandler(Iface):
     def get_backends_by_owner(self, elixir_id):
         get_url = f"{self.RE_BACKEND_URL}{self.BACKENDS_BY_OWNER_URL}/{elixir_id}"
         try:
-            response = req.get(
+            response = self.http.get(
+                FORC_ENDPOINT,
                 get_url,
                 timeout=(30, 30),
-                headers={"X-API-KEY": self.FORC_API_KEY},
-                verify=self.FORC_HTTPS,
             )
             if response.status_code == 401:
                 return [response.json()]
@@ -1542,11 +2202,10 @@ class VirtualMachineHandler(Iface):
     def get_backends_by_template(self, template):
         get_url = f"{self.RE_BACKEND_URL}{self.BACKENDS_BY_TEMPLATE_URL}/{template}"
         try:
-            response = req.get(
+            response = self.http.get(
+                FORC_ENDPOINT,
                 get_url,
                 timeout=(30, 30),
-                headers={"X-API-KEY": self.FORC_API_KEY},
-                verify=self.FORC_HTTPS,
             )
             if response.status_code == 401:
                 return [response.json()]
@@ -1570,11 +2229,10 @@ class VirtualMachineHandler(Iface):
     def get_backend_by_id(self, id):
         get_url = f"{self.RE_BACKEND_URL}{self.BACKENDS_URL}/{id}"
         try:
-            response = req.get(
+            response = self.http.get(
+                FORC_ENDPOINT,
                 get_url,
                 timeout=(30, 30),
-                headers={"X-API-KEY": self.FORC_API_KEY},
-                verify=self.FORC_HTTPS,
             )
             try:
                 data = response.json()
@@ -1595,11 +2253,10 @@ class VirtualMachineHandler(Iface):
     def delete_backend(self, id):
         delete_url = f"{self.RE_BACKEND_URL}{self.BACKENDS_URL}/{id}"
         try:
-            response = req.delete(
+            response = self.http.delete(
+                FORC_ENDPOINT,
                 delete_url,
                 timeout=(30, 30),
-                headers={"X-API-KEY": self.FORC_API_KEY},
-                verify=self.FORC_HTTPS,
             )
             if response.status_code != 200:
                 try:
@@ -1625,12 +2282,11 @@ class VirtualMachineHandler(Iface):
             self.LOG.exception(e)
             return {"Error": "Could not create url or json body."}
         try:
-            response = req.post(
+            response = self.http.post(
+                FORC_ENDPOINT,
                 post_url,
                 json=user_info,
                 timeout=(30, 30),
-                headers={"X-API-KEY": self.FORC_API_KEY},
-                verify=self.FORC_HTTPS,
             )
             try:
                 data = response.json()
@@ -1648,11 +2304,10 @@ class VirtualMachineHandler(Iface):
     def get_users_from_backend(self, backend_id):
         get_url = f"{self.RE_BACKEND_URL}{self.USERS_URL}/{backend_id}"
         try:
-            response = req.get(
+            response = self.http.get(
+                FORC_ENDPOINT,
                 get_url,
                 timeout=(30, 30),
-                headers={"X-API-KEY": self.FORC_API_KEY},
-                verify=self.FORC_HTTPS,
             )
             if response.status_code == 401:
                 return ["Error: 401"]
@@ -1673,12 +2328,11 @@ class VirtualMachineHandler(Iface):
             "user": user_id,
         }
         try:
-            response = req.delete(
+            response = self.http.delete(
+                FORC_ENDPOINT,
                 delete_url,
                 json=user_info,
                 timeout=(30, 30),
-                headers={"X-API-KEY": self.FORC_API_KEY},
-                verify=self.FORC_HTTPS,
             )
             return response.json()
         except Timeout as e:
@@ -1710,11 +2364,10 @@ class VirtualMachineHandler(Iface):
     def get_templates_by_template(self, template_name):
         get_url = f"{self.RE_BACKEND_URL}{self.TEMPLATES_URL}/{template_name}"
         try:
-            response = req.get(
+            response = self.http.get(
+                FORC_ENDPOINT,
                 get_url,
                 timeout=(30, 30),
-                headers={"X-API-KEY": self.FORC_API_KEY},
-                verify=self.FORC_HTTPS,
             )
             if response.status_code == 401:
                 return [response.json()]
@@ -1727,11 +2380,10 @@ class VirtualMachineHandler(Iface):
     def check_template(self, template_name, template_version):
         get_url = f"{self.RE_BACKEND_URL}{self.TEMPLATES_URL}/{template_name}/{template_version}"
         try:
-            response = req.get(
+            response = self.http.get(
+                FORC_ENDPOINT,
                 get_url,
                 timeout=(30, 30),
-                headers={"X-API-KEY": self.FORC_API_KEY},
-                verify=self.FORC_HTTPS,
             )
             if response.status_code == 401:
                 return [response.json()]
@@ -1744,80 +2396,145 @@ class VirtualMachineHandler(Iface):
     def get_playbook_logs(self, openstack_id):
         global active_playbooks
         self.LOG.info(f"Get Playbook self.LOGs {openstack_id}")
-        if self.redis.exists(openstack_id) == 1 and openstack_id in active_playbooks:
-            key_name = self.redis.hget(openstack_id, "name").decode("utf-8")
+        key_name = None
+        if openstack_id in active_playbooks:
+            key_name = self.state_store.get_fields(openstack_id, NAME)[NAME]
+        if key_name is not None:
             playbook = active_playbooks.pop(openstack_id)
             status, stdout, stderr = playbook.get_logs()
             self.LOG.info(f" Playbook self.LOGs{openstack_id} stattus: {status}")
 
-            playbook.cleanup(openstack_id)
+            self.playbook_supervisor.cleanup(openstack_id, playbook)
             self.delete_keypair(key_name=key_name)
             return PlaybookResult(status=status, stdout=stdout, stderr=stderr)
         else:
             return PlaybookResult(status=-2, stdout="", stderr="")
 
+    def get_playbook_log_chunk(self, openstack_id, stream, offset, max_bytes):
+        """
+        Get a chunk of the log of a playbook run.
+
+        :param openstack_id: Id of the server the playbook runs for
+        :param stream: stdout or stderr
+        :param offset: Byte offset to start reading at
+        :param max_bytes: Maximum size of the chunk, capped at MAX_LOG_CHUNK_SIZE
+        :return: {'data': chunk, 'next_offset': offset, 'eof': 'true'/'false',
+                'running': 'true'/'false'}
+        """
+        if stream not in [STDOUT, STDERR]:
+            raise otherException(Reason=f"Unknown log stream {stream}")
+        if max_bytes <= 0 or max_bytes > self.MAX_LOG_CHUNK_SIZE:
+            max_bytes = self.MAX_LOG_CHUNK_SIZE
+        offset = max(offset, 0)
+        playbook = active_playbooks.get(openstack_id, None)
+        if playbook is not None:
+            # checked before reading, output written after the check is
+            # not taken as complete
+            running = playbook.process is None or playbook.process.poll() is None
+            data, next_offset, eof = playbook.read_log(
+                stream=stream,
+                offset=offset,
+                max_bytes=max_bytes,
+                complete=not running,
+            )
+        else:
+            # the logs of a stopped playbook are kept in the state store
+            log = self.state_store.get_log(openstack_id, stream) or b""
+            data, next_offset, eof = decode_log_chunk(
+                log[offset : offset + max_bytes + LOG_READ_AHEAD],
+                offset,
+                max_bytes,
+                offset + max_bytes + LOG_READ_AHEAD >= len(log),
+                complete=True,
+            )
+            running = False
+        return {
+            "data": data,
+            "next_offset": str(next_offset),
+            "eof": str(eof).lower(),
+            "running": str(running).lower(),
+        }
+
     def get_volumes_by_ids(self, volume_ids):
-        self.LOG.info(f"Get Volumes {volume_ids}")
+        """
+        Get many volumes.
+
+        Many ids are resolved with a single list of the volumes, few ids and
+        the ids missing from the list are fetched concurrently.
 
+        :param volume_ids: Ids of the volumes
+        :return: List of volume instances in the order of volume_ids. Missing
+                volumes have the status NOT_FOUND, volumes which could not be
+                fetched the status ERROR.
+        """
+        self.LOG.info(f"Get Volumes {volume_ids}")
+        os_volumes = {}
+        if len(volume_ids) >= self.BULK_LIST_MIN_IDS:
+            wanted_ids = set(volume_ids)
+            try:
+                os_volumes = {
+                    os_volume.id: os_volume
+                    for os_volume in self.conn.block_storage.volumes(details=True)
+                    if os_volume.id in wanted_ids
+                }
+            except Exception as e:
+                self.LOG.exception(f"Could not list volumes: {e}")
+        errors = {}
+        missing_ids = [id for id in volume_ids if id not in os_volumes]
+        for id, (os_volume, error) in self.fan_out(
+            lambda id: self.conn.get_volume_by_id(id=id), missing_ids
+        ).items():
+            if os_volume:
+                os_volumes[id] = os_volume
+            elif error is not None and not isinstance(error, ResourceNotFound):
+                self.LOG.error(f"Could not get volume {id}: {error}")
+                errors[id] = error
+            else:
+                self.LOG.error(f"Could not find volume {id}")
         volumes = []
         for id in volume_ids:
-            try:
-                os_volume = self.conn.get_volume_by_id(id=id)
-                if os_volume.attachments:
-                    device = os_volume.attachments[0].device
-                else:
-                    device = None
-                self.LOG.info(os_volume)
-                thrift_volume = Volume(
-                    status=os_volume.status,
-                    id=os_volume.id,
-                    name=os_volume.name,
-                    description=os_volume.description,
-                    created_at=os_volume.created_at,
-                    device=device,
-                    size=os_volume.size,
+            if id in os_volumes:
+                volumes.append(self.openstack_volume_to_thrift_volume(os_volumes[id]))
+            else:
+                volumes.append(
+                    Volume(id=id, status=self.ERROR if id in errors else self.NOT_FOUND)
                 )
-                volumes.append(thrift_volume)
-
-            except Exception:
-                self.LOG.exception(f"Could not find volume {id}")
-
         return volumes
 
+    def openstack_volume_to_thrift_volume(self, os_volume) -> Volume:
+        if os_volume.attachments:
+            device = os_volume.attachments[0]["device"]
+            server_id = os_volume.attachments[0]["server_id"]
+        else:
+            device = None
+            server_id = None
+        return Volume(
+            status=os_volume.status,
+            id=os_volume.id,
+            name=os_volume.name,
+            description=os_volume.description,
+            created_at=os_volume.created_at,
+            device=device,
+            size=os_volume.size,
+            server_id=server_id,
+        )
+
     def get_volume(self, volume_id):
         self.LOG.info(f"Get Volume {volume_id}")
         try:
             os_volume = self.conn.get_volume_by_id(id=volume_id)
             if os_volume:
                 self.LOG.info(os_volume)
-                if os_volume.attachments:
-                    device = os_volume.attachments[0]["device"]
-                    server_id = os_volume.attachments[0]["server_id"]
-                else:
-                    device = None
-                    server_id = None
-
-                thrift_volume = Volume(
-                    status=os_volume.status,
-                    id=os_volume.id,
-                    name=os_volume.name,
-                    description=os_volume.description,
-                    created_at=os_volume.created_at,
-                    device=device,
-                    server_id=server_id,
-                    size=os_volume.size,
-                )
-
-                return thrift_volume
+                return self.openstack_volume_to_thrift_volume(os_volume)
             else:
-                self.LOG.exception(f"Could not find volume {id}")
+                self.LOG.exception(f"Could not find volume {volume_id}")
                 return Volume(status=self.NOT_FOUND)
 
         except ResourceNotFound:
-            self.LOG.exception(f"Could not find volume {id}")
+            self.LOG.exception(f"Could not find volume {volume_id}")
             return Volume(status=self.NOT_FOUND)
         except Exception:
-            self.LOG.exception(f"Could not find volume {id}")
+            self.LOG.exception(f"Could not find volume {volume_id}")
             return Volume(status=self.CHECKING_STATUS)
 
     def attach_volume_to_server(self, openstack_id, volume_id):
@@ -1857,113 +2574,202 @@ class VirtualMachineHandler(Iface):
         """
         Check status of server.
 
+        The server is fetched once and its SSH port is looked up in the
+        cache of the reachability prober, so this call never waits for a
+        connect. Unknown or stale ports are probed in the background.
+
         :param openstack_id: Id of server
-        :param diskspace: diskspace of server(volume will be attached if server
-                is active and diskpace >0)
-        :param volume_id: Id of volume
         :return: server instance
         """
-        # TODO: Remove diskspace param, if volume_id exist it can be attached
-        # diskspace not need
         self.LOG.info(f"Check Status VM {openstack_id}")
         try:
-            server = self.conn.compute.get_server(openstack_id)
+            server = self.conn.get_server_by_id(openstack_id)
             if not server:
                 self.LOG.exception(f"No Server with id  {openstack_id} ")
                 return VM(status=self.NOT_FOUND)
         except ResourceNotFound:
-            self.LOG.exception(f"Could not find server {id}")
+            self.LOG.exception(f"Could not find server {openstack_id}")
             return VM(status=self.NOT_FOUND)
         except Exception:
             self.LOG.exception(f"Could not get server {openstack_id} ")
             return VM(status=self.CHECKING_STATUS)
 
-        serv = server.to_dict()
-
         try:
-            if serv["status"] == self.ACTIVE and serv["task_state"] not in [
-                "powering-off",
-                "powering-on",
-            ]:
-                host = self.get_server(openstack_id).floating_ip
-                port = self.SSH_PORT
-
-                if self.USE_GATEWAY:
-                    serv_cop = self.get_server(openstack_id)
-                    server_base = serv_cop.fixed_ip.split(".")[-1]
-                    ip_base = serv_cop.fixed_ip.split(".")[-2]
-                    x = int(server_base)  # noqa F841
-                    y = int(ip_base)  # noqa F841
-                    host = str(self.GATEWAY_IP)
-                    port = eval(self.SSH_FORMULAR)
-                elif self.get_server(openstack_id).floating_ip is None:
-                    host = self.add_floating_ip_to_server(
-                        openstack_id, self.FLOATING_IP_NETWORK
-                    )
-                if self.netcat(host, port):
-                    server = self.get_server(openstack_id)
-                    if self.redis.exists(openstack_id) == 1:
-                        global active_playbooks
-                        if openstack_id in active_playbooks:
-                            playbook = active_playbooks[openstack_id]
-                            playbook.check_status(openstack_id)
-                        status = self.redis.hget(openstack_id, "status").decode("utf-8")
-                        if status == self.PREPARE_PLAYBOOK_BUILD:
-                            server.status = self.PREPARE_PLAYBOOK_BUILD
-                            return server
-                        elif status == self.BUILD_PLAYBOOK:
-                            server.status = self.BUILD_PLAYBOOK
-                            return server
-                        elif status == self.PLAYBOOK_FAILED:
-                            server.status = self.PLAYBOOK_FAILED
-                            return server
-                        else:
-                            return server
-                    return self.get_server(openstack_id)
-                else:
-                    server = self.get_server(openstack_id)
-                    if server.status != "SHUTDOWN":
-                        server.status = "PORT_CLOSED"
-                    return server
-            elif serv["status"] == self.ERROR:
-                server = self.get_server(openstack_id)
-                server.status = self.ERROR
-                return server
+            thrift_server = self.openstack_servers_to_thrift_servers([server])[0]
+            if self.needs_ssh_check(server):
+                host, port = self.get_ssh_address(thrift_server)
+                reachable = self.reachability_prober.is_reachable(host, port)
+                # kept up to date by the playbook supervisor
+                playbook_status = (
+                    self.state_store.get_status(openstack_id) if reachable else None
+                )
+                return self.set_reachability_status(
+                    thrift_server, reachable, playbook_status
+                )
+            elif server.status == self.ERROR:
+                thrift_server.status = self.ERROR
+                return thrift_server
             else:
-                server = self.get_server(openstack_id)
-                # server.status = self.BUILD
-                return server
+                return thrift_server
         except Exception as e:
             self.LOG.exception(f"Check Status VM {openstack_id} error: {e}")
             return VM(status=self.ERROR)
 
-    def openstack_server_to_thrift_server(self, server: Server) -> VM:
-        self.LOG.info(f"Convert server {server} to thrift server")
+    def check_servers_status(self, openstack_ids: list[str]) -> list[VM]:
+        """
+        Check status of many servers.
+
+        The servers are listed once, all SSH ports are probed concurrently
+        and the playbook states are read from redis in one round trip.
+
+        :param openstack_ids: Ids of the servers
+        :return: List of server instances, in the order of openstack_ids
+        """
+        self.LOG.info(f"Check Status VMs {openstack_ids}")
+        wanted_ids = set(openstack_ids)
+        try:
+            servers = {
+                server.id: server
+                for server in self.conn.list_servers()
+                if server.id in wanted_ids
+            }
+        except Exception:
+            self.LOG.exception(f"Could not list servers {openstack_ids}")
+            return [
+                VM(openstack_id=openstack_id, status=self.CHECKING_STATUS)
+                for openstack_id in openstack_ids
+            ]
+        thrift_servers = {
+            thrift_server.openstack_id: thrift_server
+            for thrift_server in self.openstack_servers_to_thrift_servers(
+                list(servers.values())
+            )
+        }
+        addresses = {}
+        for openstack_id, thrift_server in thrift_servers.items():
+            server = servers[openstack_id]
+            try:
+                if self.needs_ssh_check(server):
+                    addresses[openstack_id] = self.get_ssh_address(thrift_server)
+                elif server.status == self.ERROR:
+                    thrift_server.status = self.ERROR
+            except Exception as e:
+                self.LOG.exception(f"Check Status VM {openstack_id} error: {e}")
+                thrift_server.status = self.ERROR
+        reachable = self.reachability_prober.probe_many(addresses.values())
+        playbook_statuses = self.state_store.get_statuses(list(addresses))
+        for openstack_id, address in addresses.items():
+            self.set_reachability_status(
+                thrift_servers[openstack_id],
+                reachable[address],
+                playbook_statuses[openstack_id],
+            )
+        return [
+            thrift_servers.get(openstack_id, None)
+            or VM(openstack_id=openstack_id, status=self.NOT_FOUND)
+            for openstack_id in openstack_ids
+        ]
+
+    def needs_ssh_check(self, server: Server) -> bool:
+        return server.status == self.ACTIVE and server.task_state not in [
+            "powering-off",
+            "powering-on",
+        ]
+
+    def get_ssh_address(self, thrift_server: VM) -> tuple:
+        """
+        Get the address to check the SSH port of a server at.
+
+        :param thrift_server: The server
+        :return: (host, port)
+        """
+        host = thrift_server.floating_ip
+        port = self.SSH_PORT
+        if self.USE_GATEWAY:
+            host = str(self.GATEWAY_IP)
+            port = self.SSH_PORT_FORMULA.port_for_ip(thrift_server.fixed_ip)
+        elif host is None:
+            host = self.add_floating_ip_to_server(
+                thrift_server.openstack_id, self.FLOATING_IP_NETWORK
+            )
+        return host, port
+
+    def set_reachability_status(
+        self, thrift_server: VM, reachable: bool, playbook_status: str
+    ) -> VM:
+        """
+        Set the status of a server from its SSH reachability.
+
+        :param thrift_server: The server
+        :param reachable: If the SSH port is open, None if unknown
+        :param playbook_status: Status of the playbook of the server, if any
+        :return: The server, CHECKING_STATUS while the port was not probed yet
+        """
+        if reachable is None:
+            thrift_server.status = self.CHECKING_STATUS
+        elif reachable:
+            if playbook_status in [
+                self.PREPARE_PLAYBOOK_BUILD,
+                self.BUILD_PLAYBOOK,
+                self.PLAYBOOK_FAILED,
+            ]:
+                thrift_server.status = playbook_status
+        elif thrift_server.status != "SHUTDOWN":
+            thrift_server.status = "PORT_CLOSED"
+        return thrift_server
+
+    @staticmethod
+    def get_server_ips(server: Server) -> tuple:
+        """
+        Get the ips of an OpenStack server from its addresses.
+
+        :param server: The OpenStack server
+        :return: (fixed_ip, floating_ip), None for a missing ip
+        """
         fixed_ip = None
         floating_ip = None
+        for values in server.addresses.values():
+            for address in values:
+                if address["OS-EXT-IPS:type"] == "floating":
+                    floating_ip = address["addr"]
+                elif address["OS-EXT-IPS:type"] == "fixed":
+                    fixed_ip = address["addr"]
+        return fixed_ip, floating_ip
+
+    def openstack_server_to_thrift_server(
+        self, server: Server, volume_sizes: dict, images: dict = None
+    ) -> VM:
+        """
+        Convert an OpenStack server to a thrift VM.
+
+        :param server: The OpenStack server
+        :param volume_sizes: Prefetched mapping of volume id to size
+        :param images: Optional prefetched mapping of image id to thrift image.
+                If missing, the image is fetched from OpenStack.
+        :return: VM instance
+        """
         diskspace = 0
 
         if server["os-extended-volumes:volumes_attached"]:
             volume_id = server["os-extended-volumes:volumes_attached"][0]["id"]
-            try:
-                diskspace = self.conn.block_storage.get_volume(volume_id).to_dict()[
-                    "size"
-                ]
-            except Exception as e:
-                self.LOG.exception(f"Could not found volume {volume_id}: {e}")
+            if volume_id in volume_sizes:
+                diskspace = volume_sizes[volume_id]
+            else:
+                self.LOG.error(f"Could not found volume {volume_id}")
         flav = self.openstack_flav_to_thrift_flav(server["flavor"])
 
         try:
-            img = self.get_Image_with_Tag(server["image"]["id"])
+            image_id = server["image"]["id"]
+            if images is not None:
+                if image_id not in images:
+                    images[image_id] = self.get_Image_with_Tag(image_id)
+                img = images[image_id]
+            else:
+                img = self.get_Image_with_Tag(image_id)
         except Exception as e:
             self.LOG.exception(e)
             img = None
-        for values in server.addresses.values():
-            for address in values:
-                if address["OS-EXT-IPS:type"] == "floating":
-                    floating_ip = address["addr"]
-                elif address["OS-EXT-IPS:type"] == "fixed":
-                    fixed_ip = address["addr"]
+        fixed_ip, floating_ip = self.get_server_ips(server)
         task = server.task_state
         if task:
             status = task.upper().replace("-", "_")
@@ -1987,18 +2793,70 @@ class VirtualMachineHandler(Iface):
         )
         return server
 
-    def get_servers(self):
-        self.LOG.info("Get all servers")
-        servers = self.conn.list_servers()
-        self.LOG.info(f"Found {len(servers)} servers")
+    def openstack_servers_to_thrift_servers(self, servers: list[Server]) -> list[VM]:
+        """
+        Convert a list of OpenStack servers to thrift VMs.
+
+        Volumes are listed once and joined in memory by id, instead of being
+        fetched separately for every server. The volumes of few servers are
+        looked up in the volume cache instead. Images come from the image
+        catalog and are converted once per image.
+
+        :param servers: List of OpenStack servers
+        :return: List of VM instances
+        """
+        volume_sizes = self.get_attached_volume_sizes(servers)
+        # filled per image id, every image is converted only once
+        images = {}
         server_list = []
         for server in servers:
             try:
-                thrift_server = self.openstack_server_to_thrift_server(server)
-                server_list.append(thrift_server)
-
+                server_list.append(
+                    self.openstack_server_to_thrift_server(
+                        server=server, volume_sizes=volume_sizes, images=images
+                    )
+                )
             except Exception as e:
                 self.LOG.exception(f"Could not transform to thrift_server: {e}")
+        return server_list
+
+    def get_attached_volume_sizes(self, servers: list[Server]) -> dict:
+        """
+        Get the sizes of the first volumes attached to servers.
+
+        :param servers: List of OpenStack servers
+        :return: {volume id: size}, volumes which could not be found are missing
+        """
+        volume_ids = {
+            server["os-extended-volumes:volumes_attached"][0]["id"]
+            for server in servers
+            if server["os-extended-volumes:volumes_attached"]
+        }
+        if len(volume_ids) >= self.BULK_LIST_MIN_IDS:
+            try:
+                return {
+                    volume.id: volume.size
+                    for volume in self.conn.block_storage.volumes(details=True)
+                }
+            except Exception as e:
+                self.LOG.exception(f"Could not list volumes: {e}")
+                return {}
+        volume_sizes = {}
+        for volume_id in volume_ids:
+            try:
+                volume = self.volume_resolver.get(volume_id)
+            except Exception as e:
+                self.LOG.exception(f"Could not get volume {volume_id}: {e}")
+                continue
+            if volume is not None:
+                volume_sizes[volume_id] = volume.size
+        return volume_sizes
+
+    def get_servers(self):
+        self.LOG.info("Get all servers")
+        servers = self.conn.list_servers()
+        self.LOG.info(f"Found {len(servers)} servers")
+        server_list = self.openstack_servers_to_thrift_servers(servers)
         self.LOG.info(f"Converted {len(server_list)} servers to thrift_server objects")
         # self.LOG.info(server_list)
         return server_list
@@ -2036,7 +2894,7 @@ class VirtualMachineHandler(Iface):
         if server is None:
             self.LOG.exception(f"Instance {server_id} not found")
             raise serverNotFoundException
-        sec = self.conn.get_security_group(name_or_id=server.name + "_udp")
+        sec = self.security_group_index.get(server.name + "_udp")
         if sec:
             self.LOG.info(
                 f"UDP Security group with name {server.name + '_udp'} already exists."
@@ -2058,11 +2916,7 @@ class VirtualMachineHandler(Iface):
             return True
 
         server = self.get_server(server_id)
-        server_base = server.fixed_ip.split(".")[-1]
-        ip_base = server.fixed_ip.split(".")[-2]
-        x = int(server_base)  # noqa F841
-        y = int(ip_base)  # noqa F841
-        udp_port = eval(self.UDP_FORMULAR)
+        udp_port = self.UDP_PORT_FORMULA.port_for_ip(server.fixed_ip)
         security_group = self.create_security_group(
             name=server.name + "_udp",
             udp_port=udp_port,
@@ -2108,10 +2962,7 @@ class VirtualMachineHandler(Iface):
     def get_servers_by_bibigrid_id(self, bibigrid_id):
         filters = {"bibigrid_id": bibigrid_id, "name": bibigrid_id}
         servers = self.conn.list_servers(filters=filters)
-        thrift_servers = []
-        for server in servers:
-            thrift_servers.append(self.openstack_server_to_thrift_server(server))
-        return thrift_servers
+        return self.openstack_servers_to_thrift_servers(servers)
 
     def get_vm_ports(self, openstack_id):
         """
@@ -2122,22 +2973,45 @@ class VirtualMachineHandler(Iface):
         """
         self.LOG.info(f"Get IP and PORT for server {openstack_id}")
         server = self.get_server(openstack_id)
-        server_base = server.fixed_ip.split(".")[-1]
-        ip_base = server.fixed_ip.split(".")[-2]
-        x = int(server_base)  # noqa F841
-        y = int(ip_base)  # noqa F841
-        port = eval(self.SSH_FORMULAR)
-        udp_port = eval(self.UDP_FORMULAR)
+        port = self.SSH_PORT_FORMULA.port_for_ip(server.fixed_ip)
+        udp_port = self.UDP_PORT_FORMULA.port_for_ip(server.fixed_ip)
         return {"port": str(port), "udp": str(udp_port)}
 
+    def get_vms_ports(self, openstack_ids):
+        """
+        Get Ports of many servers.
+
+        All servers are listed with a single request and the ports are calculated
+        from their fixed ips, no server is converted to a thrift server.
+
+        :param openstack_ids: Ids of the servers, all servers of the project if empty
+        :return: {openstack_id: {'fixed_ip': ip, 'port': port, 'udp': udp_port}}
+        """
+        self.LOG.info(f"Get IP and PORT for servers {openstack_ids}")
+        wanted_ids = set(openstack_ids) if openstack_ids else None
+        fixed_ips = {}
+        for server in self.conn.list_servers():
+            if wanted_ids is not None and server.id not in wanted_ids:
+                continue
+            fixed_ip, _ = self.get_server_ips(server)
+            if fixed_ip:
+                fixed_ips[server.id] = fixed_ip
+        ips = list(fixed_ips.values())
+        ports = self.SSH_PORT_FORMULA.ports_for_ips(ips)
+        udp_ports = self.UDP_PORT_FORMULA.ports_for_ips(ips)
+        return {
+            openstack_id: {"fixed_ip": fixed_ip, "port": str(port), "udp": str(udp)}
+            for (openstack_id, fixed_ip), port, udp in zip(
+                fixed_ips.items(), ports, udp_ports
+            )
+        }
+
     def terminate_cluster(self, cluster_id):
-        headers = {"content-Type": "application/json"}
         body = {"mode": "openstack"}
-        response = req.delete(
+        response = self.http.delete(
+            BIBIGRID_ENDPOINT,
             url=f"{self.BIBIGRID_URL}terminate/{cluster_id}",
             json=body,
-            headers=headers,
-            verify=self.PRODUCTION,
         )
         self.LOG.info(response.json())
         return response.json()
@@ -2147,12 +3021,9 @@ class VirtualMachineHandler(Iface):
             self.LOG.error(f"Can't get cluster status - no id provided: {cluster_id}")
             return {"info": "ERROR", "msg": "Not found!"}
         self.LOG.info(f"Get Cluster {cluster_id} status")
-        headers = {"content-Type": "application/json"}
         body = {"mode": "openstack"}
         request_url = self.BIBIGRID_URL + "info/" + cluster_id
-        response = req.get(
-            url=request_url, json=body, headers=headers, verify=self.PRODUCTION
-        )
+        response = self.http.get(BIBIGRID_ENDPOINT, url=request_url, json=body)
         json_resp = response.json(strict=False)
         json_resp["log"] = str(json_resp.get("log", ""))
         json_resp["msg"] = str(json_resp.get("msg", ""))
@@ -2167,7 +3038,9 @@ class VirtualMachineHandler(Iface):
             self.LOG.info("Bibigrid EP is not set")
             return False
         try:
-            status = req.get(self.BIBIGIRD_EP + "/server/health").status_code
+            status = self.http.get(
+                BIBIGRID_ENDPOINT, self.BIBIGIRD_EP + "/server/health"
+            ).status_code
             if status == 200:
                 self.LOG.info("Bibigrid Server is available")
                 return True
@@ -2181,28 +3054,23 @@ class VirtualMachineHandler(Iface):
             return False
 
     def get_clusters_info(self):
-        headers = {"content-Type": "application/json"}
         body = {"mode": "openstack"}
         request_url = self.BIBIGRID_URL + "list"
-        response = req.get(
-            url=request_url, json=body, headers=headers, verify=self.PRODUCTION
-        )
+        response = self.http.get(BIBIGRID_ENDPOINT, url=request_url, json=body)
         self.LOG.info(response.json())
         infos = response.json()["info"]
         return infos
 
     def get_active_image_by_os_version(self, os_version, os_distro):
         self.LOG.info(f"Get active Image by os-version: {os_version}")
-        images = self.conn.list_images()
-        for image in images:
+        for image in self.image_catalog.by_os_version(os_version):
             if image and image.status == "active":
-                image_os_version = image.get("os_version", None)
                 image_os_distro = image.get("os_distro", None)
                 properties = image.get("properties", None)
                 base_image_ref = None
                 if properties:
                     base_image_ref = properties.get("base_image_ref", None)
-                if os_version == image_os_version and base_image_ref is None:
+                if base_image_ref is None:
                     if os_distro and os_distro == image_os_distro:
                         return image
                     elif os_distro is None:
@@ -2216,30 +3084,26 @@ class VirtualMachineHandler(Iface):
         if os_version == "18.04":
             os_version = "20.04"
         self.LOG.info(f"Get active Image by os-version: {os_version}")
-        images = self.conn.list_images()
         backup_image = None
-        for image in images:
+        for image in self.image_catalog.by_os_version(os_version):
             if image and image.status == "active":
-                image_os_version = image.get("os_version", None)
                 image_os_distro = image.get("os_distro", None)
-                properties = image.get("properties", None)
-                if os_version == image_os_version and "worker" in image.get("tags", []):
+                if "worker" in image.get("tags", []):
                     if os_distro and os_distro == image_os_distro:
                         backup_image = image
-                        if properties.get("slurm_version" == slurm_version):
-                            return image
+        for image in self.image_catalog.by_slurm_version(slurm_version):
+            if (
+                image.status == "active"
+                and image.get("os_version", None) == os_version
+                and image.get("os_distro", None) == os_distro
+                and "worker" in image.get("tags", [])
+            ):
+                return image
 
         return backup_image
 
     def create_deactivate_update_script(self):
-        fileDir = os.path.dirname(os.path.abspath(__file__))
-        deactivate_update_script_file = os.path.join(fileDir, "scripts/bash/mount.sh")
-        with open(deactivate_update_script_file, "r") as file:
-            deactivate_update_script = file.read()
-            deactivate_update_script = encodeutils.safe_encode(
-                deactivate_update_script.encode("utf-8")
-            )
-        return deactivate_update_script
+        return self.script_templates.render("deactive_auto_update.sh")
 
     def add_cluster_machine(
         self,
@@ -2317,7 +3181,7 @@ class VirtualMachineHandler(Iface):
                 image=openstack_image.id,
                 flavor=flavor.id,
                 network=[network.id],
-                userdata=self.BIBIGRID_DEACTIVATE_UPRADES_SCRIPT,
+                userdata=self.create_deactivate_update_script(),
                 key_name=new_key_name,
                 meta=metadata,
                 security_groups=cluster_group_id,
@@ -2325,6 +3189,7 @@ class VirtualMachineHandler(Iface):
             self.LOG.info(f"Created cluster machine:{server['id']}")
         except Exception as e:
             self.LOG.exception(f"Could no create cluster machine - {name}")
+            self.refresh_resolvers_after(e)
             self.delete_keypair(new_key_name)
             raise otherException(Reason=str(e))
         self.delete_keypair(new_key_name)
@@ -2375,7 +3240,6 @@ class VirtualMachineHandler(Iface):
         for wk in worker_instances:
             self.LOG.info(wk)
             wI.append(wk.__dict__)
-        headers = {"content-Type": "application/json"}
         body = {
             "mode": "openstack",
             "subnet": self.SUB_NETWORK,
@@ -2391,9 +3255,7 @@ class VirtualMachineHandler(Iface):
         for mode in self.BIBIGRID_MODES:
             body.update({mode: True})
         request_url = self.BIBIGRID_URL + "create"
-        response = req.post(
-            url=request_url, json=body, headers=headers, verify=self.PRODUCTION
-        )
+        response = self.http.post(BIBIGRID_ENDPOINT, url=request_url, json=body)
         self.LOG.info(response.json())
         return response.json()
 
@@ -2449,6 +3311,7 @@ class VirtualMachineHandler(Iface):
                     f"Could not add Tag {elixir_id} to Snapshot: {snapshot_id}"
                 )
                 return None
+            self.image_catalog.invalidate()
 
             return snapshot_id
         except Exception as e:
@@ -2474,6 +3337,7 @@ class VirtualMachineHandler(Iface):
                 self.LOG.exception(f"Image {image} not found!")
                 raise imageNotFoundException(Reason=f"Image {image} not found")
             self.conn.compute.delete_image(image)
+            self.image_catalog.invalidate()
             return True
         except Exception as e:
             self.LOG.exception(f"Delete Image {image_id} error : {e}")
@@ -2552,40 +3416,89 @@ class VirtualMachineHandler(Iface):
                 self.LOG.info(f"Connection to {host}:{port} timed out")
                 return False
 
-    def is_security_group_in_use(self, security_group_id):
-        self.LOG.info(f"Checking if security group [{security_group_id}] is in use")
-
+    def is_security_group_in_use(self, security_group_id, cache=None):
         """
         Checks if a security group is still in use.
-    
-        :param conn: An instance of `openstack.connection.Connection`.
+
+        A security group is in use as long as a port has it, which covers
+        servers of all projects as well as load balancers.
+
         :param security_group_id: The ID of the security group to check.
+        :param cache: Optional dict {security_group_id: in use} of earlier checks
         :returns: True if the security group is still in use, False otherwise.
         """
-        # First, get a list of all instances using the security group
-        instances = self.conn.compute.servers(
-            details=True,
-            search_opts={"all_tenants": True, "security_group": security_group_id},
+        if cache is not None and security_group_id in cache:
+            return cache[security_group_id]
+        self.LOG.info(f"Checking if security group [{security_group_id}] is in use")
+        ports = self.conn.network.ports(
+            security_group_ids=[security_group_id], fields="id", limit=1
         )
+        in_use = next(iter(ports), None) is not None
+        if cache is not None:
+            cache[security_group_id] = in_use
+        return in_use
 
-        # If any instances are using the security group, return True
-        if instances:
-            return True
-
-        # Otherwise, check if the security group is still associated with any ports
-        ports = self.conn.network.ports(security_group_id=security_group_id)
-        if ports:
-            return True
+    def delete_server_async(self, openstack_id):
+        """
+        Delete a server in the background.
 
-        # Finally, check if the security group is still associated with any load balancers
-        load_balancers = self.conn.network.load_balancers(
-            security_group_id=security_group_id
+        :param openstack_id: Id of the server
+        :return: Id of the delete job, see get_job_status
+        """
+        return self.job_manager.submit(
+            job_type="delete_server",
+            target=openstack_id,
+            function=self.delete_server,
+            args=(openstack_id,),
         )
-        if load_balancers:
-            return True
 
-        # If none of the above are true, the security group is no longer in use
-        return False
+    def delete_servers_async(self, openstack_ids):
+        """
+        Delete many servers in the background.
+
+        :param openstack_ids: Ids of the servers
+        :return: {openstack_id: id of the delete job}
+        """
+        return {
+            openstack_id: self.delete_server_async(openstack_id)
+            for openstack_id in openstack_ids
+        }
+
+    def get_job_status(self, job_id):
+        """
+        Get the state of a background job.
+
+        :param job_id: Id of the job
+        :return: {'job_id', 'type', 'target', 'status', 'result', 'error',
+                'created_at', 'updated_at'}. The status is QUEUED, RUNNING,
+                DONE, FAILED or NOT_FOUND for unknown or expired jobs.
+        """
+        return self.get_jobs_status([job_id])[job_id]
+
+    def get_jobs_status(self, job_ids):
+        """
+        Get the state of many background jobs.
+
+        :param job_ids: Ids of the jobs
+        :return: {job_id: state of the job, see get_job_status}
+        """
+        return {
+            job_id: job or {"job_id": job_id, "status": self.NOT_FOUND}
+            for job_id, job in self.job_manager.get_many(job_ids).items()
+        }
+
+    def acknowledge_job(self, job_id):
+        """
+        Acknowledge the result of a background job.
+
+        Secret parts of the result, like a private key, are deleted and not
+        returned by get_job_status anymore.
+
+        :param job_id: Id of the job
+        :return: True if the job exists, False if it is unknown or expired
+        """
+        self.LOG.info(f"Acknowledge job {job_id}")
+        return self.job_manager.acknowledge(job_id)
 
     def delete_server(self, openstack_id):
         """
@@ -2595,6 +3508,7 @@ class VirtualMachineHandler(Iface):
         :return: True if deleted, False if not
         """
         self.LOG.info(f"Delete Server {openstack_id}")
+        self.playbook_executor.remove(openstack_id)
         try:
             server = self.conn.get_server(name_or_id=openstack_id)
 
@@ -2620,6 +3534,7 @@ class VirtualMachineHandler(Iface):
                 raise ConflictException("task_state in image creating")
             security_groups = self.conn.list_server_security_groups(server=server)
             if security_groups is not None:
+                in_use_cache = {}
                 for sg in security_groups:
                     self.conn.compute.remove_security_group_from_server(
                         server=server, security_group=sg
@@ -2629,12 +3544,20 @@ class VirtualMachineHandler(Iface):
                         sg["name"] != self.DEFAULT_SECURITY_GROUP_NAME
                         and "bibigrid" not in sg["name"]
                         and not self.is_security_group_in_use(
-                            security_group_id=sg["id"]
+                            security_group_id=sg["id"], cache=in_use_cache
                         )
                     ):
                         self.LOG.info(f"Delete security group {sg['name']}")
-
-                        self.conn.delete_security_group(name_or_id=sg)
+                        try:
+                            self.conn.delete_security_group(name_or_id=sg["id"])
+                            self.security_group_index.remove(sg)
+                        except Exception as e:
+                            # e.g. still referenced by rules of another group
+                            self.LOG.warning(
+                                f"Could not delete security group {sg['name']}: {e}"
+                            )
+                        # deleted or not, don't try again for duplicates
+                        in_use_cache[sg["id"]] = True
 
             self.conn.compute.delete_server(server=server, force=True)
             return True
@@ -2789,7 +3712,7 @@ class VirtualMachineHandler(Iface):
 
     def create_or_get_default_ssh_security_group(self):
         self.LOG.info("Get default SimpleVM SSH Security Group")
-        sec = self.conn.get_security_group(name_or_id=self.DEFAULT_SECURITY_GROUP_NAME)
+        sec = self.security_group_index.get(self.DEFAULT_SECURITY_GROUP_NAME)
         if not sec:
             self.LOG.info("Default SimpleVM SSH Security group not found... Creating")
 
@@ -2799,6 +3722,53 @@ class VirtualMachineHandler(Iface):
                 description="Default SSH SimpleVM Security Group",
             )
 
+    @staticmethod
+    def security_group_rules(
+        security_group_id,
+        protocol,
+        port,
+        remote_group_id=None,
+        direction="ingress",
+        ipv6=False,
+    ):
+        """
+        Specs of the rules opening a port.
+
+        :param security_group_id: Id of the security group the rules belong to
+        :param protocol: Protocol of the port, e.g. tcp
+        :param port: Port to open
+        :param remote_group_id: Only allow traffic from this security group
+        :param direction: ingress or egress
+        :param ipv6: If an IPv6 rule is added to the IPv4 rule
+        :return: List of rule specs
+        """
+        rule = {
+            "direction": direction,
+            "ethertype": "IPv4",
+            "protocol": protocol,
+            "port_range_min": port,
+            "port_range_max": port,
+            "security_group_id": security_group_id,
+        }
+        if remote_group_id:
+            rule["remote_group_id"] = remote_group_id
+        rules = [rule]
+        if ipv6:
+            rules.append(dict(rule, ethertype="IPv6"))
+        return rules
+
+    def create_security_group_rules(self, rules):
+        """
+        Create security group rules in a single request.
+
+        :param rules: Rule specs, see security_group_rules
+        :return: List of the created rules
+        """
+        if not rules:
+            return []
+        self.LOG.info(f"Create {len(rules)} security group rules")
+        return list(self.conn.network.create_security_group_rules(rules))
+
     def create_security_group(
         self,
         name,
@@ -2811,120 +3781,81 @@ class VirtualMachineHandler(Iface):
         resenv=[],
     ):
         self.LOG.info(f"Create new security group {name}")
-        sec = self.conn.get_security_group(name_or_id=name)
-        if sec:
-            self.LOG.info(f"Security group with name {name} already exists.")
-            return sec
-        new_security_group = self.conn.create_security_group(
-            name=name, description=description
-        )
-        self.LOG.info(new_security_group)
-        if http:
-            self.LOG.info(f"Add http rule to security group {name}")
-            self.conn.network.create_security_group_rule(
-                direction="ingress",
-                protocol="tcp",
-                port_range_max=80,
-                port_range_min=80,
-                security_group_id=new_security_group["id"],
-            )
-            self.conn.network.create_security_group_rule(
-                direction="ingress",
-                ether_type="IPv6",
-                protocol="tcp",
-                port_range_max=80,
-                port_range_min=80,
-                security_group_id=new_security_group["id"],
-            )
-
-        if https:
-            self.LOG.info(f"Add https rule to security group {name}")
-
-            self.conn.network.create_security_group_rule(
-                direction="ingress",
-                protocol="tcp",
-                port_range_max=443,
-                port_range_min=443,
-                security_group_id=new_security_group["id"],
-            )
-            self.conn.network.create_security_group_rule(
-                direction="ingress",
-                ether_type="IPv6",
-                protocol="tcp",
-                port_range_max=443,
-                port_range_min=443,
-                security_group_id=new_security_group["id"],
-            )
-        if udp:
-            self.LOG.info(
-                "Add udp rule port {} to security group {} ({})".format(
-                    udp_port,
-                    name,
-                    new_security_group["id"],
+        with self.security_group_index.lock(name):
+            sec = self.security_group_index.get(name)
+            if sec:
+                self.LOG.info(f"Security group with name {name} already exists.")
+                return sec
+            new_security_group = self.conn.create_security_group(
+                name=name, description=description
+            )
+            self.security_group_index.add(new_security_group)
+            self.LOG.info(new_security_group)
+            rules = []
+            if http:
+                self.LOG.info(f"Add http rule to security group {name}")
+                rules += self.security_group_rules(
+                    security_group_id=new_security_group["id"],
+                    protocol="tcp",
+                    port=80,
+                    ipv6=True,
                 )
-            )
-
-            self.conn.network.create_security_group_rule(
-                direction="ingress",
-                protocol="udp",
-                port_range_max=udp_port,
-                port_range_min=udp_port,
-                security_group_id=new_security_group["id"],
-                remote_group_id=self.GATEWAY_SECURITY_GROUP_ID,
-            )
-            self.conn.network.create_security_group_rule(
-                direction="ingress",
-                ether_type="IPv6",
-                protocol="udp",
-                port_range_max=udp_port,
-                port_range_min=udp_port,
-                security_group_id=new_security_group["id"],
-                remote_group_id=self.GATEWAY_SECURITY_GROUP_ID,
-            )
-        if ssh:
-            self.LOG.info(f"Add ssh rule to security group {name}")
-
-            self.conn.network.create_security_group_rule(
-                direction="ingress",
-                protocol="tcp",
-                port_range_max=22,
-                port_range_min=22,
-                security_group_id=new_security_group["id"],
-                remote_group_id=self.GATEWAY_SECURITY_GROUP_ID,
-            )
-            self.conn.network.create_security_group_rule(
-                direction="ingress",
-                ether_type="IPv6",
-                protocol="tcp",
-                port_range_max=22,
-                port_range_min=22,
-                security_group_id=new_security_group["id"],
-                remote_group_id=self.GATEWAY_SECURITY_GROUP_ID,
-            )
-        for research_enviroment in resenv:
-            if research_enviroment in self.loaded_resenv_metadata:
+            if https:
+                self.LOG.info(f"Add https rule to security group {name}")
+                rules += self.security_group_rules(
+                    security_group_id=new_security_group["id"],
+                    protocol="tcp",
+                    port=443,
+                    ipv6=True,
+                )
+            if udp:
                 self.LOG.info(
-                    "Add " + research_enviroment + f" rule to security group {name}"
+                    "Add udp rule port {} to security group {} ({})".format(
+                        udp_port,
+                        name,
+                        new_security_group["id"],
+                    )
                 )
-                resenv_metadata = self.loaded_resenv_metadata[research_enviroment]
-                self.conn.network.create_security_group_rule(
-                    direction=resenv_metadata.direction,
-                    protocol=resenv_metadata.protocol,
-                    port_range_max=resenv_metadata.port,
-                    port_range_min=resenv_metadata.port,
+                rules += self.security_group_rules(
                     security_group_id=new_security_group["id"],
-                    remote_group_id=self.FORC_REMOTE_ID,
+                    protocol="udp",
+                    port=udp_port,
+                    remote_group_id=self.GATEWAY_SECURITY_GROUP_ID,
+                    ipv6=True,
                 )
-            # as MOSH is persisted as "optional" in resenv
-
-            elif research_enviroment not in ["user_key_url", "optional"]:
-                # Todo add mail for this self.LOGging as this should not happen
-                self.LOG.error(
-                    "Error: Could not find metadata for research enviroment: "
-                    + research_enviroment
+            if ssh:
+                self.LOG.info(f"Add ssh rule to security group {name}")
+                rules += self.security_group_rules(
+                    security_group_id=new_security_group["id"],
+                    protocol="tcp",
+                    port=22,
+                    remote_group_id=self.GATEWAY_SECURITY_GROUP_ID,
+                    ipv6=True,
                 )
+            for research_enviroment in resenv:
+                if research_enviroment in self.loaded_resenv_metadata:
+                    self.LOG.info(
+                        "Add " + research_enviroment + f" rule to security group {name}"
+                    )
+                    resenv_metadata = self.loaded_resenv_metadata[research_enviroment]
+                    rules += self.security_group_rules(
+                        security_group_id=new_security_group["id"],
+                        protocol=resenv_metadata.protocol,
+                        port=resenv_metadata.port,
+                        remote_group_id=self.FORC_REMOTE_ID,
+                        direction=resenv_metadata.direction,
+                    )
+                # as MOSH is persisted as "optional" in resenv
 
-        return new_security_group
+                elif research_enviroment not in ["user_key_url", "optional"]:
+                    # Todo add mail for this self.LOGging as this should not happen
+                    self.LOG.error(
+                        "Error: Could not find metadata for research enviroment: "
+                        + research_enviroment
+                    )
+            self.create_security_group_rules(rules)
+
+            return new_security_group
 
     def get_limits(self):
         """
@@ -2998,6 +3929,7 @@ class VirtualMachineHandler(Iface):
             and os.path.isdir(os.path.join(PLAYBOOKS_DIR, name))
         ]
         self.LOG.info(self.ALL_TEMPLATES)
+        self.playbook_templates.refresh()
 
         templates_metadata = self.load_resenv_metadata()
         for template_metadata in templates_metadata:
@@ -3075,32 +4007,34 @@ class VirtualMachineHandler(Iface):
         self.LOG.info(
             f"Check if Security Group for resenv - {resenv_metadata.security_group_name} exists... "
         )
-        sec = self.conn.get_security_group(
-            name_or_id=resenv_metadata.security_group_name
-        )
-        if sec:
+        with self.security_group_index.lock(resenv_metadata.security_group_name):
+            sec = self.security_group_index.get(resenv_metadata.security_group_name)
+            if sec:
+                self.LOG.info(
+                    f"Security group {resenv_metadata.security_group_name} already exists."
+                )
+                return sec["id"]
+
             self.LOG.info(
-                f"Security group {resenv_metadata.security_group_name} already exists."
+                f"No security Group for {resenv_metadata.security_group_name} exists. Creating.. "
             )
-            return sec["id"]
-
-        self.LOG.info(
-            f"No security Group for {resenv_metadata.security_group_name} exists. Creating.. "
-        )
 
-        new_security_group = self.conn.create_security_group(
-            name=resenv_metadata.security_group_name, description=resenv_metadata.name
-        )
+            new_security_group = self.conn.create_security_group(
+                name=resenv_metadata.security_group_name,
+                description=resenv_metadata.name,
+            )
+            self.security_group_index.add(new_security_group)
 
-        self.conn.network.create_security_group_rule(
-            direction=resenv_metadata.direction,
-            protocol=resenv_metadata.protocol,
-            port_range_max=resenv_metadata.port,
-            port_range_min=resenv_metadata.port,
-            security_group_id=new_security_group["id"],
-            remote_group_id=self.FORC_REMOTE_ID,
-        )
-        return new_security_group["id"]
+            self.create_security_group_rules(
+                self.security_group_rules(
+                    security_group_id=new_security_group["id"],
+                    protocol=resenv_metadata.protocol,
+                    port=resenv_metadata.port,
+                    remote_group_id=self.FORC_REMOTE_ID,
+                    direction=resenv_metadata.direction,
+                )
+            )
+            return new_security_group["id"]
 
     def update_forc_allowed(self, template_metadata):
         if template_metadata["needs_forc_support"]:
@@ -3111,11 +4045,10 @@ class VirtualMachineHandler(Iface):
                     f"{self.RE_BACKEND_URL}{self.TEMPLATES_URL}/{name}/{forc_version}"
                 )
                 try:
-                    response = req.get(
+                    response = self.http.get(
+                        FORC_ENDPOINT,
                         get_url,
                         timeout=(30, 30),
-                        headers={"X-API-KEY": self.FORC_API_KEY},
-                        verify=self.FORC_HTTPS,
                     )
                     if response.status_code == 200:
                         allowed_versions.append(forc_version)
@@ -3125,3 +4058,4 @@ class VirtualMachineHandler(Iface):
             allowed_versions.sort(key=LooseVersion)
             allowed_versions.reverse()
             self.FORC_ALLOWED[name] = allowed_versions
+            self.invalidate_forc_templates()
@@ -12,13 +12,17 @@ except Exception as e:
     print(e)
     from VirtualMachineHandler import VirtualMachineHandler
 
+import queue
 import signal
 import ssl
+import threading
+import time
 
 import click
 import yaml
 from thrift.protocol import TBinaryProtocol
-from thrift.server import TServer
+from thrift.server import TNonblockingServer, TServer
+from thrift.Thrift import TApplicationException, TMessageType, TType
 from thrift.transport import TSocket, TSSLSocket, TTransport
 
 USERNAME = "OS_USERNAME"
@@ -30,6 +34,11 @@ AUTH_URL = "OS_AUTH_URL"
 PROJECT_DOMAIN_ID = "OS_PROJECT_DOMAIN_ID"
 FORC_API_KEY = "FORC_API_KEY"
 
+SERVER_MODE_THREADPOOL = "threadpool"
+SERVER_MODE_NONBLOCKING = "nonblocking"
+DEFAULT_MAX_QUEUE_SIZE = 100
+STATS_LOG_INTERVAL = 60
+
 environment_variables = [
     USERNAME,
     PASSWORD,
@@ -42,30 +51,118 @@ environment_variables = [
 ]
 
 
-@click.command()
-@click.argument("config")
-def startServer(config):
-    def catch_shutdown(signal, frame):
-        click.echo(f"Caught SIGTERM. Shutting down. Signal: {signal} Frame: {frame}")
-        handler.keyboard_interrupt_handler_playbooks()
-        click.echo("SIGTERM was handled. Exiting with Exitcode: -1.")
-        sys.exit(-1)
-
-    signal.signal(signal.SIGTERM, catch_shutdown)
-    click.echo("Start Cloud-Client-Portal Server")
-
-    CONFIG_FILE = config
-    with open(CONFIG_FILE, "r") as ymlfile:
-        cfg = yaml.load(ymlfile, Loader=yaml.SafeLoader)
-        HOST = cfg["openstack_connection"]["host"]
-        PORT = cfg["openstack_connection"]["port"]
-        USE_SSL = cfg["openstack_connection"].get("use_ssl", True)
-        if USE_SSL:
-            CERTFILE = cfg["openstack_connection"]["certfile"]
-            CA_CERTS_PATH = cfg["openstack_connection"].get("ca_certs_path", None)
-        THREADS = cfg["openstack_connection"]["threads"]
-    click.echo(f"Server is running on port {PORT}")
-    handler = VirtualMachineHandler(CONFIG_FILE)
+class BoundedTaskQueue(queue.Queue):
+    """
+    Task queue of the non-blocking server with a maximum size.
+
+    If the queue is full, a request is answered right away with a
+    TApplicationException instead of being queued.
+    """
+
+    def __init__(self, maxsize):
+        super().__init__(maxsize=maxsize)
+        self.rejected = 0
+
+    def put(self, item, block=True, timeout=None):
+        processor, iprot, oprot, otrans, callback = item
+        if processor is None:
+            # shutdown marker for the workers
+            return super().put(item, block, timeout)
+        try:
+            super().put(item, block=False)
+        except queue.Full:
+            self.rejected += 1
+            self.reject(iprot, oprot, otrans, callback)
+
+    @staticmethod
+    def reject(iprot, oprot, otrans, callback):
+        try:
+            name, _, seqid = iprot.readMessageBegin()
+            iprot.skip(TType.STRUCT)
+            iprot.readMessageEnd()
+            error = TApplicationException(
+                TApplicationException.INTERNAL_ERROR,
+                "Server is busy, request was rejected",
+            )
+            oprot.writeMessageBegin(name, TMessageType.EXCEPTION, seqid)
+            error.write(oprot)
+            oprot.writeMessageEnd()
+            callback(True, otrans.getvalue())
+        except Exception:
+            callback(False, b"")
+
+
+class BoundedNonblockingServer(TNonblockingServer.TNonblockingServer):
+    """
+    Non-blocking server which multiplexes all connections in one thread.
+
+    The requests are processed by a fixed number of worker threads. The
+    number of waiting requests is bounded, requests beyond it are rejected.
+    Clients have to use the framed transport.
+    """
+
+    def __init__(
+        self,
+        processor,
+        lsocket,
+        inputProtocolFactory=None,
+        outputProtocolFactory=None,
+        threads=10,
+        max_queue_size=DEFAULT_MAX_QUEUE_SIZE,
+    ):
+        super().__init__(
+            processor, lsocket, inputProtocolFactory, outputProtocolFactory, threads
+        )
+        self.tasks = BoundedTaskQueue(maxsize=max_queue_size)
+
+    def stats(self):
+        return {
+            "server_mode": SERVER_MODE_NONBLOCKING,
+            "queue_depth": self.tasks.qsize(),
+            "max_queue_size": self.tasks.maxsize,
+            "rejected": self.tasks.rejected,
+        }
+
+
+def log_server_stats(server, logger, interval=STATS_LOG_INTERVAL):
+    def log_stats():
+        while True:
+            time.sleep(interval)
+            stats = server.stats()
+            logger.info(
+                f"Queue depth: {stats['queue_depth']}/{stats['max_queue_size']} "
+                f"- Rejected requests: {stats['rejected']}"
+            )
+
+    threading.Thread(target=log_stats, name="server-stats", daemon=True).start()
+
+
+def create_server(cfg, handler):
+    """
+    Create the Thrift server of a handler.
+
+    :param cfg: Loaded config with the openstack_connection section
+    :param handler: VirtualMachineHandler serving the requests
+    :return: The server, not serving yet
+    """
+    HOST = cfg["openstack_connection"]["host"]
+    PORT = cfg["openstack_connection"]["port"]
+    USE_SSL = cfg["openstack_connection"].get("use_ssl", True)
+    if USE_SSL:
+        CERTFILE = cfg["openstack_connection"]["certfile"]
+        CA_CERTS_PATH = cfg["openstack_connection"].get("ca_certs_path", None)
+    THREADS = cfg["openstack_connection"]["threads"]
+    SERVER_MODE = cfg["openstack_connection"].get("server_mode", SERVER_MODE_THREADPOOL)
+    MAX_QUEUE_SIZE = cfg["openstack_connection"].get(
+        "max_queue_size", DEFAULT_MAX_QUEUE_SIZE
+    )
+    if USE_SSL and SERVER_MODE == SERVER_MODE_NONBLOCKING:
+        # the non-blocking server can not complete TLS handshakes and reads
+        click.echo(
+            f"ERROR: server_mode {SERVER_MODE_NONBLOCKING} does not support SSL. "
+            f"Use {SERVER_MODE_THREADPOOL} or set use_ssl to False."
+        )
+        sys.exit(1)
     processor = Processor(handler)
     if USE_SSL:
         click.echo("Use SSL")
@@ -81,14 +178,50 @@ def startServer(config):
     else:
         click.echo("Does not use SSL")
         transport = TSocket.TServerSocket(host=HOST, port=PORT)
-    tfactory = TTransport.TBufferedTransportFactory()
     pfactory = TBinaryProtocol.TBinaryProtocolFactory()
-    server = TServer.TThreadPoolServer(
-        processor, transport, tfactory, pfactory, daemon=True
-    )
-    server.setNumThreads(THREADS)
-    click.echo(f"Started with {THREADS} threads!")
+    if SERVER_MODE == SERVER_MODE_NONBLOCKING:
+        server = BoundedNonblockingServer(
+            processor,
+            transport,
+            pfactory,
+            threads=THREADS,
+            max_queue_size=MAX_QUEUE_SIZE,
+        )
+        handler.server_stats = server.stats
+        log_server_stats(server, handler.LOG)
+        click.echo(
+            f"Started non-blocking server with {THREADS} threads "
+            f"and a queue of {MAX_QUEUE_SIZE} requests!"
+        )
+    else:
+        tfactory = TTransport.TBufferedTransportFactory()
+        server = TServer.TThreadPoolServer(
+            processor, transport, tfactory, pfactory, daemon=True
+        )
+        server.setNumThreads(THREADS)
+        handler.server_stats = lambda: {"server_mode": SERVER_MODE_THREADPOOL}
+        click.echo(f"Started with {THREADS} threads!")
+    return server
+
 
+@click.command()
+@click.argument("config")
+def startServer(config):
+    def catch_shutdown(signal, frame):
+        click.echo(f"Caught SIGTERM. Shutting down. Signal: {signal} Frame: {frame}")
+        handler.keyboard_interrupt_handler_playbooks()
+        click.echo("SIGTERM was handled. Exiting with Exitcode: -1.")
+        sys.exit(-1)
+
+    signal.signal(signal.SIGTERM, catch_shutdown)
+    click.echo("Start Cloud-Client-Portal Server")
+
+    CONFIG_FILE = config
+    with open(CONFIG_FILE, "r") as ymlfile:
+        cfg = yaml.load(ymlfile, Loader=yaml.SafeLoader)
+    click.echo(f"Server is running on port {cfg['openstack_connection']['port']}")
+    handler = VirtualMachineHandler(CONFIG_FILE)
+    server = create_server(cfg, handler)
     server.serve()
 
 
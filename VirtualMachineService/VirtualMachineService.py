@@ -813,6 +813,268 @@ class Iface(object):
         """
         pass
 
+    def get_vms_ports(self, openstack_ids):
+        """
+        Get Ip and Ports of many servers
+        Returns:  {openstack_id: {'fixed_ip': ip, 'port': port, 'udp': udp}}
+
+        Parameters:
+         - openstack_ids: Ids of the servers, all servers of the project if empty
+
+        """
+        pass
+
+    def get_playbook_log_chunk(self, openstack_id, stream, offset, max_bytes):
+        """
+        Get a chunk of the log of a playbook run, starting at a byte offset.
+        Returns: {'data': chunk, 'next_offset': offset to continue with,
+                  'eof': 'true' if the end of the log was reached,
+                  'running': 'true' if the playbook is still running}
+
+        Parameters:
+         - openstack_id: Id of the server the playbook runs for
+         - stream: stdout or stderr
+         - offset: Byte offset to start reading at
+         - max_bytes: Maximum size of the chunk in bytes
+
+        """
+        pass
+
+    def check_servers_status(self, openstack_ids):
+        """
+        Check status of many servers.
+        Returns: List of server instances, in the order of openstack_ids
+
+        Parameters:
+         - openstack_ids: Ids of the servers
+
+        """
+        pass
+
+    def delete_server_async(self, openstack_id):
+        """
+        Delete a server in the background.
+        Returns: Id of the delete job
+
+        Parameters:
+         - openstack_id: Id of the server
+
+        """
+        pass
+
+    def delete_servers_async(self, openstack_ids):
+        """
+        Delete many servers in the background.
+        Returns: {openstack_id: id of the delete job}
+
+        Parameters:
+         - openstack_ids: Ids of the servers
+
+        """
+        pass
+
+    def get_job_status(self, job_id):
+        """
+        Get the state of a background job.
+        Returns: {'job_id', 'type', 'target', 'status', 'result', 'error', 'created_at', 'updated_at'}
+                 status is QUEUED, RUNNING, DONE, FAILED or NOT_FOUND
+
+        Parameters:
+         - job_id: Id of the job
+
+        """
+        pass
+
+    def get_jobs_status(self, job_ids):
+        """
+        Get the state of many background jobs.
+        Returns: {job_id: state of the job, see get_job_status}
+
+        Parameters:
+         - job_ids: Ids of the jobs
+
+        """
+        pass
+
+    def start_server_async(
+        self,
+        flavor,
+        image,
+        public_key,
+        servername,
+        metadata,
+        diskspace,
+        volumename,
+        https,
+        http,
+        resenv,
+        idempotency_key,
+    ):
+        """
+        Start a new server in the background.
+        Returns: Id of the launch job, see get_job_status. Its result is the result of start_server
+
+        Parameters:
+         - flavor: Name of the  Flavor to use.
+         - image: Name of the image to use.
+         - public_key: Public Key to use
+         - servername: Name for the new server
+         - metadata: Metadata for the new instance
+         - diskspace: Diskspace in GB for additional volume.
+         - volumename: Name of additional Volume
+         - https: Boolean for https security rule
+         - http: Boolean for http security rule
+         - resenv: Names of the research environments
+         - idempotency_key: Key of the request, retries with the same key get the job of the first request
+
+        """
+        pass
+
+    def start_server_with_custom_key_async(
+        self,
+        flavor,
+        image,
+        servername,
+        metadata,
+        http,
+        https,
+        resenv,
+        volume_ids_path_new,
+        volume_ids_path_attach,
+        idempotency_key,
+    ):
+        """
+        Start a new server with custom key for ansible in the background.
+        Returns: Id of the launch job, see get_job_status. Its result is the result of start_server_with_custom_key. The private key is part of the result until the job is acknowledged with acknowledge_job
+
+        Parameters:
+         - flavor: Name of the  Flavor to use.
+         - image: Name of the image to use.
+         - servername: Name for the new server
+         - metadata: Metadata for the new instance
+         - http: Boolean for http security rule
+         - https: Boolean for https security rule
+         - resenv: Names of the research environments
+         - volume_ids_path_new: Volumes to format and mount
+         - volume_ids_path_attach: Volumes to mount
+         - idempotency_key: Key of the request, retries with the same key get the job of the first request
+
+        """
+        pass
+
+    def start_server_without_playbook_async(
+        self,
+        flavor,
+        image,
+        public_key,
+        servername,
+        metadata,
+        https,
+        http,
+        resenv,
+        volume_ids_path_new,
+        volume_ids_path_attach,
+        additional_keys,
+        idempotency_key,
+    ):
+        """
+        Start a new server without playbook in the background.
+        Returns: Id of the launch job, see get_job_status. Its result is the result of start_server_without_playbook
+
+        Parameters:
+         - flavor: Name of the  Flavor to use.
+         - image: Name of the image to use.
+         - public_key: Public Key to use
+         - servername: Name for the new server
+         - metadata: Metadata for the new instance
+         - https: Boolean for https security rule
+         - http: Boolean for http security rule
+         - resenv: Names of the research environments
+         - volume_ids_path_new: Volumes to format and mount
+         - volume_ids_path_attach: Volumes to mount
+         - additional_keys: Additional public keys to add
+         - idempotency_key: Key of the request, retries with the same key get the job of the first request
+
+        """
+        pass
+
+    def start_server_with_mounted_volume_async(
+        self,
+        flavor,
+        image,
+        public_key,
+        servername,
+        metadata,
+        https,
+        http,
+        resenv,
+        volume_ids_path_new,
+        volume_ids_path_attach,
+        idempotency_key,
+    ):
+        """
+        Start a new server with volumes in the background.
+        Returns: Id of the launch job, see get_job_status. Its result is the result of start_server_with_mounted_volume
+
+        Parameters:
+         - flavor: Name of the  Flavor to use.
+         - image: Name of the image to use.
+         - public_key: Public Key to use
+         - servername: Name for the new server
+         - metadata: Metadata for the new instance
+         - https: Boolean for https security rule
+         - http: Boolean for http security rule
+         - resenv: Names of the research environments
+         - volume_ids_path_new: Volumes to format and mount
+         - volume_ids_path_attach: Volumes to mount
+         - idempotency_key: Key of the request, retries with the same key get the job of the first request
+
+        """
+        pass
+
+    def start_servers_with_custom_key(
+        self, flavor, image, servernames, metadatas, http, https, resenv
+    ):
+        """
+        Start many servers with custom keys from one spec, e.g. for a course.
+        The image, flavor, network and security groups are resolved once.
+        Returns: List in the order of servernames, with
+                 {'servername', 'openstackid', 'private_key'} for started servers
+                 and {'servername', 'error'} for servers which failed to start
+
+        Parameters:
+         - flavor: Name of the  Flavor to use.
+         - image: Name of the image to use.
+         - servernames: Names of the new servers
+         - metadatas: Metadata of the new servers, in the order of servernames
+         - http: Boolean for http security rule
+         - https: Boolean for https security rule
+         - resenv: Names of the research environments
+
+        """
+        pass
+
+    def acknowledge_job(self, job_id):
+        """
+        Acknowledge the result of a background job.
+        Secret parts of the result, like a private key, are deleted and not returned by get_job_status anymore.
+        Returns: True if the job exists, False if it is unknown or expired
+
+        Parameters:
+         - job_id: Id of the job
+
+        """
+        pass
+
+    def get_server_stats(self):
+        """
+        Get the statistics of the Thrift server, e.g. for monitoring.
+        Returns: {'server_mode', 'queue_depth', 'max_queue_size', 'rejected'}
+                 the queue statistics are only known in the nonblocking server mode
+
+        """
+        pass
+
 
 class Client(Iface):
     """
@@ -3864,803 +4126,3328 @@ class Client(Iface):
             TApplicationException.MISSING_RESULT, "reboot_server failed: unknown result"
         )
 
+    def get_vms_ports(self, openstack_ids):
+        """
+        Get Ip and Ports of many servers
+        Returns:  {openstack_id: {'fixed_ip': ip, 'port': port, 'udp': udp}}
 
-class Processor(Iface, TProcessor):
-    def __init__(self, handler):
-        self._handler = handler
-        self._processMap = {}
-        self._processMap["check_Version"] = Processor.process_check_Version
-        self._processMap["get_client_version"] = Processor.process_get_client_version
-        self._processMap["get_gateway_ip"] = Processor.process_get_gateway_ip
-        self._processMap["get_calculation_formulars"] = (
-            Processor.process_get_calculation_formulars
-        )
-        self._processMap["import_keypair"] = Processor.process_import_keypair
-        self._processMap["get_vm_ports"] = Processor.process_get_vm_ports
-        self._processMap["get_Flavors"] = Processor.process_get_Flavors
-        self._processMap["get_Images"] = Processor.process_get_Images
-        self._processMap["get_public_Images"] = Processor.process_get_public_Images
-        self._processMap["get_private_Images"] = Processor.process_get_private_Images
-        self._processMap["get_Image_with_Tag"] = Processor.process_get_Image_with_Tag
-        self._processMap["get_Images_by_filter"] = (
-            Processor.process_get_Images_by_filter
+        Parameters:
+         - openstack_ids: Ids of the servers, all servers of the project if empty
+
+        """
+        self.send_get_vms_ports(openstack_ids)
+        return self.recv_get_vms_ports()
+
+    def send_get_vms_ports(self, openstack_ids):
+        self._oprot.writeMessageBegin("get_vms_ports", TMessageType.CALL, self._seqid)
+        args = get_vms_ports_args()
+        args.openstack_ids = openstack_ids
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_get_vms_ports(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = get_vms_ports_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.success is not None:
+            return result.success
+        raise TApplicationException(
+            TApplicationException.MISSING_RESULT, "get_vms_ports failed: unknown result"
         )
-        self._processMap["get_volume"] = Processor.process_get_volume
-        self._processMap["get_volumes_by_ids"] = Processor.process_get_volumes_by_ids
-        self._processMap["resize_volume"] = Processor.process_resize_volume
-        self._processMap["delete_server"] = Processor.process_delete_server
-        self._processMap["add_metadata_to_server"] = (
-            Processor.process_add_metadata_to_server
+
+    def get_playbook_log_chunk(self, openstack_id, stream, offset, max_bytes):
+        """
+        Get a chunk of the log of a playbook run, starting at a byte offset.
+        Returns: {'data': chunk, 'next_offset': offset to continue with,
+                  'eof': 'true' if the end of the log was reached,
+                  'running': 'true' if the playbook is still running}
+
+        Parameters:
+         - openstack_id: Id of the server the playbook runs for
+         - stream: stdout or stderr
+         - offset: Byte offset to start reading at
+         - max_bytes: Maximum size of the chunk in bytes
+
+        """
+        self.send_get_playbook_log_chunk(openstack_id, stream, offset, max_bytes)
+        return self.recv_get_playbook_log_chunk()
+
+    def send_get_playbook_log_chunk(self, openstack_id, stream, offset, max_bytes):
+        self._oprot.writeMessageBegin(
+            "get_playbook_log_chunk", TMessageType.CALL, self._seqid
         )
-        self._processMap["delete_metadata_from_server"] = (
-            Processor.process_delete_metadata_from_server
+        args = get_playbook_log_chunk_args()
+        args.openstack_id = openstack_id
+        args.stream = stream
+        args.offset = offset
+        args.max_bytes = max_bytes
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_get_playbook_log_chunk(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = get_playbook_log_chunk_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.success is not None:
+            return result.success
+        if result.o is not None:
+            raise result.o
+        raise TApplicationException(
+            TApplicationException.MISSING_RESULT,
+            "get_playbook_log_chunk failed: unknown result",
         )
-        self._processMap["add_floating_ip_to_server"] = (
-            Processor.process_add_floating_ip_to_server
-        )
-        self._processMap["create_connection"] = Processor.process_create_connection
-        self._processMap["start_server_without_playbook"] = (
-            Processor.process_start_server_without_playbook
-        )
-        self._processMap["bibigrid_available"] = Processor.process_bibigrid_available
-        self._processMap["detach_ip_from_server"] = (
-            Processor.process_detach_ip_from_server
-        )
-        self._processMap["start_server_with_mounted_volume"] = (
-            Processor.process_start_server_with_mounted_volume
-        )
-        self._processMap["start_server"] = Processor.process_start_server
-        self._processMap["start_server_with_custom_key"] = (
-            Processor.process_start_server_with_custom_key
-        )
-        self._processMap["exist_server"] = Processor.process_exist_server
-        self._processMap["create_and_deploy_playbook"] = (
-            Processor.process_create_and_deploy_playbook
-        )
-        self._processMap["get_playbook_logs"] = Processor.process_get_playbook_logs
-        self._processMap["has_forc"] = Processor.process_has_forc
-        self._processMap["get_forc_url"] = Processor.process_get_forc_url
-        self._processMap["create_backend"] = Processor.process_create_backend
-        self._processMap["get_backends"] = Processor.process_get_backends
-        self._processMap["get_backends_by_owner"] = (
-            Processor.process_get_backends_by_owner
-        )
-        self._processMap["get_backends_by_template"] = (
-            Processor.process_get_backends_by_template
-        )
-        self._processMap["get_backend_by_id"] = Processor.process_get_backend_by_id
-        self._processMap["delete_backend"] = Processor.process_delete_backend
-        self._processMap["add_user_to_backend"] = Processor.process_add_user_to_backend
-        self._processMap["get_users_from_backend"] = (
-            Processor.process_get_users_from_backend
-        )
-        self._processMap["delete_user_from_backend"] = (
-            Processor.process_delete_user_from_backend
-        )
-        self._processMap["get_templates"] = Processor.process_get_templates
-        self._processMap["get_allowed_templates"] = (
-            Processor.process_get_allowed_templates
-        )
-        self._processMap["get_templates_by_template"] = (
-            Processor.process_get_templates_by_template
-        )
-        self._processMap["check_template"] = Processor.process_check_template
-        self._processMap["add_udp_security_group"] = (
-            Processor.process_add_udp_security_group
-        )
-        self._processMap["get_servers"] = Processor.process_get_servers
-        self._processMap["get_server_openstack_ids"] = (
-            Processor.process_get_server_openstack_ids
+
+    def check_servers_status(self, openstack_ids):
+        """
+        Check status of many servers.
+        Returns: List of server instances, in the order of openstack_ids
+
+        Parameters:
+         - openstack_ids: Ids of the servers
+
+        """
+        self.send_check_servers_status(openstack_ids)
+        return self.recv_check_servers_status()
+
+    def send_check_servers_status(self, openstack_ids):
+        self._oprot.writeMessageBegin(
+            "check_servers_status", TMessageType.CALL, self._seqid
         )
-        self._processMap["get_servers_by_ids"] = Processor.process_get_servers_by_ids
-        self._processMap["check_server_task_state"] = (
-            Processor.process_check_server_task_state
+        args = check_servers_status_args()
+        args.openstack_ids = openstack_ids
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_check_servers_status(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = check_servers_status_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.success is not None:
+            return result.success
+        raise TApplicationException(
+            TApplicationException.MISSING_RESULT,
+            "check_servers_status failed: unknown result",
         )
-        self._processMap["get_servers_by_bibigrid_id"] = (
-            Processor.process_get_servers_by_bibigrid_id
+
+    def delete_server_async(self, openstack_id):
+        """
+        Delete a server in the background.
+        Returns: Id of the delete job
+
+        Parameters:
+         - openstack_id: Id of the server
+
+        """
+        self.send_delete_server_async(openstack_id)
+        return self.recv_delete_server_async()
+
+    def send_delete_server_async(self, openstack_id):
+        self._oprot.writeMessageBegin(
+            "delete_server_async", TMessageType.CALL, self._seqid
         )
-        self._processMap["add_server_metadata"] = Processor.process_add_server_metadata
-        self._processMap["create_resenv_security_group_and_attach_to_server"] = (
-            Processor.process_create_resenv_security_group_and_attach_to_server
+        args = delete_server_async_args()
+        args.openstack_id = openstack_id
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_delete_server_async(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = delete_server_async_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.success is not None:
+            return result.success
+        raise TApplicationException(
+            TApplicationException.MISSING_RESULT,
+            "delete_server_async failed: unknown result",
         )
-        self._processMap["add_cluster_machine"] = Processor.process_add_cluster_machine
-        self._processMap["get_cluster_info"] = Processor.process_get_cluster_info
-        self._processMap["get_cluster_status"] = Processor.process_get_cluster_status
-        self._processMap["get_server"] = Processor.process_get_server
-        self._processMap["stop_server"] = Processor.process_stop_server
-        self._processMap["create_snapshot"] = Processor.process_create_snapshot
-        self._processMap["get_limits"] = Processor.process_get_limits
-        self._processMap["start_cluster"] = Processor.process_start_cluster
-        self._processMap["terminate_cluster"] = Processor.process_terminate_cluster
-        self._processMap["delete_image"] = Processor.process_delete_image
-        self._processMap["delete_volume_attachment"] = (
-            Processor.process_delete_volume_attachment
+
+    def delete_servers_async(self, openstack_ids):
+        """
+        Delete many servers in the background.
+        Returns: {openstack_id: id of the delete job}
+
+        Parameters:
+         - openstack_ids: Ids of the servers
+
+        """
+        self.send_delete_servers_async(openstack_ids)
+        return self.recv_delete_servers_async()
+
+    def send_delete_servers_async(self, openstack_ids):
+        self._oprot.writeMessageBegin(
+            "delete_servers_async", TMessageType.CALL, self._seqid
         )
-        self._processMap["delete_volume"] = Processor.process_delete_volume
-        self._processMap["attach_volume_to_server"] = (
-            Processor.process_attach_volume_to_server
+        args = delete_servers_async_args()
+        args.openstack_ids = openstack_ids
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_delete_servers_async(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = delete_servers_async_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.success is not None:
+            return result.success
+        raise TApplicationException(
+            TApplicationException.MISSING_RESULT,
+            "delete_servers_async failed: unknown result",
         )
-        self._processMap["check_server_status"] = Processor.process_check_server_status
-        self._processMap["setUserPassword"] = Processor.process_setUserPassword
-        self._processMap["resume_server"] = Processor.process_resume_server
-        self._processMap["create_volume"] = Processor.process_create_volume
-        self._processMap["reboot_server"] = Processor.process_reboot_server
-        self._on_message_begin = None
 
-    def on_message_begin(self, func):
-        self._on_message_begin = func
+    def get_job_status(self, job_id):
+        """
+        Get the state of a background job.
+        Returns: {'job_id', 'type', 'target', 'status', 'result', 'error', 'created_at', 'updated_at'}
+                 status is QUEUED, RUNNING, DONE, FAILED or NOT_FOUND
 
-    def process(self, iprot, oprot):
-        (name, type, seqid) = iprot.readMessageBegin()
-        if self._on_message_begin:
-            self._on_message_begin(name, type, seqid)
-        if name not in self._processMap:
-            iprot.skip(TType.STRUCT)
-            iprot.readMessageEnd()
-            x = TApplicationException(
-                TApplicationException.UNKNOWN_METHOD, "Unknown function %s" % (name)
-            )
-            oprot.writeMessageBegin(name, TMessageType.EXCEPTION, seqid)
-            x.write(oprot)
-            oprot.writeMessageEnd()
-            oprot.trans.flush()
-            return
-        else:
-            self._processMap[name](self, seqid, iprot, oprot)
-        return True
+        Parameters:
+         - job_id: Id of the job
 
-    def process_check_Version(self, seqid, iprot, oprot):
-        args = check_Version_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = check_Version_result()
-        try:
-            result.success = self._handler.check_Version(args.version)
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
-            )
-        oprot.writeMessageBegin("check_Version", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+        """
+        self.send_get_job_status(job_id)
+        return self.recv_get_job_status()
 
-    def process_get_client_version(self, seqid, iprot, oprot):
-        args = get_client_version_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = get_client_version_result()
-        try:
-            result.success = self._handler.get_client_version()
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
-            )
-        oprot.writeMessageBegin("get_client_version", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+    def send_get_job_status(self, job_id):
+        self._oprot.writeMessageBegin("get_job_status", TMessageType.CALL, self._seqid)
+        args = get_job_status_args()
+        args.job_id = job_id
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
 
-    def process_get_gateway_ip(self, seqid, iprot, oprot):
-        args = get_gateway_ip_args()
-        args.read(iprot)
+    def recv_get_job_status(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = get_job_status_result()
+        result.read(iprot)
         iprot.readMessageEnd()
-        result = get_gateway_ip_result()
-        try:
-            result.success = self._handler.get_gateway_ip()
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
-            )
-        oprot.writeMessageBegin("get_gateway_ip", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
-
-    def process_get_calculation_formulars(self, seqid, iprot, oprot):
-        args = get_calculation_formulars_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = get_calculation_formulars_result()
-        try:
-            result.success = self._handler.get_calculation_formulars()
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
-            )
-        oprot.writeMessageBegin("get_calculation_formulars", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+        if result.success is not None:
+            return result.success
+        raise TApplicationException(
+            TApplicationException.MISSING_RESULT,
+            "get_job_status failed: unknown result",
+        )
 
-    def process_import_keypair(self, seqid, iprot, oprot):
-        args = import_keypair_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = import_keypair_result()
-        try:
-            result.success = self._handler.import_keypair(args.keyname, args.public_key)
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
-            )
-        oprot.writeMessageBegin("import_keypair", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+    def get_jobs_status(self, job_ids):
+        """
+        Get the state of many background jobs.
+        Returns: {job_id: state of the job, see get_job_status}
 
-    def process_get_vm_ports(self, seqid, iprot, oprot):
-        args = get_vm_ports_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = get_vm_ports_result()
-        try:
-            result.success = self._handler.get_vm_ports(args.openstack_id)
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
-            )
-        oprot.writeMessageBegin("get_vm_ports", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+        Parameters:
+         - job_ids: Ids of the jobs
 
-    def process_get_Flavors(self, seqid, iprot, oprot):
-        args = get_Flavors_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = get_Flavors_result()
-        try:
-            result.success = self._handler.get_Flavors()
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
-            )
-        oprot.writeMessageBegin("get_Flavors", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+        """
+        self.send_get_jobs_status(job_ids)
+        return self.recv_get_jobs_status()
 
-    def process_get_Images(self, seqid, iprot, oprot):
-        args = get_Images_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = get_Images_result()
-        try:
-            result.success = self._handler.get_Images()
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
-            )
-        oprot.writeMessageBegin("get_Images", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+    def send_get_jobs_status(self, job_ids):
+        self._oprot.writeMessageBegin("get_jobs_status", TMessageType.CALL, self._seqid)
+        args = get_jobs_status_args()
+        args.job_ids = job_ids
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
 
-    def process_get_public_Images(self, seqid, iprot, oprot):
-        args = get_public_Images_args()
-        args.read(iprot)
+    def recv_get_jobs_status(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = get_jobs_status_result()
+        result.read(iprot)
         iprot.readMessageEnd()
-        result = get_public_Images_result()
-        try:
-            result.success = self._handler.get_public_Images()
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
-            )
-        oprot.writeMessageBegin("get_public_Images", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+        if result.success is not None:
+            return result.success
+        raise TApplicationException(
+            TApplicationException.MISSING_RESULT,
+            "get_jobs_status failed: unknown result",
+        )
 
-    def process_get_private_Images(self, seqid, iprot, oprot):
-        args = get_private_Images_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = get_private_Images_result()
-        try:
-            result.success = self._handler.get_private_Images()
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
-            )
-        oprot.writeMessageBegin("get_private_Images", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+    def start_server_async(
+        self,
+        flavor,
+        image,
+        public_key,
+        servername,
+        metadata,
+        diskspace,
+        volumename,
+        https,
+        http,
+        resenv,
+        idempotency_key,
+    ):
+        """
+        Start a new server in the background.
+        Returns: Id of the launch job, see get_job_status. Its result is the result of start_server
 
-    def process_get_Image_with_Tag(self, seqid, iprot, oprot):
-        args = get_Image_with_Tag_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = get_Image_with_Tag_result()
-        try:
-            result.success = self._handler.get_Image_with_Tag(args.openstack_id)
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
-            )
-        oprot.writeMessageBegin("get_Image_with_Tag", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+        Parameters:
+         - flavor: Name of the  Flavor to use.
+         - image: Name of the image to use.
+         - public_key: Public Key to use
+         - servername: Name for the new server
+         - metadata: Metadata for the new instance
+         - diskspace: Diskspace in GB for additional volume.
+         - volumename: Name of additional Volume
+         - https: Boolean for https security rule
+         - http: Boolean for http security rule
+         - resenv: Names of the research environments
+         - idempotency_key: Key of the request, retries with the same key get the job of the first request
 
-    def process_get_Images_by_filter(self, seqid, iprot, oprot):
-        args = get_Images_by_filter_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = get_Images_by_filter_result()
-        try:
-            result.success = self._handler.get_Images_by_filter(args.filter_json)
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
-            )
-        oprot.writeMessageBegin("get_Images_by_filter", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+        """
+        self.send_start_server_async(
+            flavor,
+            image,
+            public_key,
+            servername,
+            metadata,
+            diskspace,
+            volumename,
+            https,
+            http,
+            resenv,
+            idempotency_key,
+        )
+        return self.recv_start_server_async()
 
-    def process_get_volume(self, seqid, iprot, oprot):
-        args = get_volume_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = get_volume_result()
-        try:
-            result.success = self._handler.get_volume(args.volume_id)
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
-            )
-        oprot.writeMessageBegin("get_volume", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+    def send_start_server_async(
+        self,
+        flavor,
+        image,
+        public_key,
+        servername,
+        metadata,
+        diskspace,
+        volumename,
+        https,
+        http,
+        resenv,
+        idempotency_key,
+    ):
+        self._oprot.writeMessageBegin(
+            "start_server_async", TMessageType.CALL, self._seqid
+        )
+        args = start_server_async_args()
+        args.flavor = flavor
+        args.image = image
+        args.public_key = public_key
+        args.servername = servername
+        args.metadata = metadata
+        args.diskspace = diskspace
+        args.volumename = volumename
+        args.https = https
+        args.http = http
+        args.resenv = resenv
+        args.idempotency_key = idempotency_key
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
 
-    def process_get_volumes_by_ids(self, seqid, iprot, oprot):
-        args = get_volumes_by_ids_args()
-        args.read(iprot)
+    def recv_start_server_async(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = start_server_async_result()
+        result.read(iprot)
         iprot.readMessageEnd()
-        result = get_volumes_by_ids_result()
-        try:
-            result.success = self._handler.get_volumes_by_ids(args.volume_ids)
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
-            )
-        oprot.writeMessageBegin("get_volumes_by_ids", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+        if result.success is not None:
+            return result.success
+        raise TApplicationException(
+            TApplicationException.MISSING_RESULT,
+            "start_server_async failed: unknown result",
+        )
 
-    def process_resize_volume(self, seqid, iprot, oprot):
-        args = resize_volume_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = resize_volume_result()
-        try:
-            result.success = self._handler.resize_volume(args.volume_id, args.size)
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
-            )
-        oprot.writeMessageBegin("resize_volume", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+    def start_server_with_custom_key_async(
+        self,
+        flavor,
+        image,
+        servername,
+        metadata,
+        http,
+        https,
+        resenv,
+        volume_ids_path_new,
+        volume_ids_path_attach,
+        idempotency_key,
+    ):
+        """
+        Start a new server with custom key for ansible in the background.
+        Returns: Id of the launch job, see get_job_status. Its result is the result of start_server_with_custom_key. The private key is part of the result until the job is acknowledged with acknowledge_job
 
-    def process_delete_server(self, seqid, iprot, oprot):
-        args = delete_server_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = delete_server_result()
-        try:
-            result.success = self._handler.delete_server(args.openstack_id)
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except serverNotFoundException as e:
-            msg_type = TMessageType.REPLY
-            result.e = e
-        except conflictException as c:
-            msg_type = TMessageType.REPLY
-            result.c = c
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
-            )
-        oprot.writeMessageBegin("delete_server", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+        Parameters:
+         - flavor: Name of the  Flavor to use.
+         - image: Name of the image to use.
+         - servername: Name for the new server
+         - metadata: Metadata for the new instance
+         - http: Boolean for http security rule
+         - https: Boolean for https security rule
+         - resenv: Names of the research environments
+         - volume_ids_path_new: Volumes to format and mount
+         - volume_ids_path_attach: Volumes to mount
+         - idempotency_key: Key of the request, retries with the same key get the job of the first request
 
-    def process_add_metadata_to_server(self, seqid, iprot, oprot):
-        args = add_metadata_to_server_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = add_metadata_to_server_result()
-        try:
-            result.success = self._handler.add_metadata_to_server(
-                args.servername, args.metadata
-            )
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except serverNotFoundException as e:
-            msg_type = TMessageType.REPLY
-            result.e = e
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
-            )
-        oprot.writeMessageBegin("add_metadata_to_server", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+        """
+        self.send_start_server_with_custom_key_async(
+            flavor,
+            image,
+            servername,
+            metadata,
+            http,
+            https,
+            resenv,
+            volume_ids_path_new,
+            volume_ids_path_attach,
+            idempotency_key,
+        )
+        return self.recv_start_server_with_custom_key_async()
 
-    def process_delete_metadata_from_server(self, seqid, iprot, oprot):
-        args = delete_metadata_from_server_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = delete_metadata_from_server_result()
-        try:
-            result.success = self._handler.delete_metadata_from_server(
-                args.servername, args.keys
-            )
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except serverNotFoundException as e:
-            msg_type = TMessageType.REPLY
-            result.e = e
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
-            )
-        oprot.writeMessageBegin("delete_metadata_from_server", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
-
-    def process_add_floating_ip_to_server(self, seqid, iprot, oprot):
-        args = add_floating_ip_to_server_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = add_floating_ip_to_server_result()
-        try:
-            result.success = self._handler.add_floating_ip_to_server(
-                args.openstack_id, args.network
-            )
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except serverNotFoundException as e:
-            msg_type = TMessageType.REPLY
-            result.e = e
-        except networkNotFoundException as f:
-            msg_type = TMessageType.REPLY
-            result.f = f
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
-            )
-        oprot.writeMessageBegin("add_floating_ip_to_server", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+    def send_start_server_with_custom_key_async(
+        self,
+        flavor,
+        image,
+        servername,
+        metadata,
+        http,
+        https,
+        resenv,
+        volume_ids_path_new,
+        volume_ids_path_attach,
+        idempotency_key,
+    ):
+        self._oprot.writeMessageBegin(
+            "start_server_with_custom_key_async", TMessageType.CALL, self._seqid
+        )
+        args = start_server_with_custom_key_async_args()
+        args.flavor = flavor
+        args.image = image
+        args.servername = servername
+        args.metadata = metadata
+        args.http = http
+        args.https = https
+        args.resenv = resenv
+        args.volume_ids_path_new = volume_ids_path_new
+        args.volume_ids_path_attach = volume_ids_path_attach
+        args.idempotency_key = idempotency_key
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
 
-    def process_create_connection(self, seqid, iprot, oprot):
-        args = create_connection_args()
-        args.read(iprot)
+    def recv_start_server_with_custom_key_async(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = start_server_with_custom_key_async_result()
+        result.read(iprot)
         iprot.readMessageEnd()
-        result = create_connection_result()
-        try:
-            result.success = self._handler.create_connection(
-                args.username,
-                args.password,
-                args.auth_url,
-                args.user_domain_name,
-                args.project_domain_name,
-            )
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except authenticationException as e:
-            msg_type = TMessageType.REPLY
-            result.e = e
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
-            )
-        oprot.writeMessageBegin("create_connection", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+        if result.success is not None:
+            return result.success
+        raise TApplicationException(
+            TApplicationException.MISSING_RESULT,
+            "start_server_with_custom_key_async failed: unknown result",
+        )
 
-    def process_start_server_without_playbook(self, seqid, iprot, oprot):
-        args = start_server_without_playbook_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = start_server_without_playbook_result()
-        try:
-            result.success = self._handler.start_server_without_playbook(
-                args.flavor,
-                args.image,
-                args.public_key,
-                args.servername,
-                args.metadata,
-                args.https,
-                args.http,
-                args.resenv,
-                args.volume_ids_path_new,
-                args.volume_ids_path_attach,
-                args.additional_keys,
-            )
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except nameException as e:
-            msg_type = TMessageType.REPLY
-            result.e = e
-        except ressourceException as r:
-            msg_type = TMessageType.REPLY
-            result.r = r
-        except serverNotFoundException as s:
-            msg_type = TMessageType.REPLY
-            result.s = s
-        except networkNotFoundException as n:
-            msg_type = TMessageType.REPLY
-            result.n = n
-        except imageNotFoundException as i:
-            msg_type = TMessageType.REPLY
-            result.i = i
-        except flavorNotFoundException as f:
-            msg_type = TMessageType.REPLY
-            result.f = f
-        except otherException as o:
-            msg_type = TMessageType.REPLY
-            result.o = o
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
-            )
-        oprot.writeMessageBegin("start_server_without_playbook", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+    def start_server_without_playbook_async(
+        self,
+        flavor,
+        image,
+        public_key,
+        servername,
+        metadata,
+        https,
+        http,
+        resenv,
+        volume_ids_path_new,
+        volume_ids_path_attach,
+        additional_keys,
+        idempotency_key,
+    ):
+        """
+        Start a new server without playbook in the background.
+        Returns: Id of the launch job, see get_job_status. Its result is the result of start_server_without_playbook
 
-    def process_bibigrid_available(self, seqid, iprot, oprot):
-        args = bibigrid_available_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = bibigrid_available_result()
-        try:
-            result.success = self._handler.bibigrid_available()
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
-            )
-        oprot.writeMessageBegin("bibigrid_available", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+        Parameters:
+         - flavor: Name of the  Flavor to use.
+         - image: Name of the image to use.
+         - public_key: Public Key to use
+         - servername: Name for the new server
+         - metadata: Metadata for the new instance
+         - https: Boolean for https security rule
+         - http: Boolean for http security rule
+         - resenv: Names of the research environments
+         - volume_ids_path_new: Volumes to format and mount
+         - volume_ids_path_attach: Volumes to mount
+         - additional_keys: Additional public keys to add
+         - idempotency_key: Key of the request, retries with the same key get the job of the first request
 
-    def process_detach_ip_from_server(self, seqid, iprot, oprot):
-        args = detach_ip_from_server_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = detach_ip_from_server_result()
-        try:
-            result.success = self._handler.detach_ip_from_server(
-                args.server_id, args.floating_ip
-            )
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
-            )
-        oprot.writeMessageBegin("detach_ip_from_server", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+        """
+        self.send_start_server_without_playbook_async(
+            flavor,
+            image,
+            public_key,
+            servername,
+            metadata,
+            https,
+            http,
+            resenv,
+            volume_ids_path_new,
+            volume_ids_path_attach,
+            additional_keys,
+            idempotency_key,
+        )
+        return self.recv_start_server_without_playbook_async()
 
-    def process_start_server_with_mounted_volume(self, seqid, iprot, oprot):
-        args = start_server_with_mounted_volume_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = start_server_with_mounted_volume_result()
-        try:
-            result.success = self._handler.start_server_with_mounted_volume(
-                args.flavor,
-                args.image,
+    def send_start_server_without_playbook_async(
+        self,
+        flavor,
+        image,
+        public_key,
+        servername,
+        metadata,
+        https,
+        http,
+        resenv,
+        volume_ids_path_new,
+        volume_ids_path_attach,
+        additional_keys,
+        idempotency_key,
+    ):
+        self._oprot.writeMessageBegin(
+            "start_server_without_playbook_async", TMessageType.CALL, self._seqid
+        )
+        args = start_server_without_playbook_async_args()
+        args.flavor = flavor
+        args.image = image
+        args.public_key = public_key
+        args.servername = servername
+        args.metadata = metadata
+        args.https = https
+        args.http = http
+        args.resenv = resenv
+        args.volume_ids_path_new = volume_ids_path_new
+        args.volume_ids_path_attach = volume_ids_path_attach
+        args.additional_keys = additional_keys
+        args.idempotency_key = idempotency_key
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_start_server_without_playbook_async(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = start_server_without_playbook_async_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.success is not None:
+            return result.success
+        raise TApplicationException(
+            TApplicationException.MISSING_RESULT,
+            "start_server_without_playbook_async failed: unknown result",
+        )
+
+    def start_server_with_mounted_volume_async(
+        self,
+        flavor,
+        image,
+        public_key,
+        servername,
+        metadata,
+        https,
+        http,
+        resenv,
+        volume_ids_path_new,
+        volume_ids_path_attach,
+        idempotency_key,
+    ):
+        """
+        Start a new server with volumes in the background.
+        Returns: Id of the launch job, see get_job_status. Its result is the result of start_server_with_mounted_volume
+
+        Parameters:
+         - flavor: Name of the  Flavor to use.
+         - image: Name of the image to use.
+         - public_key: Public Key to use
+         - servername: Name for the new server
+         - metadata: Metadata for the new instance
+         - https: Boolean for https security rule
+         - http: Boolean for http security rule
+         - resenv: Names of the research environments
+         - volume_ids_path_new: Volumes to format and mount
+         - volume_ids_path_attach: Volumes to mount
+         - idempotency_key: Key of the request, retries with the same key get the job of the first request
+
+        """
+        self.send_start_server_with_mounted_volume_async(
+            flavor,
+            image,
+            public_key,
+            servername,
+            metadata,
+            https,
+            http,
+            resenv,
+            volume_ids_path_new,
+            volume_ids_path_attach,
+            idempotency_key,
+        )
+        return self.recv_start_server_with_mounted_volume_async()
+
+    def send_start_server_with_mounted_volume_async(
+        self,
+        flavor,
+        image,
+        public_key,
+        servername,
+        metadata,
+        https,
+        http,
+        resenv,
+        volume_ids_path_new,
+        volume_ids_path_attach,
+        idempotency_key,
+    ):
+        self._oprot.writeMessageBegin(
+            "start_server_with_mounted_volume_async", TMessageType.CALL, self._seqid
+        )
+        args = start_server_with_mounted_volume_async_args()
+        args.flavor = flavor
+        args.image = image
+        args.public_key = public_key
+        args.servername = servername
+        args.metadata = metadata
+        args.https = https
+        args.http = http
+        args.resenv = resenv
+        args.volume_ids_path_new = volume_ids_path_new
+        args.volume_ids_path_attach = volume_ids_path_attach
+        args.idempotency_key = idempotency_key
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_start_server_with_mounted_volume_async(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = start_server_with_mounted_volume_async_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.success is not None:
+            return result.success
+        raise TApplicationException(
+            TApplicationException.MISSING_RESULT,
+            "start_server_with_mounted_volume_async failed: unknown result",
+        )
+
+    def start_servers_with_custom_key(
+        self, flavor, image, servernames, metadatas, http, https, resenv
+    ):
+        """
+        Start many servers with custom keys from one spec, e.g. for a course.
+        The image, flavor, network and security groups are resolved once.
+        Returns: List in the order of servernames, with
+                 {'servername', 'openstackid', 'private_key'} for started servers
+                 and {'servername', 'error'} for servers which failed to start
+
+        Parameters:
+         - flavor: Name of the  Flavor to use.
+         - image: Name of the image to use.
+         - servernames: Names of the new servers
+         - metadatas: Metadata of the new servers, in the order of servernames
+         - http: Boolean for http security rule
+         - https: Boolean for https security rule
+         - resenv: Names of the research environments
+
+        """
+        self.send_start_servers_with_custom_key(
+            flavor, image, servernames, metadatas, http, https, resenv
+        )
+        return self.recv_start_servers_with_custom_key()
+
+    def send_start_servers_with_custom_key(
+        self, flavor, image, servernames, metadatas, http, https, resenv
+    ):
+        self._oprot.writeMessageBegin(
+            "start_servers_with_custom_key", TMessageType.CALL, self._seqid
+        )
+        args = start_servers_with_custom_key_args()
+        args.flavor = flavor
+        args.image = image
+        args.servernames = servernames
+        args.metadatas = metadatas
+        args.http = http
+        args.https = https
+        args.resenv = resenv
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_start_servers_with_custom_key(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = start_servers_with_custom_key_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.success is not None:
+            return result.success
+        if result.i is not None:
+            raise result.i
+        if result.f is not None:
+            raise result.f
+        if result.n is not None:
+            raise result.n
+        if result.o is not None:
+            raise result.o
+        raise TApplicationException(
+            TApplicationException.MISSING_RESULT,
+            "start_servers_with_custom_key failed: unknown result",
+        )
+
+    def acknowledge_job(self, job_id):
+        """
+        Acknowledge the result of a background job.
+        Secret parts of the result, like a private key, are deleted and not returned by get_job_status anymore.
+        Returns: True if the job exists, False if it is unknown or expired
+
+        Parameters:
+         - job_id: Id of the job
+
+        """
+        self.send_acknowledge_job(job_id)
+        return self.recv_acknowledge_job()
+
+    def send_acknowledge_job(self, job_id):
+        self._oprot.writeMessageBegin("acknowledge_job", TMessageType.CALL, self._seqid)
+        args = acknowledge_job_args()
+        args.job_id = job_id
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_acknowledge_job(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = acknowledge_job_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.success is not None:
+            return result.success
+        raise TApplicationException(
+            TApplicationException.MISSING_RESULT,
+            "acknowledge_job failed: unknown result",
+        )
+
+    def get_server_stats(self):
+        """
+        Get the statistics of the Thrift server, e.g. for monitoring.
+        Returns: {'server_mode', 'queue_depth', 'max_queue_size', 'rejected'}
+                 the queue statistics are only known in the nonblocking server mode
+
+        """
+        self.send_get_server_stats()
+        return self.recv_get_server_stats()
+
+    def send_get_server_stats(self):
+        self._oprot.writeMessageBegin(
+            "get_server_stats", TMessageType.CALL, self._seqid
+        )
+        args = get_server_stats_args()
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_get_server_stats(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = get_server_stats_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.success is not None:
+            return result.success
+        raise TApplicationException(
+            TApplicationException.MISSING_RESULT,
+            "get_server_stats failed: unknown result",
+        )
+
+
+class Processor(Iface, TProcessor):
+    def __init__(self, handler):
+        self._handler = handler
+        self._processMap = {}
+        self._processMap["check_Version"] = Processor.process_check_Version
+        self._processMap["get_client_version"] = Processor.process_get_client_version
+        self._processMap["get_gateway_ip"] = Processor.process_get_gateway_ip
+        self._processMap["get_calculation_formulars"] = (
+            Processor.process_get_calculation_formulars
+        )
+        self._processMap["import_keypair"] = Processor.process_import_keypair
+        self._processMap["get_vm_ports"] = Processor.process_get_vm_ports
+        self._processMap["get_Flavors"] = Processor.process_get_Flavors
+        self._processMap["get_Images"] = Processor.process_get_Images
+        self._processMap["get_public_Images"] = Processor.process_get_public_Images
+        self._processMap["get_private_Images"] = Processor.process_get_private_Images
+        self._processMap["get_Image_with_Tag"] = Processor.process_get_Image_with_Tag
+        self._processMap["get_Images_by_filter"] = (
+            Processor.process_get_Images_by_filter
+        )
+        self._processMap["get_volume"] = Processor.process_get_volume
+        self._processMap["get_volumes_by_ids"] = Processor.process_get_volumes_by_ids
+        self._processMap["resize_volume"] = Processor.process_resize_volume
+        self._processMap["delete_server"] = Processor.process_delete_server
+        self._processMap["add_metadata_to_server"] = (
+            Processor.process_add_metadata_to_server
+        )
+        self._processMap["delete_metadata_from_server"] = (
+            Processor.process_delete_metadata_from_server
+        )
+        self._processMap["add_floating_ip_to_server"] = (
+            Processor.process_add_floating_ip_to_server
+        )
+        self._processMap["create_connection"] = Processor.process_create_connection
+        self._processMap["start_server_without_playbook"] = (
+            Processor.process_start_server_without_playbook
+        )
+        self._processMap["bibigrid_available"] = Processor.process_bibigrid_available
+        self._processMap["detach_ip_from_server"] = (
+            Processor.process_detach_ip_from_server
+        )
+        self._processMap["start_server_with_mounted_volume"] = (
+            Processor.process_start_server_with_mounted_volume
+        )
+        self._processMap["start_server"] = Processor.process_start_server
+        self._processMap["start_server_with_custom_key"] = (
+            Processor.process_start_server_with_custom_key
+        )
+        self._processMap["exist_server"] = Processor.process_exist_server
+        self._processMap["create_and_deploy_playbook"] = (
+            Processor.process_create_and_deploy_playbook
+        )
+        self._processMap["get_playbook_logs"] = Processor.process_get_playbook_logs
+        self._processMap["has_forc"] = Processor.process_has_forc
+        self._processMap["get_forc_url"] = Processor.process_get_forc_url
+        self._processMap["create_backend"] = Processor.process_create_backend
+        self._processMap["get_backends"] = Processor.process_get_backends
+        self._processMap["get_backends_by_owner"] = (
+            Processor.process_get_backends_by_owner
+        )
+        self._processMap["get_backends_by_template"] = (
+            Processor.process_get_backends_by_template
+        )
+        self._processMap["get_backend_by_id"] = Processor.process_get_backend_by_id
+        self._processMap["delete_backend"] = Processor.process_delete_backend
+        self._processMap["add_user_to_backend"] = Processor.process_add_user_to_backend
+        self._processMap["get_users_from_backend"] = (
+            Processor.process_get_users_from_backend
+        )
+        self._processMap["delete_user_from_backend"] = (
+            Processor.process_delete_user_from_backend
+        )
+        self._processMap["get_templates"] = Processor.process_get_templates
+        self._processMap["get_allowed_templates"] = (
+            Processor.process_get_allowed_templates
+        )
+        self._processMap["get_templates_by_template"] = (
+            Processor.process_get_templates_by_template
+        )
+        self._processMap["check_template"] = Processor.process_check_template
+        self._processMap["add_udp_security_group"] = (
+            Processor.process_add_udp_security_group
+        )
+        self._processMap["get_servers"] = Processor.process_get_servers
+        self._processMap["get_server_openstack_ids"] = (
+            Processor.process_get_server_openstack_ids
+        )
+        self._processMap["get_servers_by_ids"] = Processor.process_get_servers_by_ids
+        self._processMap["check_server_task_state"] = (
+            Processor.process_check_server_task_state
+        )
+        self._processMap["get_servers_by_bibigrid_id"] = (
+            Processor.process_get_servers_by_bibigrid_id
+        )
+        self._processMap["add_server_metadata"] = Processor.process_add_server_metadata
+        self._processMap["create_resenv_security_group_and_attach_to_server"] = (
+            Processor.process_create_resenv_security_group_and_attach_to_server
+        )
+        self._processMap["add_cluster_machine"] = Processor.process_add_cluster_machine
+        self._processMap["get_cluster_info"] = Processor.process_get_cluster_info
+        self._processMap["get_cluster_status"] = Processor.process_get_cluster_status
+        self._processMap["get_server"] = Processor.process_get_server
+        self._processMap["stop_server"] = Processor.process_stop_server
+        self._processMap["create_snapshot"] = Processor.process_create_snapshot
+        self._processMap["get_limits"] = Processor.process_get_limits
+        self._processMap["start_cluster"] = Processor.process_start_cluster
+        self._processMap["terminate_cluster"] = Processor.process_terminate_cluster
+        self._processMap["delete_image"] = Processor.process_delete_image
+        self._processMap["delete_volume_attachment"] = (
+            Processor.process_delete_volume_attachment
+        )
+        self._processMap["delete_volume"] = Processor.process_delete_volume
+        self._processMap["attach_volume_to_server"] = (
+            Processor.process_attach_volume_to_server
+        )
+        self._processMap["check_server_status"] = Processor.process_check_server_status
+        self._processMap["setUserPassword"] = Processor.process_setUserPassword
+        self._processMap["resume_server"] = Processor.process_resume_server
+        self._processMap["create_volume"] = Processor.process_create_volume
+        self._processMap["reboot_server"] = Processor.process_reboot_server
+        self._processMap["get_vms_ports"] = Processor.process_get_vms_ports
+        self._processMap["get_playbook_log_chunk"] = (
+            Processor.process_get_playbook_log_chunk
+        )
+        self._processMap["check_servers_status"] = (
+            Processor.process_check_servers_status
+        )
+        self._processMap["delete_server_async"] = Processor.process_delete_server_async
+        self._processMap["delete_servers_async"] = (
+            Processor.process_delete_servers_async
+        )
+        self._processMap["get_job_status"] = Processor.process_get_job_status
+        self._processMap["get_jobs_status"] = Processor.process_get_jobs_status
+        self._processMap["start_server_async"] = Processor.process_start_server_async
+        self._processMap["start_server_with_custom_key_async"] = (
+            Processor.process_start_server_with_custom_key_async
+        )
+        self._processMap["start_server_without_playbook_async"] = (
+            Processor.process_start_server_without_playbook_async
+        )
+        self._processMap["start_server_with_mounted_volume_async"] = (
+            Processor.process_start_server_with_mounted_volume_async
+        )
+        self._processMap["start_servers_with_custom_key"] = (
+            Processor.process_start_servers_with_custom_key
+        )
+        self._processMap["acknowledge_job"] = Processor.process_acknowledge_job
+        self._processMap["get_server_stats"] = Processor.process_get_server_stats
+        self._on_message_begin = None
+
+    def on_message_begin(self, func):
+        self._on_message_begin = func
+
+    def process(self, iprot, oprot):
+        (name, type, seqid) = iprot.readMessageBegin()
+        if self._on_message_begin:
+            self._on_message_begin(name, type, seqid)
+        if name not in self._processMap:
+            iprot.skip(TType.STRUCT)
+            iprot.readMessageEnd()
+            x = TApplicationException(
+                TApplicationException.UNKNOWN_METHOD, "Unknown function %s" % (name)
+            )
+            oprot.writeMessageBegin(name, TMessageType.EXCEPTION, seqid)
+            x.write(oprot)
+            oprot.writeMessageEnd()
+            oprot.trans.flush()
+            return
+        else:
+            self._processMap[name](self, seqid, iprot, oprot)
+        return True
+
+    def process_check_Version(self, seqid, iprot, oprot):
+        args = check_Version_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = check_Version_result()
+        try:
+            result.success = self._handler.check_Version(args.version)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("check_Version", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_get_client_version(self, seqid, iprot, oprot):
+        args = get_client_version_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = get_client_version_result()
+        try:
+            result.success = self._handler.get_client_version()
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("get_client_version", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_get_gateway_ip(self, seqid, iprot, oprot):
+        args = get_gateway_ip_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = get_gateway_ip_result()
+        try:
+            result.success = self._handler.get_gateway_ip()
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("get_gateway_ip", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_get_calculation_formulars(self, seqid, iprot, oprot):
+        args = get_calculation_formulars_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = get_calculation_formulars_result()
+        try:
+            result.success = self._handler.get_calculation_formulars()
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("get_calculation_formulars", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_import_keypair(self, seqid, iprot, oprot):
+        args = import_keypair_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = import_keypair_result()
+        try:
+            result.success = self._handler.import_keypair(args.keyname, args.public_key)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("import_keypair", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_get_vm_ports(self, seqid, iprot, oprot):
+        args = get_vm_ports_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = get_vm_ports_result()
+        try:
+            result.success = self._handler.get_vm_ports(args.openstack_id)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("get_vm_ports", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_get_Flavors(self, seqid, iprot, oprot):
+        args = get_Flavors_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = get_Flavors_result()
+        try:
+            result.success = self._handler.get_Flavors()
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("get_Flavors", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_get_Images(self, seqid, iprot, oprot):
+        args = get_Images_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = get_Images_result()
+        try:
+            result.success = self._handler.get_Images()
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("get_Images", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_get_public_Images(self, seqid, iprot, oprot):
+        args = get_public_Images_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = get_public_Images_result()
+        try:
+            result.success = self._handler.get_public_Images()
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("get_public_Images", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_get_private_Images(self, seqid, iprot, oprot):
+        args = get_private_Images_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = get_private_Images_result()
+        try:
+            result.success = self._handler.get_private_Images()
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("get_private_Images", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_get_Image_with_Tag(self, seqid, iprot, oprot):
+        args = get_Image_with_Tag_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = get_Image_with_Tag_result()
+        try:
+            result.success = self._handler.get_Image_with_Tag(args.openstack_id)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("get_Image_with_Tag", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_get_Images_by_filter(self, seqid, iprot, oprot):
+        args = get_Images_by_filter_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = get_Images_by_filter_result()
+        try:
+            result.success = self._handler.get_Images_by_filter(args.filter_json)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("get_Images_by_filter", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_get_volume(self, seqid, iprot, oprot):
+        args = get_volume_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = get_volume_result()
+        try:
+            result.success = self._handler.get_volume(args.volume_id)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("get_volume", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_get_volumes_by_ids(self, seqid, iprot, oprot):
+        args = get_volumes_by_ids_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = get_volumes_by_ids_result()
+        try:
+            result.success = self._handler.get_volumes_by_ids(args.volume_ids)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("get_volumes_by_ids", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_resize_volume(self, seqid, iprot, oprot):
+        args = resize_volume_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = resize_volume_result()
+        try:
+            result.success = self._handler.resize_volume(args.volume_id, args.size)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("resize_volume", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_delete_server(self, seqid, iprot, oprot):
+        args = delete_server_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = delete_server_result()
+        try:
+            result.success = self._handler.delete_server(args.openstack_id)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except serverNotFoundException as e:
+            msg_type = TMessageType.REPLY
+            result.e = e
+        except conflictException as c:
+            msg_type = TMessageType.REPLY
+            result.c = c
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("delete_server", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_add_metadata_to_server(self, seqid, iprot, oprot):
+        args = add_metadata_to_server_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = add_metadata_to_server_result()
+        try:
+            result.success = self._handler.add_metadata_to_server(
+                args.servername, args.metadata
+            )
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except serverNotFoundException as e:
+            msg_type = TMessageType.REPLY
+            result.e = e
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("add_metadata_to_server", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_delete_metadata_from_server(self, seqid, iprot, oprot):
+        args = delete_metadata_from_server_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = delete_metadata_from_server_result()
+        try:
+            result.success = self._handler.delete_metadata_from_server(
+                args.servername, args.keys
+            )
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except serverNotFoundException as e:
+            msg_type = TMessageType.REPLY
+            result.e = e
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("delete_metadata_from_server", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_add_floating_ip_to_server(self, seqid, iprot, oprot):
+        args = add_floating_ip_to_server_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = add_floating_ip_to_server_result()
+        try:
+            result.success = self._handler.add_floating_ip_to_server(
+                args.openstack_id, args.network
+            )
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except serverNotFoundException as e:
+            msg_type = TMessageType.REPLY
+            result.e = e
+        except networkNotFoundException as f:
+            msg_type = TMessageType.REPLY
+            result.f = f
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("add_floating_ip_to_server", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_create_connection(self, seqid, iprot, oprot):
+        args = create_connection_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = create_connection_result()
+        try:
+            result.success = self._handler.create_connection(
+                args.username,
+                args.password,
+                args.auth_url,
+                args.user_domain_name,
+                args.project_domain_name,
+            )
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except authenticationException as e:
+            msg_type = TMessageType.REPLY
+            result.e = e
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("create_connection", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_start_server_without_playbook(self, seqid, iprot, oprot):
+        args = start_server_without_playbook_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = start_server_without_playbook_result()
+        try:
+            result.success = self._handler.start_server_without_playbook(
+                args.flavor,
+                args.image,
+                args.public_key,
+                args.servername,
+                args.metadata,
+                args.https,
+                args.http,
+                args.resenv,
+                args.volume_ids_path_new,
+                args.volume_ids_path_attach,
+                args.additional_keys,
+            )
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except nameException as e:
+            msg_type = TMessageType.REPLY
+            result.e = e
+        except ressourceException as r:
+            msg_type = TMessageType.REPLY
+            result.r = r
+        except serverNotFoundException as s:
+            msg_type = TMessageType.REPLY
+            result.s = s
+        except networkNotFoundException as n:
+            msg_type = TMessageType.REPLY
+            result.n = n
+        except imageNotFoundException as i:
+            msg_type = TMessageType.REPLY
+            result.i = i
+        except flavorNotFoundException as f:
+            msg_type = TMessageType.REPLY
+            result.f = f
+        except otherException as o:
+            msg_type = TMessageType.REPLY
+            result.o = o
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("start_server_without_playbook", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_bibigrid_available(self, seqid, iprot, oprot):
+        args = bibigrid_available_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = bibigrid_available_result()
+        try:
+            result.success = self._handler.bibigrid_available()
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("bibigrid_available", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_detach_ip_from_server(self, seqid, iprot, oprot):
+        args = detach_ip_from_server_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = detach_ip_from_server_result()
+        try:
+            result.success = self._handler.detach_ip_from_server(
+                args.server_id, args.floating_ip
+            )
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("detach_ip_from_server", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_start_server_with_mounted_volume(self, seqid, iprot, oprot):
+        args = start_server_with_mounted_volume_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = start_server_with_mounted_volume_result()
+        try:
+            result.success = self._handler.start_server_with_mounted_volume(
+                args.flavor,
+                args.image,
+                args.public_key,
+                args.servername,
+                args.metadata,
+                args.https,
+                args.http,
+                args.resenv,
+                args.volume_ids_path_new,
+                args.volume_ids_path_attach,
+            )
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except nameException as e:
+            msg_type = TMessageType.REPLY
+            result.e = e
+        except ressourceException as r:
+            msg_type = TMessageType.REPLY
+            result.r = r
+        except serverNotFoundException as s:
+            msg_type = TMessageType.REPLY
+            result.s = s
+        except networkNotFoundException as n:
+            msg_type = TMessageType.REPLY
+            result.n = n
+        except imageNotFoundException as i:
+            msg_type = TMessageType.REPLY
+            result.i = i
+        except flavorNotFoundException as f:
+            msg_type = TMessageType.REPLY
+            result.f = f
+        except otherException as o:
+            msg_type = TMessageType.REPLY
+            result.o = o
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("start_server_with_mounted_volume", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_start_server(self, seqid, iprot, oprot):
+        args = start_server_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = start_server_result()
+        try:
+            result.success = self._handler.start_server(
+                args.flavor,
+                args.image,
+                args.public_key,
+                args.servername,
+                args.metadata,
+                args.diskspace,
+                args.volumename,
+                args.https,
+                args.http,
+                args.resenv,
+            )
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except nameException as e:
+            msg_type = TMessageType.REPLY
+            result.e = e
+        except ressourceException as r:
+            msg_type = TMessageType.REPLY
+            result.r = r
+        except serverNotFoundException as s:
+            msg_type = TMessageType.REPLY
+            result.s = s
+        except networkNotFoundException as n:
+            msg_type = TMessageType.REPLY
+            result.n = n
+        except imageNotFoundException as i:
+            msg_type = TMessageType.REPLY
+            result.i = i
+        except flavorNotFoundException as f:
+            msg_type = TMessageType.REPLY
+            result.f = f
+        except otherException as o:
+            msg_type = TMessageType.REPLY
+            result.o = o
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("start_server", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_start_server_with_custom_key(self, seqid, iprot, oprot):
+        args = start_server_with_custom_key_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = start_server_with_custom_key_result()
+        try:
+            result.success = self._handler.start_server_with_custom_key(
+                args.flavor,
+                args.image,
+                args.servername,
+                args.metadata,
+                args.http,
+                args.https,
+                args.resenv,
+                args.volume_ids_path_new,
+                args.volume_ids_path_attach,
+            )
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except nameException as e:
+            msg_type = TMessageType.REPLY
+            result.e = e
+        except ressourceException as r:
+            msg_type = TMessageType.REPLY
+            result.r = r
+        except serverNotFoundException as s:
+            msg_type = TMessageType.REPLY
+            result.s = s
+        except networkNotFoundException as n:
+            msg_type = TMessageType.REPLY
+            result.n = n
+        except imageNotFoundException as i:
+            msg_type = TMessageType.REPLY
+            result.i = i
+        except flavorNotFoundException as f:
+            msg_type = TMessageType.REPLY
+            result.f = f
+        except otherException as o:
+            msg_type = TMessageType.REPLY
+            result.o = o
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("start_server_with_custom_key", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_exist_server(self, seqid, iprot, oprot):
+        args = exist_server_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = exist_server_result()
+        try:
+            result.success = self._handler.exist_server(args.name)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("exist_server", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_create_and_deploy_playbook(self, seqid, iprot, oprot):
+        args = create_and_deploy_playbook_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = create_and_deploy_playbook_result()
+        try:
+            result.success = self._handler.create_and_deploy_playbook(
+                args.public_key, args.playbooks_information, args.openstack_id
+            )
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("create_and_deploy_playbook", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_get_playbook_logs(self, seqid, iprot, oprot):
+        args = get_playbook_logs_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = get_playbook_logs_result()
+        try:
+            result.success = self._handler.get_playbook_logs(args.openstack_id)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("get_playbook_logs", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_has_forc(self, seqid, iprot, oprot):
+        args = has_forc_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = has_forc_result()
+        try:
+            result.success = self._handler.has_forc()
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("has_forc", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_get_forc_url(self, seqid, iprot, oprot):
+        args = get_forc_url_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = get_forc_url_result()
+        try:
+            result.success = self._handler.get_forc_url()
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("get_forc_url", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_create_backend(self, seqid, iprot, oprot):
+        args = create_backend_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = create_backend_result()
+        try:
+            result.success = self._handler.create_backend(
+                args.elixir_id, args.user_key_url, args.template, args.upstream_url
+            )
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("create_backend", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_get_backends(self, seqid, iprot, oprot):
+        args = get_backends_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = get_backends_result()
+        try:
+            result.success = self._handler.get_backends()
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("get_backends", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_get_backends_by_owner(self, seqid, iprot, oprot):
+        args = get_backends_by_owner_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = get_backends_by_owner_result()
+        try:
+            result.success = self._handler.get_backends_by_owner(args.elixir_id)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("get_backends_by_owner", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_get_backends_by_template(self, seqid, iprot, oprot):
+        args = get_backends_by_template_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = get_backends_by_template_result()
+        try:
+            result.success = self._handler.get_backends_by_template(args.template)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("get_backends_by_template", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_get_backend_by_id(self, seqid, iprot, oprot):
+        args = get_backend_by_id_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = get_backend_by_id_result()
+        try:
+            result.success = self._handler.get_backend_by_id(args.id)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("get_backend_by_id", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_delete_backend(self, seqid, iprot, oprot):
+        args = delete_backend_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = delete_backend_result()
+        try:
+            result.success = self._handler.delete_backend(args.id)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("delete_backend", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_add_user_to_backend(self, seqid, iprot, oprot):
+        args = add_user_to_backend_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = add_user_to_backend_result()
+        try:
+            result.success = self._handler.add_user_to_backend(
+                args.backend_id, args.user_id
+            )
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("add_user_to_backend", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_get_users_from_backend(self, seqid, iprot, oprot):
+        args = get_users_from_backend_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = get_users_from_backend_result()
+        try:
+            result.success = self._handler.get_users_from_backend(args.backend_id)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("get_users_from_backend", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_delete_user_from_backend(self, seqid, iprot, oprot):
+        args = delete_user_from_backend_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = delete_user_from_backend_result()
+        try:
+            result.success = self._handler.delete_user_from_backend(
+                args.backend_id, args.user_id
+            )
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("delete_user_from_backend", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_get_templates(self, seqid, iprot, oprot):
+        args = get_templates_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = get_templates_result()
+        try:
+            result.success = self._handler.get_templates()
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("get_templates", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_get_allowed_templates(self, seqid, iprot, oprot):
+        args = get_allowed_templates_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = get_allowed_templates_result()
+        try:
+            result.success = self._handler.get_allowed_templates()
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("get_allowed_templates", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_get_templates_by_template(self, seqid, iprot, oprot):
+        args = get_templates_by_template_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = get_templates_by_template_result()
+        try:
+            result.success = self._handler.get_templates_by_template(args.template_name)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("get_templates_by_template", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_check_template(self, seqid, iprot, oprot):
+        args = check_template_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = check_template_result()
+        try:
+            result.success = self._handler.check_template(
+                args.template_name, args.template_version
+            )
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("check_template", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_add_udp_security_group(self, seqid, iprot, oprot):
+        args = add_udp_security_group_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = add_udp_security_group_result()
+        try:
+            result.success = self._handler.add_udp_security_group(args.server_id)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except ressourceException as r:
+            msg_type = TMessageType.REPLY
+            result.r = r
+        except serverNotFoundException as s:
+            msg_type = TMessageType.REPLY
+            result.s = s
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("add_udp_security_group", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_get_servers(self, seqid, iprot, oprot):
+        args = get_servers_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = get_servers_result()
+        try:
+            result.success = self._handler.get_servers()
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("get_servers", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_get_server_openstack_ids(self, seqid, iprot, oprot):
+        args = get_server_openstack_ids_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = get_server_openstack_ids_result()
+        try:
+            result.success = self._handler.get_server_openstack_ids(args.filter_tag)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("get_server_openstack_ids", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_get_servers_by_ids(self, seqid, iprot, oprot):
+        args = get_servers_by_ids_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = get_servers_by_ids_result()
+        try:
+            result.success = self._handler.get_servers_by_ids(args.server_ids)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("get_servers_by_ids", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_check_server_task_state(self, seqid, iprot, oprot):
+        args = check_server_task_state_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = check_server_task_state_result()
+        try:
+            result.success = self._handler.check_server_task_state(args.openstack_id)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("check_server_task_state", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_get_servers_by_bibigrid_id(self, seqid, iprot, oprot):
+        args = get_servers_by_bibigrid_id_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = get_servers_by_bibigrid_id_result()
+        try:
+            result.success = self._handler.get_servers_by_bibigrid_id(args.bibigrid_id)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("get_servers_by_bibigrid_id", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_add_server_metadata(self, seqid, iprot, oprot):
+        args = add_server_metadata_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = add_server_metadata_result()
+        try:
+            self._handler.add_server_metadata(args.server_id, args.metadata)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except serverNotFoundException as e:
+            msg_type = TMessageType.REPLY
+            result.e = e
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("add_server_metadata", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_create_resenv_security_group_and_attach_to_server(
+        self, seqid, iprot, oprot
+    ):
+        args = create_resenv_security_group_and_attach_to_server_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = create_resenv_security_group_and_attach_to_server_result()
+        try:
+            self._handler.create_resenv_security_group_and_attach_to_server(
+                args.server_id, args.resenv_template
+            )
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except serverNotFoundException as e:
+            msg_type = TMessageType.REPLY
+            result.e = e
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin(
+            "create_resenv_security_group_and_attach_to_server", msg_type, seqid
+        )
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_add_cluster_machine(self, seqid, iprot, oprot):
+        args = add_cluster_machine_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = add_cluster_machine_result()
+        try:
+            result.success = self._handler.add_cluster_machine(
+                args.cluster_id,
+                args.cluster_user,
+                args.cluster_group_id,
+                args.image,
+                args.flavor,
+                args.name,
+                args.key_name,
+                args.batch_idx,
+                args.worker_idx,
+                args.pub_key,
+                args.project_name,
+                args.project_id,
+                args.slurm_version,
+            )
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("add_cluster_machine", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_get_cluster_info(self, seqid, iprot, oprot):
+        args = get_cluster_info_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = get_cluster_info_result()
+        try:
+            result.success = self._handler.get_cluster_info(args.cluster_id)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("get_cluster_info", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_get_cluster_status(self, seqid, iprot, oprot):
+        args = get_cluster_status_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = get_cluster_status_result()
+        try:
+            result.success = self._handler.get_cluster_status(args.cluster_id)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("get_cluster_status", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_get_server(self, seqid, iprot, oprot):
+        args = get_server_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = get_server_result()
+        try:
+            result.success = self._handler.get_server(args.openstack_id)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except serverNotFoundException as e:
+            msg_type = TMessageType.REPLY
+            result.e = e
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("get_server", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_stop_server(self, seqid, iprot, oprot):
+        args = stop_server_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = stop_server_result()
+        try:
+            result.success = self._handler.stop_server(args.openstack_id)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except serverNotFoundException as e:
+            msg_type = TMessageType.REPLY
+            result.e = e
+        except conflictException as c:
+            msg_type = TMessageType.REPLY
+            result.c = c
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("stop_server", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_create_snapshot(self, seqid, iprot, oprot):
+        args = create_snapshot_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = create_snapshot_result()
+        try:
+            result.success = self._handler.create_snapshot(
+                args.openstack_id,
+                args.name,
+                args.elixir_id,
+                args.base_tags,
+                args.description,
+            )
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except serverNotFoundException as e:
+            msg_type = TMessageType.REPLY
+            result.e = e
+        except conflictException as c:
+            msg_type = TMessageType.REPLY
+            result.c = c
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("create_snapshot", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_get_limits(self, seqid, iprot, oprot):
+        args = get_limits_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = get_limits_result()
+        try:
+            result.success = self._handler.get_limits()
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("get_limits", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_start_cluster(self, seqid, iprot, oprot):
+        args = start_cluster_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = start_cluster_result()
+        try:
+            result.success = self._handler.start_cluster(
+                args.public_keys, args.master_instance, args.worker_instance, args.user
+            )
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("start_cluster", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_terminate_cluster(self, seqid, iprot, oprot):
+        args = terminate_cluster_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = terminate_cluster_result()
+        try:
+            result.success = self._handler.terminate_cluster(args.cluster_id)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("terminate_cluster", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_delete_image(self, seqid, iprot, oprot):
+        args = delete_image_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = delete_image_result()
+        try:
+            result.success = self._handler.delete_image(args.image_id)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except imageNotFoundException as e:
+            msg_type = TMessageType.REPLY
+            result.e = e
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("delete_image", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_delete_volume_attachment(self, seqid, iprot, oprot):
+        args = delete_volume_attachment_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = delete_volume_attachment_result()
+        try:
+            result.success = self._handler.delete_volume_attachment(
+                args.volume_id, args.server_id
+            )
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except serverNotFoundException as e:
+            msg_type = TMessageType.REPLY
+            result.e = e
+        except conflictException as c:
+            msg_type = TMessageType.REPLY
+            result.c = c
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("delete_volume_attachment", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_delete_volume(self, seqid, iprot, oprot):
+        args = delete_volume_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = delete_volume_result()
+        try:
+            result.success = self._handler.delete_volume(args.volume_id)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except conflictException as c:
+            msg_type = TMessageType.REPLY
+            result.c = c
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("delete_volume", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_attach_volume_to_server(self, seqid, iprot, oprot):
+        args = attach_volume_to_server_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = attach_volume_to_server_result()
+        try:
+            result.success = self._handler.attach_volume_to_server(
+                args.openstack_id, args.volume_id
+            )
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except serverNotFoundException as e:
+            msg_type = TMessageType.REPLY
+            result.e = e
+        except conflictException as c:
+            msg_type = TMessageType.REPLY
+            result.c = c
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("attach_volume_to_server", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_check_server_status(self, seqid, iprot, oprot):
+        args = check_server_status_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = check_server_status_result()
+        try:
+            result.success = self._handler.check_server_status(args.openstack_id)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except serverNotFoundException as e:
+            msg_type = TMessageType.REPLY
+            result.e = e
+        except ressourceException as r:
+            msg_type = TMessageType.REPLY
+            result.r = r
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("check_server_status", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_setUserPassword(self, seqid, iprot, oprot):
+        args = setUserPassword_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = setUserPassword_result()
+        try:
+            result.success = self._handler.setUserPassword(args.user, args.password)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except otherException as e:
+            msg_type = TMessageType.REPLY
+            result.e = e
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("setUserPassword", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_resume_server(self, seqid, iprot, oprot):
+        args = resume_server_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = resume_server_result()
+        try:
+            result.success = self._handler.resume_server(args.openstack_id)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except serverNotFoundException as e:
+            msg_type = TMessageType.REPLY
+            result.e = e
+        except conflictException as c:
+            msg_type = TMessageType.REPLY
+            result.c = c
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("resume_server", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_create_volume(self, seqid, iprot, oprot):
+        args = create_volume_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = create_volume_result()
+        try:
+            result.success = self._handler.create_volume(
+                args.volume_name, args.volume_storage, args.metadata
+            )
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except ressourceException as r:
+            msg_type = TMessageType.REPLY
+            result.r = r
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("create_volume", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_reboot_server(self, seqid, iprot, oprot):
+        args = reboot_server_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = reboot_server_result()
+        try:
+            result.success = self._handler.reboot_server(
+                args.server_id, args.reboot_type
+            )
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except serverNotFoundException as e:
+            msg_type = TMessageType.REPLY
+            result.e = e
+        except conflictException as c:
+            msg_type = TMessageType.REPLY
+            result.c = c
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("reboot_server", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_get_vms_ports(self, seqid, iprot, oprot):
+        args = get_vms_ports_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = get_vms_ports_result()
+        try:
+            result.success = self._handler.get_vms_ports(args.openstack_ids)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("get_vms_ports", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_get_playbook_log_chunk(self, seqid, iprot, oprot):
+        args = get_playbook_log_chunk_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = get_playbook_log_chunk_result()
+        try:
+            result.success = self._handler.get_playbook_log_chunk(
+                args.openstack_id, args.stream, args.offset, args.max_bytes
+            )
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except otherException as o:
+            msg_type = TMessageType.REPLY
+            result.o = o
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("get_playbook_log_chunk", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_check_servers_status(self, seqid, iprot, oprot):
+        args = check_servers_status_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = check_servers_status_result()
+        try:
+            result.success = self._handler.check_servers_status(args.openstack_ids)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("check_servers_status", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_delete_server_async(self, seqid, iprot, oprot):
+        args = delete_server_async_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = delete_server_async_result()
+        try:
+            result.success = self._handler.delete_server_async(args.openstack_id)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("delete_server_async", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_delete_servers_async(self, seqid, iprot, oprot):
+        args = delete_servers_async_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = delete_servers_async_result()
+        try:
+            result.success = self._handler.delete_servers_async(args.openstack_ids)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("delete_servers_async", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_get_job_status(self, seqid, iprot, oprot):
+        args = get_job_status_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = get_job_status_result()
+        try:
+            result.success = self._handler.get_job_status(args.job_id)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("get_job_status", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_get_jobs_status(self, seqid, iprot, oprot):
+        args = get_jobs_status_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = get_jobs_status_result()
+        try:
+            result.success = self._handler.get_jobs_status(args.job_ids)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("get_jobs_status", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_start_server_async(self, seqid, iprot, oprot):
+        args = start_server_async_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = start_server_async_result()
+        try:
+            result.success = self._handler.start_server_async(
+                args.flavor,
+                args.image,
+                args.public_key,
+                args.servername,
+                args.metadata,
+                args.diskspace,
+                args.volumename,
+                args.https,
+                args.http,
+                args.resenv,
+                args.idempotency_key,
+            )
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("start_server_async", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_start_server_with_custom_key_async(self, seqid, iprot, oprot):
+        args = start_server_with_custom_key_async_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = start_server_with_custom_key_async_result()
+        try:
+            result.success = self._handler.start_server_with_custom_key_async(
+                args.flavor,
+                args.image,
+                args.servername,
+                args.metadata,
+                args.http,
+                args.https,
+                args.resenv,
+                args.volume_ids_path_new,
+                args.volume_ids_path_attach,
+                args.idempotency_key,
+            )
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("start_server_with_custom_key_async", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_start_server_without_playbook_async(self, seqid, iprot, oprot):
+        args = start_server_without_playbook_async_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = start_server_without_playbook_async_result()
+        try:
+            result.success = self._handler.start_server_without_playbook_async(
+                args.flavor,
+                args.image,
+                args.public_key,
+                args.servername,
+                args.metadata,
+                args.https,
+                args.http,
+                args.resenv,
+                args.volume_ids_path_new,
+                args.volume_ids_path_attach,
+                args.additional_keys,
+                args.idempotency_key,
+            )
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("start_server_without_playbook_async", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_start_server_with_mounted_volume_async(self, seqid, iprot, oprot):
+        args = start_server_with_mounted_volume_async_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = start_server_with_mounted_volume_async_result()
+        try:
+            result.success = self._handler.start_server_with_mounted_volume_async(
+                args.flavor,
+                args.image,
                 args.public_key,
                 args.servername,
                 args.metadata,
@@ -4669,1390 +7456,2128 @@ class Processor(Iface, TProcessor):
                 args.resenv,
                 args.volume_ids_path_new,
                 args.volume_ids_path_attach,
+                args.idempotency_key,
+            )
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin(
+            "start_server_with_mounted_volume_async", msg_type, seqid
+        )
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_start_servers_with_custom_key(self, seqid, iprot, oprot):
+        args = start_servers_with_custom_key_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = start_servers_with_custom_key_result()
+        try:
+            result.success = self._handler.start_servers_with_custom_key(
+                args.flavor,
+                args.image,
+                args.servernames,
+                args.metadatas,
+                args.http,
+                args.https,
+                args.resenv,
+            )
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except imageNotFoundException as i:
+            msg_type = TMessageType.REPLY
+            result.i = i
+        except flavorNotFoundException as f:
+            msg_type = TMessageType.REPLY
+            result.f = f
+        except networkNotFoundException as n:
+            msg_type = TMessageType.REPLY
+            result.n = n
+        except otherException as o:
+            msg_type = TMessageType.REPLY
+            result.o = o
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("start_servers_with_custom_key", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_acknowledge_job(self, seqid, iprot, oprot):
+        args = acknowledge_job_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = acknowledge_job_result()
+        try:
+            result.success = self._handler.acknowledge_job(args.job_id)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("acknowledge_job", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_get_server_stats(self, seqid, iprot, oprot):
+        args = get_server_stats_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = get_server_stats_result()
+        try:
+            result.success = self._handler.get_server_stats()
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception("TApplication exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception("Unexpected exception in handler")
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(
+                TApplicationException.INTERNAL_ERROR, "Internal error"
+            )
+        oprot.writeMessageBegin("get_server_stats", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+
+# HELPER FUNCTIONS AND STRUCTURES
+
+
+class check_Version_args(object):
+    """
+    Attributes:
+     - version
+
+    """
+
+    def __init__(
+        self,
+        version=None,
+    ):
+        self.version = version
+
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.DOUBLE:
+                    self.version = iprot.readDouble()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
+            )
+            return
+        oprot.writeStructBegin("check_Version_args")
+        if self.version is not None:
+            oprot.writeFieldBegin("version", TType.DOUBLE, 1)
+            oprot.writeDouble(self.version)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+all_structs.append(check_Version_args)
+check_Version_args.thrift_spec = (
+    None,  # 0
+    (
+        1,
+        TType.DOUBLE,
+        "version",
+        None,
+        None,
+    ),  # 1
+)
+
+
+class check_Version_result(object):
+    """
+    Attributes:
+     - success
+
+    """
+
+    def __init__(
+        self,
+        success=None,
+    ):
+        self.success = success
+
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.BOOL:
+                    self.success = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
+            )
+            return
+        oprot.writeStructBegin("check_Version_result")
+        if self.success is not None:
+            oprot.writeFieldBegin("success", TType.BOOL, 0)
+            oprot.writeBool(self.success)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+all_structs.append(check_Version_result)
+check_Version_result.thrift_spec = (
+    (
+        0,
+        TType.BOOL,
+        "success",
+        None,
+        None,
+    ),  # 0
+)
+
+
+class get_client_version_args(object):
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
+            )
+            return
+        oprot.writeStructBegin("get_client_version_args")
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+all_structs.append(get_client_version_args)
+get_client_version_args.thrift_spec = ()
+
+
+class get_client_version_result(object):
+    """
+    Attributes:
+     - success
+
+    """
+
+    def __init__(
+        self,
+        success=None,
+    ):
+        self.success = success
+
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.STRING:
+                    self.success = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
+            )
+            return
+        oprot.writeStructBegin("get_client_version_result")
+        if self.success is not None:
+            oprot.writeFieldBegin("success", TType.STRING, 0)
+            oprot.writeString(
+                self.success.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.success
+            )
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+all_structs.append(get_client_version_result)
+get_client_version_result.thrift_spec = (
+    (
+        0,
+        TType.STRING,
+        "success",
+        "UTF8",
+        None,
+    ),  # 0
+)
+
+
+class get_gateway_ip_args(object):
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
+            )
+            return
+        oprot.writeStructBegin("get_gateway_ip_args")
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+all_structs.append(get_gateway_ip_args)
+get_gateway_ip_args.thrift_spec = ()
+
+
+class get_gateway_ip_result(object):
+    """
+    Attributes:
+     - success
+
+    """
+
+    def __init__(
+        self,
+        success=None,
+    ):
+        self.success = success
+
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.MAP:
+                    self.success = {}
+                    (_ktype24, _vtype25, _size23) = iprot.readMapBegin()
+                    for _i27 in range(_size23):
+                        _key28 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        _val29 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.success[_key28] = _val29
+                    iprot.readMapEnd()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
+            )
+            return
+        oprot.writeStructBegin("get_gateway_ip_result")
+        if self.success is not None:
+            oprot.writeFieldBegin("success", TType.MAP, 0)
+            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.success))
+            for kiter30, viter31 in self.success.items():
+                oprot.writeString(
+                    kiter30.encode("utf-8") if sys.version_info[0] == 2 else kiter30
+                )
+                oprot.writeString(
+                    viter31.encode("utf-8") if sys.version_info[0] == 2 else viter31
+                )
+            oprot.writeMapEnd()
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+all_structs.append(get_gateway_ip_result)
+get_gateway_ip_result.thrift_spec = (
+    (
+        0,
+        TType.MAP,
+        "success",
+        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
+        None,
+    ),  # 0
+)
+
+
+class get_calculation_formulars_args(object):
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
+            )
+            return
+        oprot.writeStructBegin("get_calculation_formulars_args")
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+all_structs.append(get_calculation_formulars_args)
+get_calculation_formulars_args.thrift_spec = ()
+
+
+class get_calculation_formulars_result(object):
+    """
+    Attributes:
+     - success
+
+    """
+
+    def __init__(
+        self,
+        success=None,
+    ):
+        self.success = success
+
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.MAP:
+                    self.success = {}
+                    (_ktype33, _vtype34, _size32) = iprot.readMapBegin()
+                    for _i36 in range(_size32):
+                        _key37 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        _val38 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.success[_key37] = _val38
+                    iprot.readMapEnd()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
+            )
+            return
+        oprot.writeStructBegin("get_calculation_formulars_result")
+        if self.success is not None:
+            oprot.writeFieldBegin("success", TType.MAP, 0)
+            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.success))
+            for kiter39, viter40 in self.success.items():
+                oprot.writeString(
+                    kiter39.encode("utf-8") if sys.version_info[0] == 2 else kiter39
+                )
+                oprot.writeString(
+                    viter40.encode("utf-8") if sys.version_info[0] == 2 else viter40
+                )
+            oprot.writeMapEnd()
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+all_structs.append(get_calculation_formulars_result)
+get_calculation_formulars_result.thrift_spec = (
+    (
+        0,
+        TType.MAP,
+        "success",
+        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
+        None,
+    ),  # 0
+)
+
+
+class import_keypair_args(object):
+    """
+    Attributes:
+     - keyname: Name for the keypair
+     - public_key: The public key
+
+    """
+
+    def __init__(
+        self,
+        keyname=None,
+        public_key=None,
+    ):
+        self.keyname = keyname
+        self.public_key = public_key
+
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.keyname = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.public_key = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
+            )
+            return
+        oprot.writeStructBegin("import_keypair_args")
+        if self.keyname is not None:
+            oprot.writeFieldBegin("keyname", TType.STRING, 1)
+            oprot.writeString(
+                self.keyname.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.keyname
+            )
+            oprot.writeFieldEnd()
+        if self.public_key is not None:
+            oprot.writeFieldBegin("public_key", TType.STRING, 2)
+            oprot.writeString(
+                self.public_key.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.public_key
+            )
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+all_structs.append(import_keypair_args)
+import_keypair_args.thrift_spec = (
+    None,  # 0
+    (
+        1,
+        TType.STRING,
+        "keyname",
+        "UTF8",
+        None,
+    ),  # 1
+    (
+        2,
+        TType.STRING,
+        "public_key",
+        "UTF8",
+        None,
+    ),  # 2
+)
+
+
+class import_keypair_result(object):
+    """
+    Attributes:
+     - success
+
+    """
+
+    def __init__(
+        self,
+        success=None,
+    ):
+        self.success = success
+
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.STRING:
+                    self.success = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
+            )
+            return
+        oprot.writeStructBegin("import_keypair_result")
+        if self.success is not None:
+            oprot.writeFieldBegin("success", TType.STRING, 0)
+            oprot.writeString(
+                self.success.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.success
+            )
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+all_structs.append(import_keypair_result)
+import_keypair_result.thrift_spec = (
+    (
+        0,
+        TType.STRING,
+        "success",
+        "UTF8",
+        None,
+    ),  # 0
+)
+
+
+class get_vm_ports_args(object):
+    """
+    Attributes:
+     - openstack_id: Id of server
+
+    """
+
+    def __init__(
+        self,
+        openstack_id=None,
+    ):
+        self.openstack_id = openstack_id
+
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.openstack_id = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
+            )
+            return
+        oprot.writeStructBegin("get_vm_ports_args")
+        if self.openstack_id is not None:
+            oprot.writeFieldBegin("openstack_id", TType.STRING, 1)
+            oprot.writeString(
+                self.openstack_id.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.openstack_id
+            )
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+all_structs.append(get_vm_ports_args)
+get_vm_ports_args.thrift_spec = (
+    None,  # 0
+    (
+        1,
+        TType.STRING,
+        "openstack_id",
+        "UTF8",
+        None,
+    ),  # 1
+)
+
+
+class get_vm_ports_result(object):
+    """
+    Attributes:
+     - success
+
+    """
+
+    def __init__(
+        self,
+        success=None,
+    ):
+        self.success = success
+
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.MAP:
+                    self.success = {}
+                    (_ktype42, _vtype43, _size41) = iprot.readMapBegin()
+                    for _i45 in range(_size41):
+                        _key46 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        _val47 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.success[_key46] = _val47
+                    iprot.readMapEnd()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
+            )
+            return
+        oprot.writeStructBegin("get_vm_ports_result")
+        if self.success is not None:
+            oprot.writeFieldBegin("success", TType.MAP, 0)
+            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.success))
+            for kiter48, viter49 in self.success.items():
+                oprot.writeString(
+                    kiter48.encode("utf-8") if sys.version_info[0] == 2 else kiter48
+                )
+                oprot.writeString(
+                    viter49.encode("utf-8") if sys.version_info[0] == 2 else viter49
+                )
+            oprot.writeMapEnd()
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+all_structs.append(get_vm_ports_result)
+get_vm_ports_result.thrift_spec = (
+    (
+        0,
+        TType.MAP,
+        "success",
+        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
+        None,
+    ),  # 0
+)
+
+
+class get_Flavors_args(object):
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
+            )
+            return
+        oprot.writeStructBegin("get_Flavors_args")
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+all_structs.append(get_Flavors_args)
+get_Flavors_args.thrift_spec = ()
+
+
+class get_Flavors_result(object):
+    """
+    Attributes:
+     - success
+
+    """
+
+    def __init__(
+        self,
+        success=None,
+    ):
+        self.success = success
+
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.LIST:
+                    self.success = []
+                    (_etype53, _size50) = iprot.readListBegin()
+                    for _i54 in range(_size50):
+                        _elem55 = Flavor()
+                        _elem55.read(iprot)
+                        self.success.append(_elem55)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except nameException as e:
-            msg_type = TMessageType.REPLY
-            result.e = e
-        except ressourceException as r:
-            msg_type = TMessageType.REPLY
-            result.r = r
-        except serverNotFoundException as s:
-            msg_type = TMessageType.REPLY
-            result.s = s
-        except networkNotFoundException as n:
-            msg_type = TMessageType.REPLY
-            result.n = n
-        except imageNotFoundException as i:
-            msg_type = TMessageType.REPLY
-            result.i = i
-        except flavorNotFoundException as f:
-            msg_type = TMessageType.REPLY
-            result.f = f
-        except otherException as o:
-            msg_type = TMessageType.REPLY
-            result.o = o
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
+            return
+        oprot.writeStructBegin("get_Flavors_result")
+        if self.success is not None:
+            oprot.writeFieldBegin("success", TType.LIST, 0)
+            oprot.writeListBegin(TType.STRUCT, len(self.success))
+            for iter56 in self.success:
+                iter56.write(oprot)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+all_structs.append(get_Flavors_result)
+get_Flavors_result.thrift_spec = (
+    (
+        0,
+        TType.LIST,
+        "success",
+        (TType.STRUCT, [Flavor, None], False),
+        None,
+    ),  # 0
+)
+
+
+class get_Images_args(object):
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
+            )
+            return
+        oprot.writeStructBegin("get_Images_args")
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+all_structs.append(get_Images_args)
+get_Images_args.thrift_spec = ()
+
+
+class get_Images_result(object):
+    """
+    Attributes:
+     - success
+
+    """
+
+    def __init__(
+        self,
+        success=None,
+    ):
+        self.success = success
+
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.LIST:
+                    self.success = []
+                    (_etype60, _size57) = iprot.readListBegin()
+                    for _i61 in range(_size57):
+                        _elem62 = Image()
+                        _elem62.read(iprot)
+                        self.success.append(_elem62)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
+            )
+            return
+        oprot.writeStructBegin("get_Images_result")
+        if self.success is not None:
+            oprot.writeFieldBegin("success", TType.LIST, 0)
+            oprot.writeListBegin(TType.STRUCT, len(self.success))
+            for iter63 in self.success:
+                iter63.write(oprot)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+all_structs.append(get_Images_result)
+get_Images_result.thrift_spec = (
+    (
+        0,
+        TType.LIST,
+        "success",
+        (TType.STRUCT, [Image, None], False),
+        None,
+    ),  # 0
+)
+
+
+class get_public_Images_args(object):
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
-        oprot.writeMessageBegin("start_server_with_mounted_volume", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+            return
+        oprot.writeStructBegin("get_public_Images_args")
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
 
-    def process_start_server(self, seqid, iprot, oprot):
-        args = start_server_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = start_server_result()
-        try:
-            result.success = self._handler.start_server(
-                args.flavor,
-                args.image,
-                args.public_key,
-                args.servername,
-                args.metadata,
-                args.diskspace,
-                args.volumename,
-                args.https,
-                args.http,
-                args.resenv,
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+all_structs.append(get_public_Images_args)
+get_public_Images_args.thrift_spec = ()
+
+
+class get_public_Images_result(object):
+    """
+    Attributes:
+     - success
+
+    """
+
+    def __init__(
+        self,
+        success=None,
+    ):
+        self.success = success
+
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.LIST:
+                    self.success = []
+                    (_etype67, _size64) = iprot.readListBegin()
+                    for _i68 in range(_size64):
+                        _elem69 = Image()
+                        _elem69.read(iprot)
+                        self.success.append(_elem69)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except nameException as e:
-            msg_type = TMessageType.REPLY
-            result.e = e
-        except ressourceException as r:
-            msg_type = TMessageType.REPLY
-            result.r = r
-        except serverNotFoundException as s:
-            msg_type = TMessageType.REPLY
-            result.s = s
-        except networkNotFoundException as n:
-            msg_type = TMessageType.REPLY
-            result.n = n
-        except imageNotFoundException as i:
-            msg_type = TMessageType.REPLY
-            result.i = i
-        except flavorNotFoundException as f:
-            msg_type = TMessageType.REPLY
-            result.f = f
-        except otherException as o:
-            msg_type = TMessageType.REPLY
-            result.o = o
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
+            return
+        oprot.writeStructBegin("get_public_Images_result")
+        if self.success is not None:
+            oprot.writeFieldBegin("success", TType.LIST, 0)
+            oprot.writeListBegin(TType.STRUCT, len(self.success))
+            for iter70 in self.success:
+                iter70.write(oprot)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+all_structs.append(get_public_Images_result)
+get_public_Images_result.thrift_spec = (
+    (
+        0,
+        TType.LIST,
+        "success",
+        (TType.STRUCT, [Image, None], False),
+        None,
+    ),  # 0
+)
+
+
+class get_private_Images_args(object):
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
-        oprot.writeMessageBegin("start_server", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+            return
+        oprot.writeStructBegin("get_private_Images_args")
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+all_structs.append(get_private_Images_args)
+get_private_Images_args.thrift_spec = ()
+
+
+class get_private_Images_result(object):
+    """
+    Attributes:
+     - success
+
+    """
+
+    def __init__(
+        self,
+        success=None,
+    ):
+        self.success = success
+
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.LIST:
+                    self.success = []
+                    (_etype74, _size71) = iprot.readListBegin()
+                    for _i75 in range(_size71):
+                        _elem76 = Image()
+                        _elem76.read(iprot)
+                        self.success.append(_elem76)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
 
-    def process_start_server_with_custom_key(self, seqid, iprot, oprot):
-        args = start_server_with_custom_key_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = start_server_with_custom_key_result()
-        try:
-            result.success = self._handler.start_server_with_custom_key(
-                args.flavor,
-                args.image,
-                args.servername,
-                args.metadata,
-                args.http,
-                args.https,
-                args.resenv,
-                args.volume_ids_path_new,
-                args.volume_ids_path_attach,
-            )
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except nameException as e:
-            msg_type = TMessageType.REPLY
-            result.e = e
-        except ressourceException as r:
-            msg_type = TMessageType.REPLY
-            result.r = r
-        except serverNotFoundException as s:
-            msg_type = TMessageType.REPLY
-            result.s = s
-        except networkNotFoundException as n:
-            msg_type = TMessageType.REPLY
-            result.n = n
-        except imageNotFoundException as i:
-            msg_type = TMessageType.REPLY
-            result.i = i
-        except flavorNotFoundException as f:
-            msg_type = TMessageType.REPLY
-            result.f = f
-        except otherException as o:
-            msg_type = TMessageType.REPLY
-            result.o = o
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
-        oprot.writeMessageBegin("start_server_with_custom_key", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+            return
+        oprot.writeStructBegin("get_private_Images_result")
+        if self.success is not None:
+            oprot.writeFieldBegin("success", TType.LIST, 0)
+            oprot.writeListBegin(TType.STRUCT, len(self.success))
+            for iter77 in self.success:
+                iter77.write(oprot)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
 
-    def process_exist_server(self, seqid, iprot, oprot):
-        args = exist_server_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = exist_server_result()
-        try:
-            result.success = self._handler.exist_server(args.name)
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
-            )
-        oprot.writeMessageBegin("exist_server", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+    def validate(self):
+        return
 
-    def process_create_and_deploy_playbook(self, seqid, iprot, oprot):
-        args = create_and_deploy_playbook_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = create_and_deploy_playbook_result()
-        try:
-            result.success = self._handler.create_and_deploy_playbook(
-                args.public_key, args.playbooks_information, args.openstack_id
-            )
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
-            )
-        oprot.writeMessageBegin("create_and_deploy_playbook", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
 
-    def process_get_playbook_logs(self, seqid, iprot, oprot):
-        args = get_playbook_logs_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = get_playbook_logs_result()
-        try:
-            result.success = self._handler.get_playbook_logs(args.openstack_id)
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
-            )
-        oprot.writeMessageBegin("get_playbook_logs", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
 
-    def process_has_forc(self, seqid, iprot, oprot):
-        args = has_forc_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = has_forc_result()
-        try:
-            result.success = self._handler.has_forc()
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
-            )
-        oprot.writeMessageBegin("has_forc", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+    def __ne__(self, other):
+        return not (self == other)
 
-    def process_get_forc_url(self, seqid, iprot, oprot):
-        args = get_forc_url_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = get_forc_url_result()
-        try:
-            result.success = self._handler.get_forc_url()
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
-            )
-        oprot.writeMessageBegin("get_forc_url", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
 
-    def process_create_backend(self, seqid, iprot, oprot):
-        args = create_backend_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = create_backend_result()
-        try:
-            result.success = self._handler.create_backend(
-                args.elixir_id, args.user_key_url, args.template, args.upstream_url
+all_structs.append(get_private_Images_result)
+get_private_Images_result.thrift_spec = (
+    (
+        0,
+        TType.LIST,
+        "success",
+        (TType.STRUCT, [Image, None], False),
+        None,
+    ),  # 0
+)
+
+
+class get_Image_with_Tag_args(object):
+    """
+    Attributes:
+     - openstack_id
+
+    """
+
+    def __init__(
+        self,
+        openstack_id=None,
+    ):
+        self.openstack_id = openstack_id
+
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.openstack_id = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
+            return
+        oprot.writeStructBegin("get_Image_with_Tag_args")
+        if self.openstack_id is not None:
+            oprot.writeFieldBegin("openstack_id", TType.STRING, 1)
+            oprot.writeString(
+                self.openstack_id.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.openstack_id
             )
-        oprot.writeMessageBegin("create_backend", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
 
-    def process_get_backends(self, seqid, iprot, oprot):
-        args = get_backends_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = get_backends_result()
-        try:
-            result.success = self._handler.get_backends()
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
-            )
-        oprot.writeMessageBegin("get_backends", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+    def validate(self):
+        return
 
-    def process_get_backends_by_owner(self, seqid, iprot, oprot):
-        args = get_backends_by_owner_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = get_backends_by_owner_result()
-        try:
-            result.success = self._handler.get_backends_by_owner(args.elixir_id)
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
-            )
-        oprot.writeMessageBegin("get_backends_by_owner", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
 
-    def process_get_backends_by_template(self, seqid, iprot, oprot):
-        args = get_backends_by_template_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = get_backends_by_template_result()
-        try:
-            result.success = self._handler.get_backends_by_template(args.template)
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
-            )
-        oprot.writeMessageBegin("get_backends_by_template", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
 
-    def process_get_backend_by_id(self, seqid, iprot, oprot):
-        args = get_backend_by_id_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = get_backend_by_id_result()
-        try:
-            result.success = self._handler.get_backend_by_id(args.id)
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
-            )
-        oprot.writeMessageBegin("get_backend_by_id", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+    def __ne__(self, other):
+        return not (self == other)
 
-    def process_delete_backend(self, seqid, iprot, oprot):
-        args = delete_backend_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = delete_backend_result()
-        try:
-            result.success = self._handler.delete_backend(args.id)
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
-            )
-        oprot.writeMessageBegin("delete_backend", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
 
-    def process_add_user_to_backend(self, seqid, iprot, oprot):
-        args = add_user_to_backend_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = add_user_to_backend_result()
-        try:
-            result.success = self._handler.add_user_to_backend(
-                args.backend_id, args.user_id
-            )
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
-            )
-        oprot.writeMessageBegin("add_user_to_backend", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+all_structs.append(get_Image_with_Tag_args)
+get_Image_with_Tag_args.thrift_spec = (
+    None,  # 0
+    (
+        1,
+        TType.STRING,
+        "openstack_id",
+        "UTF8",
+        None,
+    ),  # 1
+)
 
-    def process_get_users_from_backend(self, seqid, iprot, oprot):
-        args = get_users_from_backend_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = get_users_from_backend_result()
-        try:
-            result.success = self._handler.get_users_from_backend(args.backend_id)
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
-            )
-        oprot.writeMessageBegin("get_users_from_backend", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
 
-    def process_delete_user_from_backend(self, seqid, iprot, oprot):
-        args = delete_user_from_backend_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = delete_user_from_backend_result()
-        try:
-            result.success = self._handler.delete_user_from_backend(
-                args.backend_id, args.user_id
-            )
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
+class get_Image_with_Tag_result(object):
+    """
+    Attributes:
+     - success
+
+    """
+
+    def __init__(
+        self,
+        success=None,
+    ):
+        self.success = success
+
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.STRUCT:
+                    self.success = Image()
+                    self.success.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
-        oprot.writeMessageBegin("delete_user_from_backend", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+            return
+        oprot.writeStructBegin("get_Image_with_Tag_result")
+        if self.success is not None:
+            oprot.writeFieldBegin("success", TType.STRUCT, 0)
+            self.success.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
 
-    def process_get_templates(self, seqid, iprot, oprot):
-        args = get_templates_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = get_templates_result()
-        try:
-            result.success = self._handler.get_templates()
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
-            )
-        oprot.writeMessageBegin("get_templates", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+    def validate(self):
+        return
 
-    def process_get_allowed_templates(self, seqid, iprot, oprot):
-        args = get_allowed_templates_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = get_allowed_templates_result()
-        try:
-            result.success = self._handler.get_allowed_templates()
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
-            )
-        oprot.writeMessageBegin("get_allowed_templates", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
 
-    def process_get_templates_by_template(self, seqid, iprot, oprot):
-        args = get_templates_by_template_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = get_templates_by_template_result()
-        try:
-            result.success = self._handler.get_templates_by_template(args.template_name)
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
-            )
-        oprot.writeMessageBegin("get_templates_by_template", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
 
-    def process_check_template(self, seqid, iprot, oprot):
-        args = check_template_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = check_template_result()
-        try:
-            result.success = self._handler.check_template(
-                args.template_name, args.template_version
-            )
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
-            )
-        oprot.writeMessageBegin("check_template", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+    def __ne__(self, other):
+        return not (self == other)
 
-    def process_add_udp_security_group(self, seqid, iprot, oprot):
-        args = add_udp_security_group_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = add_udp_security_group_result()
-        try:
-            result.success = self._handler.add_udp_security_group(args.server_id)
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except ressourceException as r:
-            msg_type = TMessageType.REPLY
-            result.r = r
-        except serverNotFoundException as s:
-            msg_type = TMessageType.REPLY
-            result.s = s
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
-            )
-        oprot.writeMessageBegin("add_udp_security_group", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
 
-    def process_get_servers(self, seqid, iprot, oprot):
-        args = get_servers_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = get_servers_result()
-        try:
-            result.success = self._handler.get_servers()
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
-            )
-        oprot.writeMessageBegin("get_servers", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+all_structs.append(get_Image_with_Tag_result)
+get_Image_with_Tag_result.thrift_spec = (
+    (
+        0,
+        TType.STRUCT,
+        "success",
+        [Image, None],
+        None,
+    ),  # 0
+)
+
+
+class get_Images_by_filter_args(object):
+    """
+    Attributes:
+     - filter_json
+
+    """
+
+    def __init__(
+        self,
+        filter_json=None,
+    ):
+        self.filter_json = filter_json
+
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.MAP:
+                    self.filter_json = {}
+                    (_ktype79, _vtype80, _size78) = iprot.readMapBegin()
+                    for _i82 in range(_size78):
+                        _key83 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        _val84 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.filter_json[_key83] = _val84
+                    iprot.readMapEnd()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
 
-    def process_get_server_openstack_ids(self, seqid, iprot, oprot):
-        args = get_server_openstack_ids_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = get_server_openstack_ids_result()
-        try:
-            result.success = self._handler.get_server_openstack_ids(args.filter_tag)
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
-        oprot.writeMessageBegin("get_server_openstack_ids", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+            return
+        oprot.writeStructBegin("get_Images_by_filter_args")
+        if self.filter_json is not None:
+            oprot.writeFieldBegin("filter_json", TType.MAP, 1)
+            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.filter_json))
+            for kiter85, viter86 in self.filter_json.items():
+                oprot.writeString(
+                    kiter85.encode("utf-8") if sys.version_info[0] == 2 else kiter85
+                )
+                oprot.writeString(
+                    viter86.encode("utf-8") if sys.version_info[0] == 2 else viter86
+                )
+            oprot.writeMapEnd()
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
 
-    def process_get_servers_by_ids(self, seqid, iprot, oprot):
-        args = get_servers_by_ids_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = get_servers_by_ids_result()
-        try:
-            result.success = self._handler.get_servers_by_ids(args.server_ids)
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
-            )
-        oprot.writeMessageBegin("get_servers_by_ids", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+    def validate(self):
+        return
 
-    def process_check_server_task_state(self, seqid, iprot, oprot):
-        args = check_server_task_state_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = check_server_task_state_result()
-        try:
-            result.success = self._handler.check_server_task_state(args.openstack_id)
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
-            )
-        oprot.writeMessageBegin("check_server_task_state", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
 
-    def process_get_servers_by_bibigrid_id(self, seqid, iprot, oprot):
-        args = get_servers_by_bibigrid_id_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = get_servers_by_bibigrid_id_result()
-        try:
-            result.success = self._handler.get_servers_by_bibigrid_id(args.bibigrid_id)
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
-            )
-        oprot.writeMessageBegin("get_servers_by_bibigrid_id", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
 
-    def process_add_server_metadata(self, seqid, iprot, oprot):
-        args = add_server_metadata_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = add_server_metadata_result()
-        try:
-            self._handler.add_server_metadata(args.server_id, args.metadata)
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except serverNotFoundException as e:
-            msg_type = TMessageType.REPLY
-            result.e = e
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
-            )
-        oprot.writeMessageBegin("add_server_metadata", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+    def __ne__(self, other):
+        return not (self == other)
 
-    def process_create_resenv_security_group_and_attach_to_server(
-        self, seqid, iprot, oprot
+
+all_structs.append(get_Images_by_filter_args)
+get_Images_by_filter_args.thrift_spec = (
+    None,  # 0
+    (
+        1,
+        TType.MAP,
+        "filter_json",
+        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
+        None,
+    ),  # 1
+)
+
+
+class get_Images_by_filter_result(object):
+    """
+    Attributes:
+     - success
+
+    """
+
+    def __init__(
+        self,
+        success=None,
     ):
-        args = create_resenv_security_group_and_attach_to_server_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = create_resenv_security_group_and_attach_to_server_result()
-        try:
-            self._handler.create_resenv_security_group_and_attach_to_server(
-                args.server_id, args.resenv_template
-            )
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except serverNotFoundException as e:
-            msg_type = TMessageType.REPLY
-            result.e = e
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
-            )
-        oprot.writeMessageBegin(
-            "create_resenv_security_group_and_attach_to_server", msg_type, seqid
-        )
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+        self.success = success
+
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.LIST:
+                    self.success = []
+                    (_etype90, _size87) = iprot.readListBegin()
+                    for _i91 in range(_size87):
+                        _elem92 = Image()
+                        _elem92.read(iprot)
+                        self.success.append(_elem92)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
 
-    def process_add_cluster_machine(self, seqid, iprot, oprot):
-        args = add_cluster_machine_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = add_cluster_machine_result()
-        try:
-            result.success = self._handler.add_cluster_machine(
-                args.cluster_id,
-                args.cluster_user,
-                args.cluster_group_id,
-                args.image,
-                args.flavor,
-                args.name,
-                args.key_name,
-                args.batch_idx,
-                args.worker_idx,
-                args.pub_key,
-                args.project_name,
-                args.project_id,
-                args.slurm_version,
-            )
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
-        oprot.writeMessageBegin("add_cluster_machine", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+            return
+        oprot.writeStructBegin("get_Images_by_filter_result")
+        if self.success is not None:
+            oprot.writeFieldBegin("success", TType.LIST, 0)
+            oprot.writeListBegin(TType.STRUCT, len(self.success))
+            for iter93 in self.success:
+                iter93.write(oprot)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
 
-    def process_get_cluster_info(self, seqid, iprot, oprot):
-        args = get_cluster_info_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = get_cluster_info_result()
-        try:
-            result.success = self._handler.get_cluster_info(args.cluster_id)
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
-            )
-        oprot.writeMessageBegin("get_cluster_info", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+    def validate(self):
+        return
 
-    def process_get_cluster_status(self, seqid, iprot, oprot):
-        args = get_cluster_status_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = get_cluster_status_result()
-        try:
-            result.success = self._handler.get_cluster_status(args.cluster_id)
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
-            )
-        oprot.writeMessageBegin("get_cluster_status", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
 
-    def process_get_server(self, seqid, iprot, oprot):
-        args = get_server_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = get_server_result()
-        try:
-            result.success = self._handler.get_server(args.openstack_id)
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except serverNotFoundException as e:
-            msg_type = TMessageType.REPLY
-            result.e = e
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
-            )
-        oprot.writeMessageBegin("get_server", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
 
-    def process_stop_server(self, seqid, iprot, oprot):
-        args = stop_server_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = stop_server_result()
-        try:
-            result.success = self._handler.stop_server(args.openstack_id)
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except serverNotFoundException as e:
-            msg_type = TMessageType.REPLY
-            result.e = e
-        except conflictException as c:
-            msg_type = TMessageType.REPLY
-            result.c = c
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
-            )
-        oprot.writeMessageBegin("stop_server", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+    def __ne__(self, other):
+        return not (self == other)
 
-    def process_create_snapshot(self, seqid, iprot, oprot):
-        args = create_snapshot_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = create_snapshot_result()
-        try:
-            result.success = self._handler.create_snapshot(
-                args.openstack_id,
-                args.name,
-                args.elixir_id,
-                args.base_tags,
-                args.description,
-            )
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except serverNotFoundException as e:
-            msg_type = TMessageType.REPLY
-            result.e = e
-        except conflictException as c:
-            msg_type = TMessageType.REPLY
-            result.c = c
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
-            )
-        oprot.writeMessageBegin("create_snapshot", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
 
-    def process_get_limits(self, seqid, iprot, oprot):
-        args = get_limits_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = get_limits_result()
-        try:
-            result.success = self._handler.get_limits()
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
-            )
-        oprot.writeMessageBegin("get_limits", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+all_structs.append(get_Images_by_filter_result)
+get_Images_by_filter_result.thrift_spec = (
+    (
+        0,
+        TType.LIST,
+        "success",
+        (TType.STRUCT, [Image, None], False),
+        None,
+    ),  # 0
+)
+
+
+class get_volume_args(object):
+    """
+    Attributes:
+     - volume_id
+
+    """
+
+    def __init__(
+        self,
+        volume_id=None,
+    ):
+        self.volume_id = volume_id
+
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.volume_id = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
 
-    def process_start_cluster(self, seqid, iprot, oprot):
-        args = start_cluster_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = start_cluster_result()
-        try:
-            result.success = self._handler.start_cluster(
-                args.public_keys, args.master_instance, args.worker_instance, args.user
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
+            return
+        oprot.writeStructBegin("get_volume_args")
+        if self.volume_id is not None:
+            oprot.writeFieldBegin("volume_id", TType.STRING, 1)
+            oprot.writeString(
+                self.volume_id.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.volume_id
             )
-        oprot.writeMessageBegin("start_cluster", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
 
-    def process_terminate_cluster(self, seqid, iprot, oprot):
-        args = terminate_cluster_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = terminate_cluster_result()
-        try:
-            result.success = self._handler.terminate_cluster(args.cluster_id)
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
-            )
-        oprot.writeMessageBegin("terminate_cluster", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+    def validate(self):
+        return
 
-    def process_delete_image(self, seqid, iprot, oprot):
-        args = delete_image_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = delete_image_result()
-        try:
-            result.success = self._handler.delete_image(args.image_id)
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except imageNotFoundException as e:
-            msg_type = TMessageType.REPLY
-            result.e = e
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
-            )
-        oprot.writeMessageBegin("delete_image", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
 
-    def process_delete_volume_attachment(self, seqid, iprot, oprot):
-        args = delete_volume_attachment_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = delete_volume_attachment_result()
-        try:
-            result.success = self._handler.delete_volume_attachment(
-                args.volume_id, args.server_id
-            )
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except serverNotFoundException as e:
-            msg_type = TMessageType.REPLY
-            result.e = e
-        except conflictException as c:
-            msg_type = TMessageType.REPLY
-            result.c = c
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
-            )
-        oprot.writeMessageBegin("delete_volume_attachment", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
 
-    def process_delete_volume(self, seqid, iprot, oprot):
-        args = delete_volume_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = delete_volume_result()
-        try:
-            result.success = self._handler.delete_volume(args.volume_id)
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except conflictException as c:
-            msg_type = TMessageType.REPLY
-            result.c = c
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
-            )
-        oprot.writeMessageBegin("delete_volume", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+    def __ne__(self, other):
+        return not (self == other)
 
-    def process_attach_volume_to_server(self, seqid, iprot, oprot):
-        args = attach_volume_to_server_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = attach_volume_to_server_result()
-        try:
-            result.success = self._handler.attach_volume_to_server(
-                args.openstack_id, args.volume_id
-            )
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except serverNotFoundException as e:
-            msg_type = TMessageType.REPLY
-            result.e = e
-        except conflictException as c:
-            msg_type = TMessageType.REPLY
-            result.c = c
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
-            )
-        oprot.writeMessageBegin("attach_volume_to_server", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
 
-    def process_check_server_status(self, seqid, iprot, oprot):
-        args = check_server_status_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = check_server_status_result()
-        try:
-            result.success = self._handler.check_server_status(args.openstack_id)
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except serverNotFoundException as e:
-            msg_type = TMessageType.REPLY
-            result.e = e
-        except ressourceException as r:
-            msg_type = TMessageType.REPLY
-            result.r = r
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
+all_structs.append(get_volume_args)
+get_volume_args.thrift_spec = (
+    None,  # 0
+    (
+        1,
+        TType.STRING,
+        "volume_id",
+        "UTF8",
+        None,
+    ),  # 1
+)
+
+
+class get_volume_result(object):
+    """
+    Attributes:
+     - success
+
+    """
+
+    def __init__(
+        self,
+        success=None,
+    ):
+        self.success = success
+
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.STRUCT:
+                    self.success = Volume()
+                    self.success.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
-        oprot.writeMessageBegin("check_server_status", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+            return
+        oprot.writeStructBegin("get_volume_result")
+        if self.success is not None:
+            oprot.writeFieldBegin("success", TType.STRUCT, 0)
+            self.success.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
 
-    def process_setUserPassword(self, seqid, iprot, oprot):
-        args = setUserPassword_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = setUserPassword_result()
-        try:
-            result.success = self._handler.setUserPassword(args.user, args.password)
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except otherException as e:
-            msg_type = TMessageType.REPLY
-            result.e = e
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
-            )
-        oprot.writeMessageBegin("setUserPassword", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+    def validate(self):
+        return
 
-    def process_resume_server(self, seqid, iprot, oprot):
-        args = resume_server_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = resume_server_result()
-        try:
-            result.success = self._handler.resume_server(args.openstack_id)
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except serverNotFoundException as e:
-            msg_type = TMessageType.REPLY
-            result.e = e
-        except conflictException as c:
-            msg_type = TMessageType.REPLY
-            result.c = c
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
-            )
-        oprot.writeMessageBegin("resume_server", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
 
-    def process_create_volume(self, seqid, iprot, oprot):
-        args = create_volume_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = create_volume_result()
-        try:
-            result.success = self._handler.create_volume(
-                args.volume_name, args.volume_storage, args.metadata
-            )
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except ressourceException as r:
-            msg_type = TMessageType.REPLY
-            result.r = r
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
-            )
-        oprot.writeMessageBegin("create_volume", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
 
-    def process_reboot_server(self, seqid, iprot, oprot):
-        args = reboot_server_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = reboot_server_result()
-        try:
-            result.success = self._handler.reboot_server(
-                args.server_id, args.reboot_type
-            )
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except serverNotFoundException as e:
-            msg_type = TMessageType.REPLY
-            result.e = e
-        except conflictException as c:
-            msg_type = TMessageType.REPLY
-            result.c = c
-        except TApplicationException as ex:
-            logging.exception("TApplication exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception("Unexpected exception in handler")
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(
-                TApplicationException.INTERNAL_ERROR, "Internal error"
-            )
-        oprot.writeMessageBegin("reboot_server", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+    def __ne__(self, other):
+        return not (self == other)
 
 
-# HELPER FUNCTIONS AND STRUCTURES
+all_structs.append(get_volume_result)
+get_volume_result.thrift_spec = (
+    (
+        0,
+        TType.STRUCT,
+        "success",
+        [Volume, None],
+        None,
+    ),  # 0
+)
 
 
-class check_Version_args(object):
+class get_volumes_by_ids_args(object):
     """
     Attributes:
-     - version
+     - volume_ids
 
     """
 
     def __init__(
         self,
-        version=None,
+        volume_ids=None,
     ):
-        self.version = version
+        self.volume_ids = volume_ids
 
     def read(self, iprot):
         if (
@@ -6068,8 +9593,17 @@ class check_Version_args(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.DOUBLE:
-                    self.version = iprot.readDouble()
+                if ftype == TType.LIST:
+                    self.volume_ids = []
+                    (_etype97, _size94) = iprot.readListBegin()
+                    for _i98 in range(_size94):
+                        _elem99 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.volume_ids.append(_elem99)
+                    iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -6083,10 +9617,15 @@ class check_Version_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("check_Version_args")
-        if self.version is not None:
-            oprot.writeFieldBegin("version", TType.DOUBLE, 1)
-            oprot.writeDouble(self.version)
+        oprot.writeStructBegin("get_volumes_by_ids_args")
+        if self.volume_ids is not None:
+            oprot.writeFieldBegin("volume_ids", TType.LIST, 1)
+            oprot.writeListBegin(TType.STRING, len(self.volume_ids))
+            for iter100 in self.volume_ids:
+                oprot.writeString(
+                    iter100.encode("utf-8") if sys.version_info[0] == 2 else iter100
+                )
+            oprot.writeListEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -6105,20 +9644,20 @@ class check_Version_args(object):
         return not (self == other)
 
 
-all_structs.append(check_Version_args)
-check_Version_args.thrift_spec = (
+all_structs.append(get_volumes_by_ids_args)
+get_volumes_by_ids_args.thrift_spec = (
     None,  # 0
     (
         1,
-        TType.DOUBLE,
-        "version",
-        None,
+        TType.LIST,
+        "volume_ids",
+        (TType.STRING, "UTF8", False),
         None,
     ),  # 1
 )
 
 
-class check_Version_result(object):
+class get_volumes_by_ids_result(object):
     """
     Attributes:
      - success
@@ -6145,8 +9684,14 @@ class check_Version_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.BOOL:
-                    self.success = iprot.readBool()
+                if ftype == TType.LIST:
+                    self.success = []
+                    (_etype104, _size101) = iprot.readListBegin()
+                    for _i105 in range(_size101):
+                        _elem106 = Volume()
+                        _elem106.read(iprot)
+                        self.success.append(_elem106)
+                    iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -6160,10 +9705,13 @@ class check_Version_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("check_Version_result")
+        oprot.writeStructBegin("get_volumes_by_ids_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.BOOL, 0)
-            oprot.writeBool(self.success)
+            oprot.writeFieldBegin("success", TType.LIST, 0)
+            oprot.writeListBegin(TType.STRUCT, len(self.success))
+            for iter107 in self.success:
+                iter107.write(oprot)
+            oprot.writeListEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -6182,19 +9730,34 @@ class check_Version_result(object):
         return not (self == other)
 
 
-all_structs.append(check_Version_result)
-check_Version_result.thrift_spec = (
+all_structs.append(get_volumes_by_ids_result)
+get_volumes_by_ids_result.thrift_spec = (
     (
         0,
-        TType.BOOL,
+        TType.LIST,
         "success",
-        None,
+        (TType.STRUCT, [Volume, None], False),
         None,
     ),  # 0
 )
 
 
-class get_client_version_args(object):
+class resize_volume_args(object):
+    """
+    Attributes:
+     - volume_id
+     - size
+
+    """
+
+    def __init__(
+        self,
+        volume_id=None,
+        size=None,
+    ):
+        self.volume_id = volume_id
+        self.size = size
+
     def read(self, iprot):
         if (
             iprot._fast_decode is not None
@@ -6208,6 +9771,20 @@ class get_client_version_args(object):
             (fname, ftype, fid) = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.volume_id = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.I32:
+                    self.size = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -6219,7 +9796,19 @@ class get_client_version_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_client_version_args")
+        oprot.writeStructBegin("resize_volume_args")
+        if self.volume_id is not None:
+            oprot.writeFieldBegin("volume_id", TType.STRING, 1)
+            oprot.writeString(
+                self.volume_id.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.volume_id
+            )
+            oprot.writeFieldEnd()
+        if self.size is not None:
+            oprot.writeFieldBegin("size", TType.I32, 2)
+            oprot.writeI32(self.size)
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -6237,11 +9826,27 @@ class get_client_version_args(object):
         return not (self == other)
 
 
-all_structs.append(get_client_version_args)
-get_client_version_args.thrift_spec = ()
+all_structs.append(resize_volume_args)
+resize_volume_args.thrift_spec = (
+    None,  # 0
+    (
+        1,
+        TType.STRING,
+        "volume_id",
+        "UTF8",
+        None,
+    ),  # 1
+    (
+        2,
+        TType.I32,
+        "size",
+        None,
+        None,
+    ),  # 2
+)
 
 
-class get_client_version_result(object):
+class resize_volume_result(object):
     """
     Attributes:
      - success
@@ -6268,12 +9873,8 @@ class get_client_version_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.STRING:
-                    self.success = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
+                if ftype == TType.I32:
+                    self.success = iprot.readI32()
                 else:
                     iprot.skip(ftype)
             else:
@@ -6287,14 +9888,10 @@ class get_client_version_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_client_version_result")
+        oprot.writeStructBegin("resize_volume_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.STRING, 0)
-            oprot.writeString(
-                self.success.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.success
-            )
+            oprot.writeFieldBegin("success", TType.I32, 0)
+            oprot.writeI32(self.success)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -6313,19 +9910,31 @@ class get_client_version_result(object):
         return not (self == other)
 
 
-all_structs.append(get_client_version_result)
-get_client_version_result.thrift_spec = (
+all_structs.append(resize_volume_result)
+resize_volume_result.thrift_spec = (
     (
         0,
-        TType.STRING,
+        TType.I32,
         "success",
-        "UTF8",
+        None,
         None,
     ),  # 0
 )
 
 
-class get_gateway_ip_args(object):
+class delete_server_args(object):
+    """
+    Attributes:
+     - openstack_id: Id of the server.
+
+    """
+
+    def __init__(
+        self,
+        openstack_id=None,
+    ):
+        self.openstack_id = openstack_id
+
     def read(self, iprot):
         if (
             iprot._fast_decode is not None
@@ -6339,6 +9948,15 @@ class get_gateway_ip_args(object):
             (fname, ftype, fid) = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.openstack_id = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -6350,7 +9968,15 @@ class get_gateway_ip_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_gateway_ip_args")
+        oprot.writeStructBegin("delete_server_args")
+        if self.openstack_id is not None:
+            oprot.writeFieldBegin("openstack_id", TType.STRING, 1)
+            oprot.writeString(
+                self.openstack_id.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.openstack_id
+            )
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -6368,22 +9994,37 @@ class get_gateway_ip_args(object):
         return not (self == other)
 
 
-all_structs.append(get_gateway_ip_args)
-get_gateway_ip_args.thrift_spec = ()
+all_structs.append(delete_server_args)
+delete_server_args.thrift_spec = (
+    None,  # 0
+    (
+        1,
+        TType.STRING,
+        "openstack_id",
+        "UTF8",
+        None,
+    ),  # 1
+)
 
 
-class get_gateway_ip_result(object):
+class delete_server_result(object):
     """
     Attributes:
      - success
+     - e
+     - c
 
     """
 
     def __init__(
         self,
         success=None,
+        e=None,
+        c=None,
     ):
         self.success = success
+        self.e = e
+        self.c = c
 
     def read(self, iprot):
         if (
@@ -6399,22 +10040,18 @@ class get_gateway_ip_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.MAP:
-                    self.success = {}
-                    (_ktype24, _vtype25, _size23) = iprot.readMapBegin()
-                    for _i27 in range(_size23):
-                        _key28 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        _val29 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        self.success[_key28] = _val29
-                    iprot.readMapEnd()
+                if ftype == TType.BOOL:
+                    self.success = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 1:
+                if ftype == TType.STRUCT:
+                    self.e = serverNotFoundException.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRUCT:
+                    self.c = conflictException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -6428,18 +10065,18 @@ class get_gateway_ip_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_gateway_ip_result")
+        oprot.writeStructBegin("delete_server_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.MAP, 0)
-            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.success))
-            for kiter30, viter31 in self.success.items():
-                oprot.writeString(
-                    kiter30.encode("utf-8") if sys.version_info[0] == 2 else kiter30
-                )
-                oprot.writeString(
-                    viter31.encode("utf-8") if sys.version_info[0] == 2 else viter31
-                )
-            oprot.writeMapEnd()
+            oprot.writeFieldBegin("success", TType.BOOL, 0)
+            oprot.writeBool(self.success)
+            oprot.writeFieldEnd()
+        if self.e is not None:
+            oprot.writeFieldBegin("e", TType.STRUCT, 1)
+            self.e.write(oprot)
+            oprot.writeFieldEnd()
+        if self.c is not None:
+            oprot.writeFieldBegin("c", TType.STRUCT, 2)
+            self.c.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -6458,19 +10095,48 @@ class get_gateway_ip_result(object):
         return not (self == other)
 
 
-all_structs.append(get_gateway_ip_result)
-get_gateway_ip_result.thrift_spec = (
+all_structs.append(delete_server_result)
+delete_server_result.thrift_spec = (
     (
         0,
-        TType.MAP,
+        TType.BOOL,
         "success",
-        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
+        None,
         None,
     ),  # 0
+    (
+        1,
+        TType.STRUCT,
+        "e",
+        [serverNotFoundException, None],
+        None,
+    ),  # 1
+    (
+        2,
+        TType.STRUCT,
+        "c",
+        [conflictException, None],
+        None,
+    ),  # 2
 )
 
 
-class get_calculation_formulars_args(object):
+class add_metadata_to_server_args(object):
+    """
+    Attributes:
+     - servername
+     - metadata
+
+    """
+
+    def __init__(
+        self,
+        servername=None,
+        metadata=None,
+    ):
+        self.servername = servername
+        self.metadata = metadata
+
     def read(self, iprot):
         if (
             iprot._fast_decode is not None
@@ -6484,6 +10150,34 @@ class get_calculation_formulars_args(object):
             (fname, ftype, fid) = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.servername = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.MAP:
+                    self.metadata = {}
+                    (_ktype109, _vtype110, _size108) = iprot.readMapBegin()
+                    for _i112 in range(_size108):
+                        _key113 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        _val114 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.metadata[_key113] = _val114
+                    iprot.readMapEnd()
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -6495,7 +10189,27 @@ class get_calculation_formulars_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_calculation_formulars_args")
+        oprot.writeStructBegin("add_metadata_to_server_args")
+        if self.servername is not None:
+            oprot.writeFieldBegin("servername", TType.STRING, 1)
+            oprot.writeString(
+                self.servername.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.servername
+            )
+            oprot.writeFieldEnd()
+        if self.metadata is not None:
+            oprot.writeFieldBegin("metadata", TType.MAP, 2)
+            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.metadata))
+            for kiter115, viter116 in self.metadata.items():
+                oprot.writeString(
+                    kiter115.encode("utf-8") if sys.version_info[0] == 2 else kiter115
+                )
+                oprot.writeString(
+                    viter116.encode("utf-8") if sys.version_info[0] == 2 else viter116
+                )
+            oprot.writeMapEnd()
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -6513,22 +10227,41 @@ class get_calculation_formulars_args(object):
         return not (self == other)
 
 
-all_structs.append(get_calculation_formulars_args)
-get_calculation_formulars_args.thrift_spec = ()
+all_structs.append(add_metadata_to_server_args)
+add_metadata_to_server_args.thrift_spec = (
+    None,  # 0
+    (
+        1,
+        TType.STRING,
+        "servername",
+        "UTF8",
+        None,
+    ),  # 1
+    (
+        2,
+        TType.MAP,
+        "metadata",
+        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
+        None,
+    ),  # 2
+)
 
 
-class get_calculation_formulars_result(object):
+class add_metadata_to_server_result(object):
     """
     Attributes:
      - success
+     - e
 
     """
 
     def __init__(
         self,
         success=None,
+        e=None,
     ):
         self.success = success
+        self.e = e
 
     def read(self, iprot):
         if (
@@ -6546,22 +10279,27 @@ class get_calculation_formulars_result(object):
             if fid == 0:
                 if ftype == TType.MAP:
                     self.success = {}
-                    (_ktype33, _vtype34, _size32) = iprot.readMapBegin()
-                    for _i36 in range(_size32):
-                        _key37 = (
+                    (_ktype118, _vtype119, _size117) = iprot.readMapBegin()
+                    for _i121 in range(_size117):
+                        _key122 = (
                             iprot.readString().decode("utf-8", errors="replace")
                             if sys.version_info[0] == 2
                             else iprot.readString()
                         )
-                        _val38 = (
+                        _val123 = (
                             iprot.readString().decode("utf-8", errors="replace")
                             if sys.version_info[0] == 2
                             else iprot.readString()
                         )
-                        self.success[_key37] = _val38
+                        self.success[_key122] = _val123
                     iprot.readMapEnd()
                 else:
                     iprot.skip(ftype)
+            elif fid == 1:
+                if ftype == TType.STRUCT:
+                    self.e = serverNotFoundException.read(iprot)
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -6573,19 +10311,23 @@ class get_calculation_formulars_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_calculation_formulars_result")
+        oprot.writeStructBegin("add_metadata_to_server_result")
         if self.success is not None:
             oprot.writeFieldBegin("success", TType.MAP, 0)
             oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.success))
-            for kiter39, viter40 in self.success.items():
+            for kiter124, viter125 in self.success.items():
                 oprot.writeString(
-                    kiter39.encode("utf-8") if sys.version_info[0] == 2 else kiter39
+                    kiter124.encode("utf-8") if sys.version_info[0] == 2 else kiter124
                 )
                 oprot.writeString(
-                    viter40.encode("utf-8") if sys.version_info[0] == 2 else viter40
+                    viter125.encode("utf-8") if sys.version_info[0] == 2 else viter125
                 )
             oprot.writeMapEnd()
             oprot.writeFieldEnd()
+        if self.e is not None:
+            oprot.writeFieldBegin("e", TType.STRUCT, 1)
+            self.e.write(oprot)
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -6603,8 +10345,8 @@ class get_calculation_formulars_result(object):
         return not (self == other)
 
 
-all_structs.append(get_calculation_formulars_result)
-get_calculation_formulars_result.thrift_spec = (
+all_structs.append(add_metadata_to_server_result)
+add_metadata_to_server_result.thrift_spec = (
     (
         0,
         TType.MAP,
@@ -6612,24 +10354,31 @@ get_calculation_formulars_result.thrift_spec = (
         (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
         None,
     ),  # 0
+    (
+        1,
+        TType.STRUCT,
+        "e",
+        [serverNotFoundException, None],
+        None,
+    ),  # 1
 )
 
 
-class import_keypair_args(object):
+class delete_metadata_from_server_args(object):
     """
     Attributes:
-     - keyname: Name for the keypair
-     - public_key: The public key
+     - servername
+     - keys
 
     """
 
     def __init__(
         self,
-        keyname=None,
-        public_key=None,
+        servername=None,
+        keys=None,
     ):
-        self.keyname = keyname
-        self.public_key = public_key
+        self.servername = servername
+        self.keys = keys
 
     def read(self, iprot):
         if (
@@ -6646,7 +10395,7 @@ class import_keypair_args(object):
                 break
             if fid == 1:
                 if ftype == TType.STRING:
-                    self.keyname = (
+                    self.servername = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
@@ -6654,12 +10403,17 @@ class import_keypair_args(object):
                 else:
                     iprot.skip(ftype)
             elif fid == 2:
-                if ftype == TType.STRING:
-                    self.public_key = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
+                if ftype == TType.SET:
+                    self.keys = set()
+                    (_etype129, _size126) = iprot.readSetBegin()
+                    for _i130 in range(_size126):
+                        _elem131 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.keys.add(_elem131)
+                    iprot.readSetEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -6673,22 +10427,23 @@ class import_keypair_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("import_keypair_args")
-        if self.keyname is not None:
-            oprot.writeFieldBegin("keyname", TType.STRING, 1)
+        oprot.writeStructBegin("delete_metadata_from_server_args")
+        if self.servername is not None:
+            oprot.writeFieldBegin("servername", TType.STRING, 1)
             oprot.writeString(
-                self.keyname.encode("utf-8")
+                self.servername.encode("utf-8")
                 if sys.version_info[0] == 2
-                else self.keyname
+                else self.servername
             )
             oprot.writeFieldEnd()
-        if self.public_key is not None:
-            oprot.writeFieldBegin("public_key", TType.STRING, 2)
-            oprot.writeString(
-                self.public_key.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.public_key
-            )
+        if self.keys is not None:
+            oprot.writeFieldBegin("keys", TType.SET, 2)
+            oprot.writeSetBegin(TType.STRING, len(self.keys))
+            for iter132 in self.keys:
+                oprot.writeString(
+                    iter132.encode("utf-8") if sys.version_info[0] == 2 else iter132
+                )
+            oprot.writeSetEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -6707,38 +10462,41 @@ class import_keypair_args(object):
         return not (self == other)
 
 
-all_structs.append(import_keypair_args)
-import_keypair_args.thrift_spec = (
+all_structs.append(delete_metadata_from_server_args)
+delete_metadata_from_server_args.thrift_spec = (
     None,  # 0
     (
         1,
         TType.STRING,
-        "keyname",
+        "servername",
         "UTF8",
         None,
     ),  # 1
     (
         2,
-        TType.STRING,
-        "public_key",
-        "UTF8",
+        TType.SET,
+        "keys",
+        (TType.STRING, "UTF8", False),
         None,
     ),  # 2
 )
 
 
-class import_keypair_result(object):
+class delete_metadata_from_server_result(object):
     """
     Attributes:
      - success
+     - e
 
     """
 
     def __init__(
         self,
         success=None,
+        e=None,
     ):
         self.success = success
+        self.e = e
 
     def read(self, iprot):
         if (
@@ -6754,12 +10512,22 @@ class import_keypair_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.STRING:
-                    self.success = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
+                if ftype == TType.SET:
+                    self.success = set()
+                    (_etype136, _size133) = iprot.readSetBegin()
+                    for _i137 in range(_size133):
+                        _elem138 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.success.add(_elem138)
+                    iprot.readSetEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 1:
+                if ftype == TType.STRUCT:
+                    self.e = serverNotFoundException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -6773,14 +10541,19 @@ class import_keypair_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("import_keypair_result")
+        oprot.writeStructBegin("delete_metadata_from_server_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.STRING, 0)
-            oprot.writeString(
-                self.success.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.success
-            )
+            oprot.writeFieldBegin("success", TType.SET, 0)
+            oprot.writeSetBegin(TType.STRING, len(self.success))
+            for iter139 in self.success:
+                oprot.writeString(
+                    iter139.encode("utf-8") if sys.version_info[0] == 2 else iter139
+                )
+            oprot.writeSetEnd()
+            oprot.writeFieldEnd()
+        if self.e is not None:
+            oprot.writeFieldBegin("e", TType.STRUCT, 1)
+            self.e.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -6799,30 +10572,40 @@ class import_keypair_result(object):
         return not (self == other)
 
 
-all_structs.append(import_keypair_result)
-import_keypair_result.thrift_spec = (
+all_structs.append(delete_metadata_from_server_result)
+delete_metadata_from_server_result.thrift_spec = (
     (
         0,
-        TType.STRING,
+        TType.SET,
         "success",
-        "UTF8",
+        (TType.STRING, "UTF8", False),
         None,
     ),  # 0
+    (
+        1,
+        TType.STRUCT,
+        "e",
+        [serverNotFoundException, None],
+        None,
+    ),  # 1
 )
 
 
-class get_vm_ports_args(object):
+class add_floating_ip_to_server_args(object):
     """
     Attributes:
-     - openstack_id: Id of server
+     - openstack_id: Id of the server
+     - network: Network name of the network which provides the floating Ip.
 
     """
 
     def __init__(
         self,
         openstack_id=None,
+        network=None,
     ):
         self.openstack_id = openstack_id
+        self.network = network
 
     def read(self, iprot):
         if (
@@ -6846,6 +10629,15 @@ class get_vm_ports_args(object):
                     )
                 else:
                     iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.network = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -6857,7 +10649,7 @@ class get_vm_ports_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_vm_ports_args")
+        oprot.writeStructBegin("add_floating_ip_to_server_args")
         if self.openstack_id is not None:
             oprot.writeFieldBegin("openstack_id", TType.STRING, 1)
             oprot.writeString(
@@ -6866,6 +10658,14 @@ class get_vm_ports_args(object):
                 else self.openstack_id
             )
             oprot.writeFieldEnd()
+        if self.network is not None:
+            oprot.writeFieldBegin("network", TType.STRING, 2)
+            oprot.writeString(
+                self.network.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.network
+            )
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -6883,8 +10683,8 @@ class get_vm_ports_args(object):
         return not (self == other)
 
 
-all_structs.append(get_vm_ports_args)
-get_vm_ports_args.thrift_spec = (
+all_structs.append(add_floating_ip_to_server_args)
+add_floating_ip_to_server_args.thrift_spec = (
     None,  # 0
     (
         1,
@@ -6893,21 +10693,34 @@ get_vm_ports_args.thrift_spec = (
         "UTF8",
         None,
     ),  # 1
+    (
+        2,
+        TType.STRING,
+        "network",
+        "UTF8",
+        None,
+    ),  # 2
 )
 
 
-class get_vm_ports_result(object):
+class add_floating_ip_to_server_result(object):
     """
     Attributes:
      - success
+     - e
+     - f
 
     """
 
     def __init__(
         self,
         success=None,
+        e=None,
+        f=None,
     ):
         self.success = success
+        self.e = e
+        self.f = f
 
     def read(self, iprot):
         if (
@@ -6923,22 +10736,22 @@ class get_vm_ports_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.MAP:
-                    self.success = {}
-                    (_ktype42, _vtype43, _size41) = iprot.readMapBegin()
-                    for _i45 in range(_size41):
-                        _key46 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        _val47 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        self.success[_key46] = _val47
-                    iprot.readMapEnd()
+                if ftype == TType.STRING:
+                    self.success = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 1:
+                if ftype == TType.STRUCT:
+                    self.e = serverNotFoundException.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRUCT:
+                    self.f = networkNotFoundException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -6952,18 +10765,22 @@ class get_vm_ports_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_vm_ports_result")
+        oprot.writeStructBegin("add_floating_ip_to_server_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.MAP, 0)
-            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.success))
-            for kiter48, viter49 in self.success.items():
-                oprot.writeString(
-                    kiter48.encode("utf-8") if sys.version_info[0] == 2 else kiter48
-                )
-                oprot.writeString(
-                    viter49.encode("utf-8") if sys.version_info[0] == 2 else viter49
-                )
-            oprot.writeMapEnd()
+            oprot.writeFieldBegin("success", TType.STRING, 0)
+            oprot.writeString(
+                self.success.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.success
+            )
+            oprot.writeFieldEnd()
+        if self.e is not None:
+            oprot.writeFieldBegin("e", TType.STRUCT, 1)
+            self.e.write(oprot)
+            oprot.writeFieldEnd()
+        if self.f is not None:
+            oprot.writeFieldBegin("f", TType.STRUCT, 2)
+            self.f.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -6982,19 +10799,60 @@ class get_vm_ports_result(object):
         return not (self == other)
 
 
-all_structs.append(get_vm_ports_result)
-get_vm_ports_result.thrift_spec = (
+all_structs.append(add_floating_ip_to_server_result)
+add_floating_ip_to_server_result.thrift_spec = (
     (
         0,
-        TType.MAP,
+        TType.STRING,
         "success",
-        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
+        "UTF8",
         None,
     ),  # 0
+    (
+        1,
+        TType.STRUCT,
+        "e",
+        [serverNotFoundException, None],
+        None,
+    ),  # 1
+    (
+        2,
+        TType.STRUCT,
+        "f",
+        [networkNotFoundException, None],
+        None,
+    ),  # 2
 )
 
 
-class get_Flavors_args(object):
+class create_connection_args(object):
+    """
+    Attributes:
+     - username: Name of the OpenStack user.
+     - password: Password of the OpenStack user
+     - auth_url: Auth Url from OpenStack
+     - user_domain_name: Name of the project from the OpenStack user.
+    4:string project_name,
+
+    /** Domain name of OpenStack
+     - project_domain_name: Project domain name of OpenStack
+
+    """
+
+    def __init__(
+        self,
+        username=None,
+        password=None,
+        auth_url=None,
+        user_domain_name=None,
+        project_domain_name=None,
+    ):
+        self.username = username
+        self.password = password
+        self.auth_url = auth_url
+        self.user_domain_name = user_domain_name
+        self.project_domain_name = project_domain_name
+
     def read(self, iprot):
         if (
             iprot._fast_decode is not None
@@ -7008,6 +10866,51 @@ class get_Flavors_args(object):
             (fname, ftype, fid) = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.username = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.password = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.STRING:
+                    self.auth_url = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 5:
+                if ftype == TType.STRING:
+                    self.user_domain_name = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 6:
+                if ftype == TType.STRING:
+                    self.project_domain_name = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -7019,7 +10922,47 @@ class get_Flavors_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_Flavors_args")
+        oprot.writeStructBegin("create_connection_args")
+        if self.username is not None:
+            oprot.writeFieldBegin("username", TType.STRING, 1)
+            oprot.writeString(
+                self.username.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.username
+            )
+            oprot.writeFieldEnd()
+        if self.password is not None:
+            oprot.writeFieldBegin("password", TType.STRING, 2)
+            oprot.writeString(
+                self.password.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.password
+            )
+            oprot.writeFieldEnd()
+        if self.auth_url is not None:
+            oprot.writeFieldBegin("auth_url", TType.STRING, 3)
+            oprot.writeString(
+                self.auth_url.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.auth_url
+            )
+            oprot.writeFieldEnd()
+        if self.user_domain_name is not None:
+            oprot.writeFieldBegin("user_domain_name", TType.STRING, 5)
+            oprot.writeString(
+                self.user_domain_name.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.user_domain_name
+            )
+            oprot.writeFieldEnd()
+        if self.project_domain_name is not None:
+            oprot.writeFieldBegin("project_domain_name", TType.STRING, 6)
+            oprot.writeString(
+                self.project_domain_name.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.project_domain_name
+            )
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -7037,22 +10980,63 @@ class get_Flavors_args(object):
         return not (self == other)
 
 
-all_structs.append(get_Flavors_args)
-get_Flavors_args.thrift_spec = ()
+all_structs.append(create_connection_args)
+create_connection_args.thrift_spec = (
+    None,  # 0
+    (
+        1,
+        TType.STRING,
+        "username",
+        "UTF8",
+        None,
+    ),  # 1
+    (
+        2,
+        TType.STRING,
+        "password",
+        "UTF8",
+        None,
+    ),  # 2
+    (
+        3,
+        TType.STRING,
+        "auth_url",
+        "UTF8",
+        None,
+    ),  # 3
+    None,  # 4
+    (
+        5,
+        TType.STRING,
+        "user_domain_name",
+        "UTF8",
+        None,
+    ),  # 5
+    (
+        6,
+        TType.STRING,
+        "project_domain_name",
+        "UTF8",
+        None,
+    ),  # 6
+)
 
 
-class get_Flavors_result(object):
+class create_connection_result(object):
     """
     Attributes:
      - success
+     - e
 
     """
 
     def __init__(
         self,
         success=None,
+        e=None,
     ):
         self.success = success
+        self.e = e
 
     def read(self, iprot):
         if (
@@ -7068,14 +11052,13 @@ class get_Flavors_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.LIST:
-                    self.success = []
-                    (_etype53, _size50) = iprot.readListBegin()
-                    for _i54 in range(_size50):
-                        _elem55 = Flavor()
-                        _elem55.read(iprot)
-                        self.success.append(_elem55)
-                    iprot.readListEnd()
+                if ftype == TType.BOOL:
+                    self.success = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 1:
+                if ftype == TType.STRUCT:
+                    self.e = authenticationException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -7089,13 +11072,14 @@ class get_Flavors_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_Flavors_result")
+        oprot.writeStructBegin("create_connection_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.LIST, 0)
-            oprot.writeListBegin(TType.STRUCT, len(self.success))
-            for iter56 in self.success:
-                iter56.write(oprot)
-            oprot.writeListEnd()
+            oprot.writeFieldBegin("success", TType.BOOL, 0)
+            oprot.writeBool(self.success)
+            oprot.writeFieldEnd()
+        if self.e is not None:
+            oprot.writeFieldBegin("e", TType.STRUCT, 1)
+            self.e.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -7114,77 +11098,67 @@ class get_Flavors_result(object):
         return not (self == other)
 
 
-all_structs.append(get_Flavors_result)
-get_Flavors_result.thrift_spec = (
+all_structs.append(create_connection_result)
+create_connection_result.thrift_spec = (
     (
         0,
-        TType.LIST,
+        TType.BOOL,
         "success",
-        (TType.STRUCT, [Flavor, None], False),
+        None,
         None,
     ),  # 0
+    (
+        1,
+        TType.STRUCT,
+        "e",
+        [authenticationException, None],
+        None,
+    ),  # 1
 )
 
 
-class get_Images_args(object):
-    def read(self, iprot):
-        if (
-            iprot._fast_decode is not None
-            and isinstance(iprot.trans, TTransport.CReadableTransport)
-            and self.thrift_spec is not None
-        ):
-            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
-            return
-        iprot.readStructBegin()
-        while True:
-            (fname, ftype, fid) = iprot.readFieldBegin()
-            if ftype == TType.STOP:
-                break
-            else:
-                iprot.skip(ftype)
-            iprot.readFieldEnd()
-        iprot.readStructEnd()
-
-    def write(self, oprot):
-        if oprot._fast_encode is not None and self.thrift_spec is not None:
-            oprot.trans.write(
-                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
-            )
-            return
-        oprot.writeStructBegin("get_Images_args")
-        oprot.writeFieldStop()
-        oprot.writeStructEnd()
-
-    def validate(self):
-        return
-
-    def __repr__(self):
-        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
-        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
-
-    def __eq__(self, other):
-        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
-
-    def __ne__(self, other):
-        return not (self == other)
-
-
-all_structs.append(get_Images_args)
-get_Images_args.thrift_spec = ()
-
-
-class get_Images_result(object):
+class start_server_without_playbook_args(object):
     """
     Attributes:
-     - success
+     - flavor: Name of the  Flavor to use.
+     - image: Name of the image to use.
+     - public_key: Public Key to use
+     - servername: Name for the new server
+     - metadata: Metadata for the new instance
+     - https
+     - http
+     - resenv
+     - volume_ids_path_new
+     - volume_ids_path_attach
+     - additional_keys
 
     """
 
     def __init__(
         self,
-        success=None,
+        flavor=None,
+        image=None,
+        public_key=None,
+        servername=None,
+        metadata=None,
+        https=None,
+        http=None,
+        resenv=None,
+        volume_ids_path_new=None,
+        volume_ids_path_attach=None,
+        additional_keys=None,
     ):
-        self.success = success
+        self.flavor = flavor
+        self.image = image
+        self.public_key = public_key
+        self.servername = servername
+        self.metadata = metadata
+        self.https = https
+        self.http = http
+        self.resenv = resenv
+        self.volume_ids_path_new = volume_ids_path_new
+        self.volume_ids_path_attach = volume_ids_path_attach
+        self.additional_keys = additional_keys
 
     def read(self, iprot):
         if (
@@ -7199,14 +11173,144 @@ class get_Images_result(object):
             (fname, ftype, fid) = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 0:
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.flavor = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.image = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.STRING:
+                    self.public_key = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.STRING:
+                    self.servername = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 5:
+                if ftype == TType.MAP:
+                    self.metadata = {}
+                    (_ktype141, _vtype142, _size140) = iprot.readMapBegin()
+                    for _i144 in range(_size140):
+                        _key145 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        _val146 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.metadata[_key145] = _val146
+                    iprot.readMapEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 6:
+                if ftype == TType.BOOL:
+                    self.https = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 7:
+                if ftype == TType.BOOL:
+                    self.http = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 8:
+                if ftype == TType.LIST:
+                    self.resenv = []
+                    (_etype150, _size147) = iprot.readListBegin()
+                    for _i151 in range(_size147):
+                        _elem152 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.resenv.append(_elem152)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 9:
+                if ftype == TType.LIST:
+                    self.volume_ids_path_new = []
+                    (_etype156, _size153) = iprot.readListBegin()
+                    for _i157 in range(_size153):
+                        _elem158 = {}
+                        (_ktype160, _vtype161, _size159) = iprot.readMapBegin()
+                        for _i163 in range(_size159):
+                            _key164 = (
+                                iprot.readString().decode("utf-8", errors="replace")
+                                if sys.version_info[0] == 2
+                                else iprot.readString()
+                            )
+                            _val165 = (
+                                iprot.readString().decode("utf-8", errors="replace")
+                                if sys.version_info[0] == 2
+                                else iprot.readString()
+                            )
+                            _elem158[_key164] = _val165
+                        iprot.readMapEnd()
+                        self.volume_ids_path_new.append(_elem158)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 10:
+                if ftype == TType.LIST:
+                    self.volume_ids_path_attach = []
+                    (_etype169, _size166) = iprot.readListBegin()
+                    for _i170 in range(_size166):
+                        _elem171 = {}
+                        (_ktype173, _vtype174, _size172) = iprot.readMapBegin()
+                        for _i176 in range(_size172):
+                            _key177 = (
+                                iprot.readString().decode("utf-8", errors="replace")
+                                if sys.version_info[0] == 2
+                                else iprot.readString()
+                            )
+                            _val178 = (
+                                iprot.readString().decode("utf-8", errors="replace")
+                                if sys.version_info[0] == 2
+                                else iprot.readString()
+                            )
+                            _elem171[_key177] = _val178
+                        iprot.readMapEnd()
+                        self.volume_ids_path_attach.append(_elem171)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 11:
                 if ftype == TType.LIST:
-                    self.success = []
-                    (_etype60, _size57) = iprot.readListBegin()
-                    for _i61 in range(_size57):
-                        _elem62 = Image()
-                        _elem62.read(iprot)
-                        self.success.append(_elem62)
+                    self.additional_keys = []
+                    (_etype182, _size179) = iprot.readListBegin()
+                    for _i183 in range(_size179):
+                        _elem184 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.additional_keys.append(_elem184)
                     iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
@@ -7221,12 +11325,109 @@ class get_Images_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_Images_result")
-        if self.success is not None:
-            oprot.writeFieldBegin("success", TType.LIST, 0)
-            oprot.writeListBegin(TType.STRUCT, len(self.success))
-            for iter63 in self.success:
-                iter63.write(oprot)
+        oprot.writeStructBegin("start_server_without_playbook_args")
+        if self.flavor is not None:
+            oprot.writeFieldBegin("flavor", TType.STRING, 1)
+            oprot.writeString(
+                self.flavor.encode("utf-8") if sys.version_info[0] == 2 else self.flavor
+            )
+            oprot.writeFieldEnd()
+        if self.image is not None:
+            oprot.writeFieldBegin("image", TType.STRING, 2)
+            oprot.writeString(
+                self.image.encode("utf-8") if sys.version_info[0] == 2 else self.image
+            )
+            oprot.writeFieldEnd()
+        if self.public_key is not None:
+            oprot.writeFieldBegin("public_key", TType.STRING, 3)
+            oprot.writeString(
+                self.public_key.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.public_key
+            )
+            oprot.writeFieldEnd()
+        if self.servername is not None:
+            oprot.writeFieldBegin("servername", TType.STRING, 4)
+            oprot.writeString(
+                self.servername.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.servername
+            )
+            oprot.writeFieldEnd()
+        if self.metadata is not None:
+            oprot.writeFieldBegin("metadata", TType.MAP, 5)
+            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.metadata))
+            for kiter185, viter186 in self.metadata.items():
+                oprot.writeString(
+                    kiter185.encode("utf-8") if sys.version_info[0] == 2 else kiter185
+                )
+                oprot.writeString(
+                    viter186.encode("utf-8") if sys.version_info[0] == 2 else viter186
+                )
+            oprot.writeMapEnd()
+            oprot.writeFieldEnd()
+        if self.https is not None:
+            oprot.writeFieldBegin("https", TType.BOOL, 6)
+            oprot.writeBool(self.https)
+            oprot.writeFieldEnd()
+        if self.http is not None:
+            oprot.writeFieldBegin("http", TType.BOOL, 7)
+            oprot.writeBool(self.http)
+            oprot.writeFieldEnd()
+        if self.resenv is not None:
+            oprot.writeFieldBegin("resenv", TType.LIST, 8)
+            oprot.writeListBegin(TType.STRING, len(self.resenv))
+            for iter187 in self.resenv:
+                oprot.writeString(
+                    iter187.encode("utf-8") if sys.version_info[0] == 2 else iter187
+                )
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.volume_ids_path_new is not None:
+            oprot.writeFieldBegin("volume_ids_path_new", TType.LIST, 9)
+            oprot.writeListBegin(TType.MAP, len(self.volume_ids_path_new))
+            for iter188 in self.volume_ids_path_new:
+                oprot.writeMapBegin(TType.STRING, TType.STRING, len(iter188))
+                for kiter189, viter190 in iter188.items():
+                    oprot.writeString(
+                        kiter189.encode("utf-8")
+                        if sys.version_info[0] == 2
+                        else kiter189
+                    )
+                    oprot.writeString(
+                        viter190.encode("utf-8")
+                        if sys.version_info[0] == 2
+                        else viter190
+                    )
+                oprot.writeMapEnd()
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.volume_ids_path_attach is not None:
+            oprot.writeFieldBegin("volume_ids_path_attach", TType.LIST, 10)
+            oprot.writeListBegin(TType.MAP, len(self.volume_ids_path_attach))
+            for iter191 in self.volume_ids_path_attach:
+                oprot.writeMapBegin(TType.STRING, TType.STRING, len(iter191))
+                for kiter192, viter193 in iter191.items():
+                    oprot.writeString(
+                        kiter192.encode("utf-8")
+                        if sys.version_info[0] == 2
+                        else kiter192
+                    )
+                    oprot.writeString(
+                        viter193.encode("utf-8")
+                        if sys.version_info[0] == 2
+                        else viter193
+                    )
+                oprot.writeMapEnd()
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.additional_keys is not None:
+            oprot.writeFieldBegin("additional_keys", TType.LIST, 11)
+            oprot.writeListBegin(TType.STRING, len(self.additional_keys))
+            for iter194 in self.additional_keys:
+                oprot.writeString(
+                    iter194.encode("utf-8") if sys.version_info[0] == 2 else iter194
+                )
             oprot.writeListEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
@@ -7246,77 +11447,122 @@ class get_Images_result(object):
         return not (self == other)
 
 
-all_structs.append(get_Images_result)
-get_Images_result.thrift_spec = (
+all_structs.append(start_server_without_playbook_args)
+start_server_without_playbook_args.thrift_spec = (
+    None,  # 0
     (
-        0,
+        1,
+        TType.STRING,
+        "flavor",
+        "UTF8",
+        None,
+    ),  # 1
+    (
+        2,
+        TType.STRING,
+        "image",
+        "UTF8",
+        None,
+    ),  # 2
+    (
+        3,
+        TType.STRING,
+        "public_key",
+        "UTF8",
+        None,
+    ),  # 3
+    (
+        4,
+        TType.STRING,
+        "servername",
+        "UTF8",
+        None,
+    ),  # 4
+    (
+        5,
+        TType.MAP,
+        "metadata",
+        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
+        None,
+    ),  # 5
+    (
+        6,
+        TType.BOOL,
+        "https",
+        None,
+        None,
+    ),  # 6
+    (
+        7,
+        TType.BOOL,
+        "http",
+        None,
+        None,
+    ),  # 7
+    (
+        8,
         TType.LIST,
-        "success",
-        (TType.STRUCT, [Image, None], False),
+        "resenv",
+        (TType.STRING, "UTF8", False),
         None,
-    ),  # 0
-)
-
-
-class get_public_Images_args(object):
-    def read(self, iprot):
-        if (
-            iprot._fast_decode is not None
-            and isinstance(iprot.trans, TTransport.CReadableTransport)
-            and self.thrift_spec is not None
-        ):
-            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
-            return
-        iprot.readStructBegin()
-        while True:
-            (fname, ftype, fid) = iprot.readFieldBegin()
-            if ftype == TType.STOP:
-                break
-            else:
-                iprot.skip(ftype)
-            iprot.readFieldEnd()
-        iprot.readStructEnd()
-
-    def write(self, oprot):
-        if oprot._fast_encode is not None and self.thrift_spec is not None:
-            oprot.trans.write(
-                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
-            )
-            return
-        oprot.writeStructBegin("get_public_Images_args")
-        oprot.writeFieldStop()
-        oprot.writeStructEnd()
-
-    def validate(self):
-        return
-
-    def __repr__(self):
-        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
-        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
-
-    def __eq__(self, other):
-        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
-
-    def __ne__(self, other):
-        return not (self == other)
-
-
-all_structs.append(get_public_Images_args)
-get_public_Images_args.thrift_spec = ()
+    ),  # 8
+    (
+        9,
+        TType.LIST,
+        "volume_ids_path_new",
+        (TType.MAP, (TType.STRING, "UTF8", TType.STRING, "UTF8", False), False),
+        None,
+    ),  # 9
+    (
+        10,
+        TType.LIST,
+        "volume_ids_path_attach",
+        (TType.MAP, (TType.STRING, "UTF8", TType.STRING, "UTF8", False), False),
+        None,
+    ),  # 10
+    (
+        11,
+        TType.LIST,
+        "additional_keys",
+        (TType.STRING, "UTF8", False),
+        None,
+    ),  # 11
+)
 
 
-class get_public_Images_result(object):
+class start_server_without_playbook_result(object):
     """
     Attributes:
      - success
+     - e
+     - r
+     - s
+     - n
+     - i
+     - f
+     - o
 
     """
 
     def __init__(
         self,
         success=None,
+        e=None,
+        r=None,
+        s=None,
+        n=None,
+        i=None,
+        f=None,
+        o=None,
     ):
         self.success = success
+        self.e = e
+        self.r = r
+        self.s = s
+        self.n = n
+        self.i = i
+        self.f = f
+        self.o = o
 
     def read(self, iprot):
         if (
@@ -7332,14 +11578,57 @@ class get_public_Images_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.LIST:
-                    self.success = []
-                    (_etype67, _size64) = iprot.readListBegin()
-                    for _i68 in range(_size64):
-                        _elem69 = Image()
-                        _elem69.read(iprot)
-                        self.success.append(_elem69)
-                    iprot.readListEnd()
+                if ftype == TType.MAP:
+                    self.success = {}
+                    (_ktype196, _vtype197, _size195) = iprot.readMapBegin()
+                    for _i199 in range(_size195):
+                        _key200 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        _val201 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.success[_key200] = _val201
+                    iprot.readMapEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 1:
+                if ftype == TType.STRUCT:
+                    self.e = nameException.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRUCT:
+                    self.r = ressourceException.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.STRUCT:
+                    self.s = serverNotFoundException.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.STRUCT:
+                    self.n = networkNotFoundException.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 5:
+                if ftype == TType.STRUCT:
+                    self.i = imageNotFoundException.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 6:
+                if ftype == TType.STRUCT:
+                    self.f = flavorNotFoundException.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 7:
+                if ftype == TType.STRUCT:
+                    self.o = otherException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -7353,13 +11642,46 @@ class get_public_Images_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_public_Images_result")
+        oprot.writeStructBegin("start_server_without_playbook_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.LIST, 0)
-            oprot.writeListBegin(TType.STRUCT, len(self.success))
-            for iter70 in self.success:
-                iter70.write(oprot)
-            oprot.writeListEnd()
+            oprot.writeFieldBegin("success", TType.MAP, 0)
+            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.success))
+            for kiter202, viter203 in self.success.items():
+                oprot.writeString(
+                    kiter202.encode("utf-8") if sys.version_info[0] == 2 else kiter202
+                )
+                oprot.writeString(
+                    viter203.encode("utf-8") if sys.version_info[0] == 2 else viter203
+                )
+            oprot.writeMapEnd()
+            oprot.writeFieldEnd()
+        if self.e is not None:
+            oprot.writeFieldBegin("e", TType.STRUCT, 1)
+            self.e.write(oprot)
+            oprot.writeFieldEnd()
+        if self.r is not None:
+            oprot.writeFieldBegin("r", TType.STRUCT, 2)
+            self.r.write(oprot)
+            oprot.writeFieldEnd()
+        if self.s is not None:
+            oprot.writeFieldBegin("s", TType.STRUCT, 3)
+            self.s.write(oprot)
+            oprot.writeFieldEnd()
+        if self.n is not None:
+            oprot.writeFieldBegin("n", TType.STRUCT, 4)
+            self.n.write(oprot)
+            oprot.writeFieldEnd()
+        if self.i is not None:
+            oprot.writeFieldBegin("i", TType.STRUCT, 5)
+            self.i.write(oprot)
+            oprot.writeFieldEnd()
+        if self.f is not None:
+            oprot.writeFieldBegin("f", TType.STRUCT, 6)
+            self.f.write(oprot)
+            oprot.writeFieldEnd()
+        if self.o is not None:
+            oprot.writeFieldBegin("o", TType.STRUCT, 7)
+            self.o.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -7378,19 +11700,68 @@ class get_public_Images_result(object):
         return not (self == other)
 
 
-all_structs.append(get_public_Images_result)
-get_public_Images_result.thrift_spec = (
+all_structs.append(start_server_without_playbook_result)
+start_server_without_playbook_result.thrift_spec = (
     (
         0,
-        TType.LIST,
+        TType.MAP,
         "success",
-        (TType.STRUCT, [Image, None], False),
+        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
         None,
     ),  # 0
+    (
+        1,
+        TType.STRUCT,
+        "e",
+        [nameException, None],
+        None,
+    ),  # 1
+    (
+        2,
+        TType.STRUCT,
+        "r",
+        [ressourceException, None],
+        None,
+    ),  # 2
+    (
+        3,
+        TType.STRUCT,
+        "s",
+        [serverNotFoundException, None],
+        None,
+    ),  # 3
+    (
+        4,
+        TType.STRUCT,
+        "n",
+        [networkNotFoundException, None],
+        None,
+    ),  # 4
+    (
+        5,
+        TType.STRUCT,
+        "i",
+        [imageNotFoundException, None],
+        None,
+    ),  # 5
+    (
+        6,
+        TType.STRUCT,
+        "f",
+        [flavorNotFoundException, None],
+        None,
+    ),  # 6
+    (
+        7,
+        TType.STRUCT,
+        "o",
+        [otherException, None],
+        None,
+    ),  # 7
 )
 
 
-class get_private_Images_args(object):
+class bibigrid_available_args(object):
     def read(self, iprot):
         if (
             iprot._fast_decode is not None
@@ -7415,7 +11786,7 @@ class get_private_Images_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_private_Images_args")
+        oprot.writeStructBegin("bibigrid_available_args")
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -7433,11 +11804,11 @@ class get_private_Images_args(object):
         return not (self == other)
 
 
-all_structs.append(get_private_Images_args)
-get_private_Images_args.thrift_spec = ()
+all_structs.append(bibigrid_available_args)
+bibigrid_available_args.thrift_spec = ()
 
 
-class get_private_Images_result(object):
+class bibigrid_available_result(object):
     """
     Attributes:
      - success
@@ -7464,14 +11835,8 @@ class get_private_Images_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.LIST:
-                    self.success = []
-                    (_etype74, _size71) = iprot.readListBegin()
-                    for _i75 in range(_size71):
-                        _elem76 = Image()
-                        _elem76.read(iprot)
-                        self.success.append(_elem76)
-                    iprot.readListEnd()
+                if ftype == TType.BOOL:
+                    self.success = iprot.readBool()
                 else:
                     iprot.skip(ftype)
             else:
@@ -7485,13 +11850,10 @@ class get_private_Images_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_private_Images_result")
+        oprot.writeStructBegin("bibigrid_available_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.LIST, 0)
-            oprot.writeListBegin(TType.STRUCT, len(self.success))
-            for iter77 in self.success:
-                iter77.write(oprot)
-            oprot.writeListEnd()
+            oprot.writeFieldBegin("success", TType.BOOL, 0)
+            oprot.writeBool(self.success)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -7510,30 +11872,33 @@ class get_private_Images_result(object):
         return not (self == other)
 
 
-all_structs.append(get_private_Images_result)
-get_private_Images_result.thrift_spec = (
+all_structs.append(bibigrid_available_result)
+bibigrid_available_result.thrift_spec = (
     (
         0,
-        TType.LIST,
+        TType.BOOL,
         "success",
-        (TType.STRUCT, [Image, None], False),
+        None,
         None,
     ),  # 0
 )
 
 
-class get_Image_with_Tag_args(object):
+class detach_ip_from_server_args(object):
     """
     Attributes:
-     - openstack_id
+     - server_id
+     - floating_ip
 
     """
 
     def __init__(
         self,
-        openstack_id=None,
+        server_id=None,
+        floating_ip=None,
     ):
-        self.openstack_id = openstack_id
+        self.server_id = server_id
+        self.floating_ip = floating_ip
 
     def read(self, iprot):
         if (
@@ -7550,7 +11915,16 @@ class get_Image_with_Tag_args(object):
                 break
             if fid == 1:
                 if ftype == TType.STRING:
-                    self.openstack_id = (
+                    self.server_id = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.floating_ip = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
@@ -7567,14 +11941,22 @@ class get_Image_with_Tag_args(object):
             oprot.trans.write(
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
-            return
-        oprot.writeStructBegin("get_Image_with_Tag_args")
-        if self.openstack_id is not None:
-            oprot.writeFieldBegin("openstack_id", TType.STRING, 1)
+            return
+        oprot.writeStructBegin("detach_ip_from_server_args")
+        if self.server_id is not None:
+            oprot.writeFieldBegin("server_id", TType.STRING, 1)
+            oprot.writeString(
+                self.server_id.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.server_id
+            )
+            oprot.writeFieldEnd()
+        if self.floating_ip is not None:
+            oprot.writeFieldBegin("floating_ip", TType.STRING, 2)
             oprot.writeString(
-                self.openstack_id.encode("utf-8")
+                self.floating_ip.encode("utf-8")
                 if sys.version_info[0] == 2
-                else self.openstack_id
+                else self.floating_ip
             )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
@@ -7594,20 +11976,27 @@ class get_Image_with_Tag_args(object):
         return not (self == other)
 
 
-all_structs.append(get_Image_with_Tag_args)
-get_Image_with_Tag_args.thrift_spec = (
+all_structs.append(detach_ip_from_server_args)
+detach_ip_from_server_args.thrift_spec = (
     None,  # 0
     (
         1,
         TType.STRING,
-        "openstack_id",
+        "server_id",
         "UTF8",
         None,
     ),  # 1
+    (
+        2,
+        TType.STRING,
+        "floating_ip",
+        "UTF8",
+        None,
+    ),  # 2
 )
 
 
-class get_Image_with_Tag_result(object):
+class detach_ip_from_server_result(object):
     """
     Attributes:
      - success
@@ -7634,9 +12023,8 @@ class get_Image_with_Tag_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.STRUCT:
-                    self.success = Image()
-                    self.success.read(iprot)
+                if ftype == TType.BOOL:
+                    self.success = iprot.readBool()
                 else:
                     iprot.skip(ftype)
             else:
@@ -7650,10 +12038,10 @@ class get_Image_with_Tag_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_Image_with_Tag_result")
+        oprot.writeStructBegin("detach_ip_from_server_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.STRUCT, 0)
-            self.success.write(oprot)
+            oprot.writeFieldBegin("success", TType.BOOL, 0)
+            oprot.writeBool(self.success)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -7672,30 +12060,57 @@ class get_Image_with_Tag_result(object):
         return not (self == other)
 
 
-all_structs.append(get_Image_with_Tag_result)
-get_Image_with_Tag_result.thrift_spec = (
+all_structs.append(detach_ip_from_server_result)
+detach_ip_from_server_result.thrift_spec = (
     (
         0,
-        TType.STRUCT,
+        TType.BOOL,
         "success",
-        [Image, None],
+        None,
         None,
     ),  # 0
 )
 
 
-class get_Images_by_filter_args(object):
+class start_server_with_mounted_volume_args(object):
     """
     Attributes:
-     - filter_json
+     - flavor: Name of the  Flavor to use.
+     - image: Name of the image to use.
+     - public_key: Public Key to use
+     - servername: Name for the new server
+     - metadata: Metadata for the new instance
+     - https
+     - http
+     - resenv
+     - volume_ids_path_new
+     - volume_ids_path_attach
 
     """
 
     def __init__(
         self,
-        filter_json=None,
+        flavor=None,
+        image=None,
+        public_key=None,
+        servername=None,
+        metadata=None,
+        https=None,
+        http=None,
+        resenv=None,
+        volume_ids_path_new=None,
+        volume_ids_path_attach=None,
     ):
-        self.filter_json = filter_json
+        self.flavor = flavor
+        self.image = image
+        self.public_key = public_key
+        self.servername = servername
+        self.metadata = metadata
+        self.https = https
+        self.http = http
+        self.resenv = resenv
+        self.volume_ids_path_new = volume_ids_path_new
+        self.volume_ids_path_attach = volume_ids_path_attach
 
     def read(self, iprot):
         if (
@@ -7711,112 +12126,129 @@ class get_Images_by_filter_args(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
+                if ftype == TType.STRING:
+                    self.flavor = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.image = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.STRING:
+                    self.public_key = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.STRING:
+                    self.servername = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 5:
                 if ftype == TType.MAP:
-                    self.filter_json = {}
-                    (_ktype79, _vtype80, _size78) = iprot.readMapBegin()
-                    for _i82 in range(_size78):
-                        _key83 = (
+                    self.metadata = {}
+                    (_ktype205, _vtype206, _size204) = iprot.readMapBegin()
+                    for _i208 in range(_size204):
+                        _key209 = (
                             iprot.readString().decode("utf-8", errors="replace")
                             if sys.version_info[0] == 2
                             else iprot.readString()
                         )
-                        _val84 = (
+                        _val210 = (
                             iprot.readString().decode("utf-8", errors="replace")
                             if sys.version_info[0] == 2
                             else iprot.readString()
                         )
-                        self.filter_json[_key83] = _val84
+                        self.metadata[_key209] = _val210
                     iprot.readMapEnd()
                 else:
                     iprot.skip(ftype)
-            else:
-                iprot.skip(ftype)
-            iprot.readFieldEnd()
-        iprot.readStructEnd()
-
-    def write(self, oprot):
-        if oprot._fast_encode is not None and self.thrift_spec is not None:
-            oprot.trans.write(
-                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
-            )
-            return
-        oprot.writeStructBegin("get_Images_by_filter_args")
-        if self.filter_json is not None:
-            oprot.writeFieldBegin("filter_json", TType.MAP, 1)
-            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.filter_json))
-            for kiter85, viter86 in self.filter_json.items():
-                oprot.writeString(
-                    kiter85.encode("utf-8") if sys.version_info[0] == 2 else kiter85
-                )
-                oprot.writeString(
-                    viter86.encode("utf-8") if sys.version_info[0] == 2 else viter86
-                )
-            oprot.writeMapEnd()
-            oprot.writeFieldEnd()
-        oprot.writeFieldStop()
-        oprot.writeStructEnd()
-
-    def validate(self):
-        return
-
-    def __repr__(self):
-        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
-        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
-
-    def __eq__(self, other):
-        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
-
-    def __ne__(self, other):
-        return not (self == other)
-
-
-all_structs.append(get_Images_by_filter_args)
-get_Images_by_filter_args.thrift_spec = (
-    None,  # 0
-    (
-        1,
-        TType.MAP,
-        "filter_json",
-        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
-        None,
-    ),  # 1
-)
-
-
-class get_Images_by_filter_result(object):
-    """
-    Attributes:
-     - success
-
-    """
-
-    def __init__(
-        self,
-        success=None,
-    ):
-        self.success = success
-
-    def read(self, iprot):
-        if (
-            iprot._fast_decode is not None
-            and isinstance(iprot.trans, TTransport.CReadableTransport)
-            and self.thrift_spec is not None
-        ):
-            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
-            return
-        iprot.readStructBegin()
-        while True:
-            (fname, ftype, fid) = iprot.readFieldBegin()
-            if ftype == TType.STOP:
-                break
-            if fid == 0:
+            elif fid == 6:
+                if ftype == TType.BOOL:
+                    self.https = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 7:
+                if ftype == TType.BOOL:
+                    self.http = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 8:
+                if ftype == TType.LIST:
+                    self.resenv = []
+                    (_etype214, _size211) = iprot.readListBegin()
+                    for _i215 in range(_size211):
+                        _elem216 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.resenv.append(_elem216)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 9:
+                if ftype == TType.LIST:
+                    self.volume_ids_path_new = []
+                    (_etype220, _size217) = iprot.readListBegin()
+                    for _i221 in range(_size217):
+                        _elem222 = {}
+                        (_ktype224, _vtype225, _size223) = iprot.readMapBegin()
+                        for _i227 in range(_size223):
+                            _key228 = (
+                                iprot.readString().decode("utf-8", errors="replace")
+                                if sys.version_info[0] == 2
+                                else iprot.readString()
+                            )
+                            _val229 = (
+                                iprot.readString().decode("utf-8", errors="replace")
+                                if sys.version_info[0] == 2
+                                else iprot.readString()
+                            )
+                            _elem222[_key228] = _val229
+                        iprot.readMapEnd()
+                        self.volume_ids_path_new.append(_elem222)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 10:
                 if ftype == TType.LIST:
-                    self.success = []
-                    (_etype90, _size87) = iprot.readListBegin()
-                    for _i91 in range(_size87):
-                        _elem92 = Image()
-                        _elem92.read(iprot)
-                        self.success.append(_elem92)
+                    self.volume_ids_path_attach = []
+                    (_etype233, _size230) = iprot.readListBegin()
+                    for _i234 in range(_size230):
+                        _elem235 = {}
+                        (_ktype237, _vtype238, _size236) = iprot.readMapBegin()
+                        for _i240 in range(_size236):
+                            _key241 = (
+                                iprot.readString().decode("utf-8", errors="replace")
+                                if sys.version_info[0] == 2
+                                else iprot.readString()
+                            )
+                            _val242 = (
+                                iprot.readString().decode("utf-8", errors="replace")
+                                if sys.version_info[0] == 2
+                                else iprot.readString()
+                            )
+                            _elem235[_key241] = _val242
+                        iprot.readMapEnd()
+                        self.volume_ids_path_attach.append(_elem235)
                     iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
@@ -7831,12 +12263,100 @@ class get_Images_by_filter_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_Images_by_filter_result")
-        if self.success is not None:
-            oprot.writeFieldBegin("success", TType.LIST, 0)
-            oprot.writeListBegin(TType.STRUCT, len(self.success))
-            for iter93 in self.success:
-                iter93.write(oprot)
+        oprot.writeStructBegin("start_server_with_mounted_volume_args")
+        if self.flavor is not None:
+            oprot.writeFieldBegin("flavor", TType.STRING, 1)
+            oprot.writeString(
+                self.flavor.encode("utf-8") if sys.version_info[0] == 2 else self.flavor
+            )
+            oprot.writeFieldEnd()
+        if self.image is not None:
+            oprot.writeFieldBegin("image", TType.STRING, 2)
+            oprot.writeString(
+                self.image.encode("utf-8") if sys.version_info[0] == 2 else self.image
+            )
+            oprot.writeFieldEnd()
+        if self.public_key is not None:
+            oprot.writeFieldBegin("public_key", TType.STRING, 3)
+            oprot.writeString(
+                self.public_key.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.public_key
+            )
+            oprot.writeFieldEnd()
+        if self.servername is not None:
+            oprot.writeFieldBegin("servername", TType.STRING, 4)
+            oprot.writeString(
+                self.servername.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.servername
+            )
+            oprot.writeFieldEnd()
+        if self.metadata is not None:
+            oprot.writeFieldBegin("metadata", TType.MAP, 5)
+            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.metadata))
+            for kiter243, viter244 in self.metadata.items():
+                oprot.writeString(
+                    kiter243.encode("utf-8") if sys.version_info[0] == 2 else kiter243
+                )
+                oprot.writeString(
+                    viter244.encode("utf-8") if sys.version_info[0] == 2 else viter244
+                )
+            oprot.writeMapEnd()
+            oprot.writeFieldEnd()
+        if self.https is not None:
+            oprot.writeFieldBegin("https", TType.BOOL, 6)
+            oprot.writeBool(self.https)
+            oprot.writeFieldEnd()
+        if self.http is not None:
+            oprot.writeFieldBegin("http", TType.BOOL, 7)
+            oprot.writeBool(self.http)
+            oprot.writeFieldEnd()
+        if self.resenv is not None:
+            oprot.writeFieldBegin("resenv", TType.LIST, 8)
+            oprot.writeListBegin(TType.STRING, len(self.resenv))
+            for iter245 in self.resenv:
+                oprot.writeString(
+                    iter245.encode("utf-8") if sys.version_info[0] == 2 else iter245
+                )
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.volume_ids_path_new is not None:
+            oprot.writeFieldBegin("volume_ids_path_new", TType.LIST, 9)
+            oprot.writeListBegin(TType.MAP, len(self.volume_ids_path_new))
+            for iter246 in self.volume_ids_path_new:
+                oprot.writeMapBegin(TType.STRING, TType.STRING, len(iter246))
+                for kiter247, viter248 in iter246.items():
+                    oprot.writeString(
+                        kiter247.encode("utf-8")
+                        if sys.version_info[0] == 2
+                        else kiter247
+                    )
+                    oprot.writeString(
+                        viter248.encode("utf-8")
+                        if sys.version_info[0] == 2
+                        else viter248
+                    )
+                oprot.writeMapEnd()
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.volume_ids_path_attach is not None:
+            oprot.writeFieldBegin("volume_ids_path_attach", TType.LIST, 10)
+            oprot.writeListBegin(TType.MAP, len(self.volume_ids_path_attach))
+            for iter249 in self.volume_ids_path_attach:
+                oprot.writeMapBegin(TType.STRING, TType.STRING, len(iter249))
+                for kiter250, viter251 in iter249.items():
+                    oprot.writeString(
+                        kiter250.encode("utf-8")
+                        if sys.version_info[0] == 2
+                        else kiter250
+                    )
+                    oprot.writeString(
+                        viter251.encode("utf-8")
+                        if sys.version_info[0] == 2
+                        else viter251
+                    )
+                oprot.writeMapEnd()
             oprot.writeListEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
@@ -7856,30 +12376,115 @@ class get_Images_by_filter_result(object):
         return not (self == other)
 
 
-all_structs.append(get_Images_by_filter_result)
-get_Images_by_filter_result.thrift_spec = (
+all_structs.append(start_server_with_mounted_volume_args)
+start_server_with_mounted_volume_args.thrift_spec = (
+    None,  # 0
     (
-        0,
+        1,
+        TType.STRING,
+        "flavor",
+        "UTF8",
+        None,
+    ),  # 1
+    (
+        2,
+        TType.STRING,
+        "image",
+        "UTF8",
+        None,
+    ),  # 2
+    (
+        3,
+        TType.STRING,
+        "public_key",
+        "UTF8",
+        None,
+    ),  # 3
+    (
+        4,
+        TType.STRING,
+        "servername",
+        "UTF8",
+        None,
+    ),  # 4
+    (
+        5,
+        TType.MAP,
+        "metadata",
+        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
+        None,
+    ),  # 5
+    (
+        6,
+        TType.BOOL,
+        "https",
+        None,
+        None,
+    ),  # 6
+    (
+        7,
+        TType.BOOL,
+        "http",
+        None,
+        None,
+    ),  # 7
+    (
+        8,
         TType.LIST,
-        "success",
-        (TType.STRUCT, [Image, None], False),
+        "resenv",
+        (TType.STRING, "UTF8", False),
         None,
-    ),  # 0
+    ),  # 8
+    (
+        9,
+        TType.LIST,
+        "volume_ids_path_new",
+        (TType.MAP, (TType.STRING, "UTF8", TType.STRING, "UTF8", False), False),
+        None,
+    ),  # 9
+    (
+        10,
+        TType.LIST,
+        "volume_ids_path_attach",
+        (TType.MAP, (TType.STRING, "UTF8", TType.STRING, "UTF8", False), False),
+        None,
+    ),  # 10
 )
 
 
-class get_volume_args(object):
+class start_server_with_mounted_volume_result(object):
     """
     Attributes:
-     - volume_id
+     - success
+     - e
+     - r
+     - s
+     - n
+     - i
+     - f
+     - o
 
     """
 
     def __init__(
         self,
-        volume_id=None,
+        success=None,
+        e=None,
+        r=None,
+        s=None,
+        n=None,
+        i=None,
+        f=None,
+        o=None,
     ):
-        self.volume_id = volume_id
+        self.success = success
+        self.e = e
+        self.r = r
+        self.s = s
+        self.n = n
+        self.i = i
+        self.f = f
+        self.o = o
 
     def read(self, iprot):
         if (
@@ -7894,13 +12499,58 @@ class get_volume_args(object):
             (fname, ftype, fid) = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 1:
-                if ftype == TType.STRING:
-                    self.volume_id = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
+            if fid == 0:
+                if ftype == TType.MAP:
+                    self.success = {}
+                    (_ktype253, _vtype254, _size252) = iprot.readMapBegin()
+                    for _i256 in range(_size252):
+                        _key257 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        _val258 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.success[_key257] = _val258
+                    iprot.readMapEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 1:
+                if ftype == TType.STRUCT:
+                    self.e = nameException.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRUCT:
+                    self.r = ressourceException.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.STRUCT:
+                    self.s = serverNotFoundException.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.STRUCT:
+                    self.n = networkNotFoundException.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 5:
+                if ftype == TType.STRUCT:
+                    self.i = imageNotFoundException.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 6:
+                if ftype == TType.STRUCT:
+                    self.f = flavorNotFoundException.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 7:
+                if ftype == TType.STRUCT:
+                    self.o = otherException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -7914,14 +12564,46 @@ class get_volume_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_volume_args")
-        if self.volume_id is not None:
-            oprot.writeFieldBegin("volume_id", TType.STRING, 1)
-            oprot.writeString(
-                self.volume_id.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.volume_id
-            )
+        oprot.writeStructBegin("start_server_with_mounted_volume_result")
+        if self.success is not None:
+            oprot.writeFieldBegin("success", TType.MAP, 0)
+            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.success))
+            for kiter259, viter260 in self.success.items():
+                oprot.writeString(
+                    kiter259.encode("utf-8") if sys.version_info[0] == 2 else kiter259
+                )
+                oprot.writeString(
+                    viter260.encode("utf-8") if sys.version_info[0] == 2 else viter260
+                )
+            oprot.writeMapEnd()
+            oprot.writeFieldEnd()
+        if self.e is not None:
+            oprot.writeFieldBegin("e", TType.STRUCT, 1)
+            self.e.write(oprot)
+            oprot.writeFieldEnd()
+        if self.r is not None:
+            oprot.writeFieldBegin("r", TType.STRUCT, 2)
+            self.r.write(oprot)
+            oprot.writeFieldEnd()
+        if self.s is not None:
+            oprot.writeFieldBegin("s", TType.STRUCT, 3)
+            self.s.write(oprot)
+            oprot.writeFieldEnd()
+        if self.n is not None:
+            oprot.writeFieldBegin("n", TType.STRUCT, 4)
+            self.n.write(oprot)
+            oprot.writeFieldEnd()
+        if self.i is not None:
+            oprot.writeFieldBegin("i", TType.STRUCT, 5)
+            self.i.write(oprot)
+            oprot.writeFieldEnd()
+        if self.f is not None:
+            oprot.writeFieldBegin("f", TType.STRUCT, 6)
+            self.f.write(oprot)
+            oprot.writeFieldEnd()
+        if self.o is not None:
+            oprot.writeFieldBegin("o", TType.STRUCT, 7)
+            self.o.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -7940,31 +12622,106 @@ class get_volume_args(object):
         return not (self == other)
 
 
-all_structs.append(get_volume_args)
-get_volume_args.thrift_spec = (
-    None,  # 0
+all_structs.append(start_server_with_mounted_volume_result)
+start_server_with_mounted_volume_result.thrift_spec = (
+    (
+        0,
+        TType.MAP,
+        "success",
+        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
+        None,
+    ),  # 0
     (
         1,
-        TType.STRING,
-        "volume_id",
-        "UTF8",
+        TType.STRUCT,
+        "e",
+        [nameException, None],
         None,
     ),  # 1
+    (
+        2,
+        TType.STRUCT,
+        "r",
+        [ressourceException, None],
+        None,
+    ),  # 2
+    (
+        3,
+        TType.STRUCT,
+        "s",
+        [serverNotFoundException, None],
+        None,
+    ),  # 3
+    (
+        4,
+        TType.STRUCT,
+        "n",
+        [networkNotFoundException, None],
+        None,
+    ),  # 4
+    (
+        5,
+        TType.STRUCT,
+        "i",
+        [imageNotFoundException, None],
+        None,
+    ),  # 5
+    (
+        6,
+        TType.STRUCT,
+        "f",
+        [flavorNotFoundException, None],
+        None,
+    ),  # 6
+    (
+        7,
+        TType.STRUCT,
+        "o",
+        [otherException, None],
+        None,
+    ),  # 7
 )
 
 
-class get_volume_result(object):
+class start_server_args(object):
     """
     Attributes:
-     - success
+     - flavor: Name of the  Flavor to use.
+     - image: Name of the image to use.
+     - public_key: Public Key to use
+     - servername: Name for the new server
+     - metadata: Metadata for the new instance
+     - diskspace: Diskspace in GB for additional volume.
+     - volumename: Name of additional Volume
+     - https
+     - http
+     - resenv
 
     """
 
     def __init__(
         self,
-        success=None,
+        flavor=None,
+        image=None,
+        public_key=None,
+        servername=None,
+        metadata=None,
+        diskspace=None,
+        volumename=None,
+        https=None,
+        http=None,
+        resenv=None,
     ):
-        self.success = success
+        self.flavor = flavor
+        self.image = image
+        self.public_key = public_key
+        self.servername = servername
+        self.metadata = metadata
+        self.diskspace = diskspace
+        self.volumename = volumename
+        self.https = https
+        self.http = http
+        self.resenv = resenv
 
     def read(self, iprot):
         if (
@@ -7979,94 +12736,100 @@ class get_volume_result(object):
             (fname, ftype, fid) = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 0:
-                if ftype == TType.STRUCT:
-                    self.success = Volume()
-                    self.success.read(iprot)
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.flavor = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.image = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.STRING:
+                    self.public_key = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.STRING:
+                    self.servername = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 5:
+                if ftype == TType.MAP:
+                    self.metadata = {}
+                    (_ktype262, _vtype263, _size261) = iprot.readMapBegin()
+                    for _i265 in range(_size261):
+                        _key266 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        _val267 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.metadata[_key266] = _val267
+                    iprot.readMapEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 6:
+                if ftype == TType.STRING:
+                    self.diskspace = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 7:
+                if ftype == TType.STRING:
+                    self.volumename = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 8:
+                if ftype == TType.BOOL:
+                    self.https = iprot.readBool()
                 else:
                     iprot.skip(ftype)
-            else:
-                iprot.skip(ftype)
-            iprot.readFieldEnd()
-        iprot.readStructEnd()
-
-    def write(self, oprot):
-        if oprot._fast_encode is not None and self.thrift_spec is not None:
-            oprot.trans.write(
-                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
-            )
-            return
-        oprot.writeStructBegin("get_volume_result")
-        if self.success is not None:
-            oprot.writeFieldBegin("success", TType.STRUCT, 0)
-            self.success.write(oprot)
-            oprot.writeFieldEnd()
-        oprot.writeFieldStop()
-        oprot.writeStructEnd()
-
-    def validate(self):
-        return
-
-    def __repr__(self):
-        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
-        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
-
-    def __eq__(self, other):
-        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
-
-    def __ne__(self, other):
-        return not (self == other)
-
-
-all_structs.append(get_volume_result)
-get_volume_result.thrift_spec = (
-    (
-        0,
-        TType.STRUCT,
-        "success",
-        [Volume, None],
-        None,
-    ),  # 0
-)
-
-
-class get_volumes_by_ids_args(object):
-    """
-    Attributes:
-     - volume_ids
-
-    """
-
-    def __init__(
-        self,
-        volume_ids=None,
-    ):
-        self.volume_ids = volume_ids
-
-    def read(self, iprot):
-        if (
-            iprot._fast_decode is not None
-            and isinstance(iprot.trans, TTransport.CReadableTransport)
-            and self.thrift_spec is not None
-        ):
-            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
-            return
-        iprot.readStructBegin()
-        while True:
-            (fname, ftype, fid) = iprot.readFieldBegin()
-            if ftype == TType.STOP:
-                break
-            if fid == 1:
+            elif fid == 9:
+                if ftype == TType.BOOL:
+                    self.http = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 10:
                 if ftype == TType.LIST:
-                    self.volume_ids = []
-                    (_etype97, _size94) = iprot.readListBegin()
-                    for _i98 in range(_size94):
-                        _elem99 = (
+                    self.resenv = []
+                    (_etype271, _size268) = iprot.readListBegin()
+                    for _i272 in range(_size268):
+                        _elem273 = (
                             iprot.readString().decode("utf-8", errors="replace")
                             if sys.version_info[0] == 2
                             else iprot.readString()
                         )
-                        self.volume_ids.append(_elem99)
+                        self.resenv.append(_elem273)
                     iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
@@ -8081,13 +12844,77 @@ class get_volumes_by_ids_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_volumes_by_ids_args")
-        if self.volume_ids is not None:
-            oprot.writeFieldBegin("volume_ids", TType.LIST, 1)
-            oprot.writeListBegin(TType.STRING, len(self.volume_ids))
-            for iter100 in self.volume_ids:
+        oprot.writeStructBegin("start_server_args")
+        if self.flavor is not None:
+            oprot.writeFieldBegin("flavor", TType.STRING, 1)
+            oprot.writeString(
+                self.flavor.encode("utf-8") if sys.version_info[0] == 2 else self.flavor
+            )
+            oprot.writeFieldEnd()
+        if self.image is not None:
+            oprot.writeFieldBegin("image", TType.STRING, 2)
+            oprot.writeString(
+                self.image.encode("utf-8") if sys.version_info[0] == 2 else self.image
+            )
+            oprot.writeFieldEnd()
+        if self.public_key is not None:
+            oprot.writeFieldBegin("public_key", TType.STRING, 3)
+            oprot.writeString(
+                self.public_key.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.public_key
+            )
+            oprot.writeFieldEnd()
+        if self.servername is not None:
+            oprot.writeFieldBegin("servername", TType.STRING, 4)
+            oprot.writeString(
+                self.servername.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.servername
+            )
+            oprot.writeFieldEnd()
+        if self.metadata is not None:
+            oprot.writeFieldBegin("metadata", TType.MAP, 5)
+            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.metadata))
+            for kiter274, viter275 in self.metadata.items():
                 oprot.writeString(
-                    iter100.encode("utf-8") if sys.version_info[0] == 2 else iter100
+                    kiter274.encode("utf-8") if sys.version_info[0] == 2 else kiter274
+                )
+                oprot.writeString(
+                    viter275.encode("utf-8") if sys.version_info[0] == 2 else viter275
+                )
+            oprot.writeMapEnd()
+            oprot.writeFieldEnd()
+        if self.diskspace is not None:
+            oprot.writeFieldBegin("diskspace", TType.STRING, 6)
+            oprot.writeString(
+                self.diskspace.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.diskspace
+            )
+            oprot.writeFieldEnd()
+        if self.volumename is not None:
+            oprot.writeFieldBegin("volumename", TType.STRING, 7)
+            oprot.writeString(
+                self.volumename.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.volumename
+            )
+            oprot.writeFieldEnd()
+        if self.https is not None:
+            oprot.writeFieldBegin("https", TType.BOOL, 8)
+            oprot.writeBool(self.https)
+            oprot.writeFieldEnd()
+        if self.http is not None:
+            oprot.writeFieldBegin("http", TType.BOOL, 9)
+            oprot.writeBool(self.http)
+            oprot.writeFieldEnd()
+        if self.resenv is not None:
+            oprot.writeFieldBegin("resenv", TType.LIST, 10)
+            oprot.writeListBegin(TType.STRING, len(self.resenv))
+            for iter276 in self.resenv:
+                oprot.writeString(
+                    iter276.encode("utf-8") if sys.version_info[0] == 2 else iter276
                 )
             oprot.writeListEnd()
             oprot.writeFieldEnd()
@@ -8108,31 +12935,115 @@ class get_volumes_by_ids_args(object):
         return not (self == other)
 
 
-all_structs.append(get_volumes_by_ids_args)
-get_volumes_by_ids_args.thrift_spec = (
+all_structs.append(start_server_args)
+start_server_args.thrift_spec = (
     None,  # 0
     (
         1,
+        TType.STRING,
+        "flavor",
+        "UTF8",
+        None,
+    ),  # 1
+    (
+        2,
+        TType.STRING,
+        "image",
+        "UTF8",
+        None,
+    ),  # 2
+    (
+        3,
+        TType.STRING,
+        "public_key",
+        "UTF8",
+        None,
+    ),  # 3
+    (
+        4,
+        TType.STRING,
+        "servername",
+        "UTF8",
+        None,
+    ),  # 4
+    (
+        5,
+        TType.MAP,
+        "metadata",
+        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
+        None,
+    ),  # 5
+    (
+        6,
+        TType.STRING,
+        "diskspace",
+        "UTF8",
+        None,
+    ),  # 6
+    (
+        7,
+        TType.STRING,
+        "volumename",
+        "UTF8",
+        None,
+    ),  # 7
+    (
+        8,
+        TType.BOOL,
+        "https",
+        None,
+        None,
+    ),  # 8
+    (
+        9,
+        TType.BOOL,
+        "http",
+        None,
+        None,
+    ),  # 9
+    (
+        10,
         TType.LIST,
-        "volume_ids",
+        "resenv",
         (TType.STRING, "UTF8", False),
         None,
-    ),  # 1
+    ),  # 10
 )
 
 
-class get_volumes_by_ids_result(object):
+class start_server_result(object):
     """
     Attributes:
      - success
+     - e
+     - r
+     - s
+     - n
+     - i
+     - f
+     - o
 
     """
 
     def __init__(
         self,
         success=None,
+        e=None,
+        r=None,
+        s=None,
+        n=None,
+        i=None,
+        f=None,
+        o=None,
     ):
         self.success = success
+        self.e = e
+        self.r = r
+        self.s = s
+        self.n = n
+        self.i = i
+        self.f = f
+        self.o = o
 
     def read(self, iprot):
         if (
@@ -8148,14 +13059,57 @@ class get_volumes_by_ids_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.LIST:
-                    self.success = []
-                    (_etype104, _size101) = iprot.readListBegin()
-                    for _i105 in range(_size101):
-                        _elem106 = Volume()
-                        _elem106.read(iprot)
-                        self.success.append(_elem106)
-                    iprot.readListEnd()
+                if ftype == TType.MAP:
+                    self.success = {}
+                    (_ktype278, _vtype279, _size277) = iprot.readMapBegin()
+                    for _i281 in range(_size277):
+                        _key282 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        _val283 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.success[_key282] = _val283
+                    iprot.readMapEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 1:
+                if ftype == TType.STRUCT:
+                    self.e = nameException.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRUCT:
+                    self.r = ressourceException.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.STRUCT:
+                    self.s = serverNotFoundException.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.STRUCT:
+                    self.n = networkNotFoundException.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 5:
+                if ftype == TType.STRUCT:
+                    self.i = imageNotFoundException.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 6:
+                if ftype == TType.STRUCT:
+                    self.f = flavorNotFoundException.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 7:
+                if ftype == TType.STRUCT:
+                    self.o = otherException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -8169,13 +13123,46 @@ class get_volumes_by_ids_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_volumes_by_ids_result")
+        oprot.writeStructBegin("start_server_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.LIST, 0)
-            oprot.writeListBegin(TType.STRUCT, len(self.success))
-            for iter107 in self.success:
-                iter107.write(oprot)
-            oprot.writeListEnd()
+            oprot.writeFieldBegin("success", TType.MAP, 0)
+            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.success))
+            for kiter284, viter285 in self.success.items():
+                oprot.writeString(
+                    kiter284.encode("utf-8") if sys.version_info[0] == 2 else kiter284
+                )
+                oprot.writeString(
+                    viter285.encode("utf-8") if sys.version_info[0] == 2 else viter285
+                )
+            oprot.writeMapEnd()
+            oprot.writeFieldEnd()
+        if self.e is not None:
+            oprot.writeFieldBegin("e", TType.STRUCT, 1)
+            self.e.write(oprot)
+            oprot.writeFieldEnd()
+        if self.r is not None:
+            oprot.writeFieldBegin("r", TType.STRUCT, 2)
+            self.r.write(oprot)
+            oprot.writeFieldEnd()
+        if self.s is not None:
+            oprot.writeFieldBegin("s", TType.STRUCT, 3)
+            self.s.write(oprot)
+            oprot.writeFieldEnd()
+        if self.n is not None:
+            oprot.writeFieldBegin("n", TType.STRUCT, 4)
+            self.n.write(oprot)
+            oprot.writeFieldEnd()
+        if self.i is not None:
+            oprot.writeFieldBegin("i", TType.STRUCT, 5)
+            self.i.write(oprot)
+            oprot.writeFieldEnd()
+        if self.f is not None:
+            oprot.writeFieldBegin("f", TType.STRUCT, 6)
+            self.f.write(oprot)
+            oprot.writeFieldEnd()
+        if self.o is not None:
+            oprot.writeFieldBegin("o", TType.STRUCT, 7)
+            self.o.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -8194,33 +13181,103 @@ class get_volumes_by_ids_result(object):
         return not (self == other)
 
 
-all_structs.append(get_volumes_by_ids_result)
-get_volumes_by_ids_result.thrift_spec = (
+all_structs.append(start_server_result)
+start_server_result.thrift_spec = (
     (
         0,
-        TType.LIST,
+        TType.MAP,
         "success",
-        (TType.STRUCT, [Volume, None], False),
+        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
         None,
     ),  # 0
+    (
+        1,
+        TType.STRUCT,
+        "e",
+        [nameException, None],
+        None,
+    ),  # 1
+    (
+        2,
+        TType.STRUCT,
+        "r",
+        [ressourceException, None],
+        None,
+    ),  # 2
+    (
+        3,
+        TType.STRUCT,
+        "s",
+        [serverNotFoundException, None],
+        None,
+    ),  # 3
+    (
+        4,
+        TType.STRUCT,
+        "n",
+        [networkNotFoundException, None],
+        None,
+    ),  # 4
+    (
+        5,
+        TType.STRUCT,
+        "i",
+        [imageNotFoundException, None],
+        None,
+    ),  # 5
+    (
+        6,
+        TType.STRUCT,
+        "f",
+        [flavorNotFoundException, None],
+        None,
+    ),  # 6
+    (
+        7,
+        TType.STRUCT,
+        "o",
+        [otherException, None],
+        None,
+    ),  # 7
 )
 
 
-class resize_volume_args(object):
+class start_server_with_custom_key_args(object):
     """
     Attributes:
-     - volume_id
-     - size
+     - flavor: Name of the  Flavor to use.
+     - image: Name of the image to use.
+     - servername: Name for the new server
+     - metadata: Metadata for the new instance
+     - http: Boolean for http security rule
+     - https: Boolean for https security rule
+     - resenv
+     - volume_ids_path_new
+     - volume_ids_path_attach
 
     """
 
     def __init__(
         self,
-        volume_id=None,
-        size=None,
+        flavor=None,
+        image=None,
+        servername=None,
+        metadata=None,
+        http=None,
+        https=None,
+        resenv=None,
+        volume_ids_path_new=None,
+        volume_ids_path_attach=None,
     ):
-        self.volume_id = volume_id
-        self.size = size
+        self.flavor = flavor
+        self.image = image
+        self.servername = servername
+        self.metadata = metadata
+        self.http = http
+        self.https = https
+        self.resenv = resenv
+        self.volume_ids_path_new = volume_ids_path_new
+        self.volume_ids_path_attach = volume_ids_path_attach
 
     def read(self, iprot):
         if (
@@ -8237,16 +13294,120 @@ class resize_volume_args(object):
                 break
             if fid == 1:
                 if ftype == TType.STRING:
-                    self.volume_id = (
+                    self.flavor = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.image = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.STRING:
+                    self.servername = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
                     )
                 else:
                     iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.I32:
-                    self.size = iprot.readI32()
+            elif fid == 4:
+                if ftype == TType.MAP:
+                    self.metadata = {}
+                    (_ktype287, _vtype288, _size286) = iprot.readMapBegin()
+                    for _i290 in range(_size286):
+                        _key291 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        _val292 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.metadata[_key291] = _val292
+                    iprot.readMapEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 5:
+                if ftype == TType.BOOL:
+                    self.http = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 6:
+                if ftype == TType.BOOL:
+                    self.https = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 7:
+                if ftype == TType.LIST:
+                    self.resenv = []
+                    (_etype296, _size293) = iprot.readListBegin()
+                    for _i297 in range(_size293):
+                        _elem298 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.resenv.append(_elem298)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 9:
+                if ftype == TType.LIST:
+                    self.volume_ids_path_new = []
+                    (_etype302, _size299) = iprot.readListBegin()
+                    for _i303 in range(_size299):
+                        _elem304 = {}
+                        (_ktype306, _vtype307, _size305) = iprot.readMapBegin()
+                        for _i309 in range(_size305):
+                            _key310 = (
+                                iprot.readString().decode("utf-8", errors="replace")
+                                if sys.version_info[0] == 2
+                                else iprot.readString()
+                            )
+                            _val311 = (
+                                iprot.readString().decode("utf-8", errors="replace")
+                                if sys.version_info[0] == 2
+                                else iprot.readString()
+                            )
+                            _elem304[_key310] = _val311
+                        iprot.readMapEnd()
+                        self.volume_ids_path_new.append(_elem304)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 10:
+                if ftype == TType.LIST:
+                    self.volume_ids_path_attach = []
+                    (_etype315, _size312) = iprot.readListBegin()
+                    for _i316 in range(_size312):
+                        _elem317 = {}
+                        (_ktype319, _vtype320, _size318) = iprot.readMapBegin()
+                        for _i322 in range(_size318):
+                            _key323 = (
+                                iprot.readString().decode("utf-8", errors="replace")
+                                if sys.version_info[0] == 2
+                                else iprot.readString()
+                            )
+                            _val324 = (
+                                iprot.readString().decode("utf-8", errors="replace")
+                                if sys.version_info[0] == 2
+                                else iprot.readString()
+                            )
+                            _elem317[_key323] = _val324
+                        iprot.readMapEnd()
+                        self.volume_ids_path_attach.append(_elem317)
+                    iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -8260,18 +13421,93 @@ class resize_volume_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("resize_volume_args")
-        if self.volume_id is not None:
-            oprot.writeFieldBegin("volume_id", TType.STRING, 1)
+        oprot.writeStructBegin("start_server_with_custom_key_args")
+        if self.flavor is not None:
+            oprot.writeFieldBegin("flavor", TType.STRING, 1)
             oprot.writeString(
-                self.volume_id.encode("utf-8")
+                self.flavor.encode("utf-8") if sys.version_info[0] == 2 else self.flavor
+            )
+            oprot.writeFieldEnd()
+        if self.image is not None:
+            oprot.writeFieldBegin("image", TType.STRING, 2)
+            oprot.writeString(
+                self.image.encode("utf-8") if sys.version_info[0] == 2 else self.image
+            )
+            oprot.writeFieldEnd()
+        if self.servername is not None:
+            oprot.writeFieldBegin("servername", TType.STRING, 3)
+            oprot.writeString(
+                self.servername.encode("utf-8")
                 if sys.version_info[0] == 2
-                else self.volume_id
+                else self.servername
             )
             oprot.writeFieldEnd()
-        if self.size is not None:
-            oprot.writeFieldBegin("size", TType.I32, 2)
-            oprot.writeI32(self.size)
+        if self.metadata is not None:
+            oprot.writeFieldBegin("metadata", TType.MAP, 4)
+            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.metadata))
+            for kiter325, viter326 in self.metadata.items():
+                oprot.writeString(
+                    kiter325.encode("utf-8") if sys.version_info[0] == 2 else kiter325
+                )
+                oprot.writeString(
+                    viter326.encode("utf-8") if sys.version_info[0] == 2 else viter326
+                )
+            oprot.writeMapEnd()
+            oprot.writeFieldEnd()
+        if self.http is not None:
+            oprot.writeFieldBegin("http", TType.BOOL, 5)
+            oprot.writeBool(self.http)
+            oprot.writeFieldEnd()
+        if self.https is not None:
+            oprot.writeFieldBegin("https", TType.BOOL, 6)
+            oprot.writeBool(self.https)
+            oprot.writeFieldEnd()
+        if self.resenv is not None:
+            oprot.writeFieldBegin("resenv", TType.LIST, 7)
+            oprot.writeListBegin(TType.STRING, len(self.resenv))
+            for iter327 in self.resenv:
+                oprot.writeString(
+                    iter327.encode("utf-8") if sys.version_info[0] == 2 else iter327
+                )
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.volume_ids_path_new is not None:
+            oprot.writeFieldBegin("volume_ids_path_new", TType.LIST, 9)
+            oprot.writeListBegin(TType.MAP, len(self.volume_ids_path_new))
+            for iter328 in self.volume_ids_path_new:
+                oprot.writeMapBegin(TType.STRING, TType.STRING, len(iter328))
+                for kiter329, viter330 in iter328.items():
+                    oprot.writeString(
+                        kiter329.encode("utf-8")
+                        if sys.version_info[0] == 2
+                        else kiter329
+                    )
+                    oprot.writeString(
+                        viter330.encode("utf-8")
+                        if sys.version_info[0] == 2
+                        else viter330
+                    )
+                oprot.writeMapEnd()
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.volume_ids_path_attach is not None:
+            oprot.writeFieldBegin("volume_ids_path_attach", TType.LIST, 10)
+            oprot.writeListBegin(TType.MAP, len(self.volume_ids_path_attach))
+            for iter331 in self.volume_ids_path_attach:
+                oprot.writeMapBegin(TType.STRING, TType.STRING, len(iter331))
+                for kiter332, viter333 in iter331.items():
+                    oprot.writeString(
+                        kiter332.encode("utf-8")
+                        if sys.version_info[0] == 2
+                        else kiter332
+                    )
+                    oprot.writeString(
+                        viter333.encode("utf-8")
+                        if sys.version_info[0] == 2
+                        else viter333
+                    )
+                oprot.writeMapEnd()
+            oprot.writeListEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -8290,38 +13526,109 @@ class resize_volume_args(object):
         return not (self == other)
 
 
-all_structs.append(resize_volume_args)
-resize_volume_args.thrift_spec = (
+all_structs.append(start_server_with_custom_key_args)
+start_server_with_custom_key_args.thrift_spec = (
     None,  # 0
     (
         1,
         TType.STRING,
-        "volume_id",
+        "flavor",
         "UTF8",
         None,
     ),  # 1
     (
         2,
-        TType.I32,
-        "size",
-        None,
+        TType.STRING,
+        "image",
+        "UTF8",
         None,
     ),  # 2
+    (
+        3,
+        TType.STRING,
+        "servername",
+        "UTF8",
+        None,
+    ),  # 3
+    (
+        4,
+        TType.MAP,
+        "metadata",
+        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
+        None,
+    ),  # 4
+    (
+        5,
+        TType.BOOL,
+        "http",
+        None,
+        None,
+    ),  # 5
+    (
+        6,
+        TType.BOOL,
+        "https",
+        None,
+        None,
+    ),  # 6
+    (
+        7,
+        TType.LIST,
+        "resenv",
+        (TType.STRING, "UTF8", False),
+        None,
+    ),  # 7
+    None,  # 8
+    (
+        9,
+        TType.LIST,
+        "volume_ids_path_new",
+        (TType.MAP, (TType.STRING, "UTF8", TType.STRING, "UTF8", False), False),
+        None,
+    ),  # 9
+    (
+        10,
+        TType.LIST,
+        "volume_ids_path_attach",
+        (TType.MAP, (TType.STRING, "UTF8", TType.STRING, "UTF8", False), False),
+        None,
+    ),  # 10
 )
 
 
-class resize_volume_result(object):
+class start_server_with_custom_key_result(object):
     """
     Attributes:
      - success
+     - e
+     - r
+     - s
+     - n
+     - i
+     - f
+     - o
 
     """
 
     def __init__(
         self,
         success=None,
+        e=None,
+        r=None,
+        s=None,
+        n=None,
+        i=None,
+        f=None,
+        o=None,
     ):
         self.success = success
+        self.e = e
+        self.r = r
+        self.s = s
+        self.n = n
+        self.i = i
+        self.f = f
+        self.o = o
 
     def read(self, iprot):
         if (
@@ -8337,8 +13644,57 @@ class resize_volume_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.I32:
-                    self.success = iprot.readI32()
+                if ftype == TType.MAP:
+                    self.success = {}
+                    (_ktype335, _vtype336, _size334) = iprot.readMapBegin()
+                    for _i338 in range(_size334):
+                        _key339 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        _val340 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.success[_key339] = _val340
+                    iprot.readMapEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 1:
+                if ftype == TType.STRUCT:
+                    self.e = nameException.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRUCT:
+                    self.r = ressourceException.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.STRUCT:
+                    self.s = serverNotFoundException.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.STRUCT:
+                    self.n = networkNotFoundException.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 5:
+                if ftype == TType.STRUCT:
+                    self.i = imageNotFoundException.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 6:
+                if ftype == TType.STRUCT:
+                    self.f = flavorNotFoundException.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 7:
+                if ftype == TType.STRUCT:
+                    self.o = otherException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -8352,10 +13708,46 @@ class resize_volume_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("resize_volume_result")
+        oprot.writeStructBegin("start_server_with_custom_key_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.I32, 0)
-            oprot.writeI32(self.success)
+            oprot.writeFieldBegin("success", TType.MAP, 0)
+            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.success))
+            for kiter341, viter342 in self.success.items():
+                oprot.writeString(
+                    kiter341.encode("utf-8") if sys.version_info[0] == 2 else kiter341
+                )
+                oprot.writeString(
+                    viter342.encode("utf-8") if sys.version_info[0] == 2 else viter342
+                )
+            oprot.writeMapEnd()
+            oprot.writeFieldEnd()
+        if self.e is not None:
+            oprot.writeFieldBegin("e", TType.STRUCT, 1)
+            self.e.write(oprot)
+            oprot.writeFieldEnd()
+        if self.r is not None:
+            oprot.writeFieldBegin("r", TType.STRUCT, 2)
+            self.r.write(oprot)
+            oprot.writeFieldEnd()
+        if self.s is not None:
+            oprot.writeFieldBegin("s", TType.STRUCT, 3)
+            self.s.write(oprot)
+            oprot.writeFieldEnd()
+        if self.n is not None:
+            oprot.writeFieldBegin("n", TType.STRUCT, 4)
+            self.n.write(oprot)
+            oprot.writeFieldEnd()
+        if self.i is not None:
+            oprot.writeFieldBegin("i", TType.STRUCT, 5)
+            self.i.write(oprot)
+            oprot.writeFieldEnd()
+        if self.f is not None:
+            oprot.writeFieldBegin("f", TType.STRUCT, 6)
+            self.f.write(oprot)
+            oprot.writeFieldEnd()
+        if self.o is not None:
+            oprot.writeFieldBegin("o", TType.STRUCT, 7)
+            self.o.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -8374,30 +13766,79 @@ class resize_volume_result(object):
         return not (self == other)
 
 
-all_structs.append(resize_volume_result)
-resize_volume_result.thrift_spec = (
+all_structs.append(start_server_with_custom_key_result)
+start_server_with_custom_key_result.thrift_spec = (
     (
         0,
-        TType.I32,
+        TType.MAP,
         "success",
-        None,
+        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
         None,
     ),  # 0
+    (
+        1,
+        TType.STRUCT,
+        "e",
+        [nameException, None],
+        None,
+    ),  # 1
+    (
+        2,
+        TType.STRUCT,
+        "r",
+        [ressourceException, None],
+        None,
+    ),  # 2
+    (
+        3,
+        TType.STRUCT,
+        "s",
+        [serverNotFoundException, None],
+        None,
+    ),  # 3
+    (
+        4,
+        TType.STRUCT,
+        "n",
+        [networkNotFoundException, None],
+        None,
+    ),  # 4
+    (
+        5,
+        TType.STRUCT,
+        "i",
+        [imageNotFoundException, None],
+        None,
+    ),  # 5
+    (
+        6,
+        TType.STRUCT,
+        "f",
+        [flavorNotFoundException, None],
+        None,
+    ),  # 6
+    (
+        7,
+        TType.STRUCT,
+        "o",
+        [otherException, None],
+        None,
+    ),  # 7
 )
 
 
-class delete_server_args(object):
+class exist_server_args(object):
     """
     Attributes:
-     - openstack_id: Id of the server.
+     - name
 
     """
 
     def __init__(
         self,
-        openstack_id=None,
+        name=None,
     ):
-        self.openstack_id = openstack_id
+        self.name = name
 
     def read(self, iprot):
         if (
@@ -8414,7 +13855,7 @@ class delete_server_args(object):
                 break
             if fid == 1:
                 if ftype == TType.STRING:
-                    self.openstack_id = (
+                    self.name = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
@@ -8432,13 +13873,11 @@ class delete_server_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("delete_server_args")
-        if self.openstack_id is not None:
-            oprot.writeFieldBegin("openstack_id", TType.STRING, 1)
+        oprot.writeStructBegin("exist_server_args")
+        if self.name is not None:
+            oprot.writeFieldBegin("name", TType.STRING, 1)
             oprot.writeString(
-                self.openstack_id.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.openstack_id
+                self.name.encode("utf-8") if sys.version_info[0] == 2 else self.name
             )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
@@ -8458,37 +13897,31 @@ class delete_server_args(object):
         return not (self == other)
 
 
-all_structs.append(delete_server_args)
-delete_server_args.thrift_spec = (
+all_structs.append(exist_server_args)
+exist_server_args.thrift_spec = (
     None,  # 0
     (
         1,
         TType.STRING,
-        "openstack_id",
+        "name",
         "UTF8",
         None,
     ),  # 1
 )
 
 
-class delete_server_result(object):
+class exist_server_result(object):
     """
     Attributes:
      - success
-     - e
-     - c
 
     """
 
     def __init__(
         self,
         success=None,
-        e=None,
-        c=None,
     ):
         self.success = success
-        self.e = e
-        self.c = c
 
     def read(self, iprot):
         if (
@@ -8508,16 +13941,6 @@ class delete_server_result(object):
                     self.success = iprot.readBool()
                 else:
                     iprot.skip(ftype)
-            elif fid == 1:
-                if ftype == TType.STRUCT:
-                    self.e = serverNotFoundException.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.STRUCT:
-                    self.c = conflictException.read(iprot)
-                else:
-                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -8529,19 +13952,11 @@ class delete_server_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("delete_server_result")
+        oprot.writeStructBegin("exist_server_result")
         if self.success is not None:
             oprot.writeFieldBegin("success", TType.BOOL, 0)
             oprot.writeBool(self.success)
             oprot.writeFieldEnd()
-        if self.e is not None:
-            oprot.writeFieldBegin("e", TType.STRUCT, 1)
-            self.e.write(oprot)
-            oprot.writeFieldEnd()
-        if self.c is not None:
-            oprot.writeFieldBegin("c", TType.STRUCT, 2)
-            self.c.write(oprot)
-            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -8559,8 +13974,8 @@ class delete_server_result(object):
         return not (self == other)
 
 
-all_structs.append(delete_server_result)
-delete_server_result.thrift_spec = (
+all_structs.append(exist_server_result)
+exist_server_result.thrift_spec = (
     (
         0,
         TType.BOOL,
@@ -8568,38 +13983,27 @@ delete_server_result.thrift_spec = (
         None,
         None,
     ),  # 0
-    (
-        1,
-        TType.STRUCT,
-        "e",
-        [serverNotFoundException, None],
-        None,
-    ),  # 1
-    (
-        2,
-        TType.STRUCT,
-        "c",
-        [conflictException, None],
-        None,
-    ),  # 2
 )
 
 
-class add_metadata_to_server_args(object):
+class create_and_deploy_playbook_args(object):
     """
     Attributes:
-     - servername
-     - metadata
+     - public_key
+     - playbooks_information
+     - openstack_id
 
     """
 
     def __init__(
         self,
-        servername=None,
-        metadata=None,
+        public_key=None,
+        playbooks_information=None,
+        openstack_id=None,
     ):
-        self.servername = servername
-        self.metadata = metadata
+        self.public_key = public_key
+        self.playbooks_information = playbooks_information
+        self.openstack_id = openstack_id
 
     def read(self, iprot):
         if (
@@ -8616,7 +14020,7 @@ class add_metadata_to_server_args(object):
                 break
             if fid == 1:
                 if ftype == TType.STRING:
-                    self.servername = (
+                    self.public_key = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
@@ -8625,23 +14029,42 @@ class add_metadata_to_server_args(object):
                     iprot.skip(ftype)
             elif fid == 2:
                 if ftype == TType.MAP:
-                    self.metadata = {}
-                    (_ktype109, _vtype110, _size108) = iprot.readMapBegin()
-                    for _i112 in range(_size108):
-                        _key113 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        _val114 = (
+                    self.playbooks_information = {}
+                    (_ktype344, _vtype345, _size343) = iprot.readMapBegin()
+                    for _i347 in range(_size343):
+                        _key348 = (
                             iprot.readString().decode("utf-8", errors="replace")
                             if sys.version_info[0] == 2
                             else iprot.readString()
                         )
-                        self.metadata[_key113] = _val114
+                        _val349 = {}
+                        (_ktype351, _vtype352, _size350) = iprot.readMapBegin()
+                        for _i354 in range(_size350):
+                            _key355 = (
+                                iprot.readString().decode("utf-8", errors="replace")
+                                if sys.version_info[0] == 2
+                                else iprot.readString()
+                            )
+                            _val356 = (
+                                iprot.readString().decode("utf-8", errors="replace")
+                                if sys.version_info[0] == 2
+                                else iprot.readString()
+                            )
+                            _val349[_key355] = _val356
+                        iprot.readMapEnd()
+                        self.playbooks_information[_key348] = _val349
                     iprot.readMapEnd()
                 else:
                     iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.STRING:
+                    self.openstack_id = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -8653,27 +14076,47 @@ class add_metadata_to_server_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("add_metadata_to_server_args")
-        if self.servername is not None:
-            oprot.writeFieldBegin("servername", TType.STRING, 1)
+        oprot.writeStructBegin("create_and_deploy_playbook_args")
+        if self.public_key is not None:
+            oprot.writeFieldBegin("public_key", TType.STRING, 1)
             oprot.writeString(
-                self.servername.encode("utf-8")
+                self.public_key.encode("utf-8")
                 if sys.version_info[0] == 2
-                else self.servername
+                else self.public_key
             )
             oprot.writeFieldEnd()
-        if self.metadata is not None:
-            oprot.writeFieldBegin("metadata", TType.MAP, 2)
-            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.metadata))
-            for kiter115, viter116 in self.metadata.items():
-                oprot.writeString(
-                    kiter115.encode("utf-8") if sys.version_info[0] == 2 else kiter115
-                )
+        if self.playbooks_information is not None:
+            oprot.writeFieldBegin("playbooks_information", TType.MAP, 2)
+            oprot.writeMapBegin(
+                TType.STRING, TType.MAP, len(self.playbooks_information)
+            )
+            for kiter357, viter358 in self.playbooks_information.items():
                 oprot.writeString(
-                    viter116.encode("utf-8") if sys.version_info[0] == 2 else viter116
+                    kiter357.encode("utf-8") if sys.version_info[0] == 2 else kiter357
                 )
+                oprot.writeMapBegin(TType.STRING, TType.STRING, len(viter358))
+                for kiter359, viter360 in viter358.items():
+                    oprot.writeString(
+                        kiter359.encode("utf-8")
+                        if sys.version_info[0] == 2
+                        else kiter359
+                    )
+                    oprot.writeString(
+                        viter360.encode("utf-8")
+                        if sys.version_info[0] == 2
+                        else viter360
+                    )
+                oprot.writeMapEnd()
             oprot.writeMapEnd()
             oprot.writeFieldEnd()
+        if self.openstack_id is not None:
+            oprot.writeFieldBegin("openstack_id", TType.STRING, 3)
+            oprot.writeString(
+                self.openstack_id.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.openstack_id
+            )
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -8691,41 +14134,51 @@ class add_metadata_to_server_args(object):
         return not (self == other)
 
 
-all_structs.append(add_metadata_to_server_args)
-add_metadata_to_server_args.thrift_spec = (
+all_structs.append(create_and_deploy_playbook_args)
+create_and_deploy_playbook_args.thrift_spec = (
     None,  # 0
     (
         1,
         TType.STRING,
-        "servername",
+        "public_key",
         "UTF8",
         None,
     ),  # 1
     (
         2,
         TType.MAP,
-        "metadata",
-        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
+        "playbooks_information",
+        (
+            TType.STRING,
+            "UTF8",
+            TType.MAP,
+            (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
+            False,
+        ),
         None,
     ),  # 2
+    (
+        3,
+        TType.STRING,
+        "openstack_id",
+        "UTF8",
+        None,
+    ),  # 3
 )
 
 
-class add_metadata_to_server_result(object):
+class create_and_deploy_playbook_result(object):
     """
     Attributes:
      - success
-     - e
 
     """
 
     def __init__(
         self,
         success=None,
-        e=None,
     ):
         self.success = success
-        self.e = e
 
     def read(self, iprot):
         if (
@@ -8741,27 +14194,8 @@ class add_metadata_to_server_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.MAP:
-                    self.success = {}
-                    (_ktype118, _vtype119, _size117) = iprot.readMapBegin()
-                    for _i121 in range(_size117):
-                        _key122 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        _val123 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        self.success[_key122] = _val123
-                    iprot.readMapEnd()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 1:
-                if ftype == TType.STRUCT:
-                    self.e = serverNotFoundException.read(iprot)
+                if ftype == TType.I32:
+                    self.success = iprot.readI32()
                 else:
                     iprot.skip(ftype)
             else:
@@ -8775,22 +14209,10 @@ class add_metadata_to_server_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("add_metadata_to_server_result")
+        oprot.writeStructBegin("create_and_deploy_playbook_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.MAP, 0)
-            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.success))
-            for kiter124, viter125 in self.success.items():
-                oprot.writeString(
-                    kiter124.encode("utf-8") if sys.version_info[0] == 2 else kiter124
-                )
-                oprot.writeString(
-                    viter125.encode("utf-8") if sys.version_info[0] == 2 else viter125
-                )
-            oprot.writeMapEnd()
-            oprot.writeFieldEnd()
-        if self.e is not None:
-            oprot.writeFieldBegin("e", TType.STRUCT, 1)
-            self.e.write(oprot)
+            oprot.writeFieldBegin("success", TType.I32, 0)
+            oprot.writeI32(self.success)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -8809,40 +14231,30 @@ class add_metadata_to_server_result(object):
         return not (self == other)
 
 
-all_structs.append(add_metadata_to_server_result)
-add_metadata_to_server_result.thrift_spec = (
+all_structs.append(create_and_deploy_playbook_result)
+create_and_deploy_playbook_result.thrift_spec = (
     (
         0,
-        TType.MAP,
+        TType.I32,
         "success",
-        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
         None,
-    ),  # 0
-    (
-        1,
-        TType.STRUCT,
-        "e",
-        [serverNotFoundException, None],
         None,
-    ),  # 1
+    ),  # 0
 )
 
 
-class delete_metadata_from_server_args(object):
+class get_playbook_logs_args(object):
     """
     Attributes:
-     - servername
-     - keys
+     - openstack_id
 
     """
 
     def __init__(
         self,
-        servername=None,
-        keys=None,
+        openstack_id=None,
     ):
-        self.servername = servername
-        self.keys = keys
+        self.openstack_id = openstack_id
 
     def read(self, iprot):
         if (
@@ -8859,27 +14271,13 @@ class delete_metadata_from_server_args(object):
                 break
             if fid == 1:
                 if ftype == TType.STRING:
-                    self.servername = (
+                    self.openstack_id = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
                     )
                 else:
                     iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.SET:
-                    self.keys = set()
-                    (_etype129, _size126) = iprot.readSetBegin()
-                    for _i130 in range(_size126):
-                        _elem131 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        self.keys.add(_elem131)
-                    iprot.readSetEnd()
-                else:
-                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -8891,24 +14289,15 @@ class delete_metadata_from_server_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("delete_metadata_from_server_args")
-        if self.servername is not None:
-            oprot.writeFieldBegin("servername", TType.STRING, 1)
+        oprot.writeStructBegin("get_playbook_logs_args")
+        if self.openstack_id is not None:
+            oprot.writeFieldBegin("openstack_id", TType.STRING, 1)
             oprot.writeString(
-                self.servername.encode("utf-8")
+                self.openstack_id.encode("utf-8")
                 if sys.version_info[0] == 2
-                else self.servername
+                else self.openstack_id
             )
             oprot.writeFieldEnd()
-        if self.keys is not None:
-            oprot.writeFieldBegin("keys", TType.SET, 2)
-            oprot.writeSetBegin(TType.STRING, len(self.keys))
-            for iter132 in self.keys:
-                oprot.writeString(
-                    iter132.encode("utf-8") if sys.version_info[0] == 2 else iter132
-                )
-            oprot.writeSetEnd()
-            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -8926,41 +14315,31 @@ class delete_metadata_from_server_args(object):
         return not (self == other)
 
 
-all_structs.append(delete_metadata_from_server_args)
-delete_metadata_from_server_args.thrift_spec = (
+all_structs.append(get_playbook_logs_args)
+get_playbook_logs_args.thrift_spec = (
     None,  # 0
     (
         1,
         TType.STRING,
-        "servername",
+        "openstack_id",
         "UTF8",
         None,
     ),  # 1
-    (
-        2,
-        TType.SET,
-        "keys",
-        (TType.STRING, "UTF8", False),
-        None,
-    ),  # 2
 )
 
 
-class delete_metadata_from_server_result(object):
+class get_playbook_logs_result(object):
     """
     Attributes:
      - success
-     - e
 
     """
 
     def __init__(
         self,
         success=None,
-        e=None,
     ):
         self.success = success
-        self.e = e
 
     def read(self, iprot):
         if (
@@ -8976,22 +14355,9 @@ class delete_metadata_from_server_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.SET:
-                    self.success = set()
-                    (_etype136, _size133) = iprot.readSetBegin()
-                    for _i137 in range(_size133):
-                        _elem138 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        self.success.add(_elem138)
-                    iprot.readSetEnd()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 1:
                 if ftype == TType.STRUCT:
-                    self.e = serverNotFoundException.read(iprot)
+                    self.success = PlaybookResult()
+                    self.success.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -9005,19 +14371,10 @@ class delete_metadata_from_server_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("delete_metadata_from_server_result")
+        oprot.writeStructBegin("get_playbook_logs_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.SET, 0)
-            oprot.writeSetBegin(TType.STRING, len(self.success))
-            for iter139 in self.success:
-                oprot.writeString(
-                    iter139.encode("utf-8") if sys.version_info[0] == 2 else iter139
-                )
-            oprot.writeSetEnd()
-            oprot.writeFieldEnd()
-        if self.e is not None:
-            oprot.writeFieldBegin("e", TType.STRUCT, 1)
-            self.e.write(oprot)
+            oprot.writeFieldBegin("success", TType.STRUCT, 0)
+            self.success.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -9036,41 +14393,19 @@ class delete_metadata_from_server_result(object):
         return not (self == other)
 
 
-all_structs.append(delete_metadata_from_server_result)
-delete_metadata_from_server_result.thrift_spec = (
-    (
-        0,
-        TType.SET,
-        "success",
-        (TType.STRING, "UTF8", False),
-        None,
-    ),  # 0
-    (
-        1,
-        TType.STRUCT,
-        "e",
-        [serverNotFoundException, None],
-        None,
-    ),  # 1
-)
-
-
-class add_floating_ip_to_server_args(object):
-    """
-    Attributes:
-     - openstack_id: Id of the server
-     - network: Network name of the network which provides the floating Ip.
-
-    """
+all_structs.append(get_playbook_logs_result)
+get_playbook_logs_result.thrift_spec = (
+    (
+        0,
+        TType.STRUCT,
+        "success",
+        [PlaybookResult, None],
+        None,
+    ),  # 0
+)
 
-    def __init__(
-        self,
-        openstack_id=None,
-        network=None,
-    ):
-        self.openstack_id = openstack_id
-        self.network = network
 
+class has_forc_args(object):
     def read(self, iprot):
         if (
             iprot._fast_decode is not None
@@ -9084,24 +14419,6 @@ class add_floating_ip_to_server_args(object):
             (fname, ftype, fid) = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 1:
-                if ftype == TType.STRING:
-                    self.openstack_id = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.STRING:
-                    self.network = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -9113,23 +14430,7 @@ class add_floating_ip_to_server_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("add_floating_ip_to_server_args")
-        if self.openstack_id is not None:
-            oprot.writeFieldBegin("openstack_id", TType.STRING, 1)
-            oprot.writeString(
-                self.openstack_id.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.openstack_id
-            )
-            oprot.writeFieldEnd()
-        if self.network is not None:
-            oprot.writeFieldBegin("network", TType.STRING, 2)
-            oprot.writeString(
-                self.network.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.network
-            )
-            oprot.writeFieldEnd()
+        oprot.writeStructBegin("has_forc_args")
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -9147,44 +14448,22 @@ class add_floating_ip_to_server_args(object):
         return not (self == other)
 
 
-all_structs.append(add_floating_ip_to_server_args)
-add_floating_ip_to_server_args.thrift_spec = (
-    None,  # 0
-    (
-        1,
-        TType.STRING,
-        "openstack_id",
-        "UTF8",
-        None,
-    ),  # 1
-    (
-        2,
-        TType.STRING,
-        "network",
-        "UTF8",
-        None,
-    ),  # 2
-)
+all_structs.append(has_forc_args)
+has_forc_args.thrift_spec = ()
 
 
-class add_floating_ip_to_server_result(object):
+class has_forc_result(object):
     """
     Attributes:
      - success
-     - e
-     - f
 
     """
 
     def __init__(
         self,
         success=None,
-        e=None,
-        f=None,
     ):
         self.success = success
-        self.e = e
-        self.f = f
 
     def read(self, iprot):
         if (
@@ -9200,22 +14479,8 @@ class add_floating_ip_to_server_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.STRING:
-                    self.success = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 1:
-                if ftype == TType.STRUCT:
-                    self.e = serverNotFoundException.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.STRUCT:
-                    self.f = networkNotFoundException.read(iprot)
+                if ftype == TType.BOOL:
+                    self.success = iprot.readBool()
                 else:
                     iprot.skip(ftype)
             else:
@@ -9229,22 +14494,10 @@ class add_floating_ip_to_server_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("add_floating_ip_to_server_result")
+        oprot.writeStructBegin("has_forc_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.STRING, 0)
-            oprot.writeString(
-                self.success.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.success
-            )
-            oprot.writeFieldEnd()
-        if self.e is not None:
-            oprot.writeFieldBegin("e", TType.STRUCT, 1)
-            self.e.write(oprot)
-            oprot.writeFieldEnd()
-        if self.f is not None:
-            oprot.writeFieldBegin("f", TType.STRUCT, 2)
-            self.f.write(oprot)
+            oprot.writeFieldBegin("success", TType.BOOL, 0)
+            oprot.writeBool(self.success)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -9263,60 +14516,19 @@ class add_floating_ip_to_server_result(object):
         return not (self == other)
 
 
-all_structs.append(add_floating_ip_to_server_result)
-add_floating_ip_to_server_result.thrift_spec = (
+all_structs.append(has_forc_result)
+has_forc_result.thrift_spec = (
     (
         0,
-        TType.STRING,
+        TType.BOOL,
         "success",
-        "UTF8",
-        None,
-    ),  # 0
-    (
-        1,
-        TType.STRUCT,
-        "e",
-        [serverNotFoundException, None],
         None,
-    ),  # 1
-    (
-        2,
-        TType.STRUCT,
-        "f",
-        [networkNotFoundException, None],
         None,
-    ),  # 2
+    ),  # 0
 )
 
 
-class create_connection_args(object):
-    """
-    Attributes:
-     - username: Name of the OpenStack user.
-     - password: Password of the OpenStack user
-     - auth_url: Auth Url from OpenStack
-     - user_domain_name: Name of the project from the OpenStack user.
-    4:string project_name,
-
-    /** Domain name of OpenStack
-     - project_domain_name: Project domain name of OpenStack
-
-    """
-
-    def __init__(
-        self,
-        username=None,
-        password=None,
-        auth_url=None,
-        user_domain_name=None,
-        project_domain_name=None,
-    ):
-        self.username = username
-        self.password = password
-        self.auth_url = auth_url
-        self.user_domain_name = user_domain_name
-        self.project_domain_name = project_domain_name
-
+class get_forc_url_args(object):
     def read(self, iprot):
         if (
             iprot._fast_decode is not None
@@ -9330,103 +14542,18 @@ class create_connection_args(object):
             (fname, ftype, fid) = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 1:
-                if ftype == TType.STRING:
-                    self.username = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.STRING:
-                    self.password = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 3:
-                if ftype == TType.STRING:
-                    self.auth_url = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 5:
-                if ftype == TType.STRING:
-                    self.user_domain_name = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 6:
-                if ftype == TType.STRING:
-                    self.project_domain_name = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
         iprot.readStructEnd()
 
     def write(self, oprot):
-        if oprot._fast_encode is not None and self.thrift_spec is not None:
-            oprot.trans.write(
-                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
-            )
-            return
-        oprot.writeStructBegin("create_connection_args")
-        if self.username is not None:
-            oprot.writeFieldBegin("username", TType.STRING, 1)
-            oprot.writeString(
-                self.username.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.username
-            )
-            oprot.writeFieldEnd()
-        if self.password is not None:
-            oprot.writeFieldBegin("password", TType.STRING, 2)
-            oprot.writeString(
-                self.password.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.password
-            )
-            oprot.writeFieldEnd()
-        if self.auth_url is not None:
-            oprot.writeFieldBegin("auth_url", TType.STRING, 3)
-            oprot.writeString(
-                self.auth_url.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.auth_url
-            )
-            oprot.writeFieldEnd()
-        if self.user_domain_name is not None:
-            oprot.writeFieldBegin("user_domain_name", TType.STRING, 5)
-            oprot.writeString(
-                self.user_domain_name.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.user_domain_name
-            )
-            oprot.writeFieldEnd()
-        if self.project_domain_name is not None:
-            oprot.writeFieldBegin("project_domain_name", TType.STRING, 6)
-            oprot.writeString(
-                self.project_domain_name.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.project_domain_name
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
-            oprot.writeFieldEnd()
+            return
+        oprot.writeStructBegin("get_forc_url_args")
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -9444,63 +14571,22 @@ class create_connection_args(object):
         return not (self == other)
 
 
-all_structs.append(create_connection_args)
-create_connection_args.thrift_spec = (
-    None,  # 0
-    (
-        1,
-        TType.STRING,
-        "username",
-        "UTF8",
-        None,
-    ),  # 1
-    (
-        2,
-        TType.STRING,
-        "password",
-        "UTF8",
-        None,
-    ),  # 2
-    (
-        3,
-        TType.STRING,
-        "auth_url",
-        "UTF8",
-        None,
-    ),  # 3
-    None,  # 4
-    (
-        5,
-        TType.STRING,
-        "user_domain_name",
-        "UTF8",
-        None,
-    ),  # 5
-    (
-        6,
-        TType.STRING,
-        "project_domain_name",
-        "UTF8",
-        None,
-    ),  # 6
-)
+all_structs.append(get_forc_url_args)
+get_forc_url_args.thrift_spec = ()
 
 
-class create_connection_result(object):
+class get_forc_url_result(object):
     """
     Attributes:
      - success
-     - e
 
     """
 
     def __init__(
         self,
         success=None,
-        e=None,
     ):
         self.success = success
-        self.e = e
 
     def read(self, iprot):
         if (
@@ -9516,13 +14602,12 @@ class create_connection_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.BOOL:
-                    self.success = iprot.readBool()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 1:
-                if ftype == TType.STRUCT:
-                    self.e = authenticationException.read(iprot)
+                if ftype == TType.STRING:
+                    self.success = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
                 else:
                     iprot.skip(ftype)
             else:
@@ -9536,14 +14621,14 @@ class create_connection_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("create_connection_result")
+        oprot.writeStructBegin("get_forc_url_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.BOOL, 0)
-            oprot.writeBool(self.success)
-            oprot.writeFieldEnd()
-        if self.e is not None:
-            oprot.writeFieldBegin("e", TType.STRUCT, 1)
-            self.e.write(oprot)
+            oprot.writeFieldBegin("success", TType.STRING, 0)
+            oprot.writeString(
+                self.success.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.success
+            )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -9562,67 +14647,39 @@ class create_connection_result(object):
         return not (self == other)
 
 
-all_structs.append(create_connection_result)
-create_connection_result.thrift_spec = (
+all_structs.append(get_forc_url_result)
+get_forc_url_result.thrift_spec = (
     (
         0,
-        TType.BOOL,
+        TType.STRING,
         "success",
-        None,
+        "UTF8",
         None,
     ),  # 0
-    (
-        1,
-        TType.STRUCT,
-        "e",
-        [authenticationException, None],
-        None,
-    ),  # 1
 )
 
 
-class start_server_without_playbook_args(object):
+class create_backend_args(object):
     """
     Attributes:
-     - flavor: Name of the  Flavor to use.
-     - image: Name of the image to use.
-     - public_key: Public Key to use
-     - servername: Name for the new server
-     - metadata: Metadata for the new instance
-     - https
-     - http
-     - resenv
-     - volume_ids_path_new
-     - volume_ids_path_attach
-     - additional_keys
+     - elixir_id
+     - user_key_url
+     - template
+     - upstream_url
 
     """
 
     def __init__(
         self,
-        flavor=None,
-        image=None,
-        public_key=None,
-        servername=None,
-        metadata=None,
-        https=None,
-        http=None,
-        resenv=None,
-        volume_ids_path_new=None,
-        volume_ids_path_attach=None,
-        additional_keys=None,
+        elixir_id=None,
+        user_key_url=None,
+        template=None,
+        upstream_url=None,
     ):
-        self.flavor = flavor
-        self.image = image
-        self.public_key = public_key
-        self.servername = servername
-        self.metadata = metadata
-        self.https = https
-        self.http = http
-        self.resenv = resenv
-        self.volume_ids_path_new = volume_ids_path_new
-        self.volume_ids_path_attach = volume_ids_path_attach
-        self.additional_keys = additional_keys
+        self.elixir_id = elixir_id
+        self.user_key_url = user_key_url
+        self.template = template
+        self.upstream_url = upstream_url
 
     def read(self, iprot):
         if (
@@ -9639,7 +14696,7 @@ class start_server_without_playbook_args(object):
                 break
             if fid == 1:
                 if ftype == TType.STRING:
-                    self.flavor = (
+                    self.elixir_id = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
@@ -9648,134 +14705,29 @@ class start_server_without_playbook_args(object):
                     iprot.skip(ftype)
             elif fid == 2:
                 if ftype == TType.STRING:
-                    self.image = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 3:
-                if ftype == TType.STRING:
-                    self.public_key = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 4:
-                if ftype == TType.STRING:
-                    self.servername = (
+                    self.user_key_url = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 5:
-                if ftype == TType.MAP:
-                    self.metadata = {}
-                    (_ktype141, _vtype142, _size140) = iprot.readMapBegin()
-                    for _i144 in range(_size140):
-                        _key145 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        _val146 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        self.metadata[_key145] = _val146
-                    iprot.readMapEnd()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 6:
-                if ftype == TType.BOOL:
-                    self.https = iprot.readBool()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 7:
-                if ftype == TType.BOOL:
-                    self.http = iprot.readBool()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 8:
-                if ftype == TType.LIST:
-                    self.resenv = []
-                    (_etype150, _size147) = iprot.readListBegin()
-                    for _i151 in range(_size147):
-                        _elem152 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        self.resenv.append(_elem152)
-                    iprot.readListEnd()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 9:
-                if ftype == TType.LIST:
-                    self.volume_ids_path_new = []
-                    (_etype156, _size153) = iprot.readListBegin()
-                    for _i157 in range(_size153):
-                        _elem158 = {}
-                        (_ktype160, _vtype161, _size159) = iprot.readMapBegin()
-                        for _i163 in range(_size159):
-                            _key164 = (
-                                iprot.readString().decode("utf-8", errors="replace")
-                                if sys.version_info[0] == 2
-                                else iprot.readString()
-                            )
-                            _val165 = (
-                                iprot.readString().decode("utf-8", errors="replace")
-                                if sys.version_info[0] == 2
-                                else iprot.readString()
-                            )
-                            _elem158[_key164] = _val165
-                        iprot.readMapEnd()
-                        self.volume_ids_path_new.append(_elem158)
-                    iprot.readListEnd()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 10:
-                if ftype == TType.LIST:
-                    self.volume_ids_path_attach = []
-                    (_etype169, _size166) = iprot.readListBegin()
-                    for _i170 in range(_size166):
-                        _elem171 = {}
-                        (_ktype173, _vtype174, _size172) = iprot.readMapBegin()
-                        for _i176 in range(_size172):
-                            _key177 = (
-                                iprot.readString().decode("utf-8", errors="replace")
-                                if sys.version_info[0] == 2
-                                else iprot.readString()
-                            )
-                            _val178 = (
-                                iprot.readString().decode("utf-8", errors="replace")
-                                if sys.version_info[0] == 2
-                                else iprot.readString()
-                            )
-                            _elem171[_key177] = _val178
-                        iprot.readMapEnd()
-                        self.volume_ids_path_attach.append(_elem171)
-                    iprot.readListEnd()
+                    )
                 else:
                     iprot.skip(ftype)
-            elif fid == 11:
-                if ftype == TType.LIST:
-                    self.additional_keys = []
-                    (_etype182, _size179) = iprot.readListBegin()
-                    for _i183 in range(_size179):
-                        _elem184 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        self.additional_keys.append(_elem184)
-                    iprot.readListEnd()
+            elif fid == 3:
+                if ftype == TType.STRING:
+                    self.template = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.STRING:
+                    self.upstream_url = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
                 else:
                     iprot.skip(ftype)
             else:
@@ -9789,111 +14741,39 @@ class start_server_without_playbook_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("start_server_without_playbook_args")
-        if self.flavor is not None:
-            oprot.writeFieldBegin("flavor", TType.STRING, 1)
+        oprot.writeStructBegin("create_backend_args")
+        if self.elixir_id is not None:
+            oprot.writeFieldBegin("elixir_id", TType.STRING, 1)
             oprot.writeString(
-                self.flavor.encode("utf-8") if sys.version_info[0] == 2 else self.flavor
+                self.elixir_id.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.elixir_id
             )
             oprot.writeFieldEnd()
-        if self.image is not None:
-            oprot.writeFieldBegin("image", TType.STRING, 2)
+        if self.user_key_url is not None:
+            oprot.writeFieldBegin("user_key_url", TType.STRING, 2)
             oprot.writeString(
-                self.image.encode("utf-8") if sys.version_info[0] == 2 else self.image
+                self.user_key_url.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.user_key_url
             )
             oprot.writeFieldEnd()
-        if self.public_key is not None:
-            oprot.writeFieldBegin("public_key", TType.STRING, 3)
+        if self.template is not None:
+            oprot.writeFieldBegin("template", TType.STRING, 3)
             oprot.writeString(
-                self.public_key.encode("utf-8")
+                self.template.encode("utf-8")
                 if sys.version_info[0] == 2
-                else self.public_key
+                else self.template
             )
             oprot.writeFieldEnd()
-        if self.servername is not None:
-            oprot.writeFieldBegin("servername", TType.STRING, 4)
+        if self.upstream_url is not None:
+            oprot.writeFieldBegin("upstream_url", TType.STRING, 4)
             oprot.writeString(
-                self.servername.encode("utf-8")
+                self.upstream_url.encode("utf-8")
                 if sys.version_info[0] == 2
-                else self.servername
+                else self.upstream_url
             )
             oprot.writeFieldEnd()
-        if self.metadata is not None:
-            oprot.writeFieldBegin("metadata", TType.MAP, 5)
-            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.metadata))
-            for kiter185, viter186 in self.metadata.items():
-                oprot.writeString(
-                    kiter185.encode("utf-8") if sys.version_info[0] == 2 else kiter185
-                )
-                oprot.writeString(
-                    viter186.encode("utf-8") if sys.version_info[0] == 2 else viter186
-                )
-            oprot.writeMapEnd()
-            oprot.writeFieldEnd()
-        if self.https is not None:
-            oprot.writeFieldBegin("https", TType.BOOL, 6)
-            oprot.writeBool(self.https)
-            oprot.writeFieldEnd()
-        if self.http is not None:
-            oprot.writeFieldBegin("http", TType.BOOL, 7)
-            oprot.writeBool(self.http)
-            oprot.writeFieldEnd()
-        if self.resenv is not None:
-            oprot.writeFieldBegin("resenv", TType.LIST, 8)
-            oprot.writeListBegin(TType.STRING, len(self.resenv))
-            for iter187 in self.resenv:
-                oprot.writeString(
-                    iter187.encode("utf-8") if sys.version_info[0] == 2 else iter187
-                )
-            oprot.writeListEnd()
-            oprot.writeFieldEnd()
-        if self.volume_ids_path_new is not None:
-            oprot.writeFieldBegin("volume_ids_path_new", TType.LIST, 9)
-            oprot.writeListBegin(TType.MAP, len(self.volume_ids_path_new))
-            for iter188 in self.volume_ids_path_new:
-                oprot.writeMapBegin(TType.STRING, TType.STRING, len(iter188))
-                for kiter189, viter190 in iter188.items():
-                    oprot.writeString(
-                        kiter189.encode("utf-8")
-                        if sys.version_info[0] == 2
-                        else kiter189
-                    )
-                    oprot.writeString(
-                        viter190.encode("utf-8")
-                        if sys.version_info[0] == 2
-                        else viter190
-                    )
-                oprot.writeMapEnd()
-            oprot.writeListEnd()
-            oprot.writeFieldEnd()
-        if self.volume_ids_path_attach is not None:
-            oprot.writeFieldBegin("volume_ids_path_attach", TType.LIST, 10)
-            oprot.writeListBegin(TType.MAP, len(self.volume_ids_path_attach))
-            for iter191 in self.volume_ids_path_attach:
-                oprot.writeMapBegin(TType.STRING, TType.STRING, len(iter191))
-                for kiter192, viter193 in iter191.items():
-                    oprot.writeString(
-                        kiter192.encode("utf-8")
-                        if sys.version_info[0] == 2
-                        else kiter192
-                    )
-                    oprot.writeString(
-                        viter193.encode("utf-8")
-                        if sys.version_info[0] == 2
-                        else viter193
-                    )
-                oprot.writeMapEnd()
-            oprot.writeListEnd()
-            oprot.writeFieldEnd()
-        if self.additional_keys is not None:
-            oprot.writeFieldBegin("additional_keys", TType.LIST, 11)
-            oprot.writeListBegin(TType.STRING, len(self.additional_keys))
-            for iter194 in self.additional_keys:
-                oprot.writeString(
-                    iter194.encode("utf-8") if sys.version_info[0] == 2 else iter194
-                )
-            oprot.writeListEnd()
-            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -9911,122 +14791,176 @@ class start_server_without_playbook_args(object):
         return not (self == other)
 
 
-all_structs.append(start_server_without_playbook_args)
-start_server_without_playbook_args.thrift_spec = (
+all_structs.append(create_backend_args)
+create_backend_args.thrift_spec = (
     None,  # 0
     (
         1,
         TType.STRING,
-        "flavor",
+        "elixir_id",
         "UTF8",
         None,
     ),  # 1
     (
         2,
         TType.STRING,
-        "image",
+        "user_key_url",
         "UTF8",
         None,
     ),  # 2
     (
         3,
         TType.STRING,
-        "public_key",
+        "template",
         "UTF8",
         None,
     ),  # 3
     (
         4,
         TType.STRING,
-        "servername",
+        "upstream_url",
         "UTF8",
         None,
     ),  # 4
+)
+
+
+class create_backend_result(object):
+    """
+    Attributes:
+     - success
+
+    """
+
+    def __init__(
+        self,
+        success=None,
+    ):
+        self.success = success
+
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.STRUCT:
+                    self.success = Backend()
+                    self.success.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
+            )
+            return
+        oprot.writeStructBegin("create_backend_result")
+        if self.success is not None:
+            oprot.writeFieldBegin("success", TType.STRUCT, 0)
+            self.success.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+all_structs.append(create_backend_result)
+create_backend_result.thrift_spec = (
     (
-        5,
-        TType.MAP,
-        "metadata",
-        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
-        None,
-    ),  # 5
-    (
-        6,
-        TType.BOOL,
-        "https",
-        None,
-        None,
-    ),  # 6
-    (
-        7,
-        TType.BOOL,
-        "http",
-        None,
-        None,
-    ),  # 7
-    (
-        8,
-        TType.LIST,
-        "resenv",
-        (TType.STRING, "UTF8", False),
-        None,
-    ),  # 8
-    (
-        9,
-        TType.LIST,
-        "volume_ids_path_new",
-        (TType.MAP, (TType.STRING, "UTF8", TType.STRING, "UTF8", False), False),
-        None,
-    ),  # 9
-    (
-        10,
-        TType.LIST,
-        "volume_ids_path_attach",
-        (TType.MAP, (TType.STRING, "UTF8", TType.STRING, "UTF8", False), False),
-        None,
-    ),  # 10
-    (
-        11,
-        TType.LIST,
-        "additional_keys",
-        (TType.STRING, "UTF8", False),
+        0,
+        TType.STRUCT,
+        "success",
+        [Backend, None],
         None,
-    ),  # 11
+    ),  # 0
 )
 
 
-class start_server_without_playbook_result(object):
+class get_backends_args(object):
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
+            )
+            return
+        oprot.writeStructBegin("get_backends_args")
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+all_structs.append(get_backends_args)
+get_backends_args.thrift_spec = ()
+
+
+class get_backends_result(object):
     """
     Attributes:
      - success
-     - e
-     - r
-     - s
-     - n
-     - i
-     - f
-     - o
 
     """
 
     def __init__(
         self,
         success=None,
-        e=None,
-        r=None,
-        s=None,
-        n=None,
-        i=None,
-        f=None,
-        o=None,
     ):
         self.success = success
-        self.e = e
-        self.r = r
-        self.s = s
-        self.n = n
-        self.i = i
-        self.f = f
-        self.o = o
 
     def read(self, iprot):
         if (
@@ -10042,57 +14976,14 @@ class start_server_without_playbook_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.MAP:
-                    self.success = {}
-                    (_ktype196, _vtype197, _size195) = iprot.readMapBegin()
-                    for _i199 in range(_size195):
-                        _key200 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        _val201 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        self.success[_key200] = _val201
-                    iprot.readMapEnd()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 1:
-                if ftype == TType.STRUCT:
-                    self.e = nameException.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.STRUCT:
-                    self.r = ressourceException.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 3:
-                if ftype == TType.STRUCT:
-                    self.s = serverNotFoundException.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 4:
-                if ftype == TType.STRUCT:
-                    self.n = networkNotFoundException.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 5:
-                if ftype == TType.STRUCT:
-                    self.i = imageNotFoundException.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 6:
-                if ftype == TType.STRUCT:
-                    self.f = flavorNotFoundException.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 7:
-                if ftype == TType.STRUCT:
-                    self.o = otherException.read(iprot)
+                if ftype == TType.LIST:
+                    self.success = []
+                    (_etype364, _size361) = iprot.readListBegin()
+                    for _i365 in range(_size361):
+                        _elem366 = Backend()
+                        _elem366.read(iprot)
+                        self.success.append(_elem366)
+                    iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -10106,46 +14997,13 @@ class start_server_without_playbook_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("start_server_without_playbook_result")
+        oprot.writeStructBegin("get_backends_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.MAP, 0)
-            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.success))
-            for kiter202, viter203 in self.success.items():
-                oprot.writeString(
-                    kiter202.encode("utf-8") if sys.version_info[0] == 2 else kiter202
-                )
-                oprot.writeString(
-                    viter203.encode("utf-8") if sys.version_info[0] == 2 else viter203
-                )
-            oprot.writeMapEnd()
-            oprot.writeFieldEnd()
-        if self.e is not None:
-            oprot.writeFieldBegin("e", TType.STRUCT, 1)
-            self.e.write(oprot)
-            oprot.writeFieldEnd()
-        if self.r is not None:
-            oprot.writeFieldBegin("r", TType.STRUCT, 2)
-            self.r.write(oprot)
-            oprot.writeFieldEnd()
-        if self.s is not None:
-            oprot.writeFieldBegin("s", TType.STRUCT, 3)
-            self.s.write(oprot)
-            oprot.writeFieldEnd()
-        if self.n is not None:
-            oprot.writeFieldBegin("n", TType.STRUCT, 4)
-            self.n.write(oprot)
-            oprot.writeFieldEnd()
-        if self.i is not None:
-            oprot.writeFieldBegin("i", TType.STRUCT, 5)
-            self.i.write(oprot)
-            oprot.writeFieldEnd()
-        if self.f is not None:
-            oprot.writeFieldBegin("f", TType.STRUCT, 6)
-            self.f.write(oprot)
-            oprot.writeFieldEnd()
-        if self.o is not None:
-            oprot.writeFieldBegin("o", TType.STRUCT, 7)
-            self.o.write(oprot)
+            oprot.writeFieldBegin("success", TType.LIST, 0)
+            oprot.writeListBegin(TType.STRUCT, len(self.success))
+            for iter367 in self.success:
+                iter367.write(oprot)
+            oprot.writeListEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -10164,68 +15022,31 @@ class start_server_without_playbook_result(object):
         return not (self == other)
 
 
-all_structs.append(start_server_without_playbook_result)
-start_server_without_playbook_result.thrift_spec = (
+all_structs.append(get_backends_result)
+get_backends_result.thrift_spec = (
     (
         0,
-        TType.MAP,
+        TType.LIST,
         "success",
-        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
+        (TType.STRUCT, [Backend, None], False),
         None,
     ),  # 0
-    (
-        1,
-        TType.STRUCT,
-        "e",
-        [nameException, None],
-        None,
-    ),  # 1
-    (
-        2,
-        TType.STRUCT,
-        "r",
-        [ressourceException, None],
-        None,
-    ),  # 2
-    (
-        3,
-        TType.STRUCT,
-        "s",
-        [serverNotFoundException, None],
-        None,
-    ),  # 3
-    (
-        4,
-        TType.STRUCT,
-        "n",
-        [networkNotFoundException, None],
-        None,
-    ),  # 4
-    (
-        5,
-        TType.STRUCT,
-        "i",
-        [imageNotFoundException, None],
-        None,
-    ),  # 5
-    (
-        6,
-        TType.STRUCT,
-        "f",
-        [flavorNotFoundException, None],
-        None,
-    ),  # 6
-    (
-        7,
-        TType.STRUCT,
-        "o",
-        [otherException, None],
-        None,
-    ),  # 7
 )
 
 
-class bibigrid_available_args(object):
+class get_backends_by_owner_args(object):
+    """
+    Attributes:
+     - elixir_id
+
+    """
+
+    def __init__(
+        self,
+        elixir_id=None,
+    ):
+        self.elixir_id = elixir_id
+
     def read(self, iprot):
         if (
             iprot._fast_decode is not None
@@ -10239,6 +15060,15 @@ class bibigrid_available_args(object):
             (fname, ftype, fid) = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.elixir_id = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -10250,7 +15080,15 @@ class bibigrid_available_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("bibigrid_available_args")
+        oprot.writeStructBegin("get_backends_by_owner_args")
+        if self.elixir_id is not None:
+            oprot.writeFieldBegin("elixir_id", TType.STRING, 1)
+            oprot.writeString(
+                self.elixir_id.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.elixir_id
+            )
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -10268,11 +15106,20 @@ class bibigrid_available_args(object):
         return not (self == other)
 
 
-all_structs.append(bibigrid_available_args)
-bibigrid_available_args.thrift_spec = ()
+all_structs.append(get_backends_by_owner_args)
+get_backends_by_owner_args.thrift_spec = (
+    None,  # 0
+    (
+        1,
+        TType.STRING,
+        "elixir_id",
+        "UTF8",
+        None,
+    ),  # 1
+)
 
 
-class bibigrid_available_result(object):
+class get_backends_by_owner_result(object):
     """
     Attributes:
      - success
@@ -10299,8 +15146,14 @@ class bibigrid_available_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.BOOL:
-                    self.success = iprot.readBool()
+                if ftype == TType.LIST:
+                    self.success = []
+                    (_etype371, _size368) = iprot.readListBegin()
+                    for _i372 in range(_size368):
+                        _elem373 = Backend()
+                        _elem373.read(iprot)
+                        self.success.append(_elem373)
+                    iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -10314,10 +15167,13 @@ class bibigrid_available_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("bibigrid_available_result")
+        oprot.writeStructBegin("get_backends_by_owner_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.BOOL, 0)
-            oprot.writeBool(self.success)
+            oprot.writeFieldBegin("success", TType.LIST, 0)
+            oprot.writeListBegin(TType.STRUCT, len(self.success))
+            for iter374 in self.success:
+                iter374.write(oprot)
+            oprot.writeListEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -10336,33 +15192,30 @@ class bibigrid_available_result(object):
         return not (self == other)
 
 
-all_structs.append(bibigrid_available_result)
-bibigrid_available_result.thrift_spec = (
+all_structs.append(get_backends_by_owner_result)
+get_backends_by_owner_result.thrift_spec = (
     (
         0,
-        TType.BOOL,
+        TType.LIST,
         "success",
-        None,
+        (TType.STRUCT, [Backend, None], False),
         None,
     ),  # 0
 )
 
 
-class detach_ip_from_server_args(object):
+class get_backends_by_template_args(object):
     """
     Attributes:
-     - server_id
-     - floating_ip
+     - template
 
     """
 
     def __init__(
         self,
-        server_id=None,
-        floating_ip=None,
+        template=None,
     ):
-        self.server_id = server_id
-        self.floating_ip = floating_ip
+        self.template = template
 
     def read(self, iprot):
         if (
@@ -10379,16 +15232,7 @@ class detach_ip_from_server_args(object):
                 break
             if fid == 1:
                 if ftype == TType.STRING:
-                    self.server_id = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.STRING:
-                    self.floating_ip = (
+                    self.template = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
@@ -10406,21 +15250,13 @@ class detach_ip_from_server_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("detach_ip_from_server_args")
-        if self.server_id is not None:
-            oprot.writeFieldBegin("server_id", TType.STRING, 1)
-            oprot.writeString(
-                self.server_id.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.server_id
-            )
-            oprot.writeFieldEnd()
-        if self.floating_ip is not None:
-            oprot.writeFieldBegin("floating_ip", TType.STRING, 2)
+        oprot.writeStructBegin("get_backends_by_template_args")
+        if self.template is not None:
+            oprot.writeFieldBegin("template", TType.STRING, 1)
             oprot.writeString(
-                self.floating_ip.encode("utf-8")
+                self.template.encode("utf-8")
                 if sys.version_info[0] == 2
-                else self.floating_ip
+                else self.template
             )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
@@ -10440,27 +15276,20 @@ class detach_ip_from_server_args(object):
         return not (self == other)
 
 
-all_structs.append(detach_ip_from_server_args)
-detach_ip_from_server_args.thrift_spec = (
+all_structs.append(get_backends_by_template_args)
+get_backends_by_template_args.thrift_spec = (
     None,  # 0
     (
         1,
         TType.STRING,
-        "server_id",
+        "template",
         "UTF8",
         None,
     ),  # 1
-    (
-        2,
-        TType.STRING,
-        "floating_ip",
-        "UTF8",
-        None,
-    ),  # 2
 )
 
 
-class detach_ip_from_server_result(object):
+class get_backends_by_template_result(object):
     """
     Attributes:
      - success
@@ -10487,8 +15316,14 @@ class detach_ip_from_server_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.BOOL:
-                    self.success = iprot.readBool()
+                if ftype == TType.LIST:
+                    self.success = []
+                    (_etype378, _size375) = iprot.readListBegin()
+                    for _i379 in range(_size375):
+                        _elem380 = Backend()
+                        _elem380.read(iprot)
+                        self.success.append(_elem380)
+                    iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -10502,10 +15337,13 @@ class detach_ip_from_server_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("detach_ip_from_server_result")
+        oprot.writeStructBegin("get_backends_by_template_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.BOOL, 0)
-            oprot.writeBool(self.success)
+            oprot.writeFieldBegin("success", TType.LIST, 0)
+            oprot.writeListBegin(TType.STRUCT, len(self.success))
+            for iter381 in self.success:
+                iter381.write(oprot)
+            oprot.writeListEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -10524,57 +15362,107 @@ class detach_ip_from_server_result(object):
         return not (self == other)
 
 
-all_structs.append(detach_ip_from_server_result)
-detach_ip_from_server_result.thrift_spec = (
+all_structs.append(get_backends_by_template_result)
+get_backends_by_template_result.thrift_spec = (
     (
         0,
-        TType.BOOL,
+        TType.LIST,
         "success",
-        None,
+        (TType.STRUCT, [Backend, None], False),
         None,
     ),  # 0
 )
 
 
-class start_server_with_mounted_volume_args(object):
+class get_backend_by_id_args(object):
     """
     Attributes:
-     - flavor: Name of the  Flavor to use.
-     - image: Name of the image to use.
-     - public_key: Public Key to use
-     - servername: Name for the new server
-     - metadata: Metadata for the new instance
-     - https
-     - http
-     - resenv
-     - volume_ids_path_new
-     - volume_ids_path_attach
+     - id
 
     """
 
     def __init__(
         self,
-        flavor=None,
-        image=None,
-        public_key=None,
-        servername=None,
-        metadata=None,
-        https=None,
-        http=None,
-        resenv=None,
-        volume_ids_path_new=None,
-        volume_ids_path_attach=None,
+        id=None,
     ):
-        self.flavor = flavor
-        self.image = image
-        self.public_key = public_key
-        self.servername = servername
-        self.metadata = metadata
-        self.https = https
-        self.http = http
-        self.resenv = resenv
-        self.volume_ids_path_new = volume_ids_path_new
-        self.volume_ids_path_attach = volume_ids_path_attach
+        self.id = id
+
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.I64:
+                    self.id = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
+            )
+            return
+        oprot.writeStructBegin("get_backend_by_id_args")
+        if self.id is not None:
+            oprot.writeFieldBegin("id", TType.I64, 1)
+            oprot.writeI64(self.id)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+all_structs.append(get_backend_by_id_args)
+get_backend_by_id_args.thrift_spec = (
+    None,  # 0
+    (
+        1,
+        TType.I64,
+        "id",
+        None,
+        None,
+    ),  # 1
+)
+
+
+class get_backend_by_id_result(object):
+    """
+    Attributes:
+     - success
+
+    """
+
+    def __init__(
+        self,
+        success=None,
+    ):
+        self.success = success
 
     def read(self, iprot):
         if (
@@ -10589,131 +15477,10 @@ class start_server_with_mounted_volume_args(object):
             (fname, ftype, fid) = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 1:
-                if ftype == TType.STRING:
-                    self.flavor = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.STRING:
-                    self.image = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 3:
-                if ftype == TType.STRING:
-                    self.public_key = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 4:
-                if ftype == TType.STRING:
-                    self.servername = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 5:
-                if ftype == TType.MAP:
-                    self.metadata = {}
-                    (_ktype205, _vtype206, _size204) = iprot.readMapBegin()
-                    for _i208 in range(_size204):
-                        _key209 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        _val210 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        self.metadata[_key209] = _val210
-                    iprot.readMapEnd()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 6:
-                if ftype == TType.BOOL:
-                    self.https = iprot.readBool()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 7:
-                if ftype == TType.BOOL:
-                    self.http = iprot.readBool()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 8:
-                if ftype == TType.LIST:
-                    self.resenv = []
-                    (_etype214, _size211) = iprot.readListBegin()
-                    for _i215 in range(_size211):
-                        _elem216 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        self.resenv.append(_elem216)
-                    iprot.readListEnd()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 9:
-                if ftype == TType.LIST:
-                    self.volume_ids_path_new = []
-                    (_etype220, _size217) = iprot.readListBegin()
-                    for _i221 in range(_size217):
-                        _elem222 = {}
-                        (_ktype224, _vtype225, _size223) = iprot.readMapBegin()
-                        for _i227 in range(_size223):
-                            _key228 = (
-                                iprot.readString().decode("utf-8", errors="replace")
-                                if sys.version_info[0] == 2
-                                else iprot.readString()
-                            )
-                            _val229 = (
-                                iprot.readString().decode("utf-8", errors="replace")
-                                if sys.version_info[0] == 2
-                                else iprot.readString()
-                            )
-                            _elem222[_key228] = _val229
-                        iprot.readMapEnd()
-                        self.volume_ids_path_new.append(_elem222)
-                    iprot.readListEnd()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 10:
-                if ftype == TType.LIST:
-                    self.volume_ids_path_attach = []
-                    (_etype233, _size230) = iprot.readListBegin()
-                    for _i234 in range(_size230):
-                        _elem235 = {}
-                        (_ktype237, _vtype238, _size236) = iprot.readMapBegin()
-                        for _i240 in range(_size236):
-                            _key241 = (
-                                iprot.readString().decode("utf-8", errors="replace")
-                                if sys.version_info[0] == 2
-                                else iprot.readString()
-                            )
-                            _val242 = (
-                                iprot.readString().decode("utf-8", errors="replace")
-                                if sys.version_info[0] == 2
-                                else iprot.readString()
-                            )
-                            _elem235[_key241] = _val242
-                        iprot.readMapEnd()
-                        self.volume_ids_path_attach.append(_elem235)
-                    iprot.readListEnd()
+            if fid == 0:
+                if ftype == TType.STRUCT:
+                    self.success = Backend()
+                    self.success.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -10727,101 +15494,86 @@ class start_server_with_mounted_volume_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("start_server_with_mounted_volume_args")
-        if self.flavor is not None:
-            oprot.writeFieldBegin("flavor", TType.STRING, 1)
-            oprot.writeString(
-                self.flavor.encode("utf-8") if sys.version_info[0] == 2 else self.flavor
-            )
-            oprot.writeFieldEnd()
-        if self.image is not None:
-            oprot.writeFieldBegin("image", TType.STRING, 2)
-            oprot.writeString(
-                self.image.encode("utf-8") if sys.version_info[0] == 2 else self.image
-            )
-            oprot.writeFieldEnd()
-        if self.public_key is not None:
-            oprot.writeFieldBegin("public_key", TType.STRING, 3)
-            oprot.writeString(
-                self.public_key.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.public_key
-            )
-            oprot.writeFieldEnd()
-        if self.servername is not None:
-            oprot.writeFieldBegin("servername", TType.STRING, 4)
-            oprot.writeString(
-                self.servername.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.servername
-            )
-            oprot.writeFieldEnd()
-        if self.metadata is not None:
-            oprot.writeFieldBegin("metadata", TType.MAP, 5)
-            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.metadata))
-            for kiter243, viter244 in self.metadata.items():
-                oprot.writeString(
-                    kiter243.encode("utf-8") if sys.version_info[0] == 2 else kiter243
-                )
-                oprot.writeString(
-                    viter244.encode("utf-8") if sys.version_info[0] == 2 else viter244
-                )
-            oprot.writeMapEnd()
-            oprot.writeFieldEnd()
-        if self.https is not None:
-            oprot.writeFieldBegin("https", TType.BOOL, 6)
-            oprot.writeBool(self.https)
-            oprot.writeFieldEnd()
-        if self.http is not None:
-            oprot.writeFieldBegin("http", TType.BOOL, 7)
-            oprot.writeBool(self.http)
-            oprot.writeFieldEnd()
-        if self.resenv is not None:
-            oprot.writeFieldBegin("resenv", TType.LIST, 8)
-            oprot.writeListBegin(TType.STRING, len(self.resenv))
-            for iter245 in self.resenv:
-                oprot.writeString(
-                    iter245.encode("utf-8") if sys.version_info[0] == 2 else iter245
-                )
-            oprot.writeListEnd()
-            oprot.writeFieldEnd()
-        if self.volume_ids_path_new is not None:
-            oprot.writeFieldBegin("volume_ids_path_new", TType.LIST, 9)
-            oprot.writeListBegin(TType.MAP, len(self.volume_ids_path_new))
-            for iter246 in self.volume_ids_path_new:
-                oprot.writeMapBegin(TType.STRING, TType.STRING, len(iter246))
-                for kiter247, viter248 in iter246.items():
-                    oprot.writeString(
-                        kiter247.encode("utf-8")
-                        if sys.version_info[0] == 2
-                        else kiter247
-                    )
-                    oprot.writeString(
-                        viter248.encode("utf-8")
-                        if sys.version_info[0] == 2
-                        else viter248
-                    )
-                oprot.writeMapEnd()
-            oprot.writeListEnd()
+        oprot.writeStructBegin("get_backend_by_id_result")
+        if self.success is not None:
+            oprot.writeFieldBegin("success", TType.STRUCT, 0)
+            self.success.write(oprot)
             oprot.writeFieldEnd()
-        if self.volume_ids_path_attach is not None:
-            oprot.writeFieldBegin("volume_ids_path_attach", TType.LIST, 10)
-            oprot.writeListBegin(TType.MAP, len(self.volume_ids_path_attach))
-            for iter249 in self.volume_ids_path_attach:
-                oprot.writeMapBegin(TType.STRING, TType.STRING, len(iter249))
-                for kiter250, viter251 in iter249.items():
-                    oprot.writeString(
-                        kiter250.encode("utf-8")
-                        if sys.version_info[0] == 2
-                        else kiter250
-                    )
-                    oprot.writeString(
-                        viter251.encode("utf-8")
-                        if sys.version_info[0] == 2
-                        else viter251
-                    )
-                oprot.writeMapEnd()
-            oprot.writeListEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+all_structs.append(get_backend_by_id_result)
+get_backend_by_id_result.thrift_spec = (
+    (
+        0,
+        TType.STRUCT,
+        "success",
+        [Backend, None],
+        None,
+    ),  # 0
+)
+
+
+class delete_backend_args(object):
+    """
+    Attributes:
+     - id
+
+    """
+
+    def __init__(
+        self,
+        id=None,
+    ):
+        self.id = id
+
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.I64:
+                    self.id = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
+            )
+            return
+        oprot.writeStructBegin("delete_backend_args")
+        if self.id is not None:
+            oprot.writeFieldBegin("id", TType.I64, 1)
+            oprot.writeI64(self.id)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -10840,115 +15592,31 @@ class start_server_with_mounted_volume_args(object):
         return not (self == other)
 
 
-all_structs.append(start_server_with_mounted_volume_args)
-start_server_with_mounted_volume_args.thrift_spec = (
+all_structs.append(delete_backend_args)
+delete_backend_args.thrift_spec = (
     None,  # 0
     (
         1,
-        TType.STRING,
-        "flavor",
-        "UTF8",
-        None,
-    ),  # 1
-    (
-        2,
-        TType.STRING,
-        "image",
-        "UTF8",
-        None,
-    ),  # 2
-    (
-        3,
-        TType.STRING,
-        "public_key",
-        "UTF8",
-        None,
-    ),  # 3
-    (
-        4,
-        TType.STRING,
-        "servername",
-        "UTF8",
-        None,
-    ),  # 4
-    (
-        5,
-        TType.MAP,
-        "metadata",
-        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
-        None,
-    ),  # 5
-    (
-        6,
-        TType.BOOL,
-        "https",
-        None,
-        None,
-    ),  # 6
-    (
-        7,
-        TType.BOOL,
-        "http",
-        None,
-        None,
-    ),  # 7
-    (
-        8,
-        TType.LIST,
-        "resenv",
-        (TType.STRING, "UTF8", False),
-        None,
-    ),  # 8
-    (
-        9,
-        TType.LIST,
-        "volume_ids_path_new",
-        (TType.MAP, (TType.STRING, "UTF8", TType.STRING, "UTF8", False), False),
+        TType.I64,
+        "id",
         None,
-    ),  # 9
-    (
-        10,
-        TType.LIST,
-        "volume_ids_path_attach",
-        (TType.MAP, (TType.STRING, "UTF8", TType.STRING, "UTF8", False), False),
         None,
-    ),  # 10
+    ),  # 1
 )
 
 
-class start_server_with_mounted_volume_result(object):
+class delete_backend_result(object):
     """
     Attributes:
      - success
-     - e
-     - r
-     - s
-     - n
-     - i
-     - f
-     - o
 
     """
 
     def __init__(
         self,
         success=None,
-        e=None,
-        r=None,
-        s=None,
-        n=None,
-        i=None,
-        f=None,
-        o=None,
     ):
         self.success = success
-        self.e = e
-        self.r = r
-        self.s = s
-        self.n = n
-        self.i = i
-        self.f = f
-        self.o = o
 
     def read(self, iprot):
         if (
@@ -10964,110 +15632,33 @@ class start_server_with_mounted_volume_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.MAP:
-                    self.success = {}
-                    (_ktype253, _vtype254, _size252) = iprot.readMapBegin()
-                    for _i256 in range(_size252):
-                        _key257 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        _val258 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        self.success[_key257] = _val258
-                    iprot.readMapEnd()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 1:
-                if ftype == TType.STRUCT:
-                    self.e = nameException.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.STRUCT:
-                    self.r = ressourceException.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 3:
-                if ftype == TType.STRUCT:
-                    self.s = serverNotFoundException.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 4:
-                if ftype == TType.STRUCT:
-                    self.n = networkNotFoundException.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 5:
-                if ftype == TType.STRUCT:
-                    self.i = imageNotFoundException.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 6:
-                if ftype == TType.STRUCT:
-                    self.f = flavorNotFoundException.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 7:
-                if ftype == TType.STRUCT:
-                    self.o = otherException.read(iprot)
+                if ftype == TType.STRING:
+                    self.success = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
                 else:
-                    iprot.skip(ftype)
-            else:
-                iprot.skip(ftype)
-            iprot.readFieldEnd()
-        iprot.readStructEnd()
-
-    def write(self, oprot):
-        if oprot._fast_encode is not None and self.thrift_spec is not None:
-            oprot.trans.write(
-                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
-            )
-            return
-        oprot.writeStructBegin("start_server_with_mounted_volume_result")
-        if self.success is not None:
-            oprot.writeFieldBegin("success", TType.MAP, 0)
-            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.success))
-            for kiter259, viter260 in self.success.items():
-                oprot.writeString(
-                    kiter259.encode("utf-8") if sys.version_info[0] == 2 else kiter259
-                )
-                oprot.writeString(
-                    viter260.encode("utf-8") if sys.version_info[0] == 2 else viter260
-                )
-            oprot.writeMapEnd()
-            oprot.writeFieldEnd()
-        if self.e is not None:
-            oprot.writeFieldBegin("e", TType.STRUCT, 1)
-            self.e.write(oprot)
-            oprot.writeFieldEnd()
-        if self.r is not None:
-            oprot.writeFieldBegin("r", TType.STRUCT, 2)
-            self.r.write(oprot)
-            oprot.writeFieldEnd()
-        if self.s is not None:
-            oprot.writeFieldBegin("s", TType.STRUCT, 3)
-            self.s.write(oprot)
-            oprot.writeFieldEnd()
-        if self.n is not None:
-            oprot.writeFieldBegin("n", TType.STRUCT, 4)
-            self.n.write(oprot)
-            oprot.writeFieldEnd()
-        if self.i is not None:
-            oprot.writeFieldBegin("i", TType.STRUCT, 5)
-            self.i.write(oprot)
-            oprot.writeFieldEnd()
-        if self.f is not None:
-            oprot.writeFieldBegin("f", TType.STRUCT, 6)
-            self.f.write(oprot)
-            oprot.writeFieldEnd()
-        if self.o is not None:
-            oprot.writeFieldBegin("o", TType.STRUCT, 7)
-            self.o.write(oprot)
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
+            )
+            return
+        oprot.writeStructBegin("delete_backend_result")
+        if self.success is not None:
+            oprot.writeFieldBegin("success", TType.STRING, 0)
+            oprot.writeString(
+                self.success.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.success
+            )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -11086,106 +15677,33 @@ class start_server_with_mounted_volume_result(object):
         return not (self == other)
 
 
-all_structs.append(start_server_with_mounted_volume_result)
-start_server_with_mounted_volume_result.thrift_spec = (
+all_structs.append(delete_backend_result)
+delete_backend_result.thrift_spec = (
     (
         0,
-        TType.MAP,
+        TType.STRING,
         "success",
-        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
+        "UTF8",
         None,
     ),  # 0
-    (
-        1,
-        TType.STRUCT,
-        "e",
-        [nameException, None],
-        None,
-    ),  # 1
-    (
-        2,
-        TType.STRUCT,
-        "r",
-        [ressourceException, None],
-        None,
-    ),  # 2
-    (
-        3,
-        TType.STRUCT,
-        "s",
-        [serverNotFoundException, None],
-        None,
-    ),  # 3
-    (
-        4,
-        TType.STRUCT,
-        "n",
-        [networkNotFoundException, None],
-        None,
-    ),  # 4
-    (
-        5,
-        TType.STRUCT,
-        "i",
-        [imageNotFoundException, None],
-        None,
-    ),  # 5
-    (
-        6,
-        TType.STRUCT,
-        "f",
-        [flavorNotFoundException, None],
-        None,
-    ),  # 6
-    (
-        7,
-        TType.STRUCT,
-        "o",
-        [otherException, None],
-        None,
-    ),  # 7
 )
 
 
-class start_server_args(object):
+class add_user_to_backend_args(object):
     """
     Attributes:
-     - flavor: Name of the  Flavor to use.
-     - image: Name of the image to use.
-     - public_key: Public Key to use
-     - servername: Name for the new server
-     - metadata: Metadata for the new instance
-     - diskspace: Diskspace in GB for additional volume.
-     - volumename: Name of additional Volume
-     - https
-     - http
-     - resenv
+     - backend_id
+     - user_id
 
     """
 
     def __init__(
         self,
-        flavor=None,
-        image=None,
-        public_key=None,
-        servername=None,
-        metadata=None,
-        diskspace=None,
-        volumename=None,
-        https=None,
-        http=None,
-        resenv=None,
+        backend_id=None,
+        user_id=None,
     ):
-        self.flavor = flavor
-        self.image = image
-        self.public_key = public_key
-        self.servername = servername
-        self.metadata = metadata
-        self.diskspace = diskspace
-        self.volumename = volumename
-        self.https = https
-        self.http = http
-        self.resenv = resenv
+        self.backend_id = backend_id
+        self.user_id = user_id
 
     def read(self, iprot):
         if (
@@ -11201,187 +15719,43 @@ class start_server_args(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.STRING:
-                    self.flavor = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
+                if ftype == TType.I64:
+                    self.backend_id = iprot.readI64()
                 else:
                     iprot.skip(ftype)
             elif fid == 2:
                 if ftype == TType.STRING:
-                    self.image = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 3:
-                if ftype == TType.STRING:
-                    self.public_key = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 4:
-                if ftype == TType.STRING:
-                    self.servername = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 5:
-                if ftype == TType.MAP:
-                    self.metadata = {}
-                    (_ktype262, _vtype263, _size261) = iprot.readMapBegin()
-                    for _i265 in range(_size261):
-                        _key266 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        _val267 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        self.metadata[_key266] = _val267
-                    iprot.readMapEnd()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 6:
-                if ftype == TType.STRING:
-                    self.diskspace = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 7:
-                if ftype == TType.STRING:
-                    self.volumename = (
+                    self.user_id = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
                     )
                 else:
                     iprot.skip(ftype)
-            elif fid == 8:
-                if ftype == TType.BOOL:
-                    self.https = iprot.readBool()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 9:
-                if ftype == TType.BOOL:
-                    self.http = iprot.readBool()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 10:
-                if ftype == TType.LIST:
-                    self.resenv = []
-                    (_etype271, _size268) = iprot.readListBegin()
-                    for _i272 in range(_size268):
-                        _elem273 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        self.resenv.append(_elem273)
-                    iprot.readListEnd()
-                else:
-                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
         iprot.readStructEnd()
 
     def write(self, oprot):
-        if oprot._fast_encode is not None and self.thrift_spec is not None:
-            oprot.trans.write(
-                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
-            )
-            return
-        oprot.writeStructBegin("start_server_args")
-        if self.flavor is not None:
-            oprot.writeFieldBegin("flavor", TType.STRING, 1)
-            oprot.writeString(
-                self.flavor.encode("utf-8") if sys.version_info[0] == 2 else self.flavor
-            )
-            oprot.writeFieldEnd()
-        if self.image is not None:
-            oprot.writeFieldBegin("image", TType.STRING, 2)
-            oprot.writeString(
-                self.image.encode("utf-8") if sys.version_info[0] == 2 else self.image
-            )
-            oprot.writeFieldEnd()
-        if self.public_key is not None:
-            oprot.writeFieldBegin("public_key", TType.STRING, 3)
-            oprot.writeString(
-                self.public_key.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.public_key
-            )
-            oprot.writeFieldEnd()
-        if self.servername is not None:
-            oprot.writeFieldBegin("servername", TType.STRING, 4)
-            oprot.writeString(
-                self.servername.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.servername
-            )
-            oprot.writeFieldEnd()
-        if self.metadata is not None:
-            oprot.writeFieldBegin("metadata", TType.MAP, 5)
-            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.metadata))
-            for kiter274, viter275 in self.metadata.items():
-                oprot.writeString(
-                    kiter274.encode("utf-8") if sys.version_info[0] == 2 else kiter274
-                )
-                oprot.writeString(
-                    viter275.encode("utf-8") if sys.version_info[0] == 2 else viter275
-                )
-            oprot.writeMapEnd()
-            oprot.writeFieldEnd()
-        if self.diskspace is not None:
-            oprot.writeFieldBegin("diskspace", TType.STRING, 6)
-            oprot.writeString(
-                self.diskspace.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.diskspace
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
+            return
+        oprot.writeStructBegin("add_user_to_backend_args")
+        if self.backend_id is not None:
+            oprot.writeFieldBegin("backend_id", TType.I64, 1)
+            oprot.writeI64(self.backend_id)
             oprot.writeFieldEnd()
-        if self.volumename is not None:
-            oprot.writeFieldBegin("volumename", TType.STRING, 7)
+        if self.user_id is not None:
+            oprot.writeFieldBegin("user_id", TType.STRING, 2)
             oprot.writeString(
-                self.volumename.encode("utf-8")
+                self.user_id.encode("utf-8")
                 if sys.version_info[0] == 2
-                else self.volumename
+                else self.user_id
             )
             oprot.writeFieldEnd()
-        if self.https is not None:
-            oprot.writeFieldBegin("https", TType.BOOL, 8)
-            oprot.writeBool(self.https)
-            oprot.writeFieldEnd()
-        if self.http is not None:
-            oprot.writeFieldBegin("http", TType.BOOL, 9)
-            oprot.writeBool(self.http)
-            oprot.writeFieldEnd()
-        if self.resenv is not None:
-            oprot.writeFieldBegin("resenv", TType.LIST, 10)
-            oprot.writeListBegin(TType.STRING, len(self.resenv))
-            for iter276 in self.resenv:
-                oprot.writeString(
-                    iter276.encode("utf-8") if sys.version_info[0] == 2 else iter276
-                )
-            oprot.writeListEnd()
-            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -11399,115 +15773,38 @@ class start_server_args(object):
         return not (self == other)
 
 
-all_structs.append(start_server_args)
-start_server_args.thrift_spec = (
+all_structs.append(add_user_to_backend_args)
+add_user_to_backend_args.thrift_spec = (
     None,  # 0
     (
         1,
-        TType.STRING,
-        "flavor",
-        "UTF8",
+        TType.I64,
+        "backend_id",
+        None,
         None,
     ),  # 1
     (
         2,
         TType.STRING,
-        "image",
+        "user_id",
         "UTF8",
         None,
     ),  # 2
-    (
-        3,
-        TType.STRING,
-        "public_key",
-        "UTF8",
-        None,
-    ),  # 3
-    (
-        4,
-        TType.STRING,
-        "servername",
-        "UTF8",
-        None,
-    ),  # 4
-    (
-        5,
-        TType.MAP,
-        "metadata",
-        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
-        None,
-    ),  # 5
-    (
-        6,
-        TType.STRING,
-        "diskspace",
-        "UTF8",
-        None,
-    ),  # 6
-    (
-        7,
-        TType.STRING,
-        "volumename",
-        "UTF8",
-        None,
-    ),  # 7
-    (
-        8,
-        TType.BOOL,
-        "https",
-        None,
-        None,
-    ),  # 8
-    (
-        9,
-        TType.BOOL,
-        "http",
-        None,
-        None,
-    ),  # 9
-    (
-        10,
-        TType.LIST,
-        "resenv",
-        (TType.STRING, "UTF8", False),
-        None,
-    ),  # 10
 )
 
 
-class start_server_result(object):
+class add_user_to_backend_result(object):
     """
     Attributes:
      - success
-     - e
-     - r
-     - s
-     - n
-     - i
-     - f
-     - o
 
     """
 
     def __init__(
         self,
         success=None,
-        e=None,
-        r=None,
-        s=None,
-        n=None,
-        i=None,
-        f=None,
-        o=None,
     ):
         self.success = success
-        self.e = e
-        self.r = r
-        self.s = s
-        self.n = n
-        self.i = i
-        self.f = f
-        self.o = o
 
     def read(self, iprot):
         if (
@@ -11525,57 +15822,22 @@ class start_server_result(object):
             if fid == 0:
                 if ftype == TType.MAP:
                     self.success = {}
-                    (_ktype278, _vtype279, _size277) = iprot.readMapBegin()
-                    for _i281 in range(_size277):
-                        _key282 = (
+                    (_ktype383, _vtype384, _size382) = iprot.readMapBegin()
+                    for _i386 in range(_size382):
+                        _key387 = (
                             iprot.readString().decode("utf-8", errors="replace")
                             if sys.version_info[0] == 2
                             else iprot.readString()
                         )
-                        _val283 = (
+                        _val388 = (
                             iprot.readString().decode("utf-8", errors="replace")
                             if sys.version_info[0] == 2
                             else iprot.readString()
                         )
-                        self.success[_key282] = _val283
+                        self.success[_key387] = _val388
                     iprot.readMapEnd()
                 else:
                     iprot.skip(ftype)
-            elif fid == 1:
-                if ftype == TType.STRUCT:
-                    self.e = nameException.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.STRUCT:
-                    self.r = ressourceException.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 3:
-                if ftype == TType.STRUCT:
-                    self.s = serverNotFoundException.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 4:
-                if ftype == TType.STRUCT:
-                    self.n = networkNotFoundException.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 5:
-                if ftype == TType.STRUCT:
-                    self.i = imageNotFoundException.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 6:
-                if ftype == TType.STRUCT:
-                    self.f = flavorNotFoundException.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 7:
-                if ftype == TType.STRUCT:
-                    self.o = otherException.read(iprot)
-                else:
-                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -11587,47 +15849,19 @@ class start_server_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("start_server_result")
+        oprot.writeStructBegin("add_user_to_backend_result")
         if self.success is not None:
             oprot.writeFieldBegin("success", TType.MAP, 0)
             oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.success))
-            for kiter284, viter285 in self.success.items():
+            for kiter389, viter390 in self.success.items():
                 oprot.writeString(
-                    kiter284.encode("utf-8") if sys.version_info[0] == 2 else kiter284
+                    kiter389.encode("utf-8") if sys.version_info[0] == 2 else kiter389
                 )
                 oprot.writeString(
-                    viter285.encode("utf-8") if sys.version_info[0] == 2 else viter285
+                    viter390.encode("utf-8") if sys.version_info[0] == 2 else viter390
                 )
             oprot.writeMapEnd()
             oprot.writeFieldEnd()
-        if self.e is not None:
-            oprot.writeFieldBegin("e", TType.STRUCT, 1)
-            self.e.write(oprot)
-            oprot.writeFieldEnd()
-        if self.r is not None:
-            oprot.writeFieldBegin("r", TType.STRUCT, 2)
-            self.r.write(oprot)
-            oprot.writeFieldEnd()
-        if self.s is not None:
-            oprot.writeFieldBegin("s", TType.STRUCT, 3)
-            self.s.write(oprot)
-            oprot.writeFieldEnd()
-        if self.n is not None:
-            oprot.writeFieldBegin("n", TType.STRUCT, 4)
-            self.n.write(oprot)
-            oprot.writeFieldEnd()
-        if self.i is not None:
-            oprot.writeFieldBegin("i", TType.STRUCT, 5)
-            self.i.write(oprot)
-            oprot.writeFieldEnd()
-        if self.f is not None:
-            oprot.writeFieldBegin("f", TType.STRUCT, 6)
-            self.f.write(oprot)
-            oprot.writeFieldEnd()
-        if self.o is not None:
-            oprot.writeFieldBegin("o", TType.STRUCT, 7)
-            self.o.write(oprot)
-            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -11645,103 +15879,30 @@ class start_server_result(object):
         return not (self == other)
 
 
-all_structs.append(start_server_result)
-start_server_result.thrift_spec = (
-    (
-        0,
-        TType.MAP,
-        "success",
-        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
-        None,
-    ),  # 0
-    (
-        1,
-        TType.STRUCT,
-        "e",
-        [nameException, None],
-        None,
-    ),  # 1
-    (
-        2,
-        TType.STRUCT,
-        "r",
-        [ressourceException, None],
-        None,
-    ),  # 2
-    (
-        3,
-        TType.STRUCT,
-        "s",
-        [serverNotFoundException, None],
-        None,
-    ),  # 3
-    (
-        4,
-        TType.STRUCT,
-        "n",
-        [networkNotFoundException, None],
-        None,
-    ),  # 4
-    (
-        5,
-        TType.STRUCT,
-        "i",
-        [imageNotFoundException, None],
-        None,
-    ),  # 5
-    (
-        6,
-        TType.STRUCT,
-        "f",
-        [flavorNotFoundException, None],
-        None,
-    ),  # 6
+all_structs.append(add_user_to_backend_result)
+add_user_to_backend_result.thrift_spec = (
     (
-        7,
-        TType.STRUCT,
-        "o",
-        [otherException, None],
+        0,
+        TType.MAP,
+        "success",
+        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
         None,
-    ),  # 7
+    ),  # 0
 )
 
 
-class start_server_with_custom_key_args(object):
+class get_users_from_backend_args(object):
     """
     Attributes:
-     - flavor: Name of the  Flavor to use.
-     - image: Name of the image to use.
-     - servername: Name for the new server
-     - metadata: Metadata for the new instance
-     - http: Boolean for http security rule
-     - https: Boolean for https security rule
-     - resenv
-     - volume_ids_path_new
-     - volume_ids_path_attach
+     - backend_id
 
     """
 
     def __init__(
         self,
-        flavor=None,
-        image=None,
-        servername=None,
-        metadata=None,
-        http=None,
-        https=None,
-        resenv=None,
-        volume_ids_path_new=None,
-        volume_ids_path_attach=None,
+        backend_id=None,
     ):
-        self.flavor = flavor
-        self.image = image
-        self.servername = servername
-        self.metadata = metadata
-        self.http = http
-        self.https = https
-        self.resenv = resenv
-        self.volume_ids_path_new = volume_ids_path_new
-        self.volume_ids_path_attach = volume_ids_path_attach
+        self.backend_id = backend_id
 
     def read(self, iprot):
         if (
@@ -11757,221 +15918,25 @@ class start_server_with_custom_key_args(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.STRING:
-                    self.flavor = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.STRING:
-                    self.image = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 3:
-                if ftype == TType.STRING:
-                    self.servername = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 4:
-                if ftype == TType.MAP:
-                    self.metadata = {}
-                    (_ktype287, _vtype288, _size286) = iprot.readMapBegin()
-                    for _i290 in range(_size286):
-                        _key291 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        _val292 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        self.metadata[_key291] = _val292
-                    iprot.readMapEnd()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 5:
-                if ftype == TType.BOOL:
-                    self.http = iprot.readBool()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 6:
-                if ftype == TType.BOOL:
-                    self.https = iprot.readBool()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 7:
-                if ftype == TType.LIST:
-                    self.resenv = []
-                    (_etype296, _size293) = iprot.readListBegin()
-                    for _i297 in range(_size293):
-                        _elem298 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        self.resenv.append(_elem298)
-                    iprot.readListEnd()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 9:
-                if ftype == TType.LIST:
-                    self.volume_ids_path_new = []
-                    (_etype302, _size299) = iprot.readListBegin()
-                    for _i303 in range(_size299):
-                        _elem304 = {}
-                        (_ktype306, _vtype307, _size305) = iprot.readMapBegin()
-                        for _i309 in range(_size305):
-                            _key310 = (
-                                iprot.readString().decode("utf-8", errors="replace")
-                                if sys.version_info[0] == 2
-                                else iprot.readString()
-                            )
-                            _val311 = (
-                                iprot.readString().decode("utf-8", errors="replace")
-                                if sys.version_info[0] == 2
-                                else iprot.readString()
-                            )
-                            _elem304[_key310] = _val311
-                        iprot.readMapEnd()
-                        self.volume_ids_path_new.append(_elem304)
-                    iprot.readListEnd()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 10:
-                if ftype == TType.LIST:
-                    self.volume_ids_path_attach = []
-                    (_etype315, _size312) = iprot.readListBegin()
-                    for _i316 in range(_size312):
-                        _elem317 = {}
-                        (_ktype319, _vtype320, _size318) = iprot.readMapBegin()
-                        for _i322 in range(_size318):
-                            _key323 = (
-                                iprot.readString().decode("utf-8", errors="replace")
-                                if sys.version_info[0] == 2
-                                else iprot.readString()
-                            )
-                            _val324 = (
-                                iprot.readString().decode("utf-8", errors="replace")
-                                if sys.version_info[0] == 2
-                                else iprot.readString()
-                            )
-                            _elem317[_key323] = _val324
-                        iprot.readMapEnd()
-                        self.volume_ids_path_attach.append(_elem317)
-                    iprot.readListEnd()
+                if ftype == TType.I64:
+                    self.backend_id = iprot.readI64()
                 else:
                     iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
-        iprot.readStructEnd()
-
-    def write(self, oprot):
-        if oprot._fast_encode is not None and self.thrift_spec is not None:
-            oprot.trans.write(
-                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
-            )
-            return
-        oprot.writeStructBegin("start_server_with_custom_key_args")
-        if self.flavor is not None:
-            oprot.writeFieldBegin("flavor", TType.STRING, 1)
-            oprot.writeString(
-                self.flavor.encode("utf-8") if sys.version_info[0] == 2 else self.flavor
-            )
-            oprot.writeFieldEnd()
-        if self.image is not None:
-            oprot.writeFieldBegin("image", TType.STRING, 2)
-            oprot.writeString(
-                self.image.encode("utf-8") if sys.version_info[0] == 2 else self.image
-            )
-            oprot.writeFieldEnd()
-        if self.servername is not None:
-            oprot.writeFieldBegin("servername", TType.STRING, 3)
-            oprot.writeString(
-                self.servername.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.servername
-            )
-            oprot.writeFieldEnd()
-        if self.metadata is not None:
-            oprot.writeFieldBegin("metadata", TType.MAP, 4)
-            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.metadata))
-            for kiter325, viter326 in self.metadata.items():
-                oprot.writeString(
-                    kiter325.encode("utf-8") if sys.version_info[0] == 2 else kiter325
-                )
-                oprot.writeString(
-                    viter326.encode("utf-8") if sys.version_info[0] == 2 else viter326
-                )
-            oprot.writeMapEnd()
-            oprot.writeFieldEnd()
-        if self.http is not None:
-            oprot.writeFieldBegin("http", TType.BOOL, 5)
-            oprot.writeBool(self.http)
-            oprot.writeFieldEnd()
-        if self.https is not None:
-            oprot.writeFieldBegin("https", TType.BOOL, 6)
-            oprot.writeBool(self.https)
-            oprot.writeFieldEnd()
-        if self.resenv is not None:
-            oprot.writeFieldBegin("resenv", TType.LIST, 7)
-            oprot.writeListBegin(TType.STRING, len(self.resenv))
-            for iter327 in self.resenv:
-                oprot.writeString(
-                    iter327.encode("utf-8") if sys.version_info[0] == 2 else iter327
-                )
-            oprot.writeListEnd()
-            oprot.writeFieldEnd()
-        if self.volume_ids_path_new is not None:
-            oprot.writeFieldBegin("volume_ids_path_new", TType.LIST, 9)
-            oprot.writeListBegin(TType.MAP, len(self.volume_ids_path_new))
-            for iter328 in self.volume_ids_path_new:
-                oprot.writeMapBegin(TType.STRING, TType.STRING, len(iter328))
-                for kiter329, viter330 in iter328.items():
-                    oprot.writeString(
-                        kiter329.encode("utf-8")
-                        if sys.version_info[0] == 2
-                        else kiter329
-                    )
-                    oprot.writeString(
-                        viter330.encode("utf-8")
-                        if sys.version_info[0] == 2
-                        else viter330
-                    )
-                oprot.writeMapEnd()
-            oprot.writeListEnd()
-            oprot.writeFieldEnd()
-        if self.volume_ids_path_attach is not None:
-            oprot.writeFieldBegin("volume_ids_path_attach", TType.LIST, 10)
-            oprot.writeListBegin(TType.MAP, len(self.volume_ids_path_attach))
-            for iter331 in self.volume_ids_path_attach:
-                oprot.writeMapBegin(TType.STRING, TType.STRING, len(iter331))
-                for kiter332, viter333 in iter331.items():
-                    oprot.writeString(
-                        kiter332.encode("utf-8")
-                        if sys.version_info[0] == 2
-                        else kiter332
-                    )
-                    oprot.writeString(
-                        viter333.encode("utf-8")
-                        if sys.version_info[0] == 2
-                        else viter333
-                    )
-                oprot.writeMapEnd()
-            oprot.writeListEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
+            )
+            return
+        oprot.writeStructBegin("get_users_from_backend_args")
+        if self.backend_id is not None:
+            oprot.writeFieldBegin("backend_id", TType.I64, 1)
+            oprot.writeI64(self.backend_id)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -11990,109 +15955,31 @@ class start_server_with_custom_key_args(object):
         return not (self == other)
 
 
-all_structs.append(start_server_with_custom_key_args)
-start_server_with_custom_key_args.thrift_spec = (
+all_structs.append(get_users_from_backend_args)
+get_users_from_backend_args.thrift_spec = (
     None,  # 0
     (
         1,
-        TType.STRING,
-        "flavor",
-        "UTF8",
-        None,
-    ),  # 1
-    (
-        2,
-        TType.STRING,
-        "image",
-        "UTF8",
-        None,
-    ),  # 2
-    (
-        3,
-        TType.STRING,
-        "servername",
-        "UTF8",
-        None,
-    ),  # 3
-    (
-        4,
-        TType.MAP,
-        "metadata",
-        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
-        None,
-    ),  # 4
-    (
-        5,
-        TType.BOOL,
-        "http",
-        None,
-        None,
-    ),  # 5
-    (
-        6,
-        TType.BOOL,
-        "https",
-        None,
-        None,
-    ),  # 6
-    (
-        7,
-        TType.LIST,
-        "resenv",
-        (TType.STRING, "UTF8", False),
-        None,
-    ),  # 7
-    None,  # 8
-    (
-        9,
-        TType.LIST,
-        "volume_ids_path_new",
-        (TType.MAP, (TType.STRING, "UTF8", TType.STRING, "UTF8", False), False),
+        TType.I64,
+        "backend_id",
         None,
-    ),  # 9
-    (
-        10,
-        TType.LIST,
-        "volume_ids_path_attach",
-        (TType.MAP, (TType.STRING, "UTF8", TType.STRING, "UTF8", False), False),
         None,
-    ),  # 10
+    ),  # 1
 )
 
 
-class start_server_with_custom_key_result(object):
+class get_users_from_backend_result(object):
     """
     Attributes:
      - success
-     - e
-     - r
-     - s
-     - n
-     - i
-     - f
-     - o
 
     """
 
     def __init__(
         self,
         success=None,
-        e=None,
-        r=None,
-        s=None,
-        n=None,
-        i=None,
-        f=None,
-        o=None,
     ):
         self.success = success
-        self.e = e
-        self.r = r
-        self.s = s
-        self.n = n
-        self.i = i
-        self.f = f
-        self.o = o
 
     def read(self, iprot):
         if (
@@ -12108,57 +15995,17 @@ class start_server_with_custom_key_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.MAP:
-                    self.success = {}
-                    (_ktype335, _vtype336, _size334) = iprot.readMapBegin()
-                    for _i338 in range(_size334):
-                        _key339 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        _val340 = (
+                if ftype == TType.LIST:
+                    self.success = []
+                    (_etype394, _size391) = iprot.readListBegin()
+                    for _i395 in range(_size391):
+                        _elem396 = (
                             iprot.readString().decode("utf-8", errors="replace")
                             if sys.version_info[0] == 2
                             else iprot.readString()
                         )
-                        self.success[_key339] = _val340
-                    iprot.readMapEnd()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 1:
-                if ftype == TType.STRUCT:
-                    self.e = nameException.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.STRUCT:
-                    self.r = ressourceException.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 3:
-                if ftype == TType.STRUCT:
-                    self.s = serverNotFoundException.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 4:
-                if ftype == TType.STRUCT:
-                    self.n = networkNotFoundException.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 5:
-                if ftype == TType.STRUCT:
-                    self.i = imageNotFoundException.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 6:
-                if ftype == TType.STRUCT:
-                    self.f = flavorNotFoundException.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 7:
-                if ftype == TType.STRUCT:
-                    self.o = otherException.read(iprot)
+                        self.success.append(_elem396)
+                    iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -12172,46 +16019,15 @@ class start_server_with_custom_key_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("start_server_with_custom_key_result")
+        oprot.writeStructBegin("get_users_from_backend_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.MAP, 0)
-            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.success))
-            for kiter341, viter342 in self.success.items():
-                oprot.writeString(
-                    kiter341.encode("utf-8") if sys.version_info[0] == 2 else kiter341
-                )
+            oprot.writeFieldBegin("success", TType.LIST, 0)
+            oprot.writeListBegin(TType.STRING, len(self.success))
+            for iter397 in self.success:
                 oprot.writeString(
-                    viter342.encode("utf-8") if sys.version_info[0] == 2 else viter342
+                    iter397.encode("utf-8") if sys.version_info[0] == 2 else iter397
                 )
-            oprot.writeMapEnd()
-            oprot.writeFieldEnd()
-        if self.e is not None:
-            oprot.writeFieldBegin("e", TType.STRUCT, 1)
-            self.e.write(oprot)
-            oprot.writeFieldEnd()
-        if self.r is not None:
-            oprot.writeFieldBegin("r", TType.STRUCT, 2)
-            self.r.write(oprot)
-            oprot.writeFieldEnd()
-        if self.s is not None:
-            oprot.writeFieldBegin("s", TType.STRUCT, 3)
-            self.s.write(oprot)
-            oprot.writeFieldEnd()
-        if self.n is not None:
-            oprot.writeFieldBegin("n", TType.STRUCT, 4)
-            self.n.write(oprot)
-            oprot.writeFieldEnd()
-        if self.i is not None:
-            oprot.writeFieldBegin("i", TType.STRUCT, 5)
-            self.i.write(oprot)
-            oprot.writeFieldEnd()
-        if self.f is not None:
-            oprot.writeFieldBegin("f", TType.STRUCT, 6)
-            self.f.write(oprot)
-            oprot.writeFieldEnd()
-        if self.o is not None:
-            oprot.writeFieldBegin("o", TType.STRUCT, 7)
-            self.o.write(oprot)
+            oprot.writeListEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -12230,79 +16046,33 @@ class start_server_with_custom_key_result(object):
         return not (self == other)
 
 
-all_structs.append(start_server_with_custom_key_result)
-start_server_with_custom_key_result.thrift_spec = (
+all_structs.append(get_users_from_backend_result)
+get_users_from_backend_result.thrift_spec = (
     (
         0,
-        TType.MAP,
-        "success",
-        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
-        None,
-    ),  # 0
-    (
-        1,
-        TType.STRUCT,
-        "e",
-        [nameException, None],
-        None,
-    ),  # 1
-    (
-        2,
-        TType.STRUCT,
-        "r",
-        [ressourceException, None],
-        None,
-    ),  # 2
-    (
-        3,
-        TType.STRUCT,
-        "s",
-        [serverNotFoundException, None],
-        None,
-    ),  # 3
-    (
-        4,
-        TType.STRUCT,
-        "n",
-        [networkNotFoundException, None],
-        None,
-    ),  # 4
-    (
-        5,
-        TType.STRUCT,
-        "i",
-        [imageNotFoundException, None],
-        None,
-    ),  # 5
-    (
-        6,
-        TType.STRUCT,
-        "f",
-        [flavorNotFoundException, None],
-        None,
-    ),  # 6
-    (
-        7,
-        TType.STRUCT,
-        "o",
-        [otherException, None],
+        TType.LIST,
+        "success",
+        (TType.STRING, "UTF8", False),
         None,
-    ),  # 7
+    ),  # 0
 )
 
 
-class exist_server_args(object):
+class delete_user_from_backend_args(object):
     """
     Attributes:
-     - name
+     - backend_id
+     - user_id
 
     """
 
     def __init__(
         self,
-        name=None,
+        backend_id=None,
+        user_id=None,
     ):
-        self.name = name
+        self.backend_id = backend_id
+        self.user_id = user_id
 
     def read(self, iprot):
         if (
@@ -12318,8 +16088,13 @@ class exist_server_args(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
+                if ftype == TType.I64:
+                    self.backend_id = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
                 if ftype == TType.STRING:
-                    self.name = (
+                    self.user_id = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
@@ -12337,11 +16112,17 @@ class exist_server_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("exist_server_args")
-        if self.name is not None:
-            oprot.writeFieldBegin("name", TType.STRING, 1)
+        oprot.writeStructBegin("delete_user_from_backend_args")
+        if self.backend_id is not None:
+            oprot.writeFieldBegin("backend_id", TType.I64, 1)
+            oprot.writeI64(self.backend_id)
+            oprot.writeFieldEnd()
+        if self.user_id is not None:
+            oprot.writeFieldBegin("user_id", TType.STRING, 2)
             oprot.writeString(
-                self.name.encode("utf-8") if sys.version_info[0] == 2 else self.name
+                self.user_id.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.user_id
             )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
@@ -12361,20 +16142,27 @@ class exist_server_args(object):
         return not (self == other)
 
 
-all_structs.append(exist_server_args)
-exist_server_args.thrift_spec = (
+all_structs.append(delete_user_from_backend_args)
+delete_user_from_backend_args.thrift_spec = (
     None,  # 0
     (
         1,
+        TType.I64,
+        "backend_id",
+        None,
+        None,
+    ),  # 1
+    (
+        2,
         TType.STRING,
-        "name",
+        "user_id",
         "UTF8",
         None,
-    ),  # 1
+    ),  # 2
 )
 
 
-class exist_server_result(object):
+class delete_user_from_backend_result(object):
     """
     Attributes:
      - success
@@ -12401,8 +16189,22 @@ class exist_server_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.BOOL:
-                    self.success = iprot.readBool()
+                if ftype == TType.MAP:
+                    self.success = {}
+                    (_ktype399, _vtype400, _size398) = iprot.readMapBegin()
+                    for _i402 in range(_size398):
+                        _key403 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        _val404 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.success[_key403] = _val404
+                    iprot.readMapEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -12416,10 +16218,18 @@ class exist_server_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("exist_server_result")
+        oprot.writeStructBegin("delete_user_from_backend_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.BOOL, 0)
-            oprot.writeBool(self.success)
+            oprot.writeFieldBegin("success", TType.MAP, 0)
+            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.success))
+            for kiter405, viter406 in self.success.items():
+                oprot.writeString(
+                    kiter405.encode("utf-8") if sys.version_info[0] == 2 else kiter405
+                )
+                oprot.writeString(
+                    viter406.encode("utf-8") if sys.version_info[0] == 2 else viter406
+                )
+            oprot.writeMapEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -12438,36 +16248,77 @@ class exist_server_result(object):
         return not (self == other)
 
 
-all_structs.append(exist_server_result)
-exist_server_result.thrift_spec = (
+all_structs.append(delete_user_from_backend_result)
+delete_user_from_backend_result.thrift_spec = (
     (
         0,
-        TType.BOOL,
+        TType.MAP,
         "success",
-        None,
+        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
         None,
     ),  # 0
 )
 
 
-class create_and_deploy_playbook_args(object):
+class get_templates_args(object):
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
+            )
+            return
+        oprot.writeStructBegin("get_templates_args")
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+all_structs.append(get_templates_args)
+get_templates_args.thrift_spec = ()
+
+
+class get_templates_result(object):
     """
     Attributes:
-     - public_key
-     - playbooks_information
-     - openstack_id
+     - success
 
     """
 
     def __init__(
         self,
-        public_key=None,
-        playbooks_information=None,
-        openstack_id=None,
+        success=None,
     ):
-        self.public_key = public_key
-        self.playbooks_information = playbooks_information
-        self.openstack_id = openstack_id
+        self.success = success
 
     def read(self, iprot):
         if (
@@ -12482,53 +16333,104 @@ class create_and_deploy_playbook_args(object):
             (fname, ftype, fid) = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 1:
-                if ftype == TType.STRING:
-                    self.public_key = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.MAP:
-                    self.playbooks_information = {}
-                    (_ktype344, _vtype345, _size343) = iprot.readMapBegin()
-                    for _i347 in range(_size343):
-                        _key348 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        _val349 = {}
-                        (_ktype351, _vtype352, _size350) = iprot.readMapBegin()
-                        for _i354 in range(_size350):
-                            _key355 = (
+            if fid == 0:
+                if ftype == TType.LIST:
+                    self.success = []
+                    (_etype410, _size407) = iprot.readListBegin()
+                    for _i411 in range(_size407):
+                        _elem412 = {}
+                        (_ktype414, _vtype415, _size413) = iprot.readMapBegin()
+                        for _i417 in range(_size413):
+                            _key418 = (
                                 iprot.readString().decode("utf-8", errors="replace")
                                 if sys.version_info[0] == 2
                                 else iprot.readString()
                             )
-                            _val356 = (
+                            _val419 = (
                                 iprot.readString().decode("utf-8", errors="replace")
                                 if sys.version_info[0] == 2
                                 else iprot.readString()
                             )
-                            _val349[_key355] = _val356
+                            _elem412[_key418] = _val419
                         iprot.readMapEnd()
-                        self.playbooks_information[_key348] = _val349
-                    iprot.readMapEnd()
+                        self.success.append(_elem412)
+                    iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
-            elif fid == 3:
-                if ftype == TType.STRING:
-                    self.openstack_id = (
-                        iprot.readString().decode("utf-8", errors="replace")
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
+            )
+            return
+        oprot.writeStructBegin("get_templates_result")
+        if self.success is not None:
+            oprot.writeFieldBegin("success", TType.LIST, 0)
+            oprot.writeListBegin(TType.MAP, len(self.success))
+            for iter420 in self.success:
+                oprot.writeMapBegin(TType.STRING, TType.STRING, len(iter420))
+                for kiter421, viter422 in iter420.items():
+                    oprot.writeString(
+                        kiter421.encode("utf-8")
                         if sys.version_info[0] == 2
-                        else iprot.readString()
+                        else kiter421
                     )
-                else:
-                    iprot.skip(ftype)
+                    oprot.writeString(
+                        viter422.encode("utf-8")
+                        if sys.version_info[0] == 2
+                        else viter422
+                    )
+                oprot.writeMapEnd()
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+all_structs.append(get_templates_result)
+get_templates_result.thrift_spec = (
+    (
+        0,
+        TType.LIST,
+        "success",
+        (TType.MAP, (TType.STRING, "UTF8", TType.STRING, "UTF8", False), False),
+        None,
+    ),  # 0
+)
+
+
+class get_allowed_templates_args(object):
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -12540,47 +16442,7 @@ class create_and_deploy_playbook_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("create_and_deploy_playbook_args")
-        if self.public_key is not None:
-            oprot.writeFieldBegin("public_key", TType.STRING, 1)
-            oprot.writeString(
-                self.public_key.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.public_key
-            )
-            oprot.writeFieldEnd()
-        if self.playbooks_information is not None:
-            oprot.writeFieldBegin("playbooks_information", TType.MAP, 2)
-            oprot.writeMapBegin(
-                TType.STRING, TType.MAP, len(self.playbooks_information)
-            )
-            for kiter357, viter358 in self.playbooks_information.items():
-                oprot.writeString(
-                    kiter357.encode("utf-8") if sys.version_info[0] == 2 else kiter357
-                )
-                oprot.writeMapBegin(TType.STRING, TType.STRING, len(viter358))
-                for kiter359, viter360 in viter358.items():
-                    oprot.writeString(
-                        kiter359.encode("utf-8")
-                        if sys.version_info[0] == 2
-                        else kiter359
-                    )
-                    oprot.writeString(
-                        viter360.encode("utf-8")
-                        if sys.version_info[0] == 2
-                        else viter360
-                    )
-                oprot.writeMapEnd()
-            oprot.writeMapEnd()
-            oprot.writeFieldEnd()
-        if self.openstack_id is not None:
-            oprot.writeFieldBegin("openstack_id", TType.STRING, 3)
-            oprot.writeString(
-                self.openstack_id.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.openstack_id
-            )
-            oprot.writeFieldEnd()
+        oprot.writeStructBegin("get_allowed_templates_args")
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -12598,40 +16460,11 @@ class create_and_deploy_playbook_args(object):
         return not (self == other)
 
 
-all_structs.append(create_and_deploy_playbook_args)
-create_and_deploy_playbook_args.thrift_spec = (
-    None,  # 0
-    (
-        1,
-        TType.STRING,
-        "public_key",
-        "UTF8",
-        None,
-    ),  # 1
-    (
-        2,
-        TType.MAP,
-        "playbooks_information",
-        (
-            TType.STRING,
-            "UTF8",
-            TType.MAP,
-            (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
-            False,
-        ),
-        None,
-    ),  # 2
-    (
-        3,
-        TType.STRING,
-        "openstack_id",
-        "UTF8",
-        None,
-    ),  # 3
-)
+all_structs.append(get_allowed_templates_args)
+get_allowed_templates_args.thrift_spec = ()
 
 
-class create_and_deploy_playbook_result(object):
+class get_allowed_templates_result(object):
     """
     Attributes:
      - success
@@ -12658,8 +16491,17 @@ class create_and_deploy_playbook_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.I32:
-                    self.success = iprot.readI32()
+                if ftype == TType.LIST:
+                    self.success = []
+                    (_etype426, _size423) = iprot.readListBegin()
+                    for _i427 in range(_size423):
+                        _elem428 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.success.append(_elem428)
+                    iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -12673,10 +16515,15 @@ class create_and_deploy_playbook_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("create_and_deploy_playbook_result")
+        oprot.writeStructBegin("get_allowed_templates_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.I32, 0)
-            oprot.writeI32(self.success)
+            oprot.writeFieldBegin("success", TType.LIST, 0)
+            oprot.writeListBegin(TType.STRING, len(self.success))
+            for iter429 in self.success:
+                oprot.writeString(
+                    iter429.encode("utf-8") if sys.version_info[0] == 2 else iter429
+                )
+            oprot.writeListEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -12695,30 +16542,30 @@ class create_and_deploy_playbook_result(object):
         return not (self == other)
 
 
-all_structs.append(create_and_deploy_playbook_result)
-create_and_deploy_playbook_result.thrift_spec = (
+all_structs.append(get_allowed_templates_result)
+get_allowed_templates_result.thrift_spec = (
     (
         0,
-        TType.I32,
+        TType.LIST,
         "success",
-        None,
+        (TType.STRING, "UTF8", False),
         None,
     ),  # 0
 )
 
 
-class get_playbook_logs_args(object):
+class get_templates_by_template_args(object):
     """
     Attributes:
-     - openstack_id
+     - template_name
 
     """
 
     def __init__(
         self,
-        openstack_id=None,
+        template_name=None,
     ):
-        self.openstack_id = openstack_id
+        self.template_name = template_name
 
     def read(self, iprot):
         if (
@@ -12735,7 +16582,7 @@ class get_playbook_logs_args(object):
                 break
             if fid == 1:
                 if ftype == TType.STRING:
-                    self.openstack_id = (
+                    self.template_name = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
@@ -12753,13 +16600,13 @@ class get_playbook_logs_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_playbook_logs_args")
-        if self.openstack_id is not None:
-            oprot.writeFieldBegin("openstack_id", TType.STRING, 1)
+        oprot.writeStructBegin("get_templates_by_template_args")
+        if self.template_name is not None:
+            oprot.writeFieldBegin("template_name", TType.STRING, 1)
             oprot.writeString(
-                self.openstack_id.encode("utf-8")
+                self.template_name.encode("utf-8")
                 if sys.version_info[0] == 2
-                else self.openstack_id
+                else self.template_name
             )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
@@ -12779,20 +16626,20 @@ class get_playbook_logs_args(object):
         return not (self == other)
 
 
-all_structs.append(get_playbook_logs_args)
-get_playbook_logs_args.thrift_spec = (
+all_structs.append(get_templates_by_template_args)
+get_templates_by_template_args.thrift_spec = (
     None,  # 0
     (
         1,
         TType.STRING,
-        "openstack_id",
+        "template_name",
         "UTF8",
         None,
     ),  # 1
 )
 
 
-class get_playbook_logs_result(object):
+class get_templates_by_template_result(object):
     """
     Attributes:
      - success
@@ -12819,9 +16666,27 @@ class get_playbook_logs_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.STRUCT:
-                    self.success = PlaybookResult()
-                    self.success.read(iprot)
+                if ftype == TType.LIST:
+                    self.success = []
+                    (_etype433, _size430) = iprot.readListBegin()
+                    for _i434 in range(_size430):
+                        _elem435 = {}
+                        (_ktype437, _vtype438, _size436) = iprot.readMapBegin()
+                        for _i440 in range(_size436):
+                            _key441 = (
+                                iprot.readString().decode("utf-8", errors="replace")
+                                if sys.version_info[0] == 2
+                                else iprot.readString()
+                            )
+                            _val442 = (
+                                iprot.readString().decode("utf-8", errors="replace")
+                                if sys.version_info[0] == 2
+                                else iprot.readString()
+                            )
+                            _elem435[_key441] = _val442
+                        iprot.readMapEnd()
+                        self.success.append(_elem435)
+                    iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -12835,10 +16700,25 @@ class get_playbook_logs_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_playbook_logs_result")
+        oprot.writeStructBegin("get_templates_by_template_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.STRUCT, 0)
-            self.success.write(oprot)
+            oprot.writeFieldBegin("success", TType.LIST, 0)
+            oprot.writeListBegin(TType.MAP, len(self.success))
+            for iter443 in self.success:
+                oprot.writeMapBegin(TType.STRING, TType.STRING, len(iter443))
+                for kiter444, viter445 in iter443.items():
+                    oprot.writeString(
+                        kiter444.encode("utf-8")
+                        if sys.version_info[0] == 2
+                        else kiter444
+                    )
+                    oprot.writeString(
+                        viter445.encode("utf-8")
+                        if sys.version_info[0] == 2
+                        else viter445
+                    )
+                oprot.writeMapEnd()
+            oprot.writeListEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -12857,77 +16737,33 @@ class get_playbook_logs_result(object):
         return not (self == other)
 
 
-all_structs.append(get_playbook_logs_result)
-get_playbook_logs_result.thrift_spec = (
+all_structs.append(get_templates_by_template_result)
+get_templates_by_template_result.thrift_spec = (
     (
         0,
-        TType.STRUCT,
+        TType.LIST,
         "success",
-        [PlaybookResult, None],
+        (TType.MAP, (TType.STRING, "UTF8", TType.STRING, "UTF8", False), False),
         None,
     ),  # 0
 )
 
 
-class has_forc_args(object):
-    def read(self, iprot):
-        if (
-            iprot._fast_decode is not None
-            and isinstance(iprot.trans, TTransport.CReadableTransport)
-            and self.thrift_spec is not None
-        ):
-            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
-            return
-        iprot.readStructBegin()
-        while True:
-            (fname, ftype, fid) = iprot.readFieldBegin()
-            if ftype == TType.STOP:
-                break
-            else:
-                iprot.skip(ftype)
-            iprot.readFieldEnd()
-        iprot.readStructEnd()
-
-    def write(self, oprot):
-        if oprot._fast_encode is not None and self.thrift_spec is not None:
-            oprot.trans.write(
-                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
-            )
-            return
-        oprot.writeStructBegin("has_forc_args")
-        oprot.writeFieldStop()
-        oprot.writeStructEnd()
-
-    def validate(self):
-        return
-
-    def __repr__(self):
-        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
-        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
-
-    def __eq__(self, other):
-        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
-
-    def __ne__(self, other):
-        return not (self == other)
-
-
-all_structs.append(has_forc_args)
-has_forc_args.thrift_spec = ()
-
-
-class has_forc_result(object):
+class check_template_args(object):
     """
     Attributes:
-     - success
+     - template_name
+     - template_version
 
     """
 
     def __init__(
         self,
-        success=None,
+        template_name=None,
+        template_version=None,
     ):
-        self.success = success
+        self.template_name = template_name
+        self.template_version = template_version
 
     def read(self, iprot):
         if (
@@ -12942,9 +16778,22 @@ class has_forc_result(object):
             (fname, ftype, fid) = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 0:
-                if ftype == TType.BOOL:
-                    self.success = iprot.readBool()
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.template_name = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.template_version = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
                 else:
                     iprot.skip(ftype)
             else:
@@ -12958,10 +16807,22 @@ class has_forc_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("has_forc_result")
-        if self.success is not None:
-            oprot.writeFieldBegin("success", TType.BOOL, 0)
-            oprot.writeBool(self.success)
+        oprot.writeStructBegin("check_template_args")
+        if self.template_name is not None:
+            oprot.writeFieldBegin("template_name", TType.STRING, 1)
+            oprot.writeString(
+                self.template_name.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.template_name
+            )
+            oprot.writeFieldEnd()
+        if self.template_version is not None:
+            oprot.writeFieldBegin("template_version", TType.STRING, 2)
+            oprot.writeString(
+                self.template_version.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.template_version
+            )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -12980,19 +16841,39 @@ class has_forc_result(object):
         return not (self == other)
 
 
-all_structs.append(has_forc_result)
-has_forc_result.thrift_spec = (
+all_structs.append(check_template_args)
+check_template_args.thrift_spec = (
+    None,  # 0
     (
-        0,
-        TType.BOOL,
-        "success",
+        1,
+        TType.STRING,
+        "template_name",
+        "UTF8",
         None,
+    ),  # 1
+    (
+        2,
+        TType.STRING,
+        "template_version",
+        "UTF8",
         None,
-    ),  # 0
+    ),  # 2
 )
 
 
-class get_forc_url_args(object):
+class check_template_result(object):
+    """
+    Attributes:
+     - success
+
+    """
+
+    def __init__(
+        self,
+        success=None,
+    ):
+        self.success = success
+
     def read(self, iprot):
         if (
             iprot._fast_decode is not None
@@ -13006,6 +16887,25 @@ class get_forc_url_args(object):
             (fname, ftype, fid) = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
+            if fid == 0:
+                if ftype == TType.MAP:
+                    self.success = {}
+                    (_ktype447, _vtype448, _size446) = iprot.readMapBegin()
+                    for _i450 in range(_size446):
+                        _key451 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        _val452 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.success[_key451] = _val452
+                    iprot.readMapEnd()
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -13017,7 +16917,19 @@ class get_forc_url_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_forc_url_args")
+        oprot.writeStructBegin("check_template_result")
+        if self.success is not None:
+            oprot.writeFieldBegin("success", TType.MAP, 0)
+            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.success))
+            for kiter453, viter454 in self.success.items():
+                oprot.writeString(
+                    kiter453.encode("utf-8") if sys.version_info[0] == 2 else kiter453
+                )
+                oprot.writeString(
+                    viter454.encode("utf-8") if sys.version_info[0] == 2 else viter454
+                )
+            oprot.writeMapEnd()
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -13035,22 +16947,30 @@ class get_forc_url_args(object):
         return not (self == other)
 
 
-all_structs.append(get_forc_url_args)
-get_forc_url_args.thrift_spec = ()
+all_structs.append(check_template_result)
+check_template_result.thrift_spec = (
+    (
+        0,
+        TType.MAP,
+        "success",
+        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
+        None,
+    ),  # 0
+)
 
 
-class get_forc_url_result(object):
+class add_udp_security_group_args(object):
     """
     Attributes:
-     - success
+     - server_id: OpenStack id of the server
 
     """
 
     def __init__(
         self,
-        success=None,
+        server_id=None,
     ):
-        self.success = success
+        self.server_id = server_id
 
     def read(self, iprot):
         if (
@@ -13065,9 +16985,9 @@ class get_forc_url_result(object):
             (fname, ftype, fid) = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 0:
+            if fid == 1:
                 if ftype == TType.STRING:
-                    self.success = (
+                    self.server_id = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
@@ -13085,13 +17005,13 @@ class get_forc_url_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_forc_url_result")
-        if self.success is not None:
-            oprot.writeFieldBegin("success", TType.STRING, 0)
+        oprot.writeStructBegin("add_udp_security_group_args")
+        if self.server_id is not None:
+            oprot.writeFieldBegin("server_id", TType.STRING, 1)
             oprot.writeString(
-                self.success.encode("utf-8")
+                self.server_id.encode("utf-8")
                 if sys.version_info[0] == 2
-                else self.success
+                else self.server_id
             )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
@@ -13111,39 +17031,37 @@ class get_forc_url_result(object):
         return not (self == other)
 
 
-all_structs.append(get_forc_url_result)
-get_forc_url_result.thrift_spec = (
+all_structs.append(add_udp_security_group_args)
+add_udp_security_group_args.thrift_spec = (
+    None,  # 0
     (
-        0,
+        1,
         TType.STRING,
-        "success",
+        "server_id",
         "UTF8",
         None,
-    ),  # 0
+    ),  # 1
 )
 
 
-class create_backend_args(object):
+class add_udp_security_group_result(object):
     """
     Attributes:
-     - elixir_id
-     - user_key_url
-     - template
-     - upstream_url
+     - success
+     - r
+     - s
 
     """
 
     def __init__(
         self,
-        elixir_id=None,
-        user_key_url=None,
-        template=None,
-        upstream_url=None,
+        success=None,
+        r=None,
+        s=None,
     ):
-        self.elixir_id = elixir_id
-        self.user_key_url = user_key_url
-        self.template = template
-        self.upstream_url = upstream_url
+        self.success = success
+        self.r = r
+        self.s = s
 
     def read(self, iprot):
         if (
@@ -13158,40 +17076,19 @@ class create_backend_args(object):
             (fname, ftype, fid) = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 1:
-                if ftype == TType.STRING:
-                    self.elixir_id = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.STRING:
-                    self.user_key_url = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
+            if fid == 0:
+                if ftype == TType.BOOL:
+                    self.success = iprot.readBool()
                 else:
                     iprot.skip(ftype)
-            elif fid == 3:
-                if ftype == TType.STRING:
-                    self.template = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
+            elif fid == 1:
+                if ftype == TType.STRUCT:
+                    self.r = ressourceException.read(iprot)
                 else:
                     iprot.skip(ftype)
-            elif fid == 4:
-                if ftype == TType.STRING:
-                    self.upstream_url = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
+            elif fid == 2:
+                if ftype == TType.STRUCT:
+                    self.s = serverNotFoundException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -13202,41 +17099,21 @@ class create_backend_args(object):
     def write(self, oprot):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(
-                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
-            )
-            return
-        oprot.writeStructBegin("create_backend_args")
-        if self.elixir_id is not None:
-            oprot.writeFieldBegin("elixir_id", TType.STRING, 1)
-            oprot.writeString(
-                self.elixir_id.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.elixir_id
-            )
-            oprot.writeFieldEnd()
-        if self.user_key_url is not None:
-            oprot.writeFieldBegin("user_key_url", TType.STRING, 2)
-            oprot.writeString(
-                self.user_key_url.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.user_key_url
-            )
-            oprot.writeFieldEnd()
-        if self.template is not None:
-            oprot.writeFieldBegin("template", TType.STRING, 3)
-            oprot.writeString(
-                self.template.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.template
-            )
-            oprot.writeFieldEnd()
-        if self.upstream_url is not None:
-            oprot.writeFieldBegin("upstream_url", TType.STRING, 4)
-            oprot.writeString(
-                self.upstream_url.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.upstream_url
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
+            return
+        oprot.writeStructBegin("add_udp_security_group_result")
+        if self.success is not None:
+            oprot.writeFieldBegin("success", TType.BOOL, 0)
+            oprot.writeBool(self.success)
+            oprot.writeFieldEnd()
+        if self.r is not None:
+            oprot.writeFieldBegin("r", TType.STRUCT, 1)
+            self.r.write(oprot)
+            oprot.writeFieldEnd()
+        if self.s is not None:
+            oprot.writeFieldBegin("s", TType.STRUCT, 2)
+            self.s.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -13255,41 +17132,80 @@ class create_backend_args(object):
         return not (self == other)
 
 
-all_structs.append(create_backend_args)
-create_backend_args.thrift_spec = (
-    None,  # 0
+all_structs.append(add_udp_security_group_result)
+add_udp_security_group_result.thrift_spec = (
+    (
+        0,
+        TType.BOOL,
+        "success",
+        None,
+        None,
+    ),  # 0
     (
         1,
-        TType.STRING,
-        "elixir_id",
-        "UTF8",
+        TType.STRUCT,
+        "r",
+        [ressourceException, None],
         None,
     ),  # 1
     (
         2,
-        TType.STRING,
-        "user_key_url",
-        "UTF8",
+        TType.STRUCT,
+        "s",
+        [serverNotFoundException, None],
         None,
     ),  # 2
-    (
-        3,
-        TType.STRING,
-        "template",
-        "UTF8",
-        None,
-    ),  # 3
-    (
-        4,
-        TType.STRING,
-        "upstream_url",
-        "UTF8",
-        None,
-    ),  # 4
 )
 
 
-class create_backend_result(object):
+class get_servers_args(object):
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
+            )
+            return
+        oprot.writeStructBegin("get_servers_args")
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+all_structs.append(get_servers_args)
+get_servers_args.thrift_spec = ()
+
+
+class get_servers_result(object):
     """
     Attributes:
      - success
@@ -13316,9 +17232,14 @@ class create_backend_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.STRUCT:
-                    self.success = Backend()
-                    self.success.read(iprot)
+                if ftype == TType.LIST:
+                    self.success = []
+                    (_etype458, _size455) = iprot.readListBegin()
+                    for _i459 in range(_size455):
+                        _elem460 = VM()
+                        _elem460.read(iprot)
+                        self.success.append(_elem460)
+                    iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -13332,10 +17253,13 @@ class create_backend_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("create_backend_result")
+        oprot.writeStructBegin("get_servers_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.STRUCT, 0)
-            self.success.write(oprot)
+            oprot.writeFieldBegin("success", TType.LIST, 0)
+            oprot.writeListBegin(TType.STRUCT, len(self.success))
+            for iter461 in self.success:
+                iter461.write(oprot)
+            oprot.writeListEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -13354,19 +17278,31 @@ class create_backend_result(object):
         return not (self == other)
 
 
-all_structs.append(create_backend_result)
-create_backend_result.thrift_spec = (
+all_structs.append(get_servers_result)
+get_servers_result.thrift_spec = (
     (
         0,
-        TType.STRUCT,
+        TType.LIST,
         "success",
-        [Backend, None],
+        (TType.STRUCT, [VM, None], False),
         None,
     ),  # 0
 )
 
 
-class get_backends_args(object):
+class get_server_openstack_ids_args(object):
+    """
+    Attributes:
+     - filter_tag
+
+    """
+
+    def __init__(
+        self,
+        filter_tag=None,
+    ):
+        self.filter_tag = filter_tag
+
     def read(self, iprot):
         if (
             iprot._fast_decode is not None
@@ -13380,6 +17316,15 @@ class get_backends_args(object):
             (fname, ftype, fid) = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.filter_tag = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -13391,7 +17336,15 @@ class get_backends_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_backends_args")
+        oprot.writeStructBegin("get_server_openstack_ids_args")
+        if self.filter_tag is not None:
+            oprot.writeFieldBegin("filter_tag", TType.STRING, 1)
+            oprot.writeString(
+                self.filter_tag.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.filter_tag
+            )
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -13409,11 +17362,20 @@ class get_backends_args(object):
         return not (self == other)
 
 
-all_structs.append(get_backends_args)
-get_backends_args.thrift_spec = ()
+all_structs.append(get_server_openstack_ids_args)
+get_server_openstack_ids_args.thrift_spec = (
+    None,  # 0
+    (
+        1,
+        TType.STRING,
+        "filter_tag",
+        "UTF8",
+        None,
+    ),  # 1
+)
 
 
-class get_backends_result(object):
+class get_server_openstack_ids_result(object):
     """
     Attributes:
      - success
@@ -13442,11 +17404,14 @@ class get_backends_result(object):
             if fid == 0:
                 if ftype == TType.LIST:
                     self.success = []
-                    (_etype364, _size361) = iprot.readListBegin()
-                    for _i365 in range(_size361):
-                        _elem366 = Backend()
-                        _elem366.read(iprot)
-                        self.success.append(_elem366)
+                    (_etype465, _size462) = iprot.readListBegin()
+                    for _i466 in range(_size462):
+                        _elem467 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.success.append(_elem467)
                     iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
@@ -13461,12 +17426,14 @@ class get_backends_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_backends_result")
+        oprot.writeStructBegin("get_server_openstack_ids_result")
         if self.success is not None:
             oprot.writeFieldBegin("success", TType.LIST, 0)
-            oprot.writeListBegin(TType.STRUCT, len(self.success))
-            for iter367 in self.success:
-                iter367.write(oprot)
+            oprot.writeListBegin(TType.STRING, len(self.success))
+            for iter468 in self.success:
+                oprot.writeString(
+                    iter468.encode("utf-8") if sys.version_info[0] == 2 else iter468
+                )
             oprot.writeListEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
@@ -13486,30 +17453,30 @@ class get_backends_result(object):
         return not (self == other)
 
 
-all_structs.append(get_backends_result)
-get_backends_result.thrift_spec = (
+all_structs.append(get_server_openstack_ids_result)
+get_server_openstack_ids_result.thrift_spec = (
     (
         0,
         TType.LIST,
         "success",
-        (TType.STRUCT, [Backend, None], False),
+        (TType.STRING, "UTF8", False),
         None,
     ),  # 0
 )
 
 
-class get_backends_by_owner_args(object):
+class get_servers_by_ids_args(object):
     """
     Attributes:
-     - elixir_id
+     - server_ids
 
     """
 
     def __init__(
         self,
-        elixir_id=None,
+        server_ids=None,
     ):
-        self.elixir_id = elixir_id
+        self.server_ids = server_ids
 
     def read(self, iprot):
         if (
@@ -13525,12 +17492,17 @@ class get_backends_by_owner_args(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.STRING:
-                    self.elixir_id = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
+                if ftype == TType.LIST:
+                    self.server_ids = []
+                    (_etype472, _size469) = iprot.readListBegin()
+                    for _i473 in range(_size469):
+                        _elem474 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.server_ids.append(_elem474)
+                    iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -13544,14 +17516,15 @@ class get_backends_by_owner_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_backends_by_owner_args")
-        if self.elixir_id is not None:
-            oprot.writeFieldBegin("elixir_id", TType.STRING, 1)
-            oprot.writeString(
-                self.elixir_id.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.elixir_id
-            )
+        oprot.writeStructBegin("get_servers_by_ids_args")
+        if self.server_ids is not None:
+            oprot.writeFieldBegin("server_ids", TType.LIST, 1)
+            oprot.writeListBegin(TType.STRING, len(self.server_ids))
+            for iter475 in self.server_ids:
+                oprot.writeString(
+                    iter475.encode("utf-8") if sys.version_info[0] == 2 else iter475
+                )
+            oprot.writeListEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -13570,20 +17543,20 @@ class get_backends_by_owner_args(object):
         return not (self == other)
 
 
-all_structs.append(get_backends_by_owner_args)
-get_backends_by_owner_args.thrift_spec = (
+all_structs.append(get_servers_by_ids_args)
+get_servers_by_ids_args.thrift_spec = (
     None,  # 0
     (
-        1,
-        TType.STRING,
-        "elixir_id",
-        "UTF8",
+        1,
+        TType.LIST,
+        "server_ids",
+        (TType.STRING, "UTF8", False),
         None,
     ),  # 1
 )
 
 
-class get_backends_by_owner_result(object):
+class get_servers_by_ids_result(object):
     """
     Attributes:
      - success
@@ -13612,11 +17585,11 @@ class get_backends_by_owner_result(object):
             if fid == 0:
                 if ftype == TType.LIST:
                     self.success = []
-                    (_etype371, _size368) = iprot.readListBegin()
-                    for _i372 in range(_size368):
-                        _elem373 = Backend()
-                        _elem373.read(iprot)
-                        self.success.append(_elem373)
+                    (_etype479, _size476) = iprot.readListBegin()
+                    for _i480 in range(_size476):
+                        _elem481 = VM()
+                        _elem481.read(iprot)
+                        self.success.append(_elem481)
                     iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
@@ -13631,12 +17604,12 @@ class get_backends_by_owner_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_backends_by_owner_result")
+        oprot.writeStructBegin("get_servers_by_ids_result")
         if self.success is not None:
             oprot.writeFieldBegin("success", TType.LIST, 0)
             oprot.writeListBegin(TType.STRUCT, len(self.success))
-            for iter374 in self.success:
-                iter374.write(oprot)
+            for iter482 in self.success:
+                iter482.write(oprot)
             oprot.writeListEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
@@ -13656,30 +17629,30 @@ class get_backends_by_owner_result(object):
         return not (self == other)
 
 
-all_structs.append(get_backends_by_owner_result)
-get_backends_by_owner_result.thrift_spec = (
+all_structs.append(get_servers_by_ids_result)
+get_servers_by_ids_result.thrift_spec = (
     (
         0,
         TType.LIST,
         "success",
-        (TType.STRUCT, [Backend, None], False),
+        (TType.STRUCT, [VM, None], False),
         None,
     ),  # 0
 )
 
 
-class get_backends_by_template_args(object):
+class check_server_task_state_args(object):
     """
     Attributes:
-     - template
+     - openstack_id
 
     """
 
     def __init__(
         self,
-        template=None,
+        openstack_id=None,
     ):
-        self.template = template
+        self.openstack_id = openstack_id
 
     def read(self, iprot):
         if (
@@ -13696,7 +17669,7 @@ class get_backends_by_template_args(object):
                 break
             if fid == 1:
                 if ftype == TType.STRING:
-                    self.template = (
+                    self.openstack_id = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
@@ -13714,13 +17687,13 @@ class get_backends_by_template_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_backends_by_template_args")
-        if self.template is not None:
-            oprot.writeFieldBegin("template", TType.STRING, 1)
+        oprot.writeStructBegin("check_server_task_state_args")
+        if self.openstack_id is not None:
+            oprot.writeFieldBegin("openstack_id", TType.STRING, 1)
             oprot.writeString(
-                self.template.encode("utf-8")
+                self.openstack_id.encode("utf-8")
                 if sys.version_info[0] == 2
-                else self.template
+                else self.openstack_id
             )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
@@ -13740,20 +17713,20 @@ class get_backends_by_template_args(object):
         return not (self == other)
 
 
-all_structs.append(get_backends_by_template_args)
-get_backends_by_template_args.thrift_spec = (
+all_structs.append(check_server_task_state_args)
+check_server_task_state_args.thrift_spec = (
     None,  # 0
     (
         1,
         TType.STRING,
-        "template",
+        "openstack_id",
         "UTF8",
         None,
     ),  # 1
 )
 
 
-class get_backends_by_template_result(object):
+class check_server_task_state_result(object):
     """
     Attributes:
      - success
@@ -13780,14 +17753,12 @@ class get_backends_by_template_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.LIST:
-                    self.success = []
-                    (_etype378, _size375) = iprot.readListBegin()
-                    for _i379 in range(_size375):
-                        _elem380 = Backend()
-                        _elem380.read(iprot)
-                        self.success.append(_elem380)
-                    iprot.readListEnd()
+                if ftype == TType.STRING:
+                    self.success = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
                 else:
                     iprot.skip(ftype)
             else:
@@ -13801,13 +17772,14 @@ class get_backends_by_template_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_backends_by_template_result")
+        oprot.writeStructBegin("check_server_task_state_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.LIST, 0)
-            oprot.writeListBegin(TType.STRUCT, len(self.success))
-            for iter381 in self.success:
-                iter381.write(oprot)
-            oprot.writeListEnd()
+            oprot.writeFieldBegin("success", TType.STRING, 0)
+            oprot.writeString(
+                self.success.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.success
+            )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -13826,30 +17798,30 @@ class get_backends_by_template_result(object):
         return not (self == other)
 
 
-all_structs.append(get_backends_by_template_result)
-get_backends_by_template_result.thrift_spec = (
+all_structs.append(check_server_task_state_result)
+check_server_task_state_result.thrift_spec = (
     (
         0,
-        TType.LIST,
+        TType.STRING,
         "success",
-        (TType.STRUCT, [Backend, None], False),
+        "UTF8",
         None,
     ),  # 0
 )
 
 
-class get_backend_by_id_args(object):
+class get_servers_by_bibigrid_id_args(object):
     """
     Attributes:
-     - id
+     - bibigrid_id
 
     """
 
     def __init__(
         self,
-        id=None,
+        bibigrid_id=None,
     ):
-        self.id = id
+        self.bibigrid_id = bibigrid_id
 
     def read(self, iprot):
         if (
@@ -13865,8 +17837,12 @@ class get_backend_by_id_args(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.I64:
-                    self.id = iprot.readI64()
+                if ftype == TType.STRING:
+                    self.bibigrid_id = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
                 else:
                     iprot.skip(ftype)
             else:
@@ -13880,10 +17856,14 @@ class get_backend_by_id_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_backend_by_id_args")
-        if self.id is not None:
-            oprot.writeFieldBegin("id", TType.I64, 1)
-            oprot.writeI64(self.id)
+        oprot.writeStructBegin("get_servers_by_bibigrid_id_args")
+        if self.bibigrid_id is not None:
+            oprot.writeFieldBegin("bibigrid_id", TType.STRING, 1)
+            oprot.writeString(
+                self.bibigrid_id.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.bibigrid_id
+            )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -13902,20 +17882,20 @@ class get_backend_by_id_args(object):
         return not (self == other)
 
 
-all_structs.append(get_backend_by_id_args)
-get_backend_by_id_args.thrift_spec = (
+all_structs.append(get_servers_by_bibigrid_id_args)
+get_servers_by_bibigrid_id_args.thrift_spec = (
     None,  # 0
     (
         1,
-        TType.I64,
-        "id",
-        None,
+        TType.STRING,
+        "bibigrid_id",
+        "UTF8",
         None,
     ),  # 1
 )
 
 
-class get_backend_by_id_result(object):
+class get_servers_by_bibigrid_id_result(object):
     """
     Attributes:
      - success
@@ -13942,9 +17922,14 @@ class get_backend_by_id_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.STRUCT:
-                    self.success = Backend()
-                    self.success.read(iprot)
+                if ftype == TType.LIST:
+                    self.success = []
+                    (_etype486, _size483) = iprot.readListBegin()
+                    for _i487 in range(_size483):
+                        _elem488 = VM()
+                        _elem488.read(iprot)
+                        self.success.append(_elem488)
+                    iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -13958,10 +17943,13 @@ class get_backend_by_id_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_backend_by_id_result")
+        oprot.writeStructBegin("get_servers_by_bibigrid_id_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.STRUCT, 0)
-            self.success.write(oprot)
+            oprot.writeFieldBegin("success", TType.LIST, 0)
+            oprot.writeListBegin(TType.STRUCT, len(self.success))
+            for iter489 in self.success:
+                iter489.write(oprot)
+            oprot.writeListEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -13980,30 +17968,33 @@ class get_backend_by_id_result(object):
         return not (self == other)
 
 
-all_structs.append(get_backend_by_id_result)
-get_backend_by_id_result.thrift_spec = (
+all_structs.append(get_servers_by_bibigrid_id_result)
+get_servers_by_bibigrid_id_result.thrift_spec = (
     (
         0,
-        TType.STRUCT,
+        TType.LIST,
         "success",
-        [Backend, None],
+        (TType.STRUCT, [VM, None], False),
         None,
     ),  # 0
 )
 
 
-class delete_backend_args(object):
+class add_server_metadata_args(object):
     """
     Attributes:
-     - id
+     - server_id
+     - metadata
 
     """
 
     def __init__(
         self,
-        id=None,
+        server_id=None,
+        metadata=None,
     ):
-        self.id = id
+        self.server_id = server_id
+        self.metadata = metadata
 
     def read(self, iprot):
         if (
@@ -14019,8 +18010,31 @@ class delete_backend_args(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.I64:
-                    self.id = iprot.readI64()
+                if ftype == TType.STRING:
+                    self.server_id = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.MAP:
+                    self.metadata = {}
+                    (_ktype491, _vtype492, _size490) = iprot.readMapBegin()
+                    for _i494 in range(_size490):
+                        _key495 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        _val496 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.metadata[_key495] = _val496
+                    iprot.readMapEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -14034,10 +18048,26 @@ class delete_backend_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("delete_backend_args")
-        if self.id is not None:
-            oprot.writeFieldBegin("id", TType.I64, 1)
-            oprot.writeI64(self.id)
+        oprot.writeStructBegin("add_server_metadata_args")
+        if self.server_id is not None:
+            oprot.writeFieldBegin("server_id", TType.STRING, 1)
+            oprot.writeString(
+                self.server_id.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.server_id
+            )
+            oprot.writeFieldEnd()
+        if self.metadata is not None:
+            oprot.writeFieldBegin("metadata", TType.MAP, 2)
+            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.metadata))
+            for kiter497, viter498 in self.metadata.items():
+                oprot.writeString(
+                    kiter497.encode("utf-8") if sys.version_info[0] == 2 else kiter497
+                )
+                oprot.writeString(
+                    viter498.encode("utf-8") if sys.version_info[0] == 2 else viter498
+                )
+            oprot.writeMapEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -14056,31 +18086,38 @@ class delete_backend_args(object):
         return not (self == other)
 
 
-all_structs.append(delete_backend_args)
-delete_backend_args.thrift_spec = (
+all_structs.append(add_server_metadata_args)
+add_server_metadata_args.thrift_spec = (
     None,  # 0
     (
         1,
-        TType.I64,
-        "id",
-        None,
+        TType.STRING,
+        "server_id",
+        "UTF8",
         None,
     ),  # 1
+    (
+        2,
+        TType.MAP,
+        "metadata",
+        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
+        None,
+    ),  # 2
 )
 
 
-class delete_backend_result(object):
+class add_server_metadata_result(object):
     """
     Attributes:
-     - success
+     - e
 
     """
 
     def __init__(
         self,
-        success=None,
+        e=None,
     ):
-        self.success = success
+        self.e = e
 
     def read(self, iprot):
         if (
@@ -14095,13 +18132,9 @@ class delete_backend_result(object):
             (fname, ftype, fid) = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 0:
-                if ftype == TType.STRING:
-                    self.success = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
+            if fid == 1:
+                if ftype == TType.STRUCT:
+                    self.e = serverNotFoundException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -14115,14 +18148,10 @@ class delete_backend_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("delete_backend_result")
-        if self.success is not None:
-            oprot.writeFieldBegin("success", TType.STRING, 0)
-            oprot.writeString(
-                self.success.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.success
-            )
+        oprot.writeStructBegin("add_server_metadata_result")
+        if self.e is not None:
+            oprot.writeFieldBegin("e", TType.STRUCT, 1)
+            self.e.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -14141,33 +18170,34 @@ class delete_backend_result(object):
         return not (self == other)
 
 
-all_structs.append(delete_backend_result)
-delete_backend_result.thrift_spec = (
+all_structs.append(add_server_metadata_result)
+add_server_metadata_result.thrift_spec = (
+    None,  # 0
     (
-        0,
-        TType.STRING,
-        "success",
-        "UTF8",
+        1,
+        TType.STRUCT,
+        "e",
+        [serverNotFoundException, None],
         None,
-    ),  # 0
+    ),  # 1
 )
 
 
-class add_user_to_backend_args(object):
+class create_resenv_security_group_and_attach_to_server_args(object):
     """
     Attributes:
-     - backend_id
-     - user_id
+     - server_id
+     - resenv_template
 
     """
 
     def __init__(
         self,
-        backend_id=None,
-        user_id=None,
+        server_id=None,
+        resenv_template=None,
     ):
-        self.backend_id = backend_id
-        self.user_id = user_id
+        self.server_id = server_id
+        self.resenv_template = resenv_template
 
     def read(self, iprot):
         if (
@@ -14183,13 +18213,17 @@ class add_user_to_backend_args(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.I64:
-                    self.backend_id = iprot.readI64()
+                if ftype == TType.STRING:
+                    self.server_id = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
                 else:
                     iprot.skip(ftype)
             elif fid == 2:
                 if ftype == TType.STRING:
-                    self.user_id = (
+                    self.resenv_template = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
@@ -14207,17 +18241,21 @@ class add_user_to_backend_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("add_user_to_backend_args")
-        if self.backend_id is not None:
-            oprot.writeFieldBegin("backend_id", TType.I64, 1)
-            oprot.writeI64(self.backend_id)
+        oprot.writeStructBegin("create_resenv_security_group_and_attach_to_server_args")
+        if self.server_id is not None:
+            oprot.writeFieldBegin("server_id", TType.STRING, 1)
+            oprot.writeString(
+                self.server_id.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.server_id
+            )
             oprot.writeFieldEnd()
-        if self.user_id is not None:
-            oprot.writeFieldBegin("user_id", TType.STRING, 2)
+        if self.resenv_template is not None:
+            oprot.writeFieldBegin("resenv_template", TType.STRING, 2)
             oprot.writeString(
-                self.user_id.encode("utf-8")
+                self.resenv_template.encode("utf-8")
                 if sys.version_info[0] == 2
-                else self.user_id
+                else self.resenv_template
             )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
@@ -14237,38 +18275,38 @@ class add_user_to_backend_args(object):
         return not (self == other)
 
 
-all_structs.append(add_user_to_backend_args)
-add_user_to_backend_args.thrift_spec = (
+all_structs.append(create_resenv_security_group_and_attach_to_server_args)
+create_resenv_security_group_and_attach_to_server_args.thrift_spec = (
     None,  # 0
     (
         1,
-        TType.I64,
-        "backend_id",
-        None,
+        TType.STRING,
+        "server_id",
+        "UTF8",
         None,
     ),  # 1
     (
         2,
         TType.STRING,
-        "user_id",
+        "resenv_template",
         "UTF8",
         None,
     ),  # 2
 )
 
 
-class add_user_to_backend_result(object):
+class create_resenv_security_group_and_attach_to_server_result(object):
     """
     Attributes:
-     - success
+     - e
 
     """
 
     def __init__(
         self,
-        success=None,
+        e=None,
     ):
-        self.success = success
+        self.e = e
 
     def read(self, iprot):
         if (
@@ -14283,23 +18321,9 @@ class add_user_to_backend_result(object):
             (fname, ftype, fid) = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 0:
-                if ftype == TType.MAP:
-                    self.success = {}
-                    (_ktype383, _vtype384, _size382) = iprot.readMapBegin()
-                    for _i386 in range(_size382):
-                        _key387 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        _val388 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        self.success[_key387] = _val388
-                    iprot.readMapEnd()
+            if fid == 1:
+                if ftype == TType.STRUCT:
+                    self.e = serverNotFoundException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -14313,18 +18337,12 @@ class add_user_to_backend_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("add_user_to_backend_result")
-        if self.success is not None:
-            oprot.writeFieldBegin("success", TType.MAP, 0)
-            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.success))
-            for kiter389, viter390 in self.success.items():
-                oprot.writeString(
-                    kiter389.encode("utf-8") if sys.version_info[0] == 2 else kiter389
-                )
-                oprot.writeString(
-                    viter390.encode("utf-8") if sys.version_info[0] == 2 else viter390
-                )
-            oprot.writeMapEnd()
+        oprot.writeStructBegin(
+            "create_resenv_security_group_and_attach_to_server_result"
+        )
+        if self.e is not None:
+            oprot.writeFieldBegin("e", TType.STRUCT, 1)
+            self.e.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -14343,30 +18361,67 @@ class add_user_to_backend_result(object):
         return not (self == other)
 
 
-all_structs.append(add_user_to_backend_result)
-add_user_to_backend_result.thrift_spec = (
+all_structs.append(create_resenv_security_group_and_attach_to_server_result)
+create_resenv_security_group_and_attach_to_server_result.thrift_spec = (
+    None,  # 0
     (
-        0,
-        TType.MAP,
-        "success",
-        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
+        1,
+        TType.STRUCT,
+        "e",
+        [serverNotFoundException, None],
         None,
-    ),  # 0
+    ),  # 1
 )
 
 
-class get_users_from_backend_args(object):
+class add_cluster_machine_args(object):
     """
     Attributes:
-     - backend_id
+     - cluster_id
+     - cluster_user
+     - cluster_group_id
+     - image
+     - flavor
+     - name
+     - key_name
+     - batch_idx
+     - worker_idx
+     - pub_key
+     - project_name
+     - project_id
+     - slurm_version
 
     """
 
     def __init__(
         self,
-        backend_id=None,
+        cluster_id=None,
+        cluster_user=None,
+        cluster_group_id=None,
+        image=None,
+        flavor=None,
+        name=None,
+        key_name=None,
+        batch_idx=None,
+        worker_idx=None,
+        pub_key=None,
+        project_name=None,
+        project_id=None,
+        slurm_version=None,
     ):
-        self.backend_id = backend_id
+        self.cluster_id = cluster_id
+        self.cluster_user = cluster_user
+        self.cluster_group_id = cluster_group_id
+        self.image = image
+        self.flavor = flavor
+        self.name = name
+        self.key_name = key_name
+        self.batch_idx = batch_idx
+        self.worker_idx = worker_idx
+        self.pub_key = pub_key
+        self.project_name = project_name
+        self.project_id = project_id
+        self.slurm_version = slurm_version
 
     def read(self, iprot):
         if (
@@ -14382,8 +18437,112 @@ class get_users_from_backend_args(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.I64:
-                    self.backend_id = iprot.readI64()
+                if ftype == TType.STRING:
+                    self.cluster_id = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.cluster_user = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.STRING:
+                    self.cluster_group_id = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.STRING:
+                    self.image = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 5:
+                if ftype == TType.STRING:
+                    self.flavor = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 6:
+                if ftype == TType.STRING:
+                    self.name = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 7:
+                if ftype == TType.STRING:
+                    self.key_name = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 8:
+                if ftype == TType.I32:
+                    self.batch_idx = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 9:
+                if ftype == TType.I32:
+                    self.worker_idx = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 10:
+                if ftype == TType.STRING:
+                    self.pub_key = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 11:
+                if ftype == TType.STRING:
+                    self.project_name = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 12:
+                if ftype == TType.STRING:
+                    self.project_id = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 13:
+                if ftype == TType.STRING:
+                    self.slurm_version = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
                 else:
                     iprot.skip(ftype)
             else:
@@ -14397,10 +18556,96 @@ class get_users_from_backend_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_users_from_backend_args")
-        if self.backend_id is not None:
-            oprot.writeFieldBegin("backend_id", TType.I64, 1)
-            oprot.writeI64(self.backend_id)
+        oprot.writeStructBegin("add_cluster_machine_args")
+        if self.cluster_id is not None:
+            oprot.writeFieldBegin("cluster_id", TType.STRING, 1)
+            oprot.writeString(
+                self.cluster_id.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.cluster_id
+            )
+            oprot.writeFieldEnd()
+        if self.cluster_user is not None:
+            oprot.writeFieldBegin("cluster_user", TType.STRING, 2)
+            oprot.writeString(
+                self.cluster_user.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.cluster_user
+            )
+            oprot.writeFieldEnd()
+        if self.cluster_group_id is not None:
+            oprot.writeFieldBegin("cluster_group_id", TType.STRING, 3)
+            oprot.writeString(
+                self.cluster_group_id.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.cluster_group_id
+            )
+            oprot.writeFieldEnd()
+        if self.image is not None:
+            oprot.writeFieldBegin("image", TType.STRING, 4)
+            oprot.writeString(
+                self.image.encode("utf-8") if sys.version_info[0] == 2 else self.image
+            )
+            oprot.writeFieldEnd()
+        if self.flavor is not None:
+            oprot.writeFieldBegin("flavor", TType.STRING, 5)
+            oprot.writeString(
+                self.flavor.encode("utf-8") if sys.version_info[0] == 2 else self.flavor
+            )
+            oprot.writeFieldEnd()
+        if self.name is not None:
+            oprot.writeFieldBegin("name", TType.STRING, 6)
+            oprot.writeString(
+                self.name.encode("utf-8") if sys.version_info[0] == 2 else self.name
+            )
+            oprot.writeFieldEnd()
+        if self.key_name is not None:
+            oprot.writeFieldBegin("key_name", TType.STRING, 7)
+            oprot.writeString(
+                self.key_name.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.key_name
+            )
+            oprot.writeFieldEnd()
+        if self.batch_idx is not None:
+            oprot.writeFieldBegin("batch_idx", TType.I32, 8)
+            oprot.writeI32(self.batch_idx)
+            oprot.writeFieldEnd()
+        if self.worker_idx is not None:
+            oprot.writeFieldBegin("worker_idx", TType.I32, 9)
+            oprot.writeI32(self.worker_idx)
+            oprot.writeFieldEnd()
+        if self.pub_key is not None:
+            oprot.writeFieldBegin("pub_key", TType.STRING, 10)
+            oprot.writeString(
+                self.pub_key.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.pub_key
+            )
+            oprot.writeFieldEnd()
+        if self.project_name is not None:
+            oprot.writeFieldBegin("project_name", TType.STRING, 11)
+            oprot.writeString(
+                self.project_name.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.project_name
+            )
+            oprot.writeFieldEnd()
+        if self.project_id is not None:
+            oprot.writeFieldBegin("project_id", TType.STRING, 12)
+            oprot.writeString(
+                self.project_id.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.project_id
+            )
+            oprot.writeFieldEnd()
+        if self.slurm_version is not None:
+            oprot.writeFieldBegin("slurm_version", TType.STRING, 13)
+            oprot.writeString(
+                self.slurm_version.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.slurm_version
+            )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -14419,20 +18664,104 @@ class get_users_from_backend_args(object):
         return not (self == other)
 
 
-all_structs.append(get_users_from_backend_args)
-get_users_from_backend_args.thrift_spec = (
+all_structs.append(add_cluster_machine_args)
+add_cluster_machine_args.thrift_spec = (
     None,  # 0
     (
         1,
-        TType.I64,
-        "backend_id",
-        None,
+        TType.STRING,
+        "cluster_id",
+        "UTF8",
         None,
     ),  # 1
+    (
+        2,
+        TType.STRING,
+        "cluster_user",
+        "UTF8",
+        None,
+    ),  # 2
+    (
+        3,
+        TType.STRING,
+        "cluster_group_id",
+        "UTF8",
+        None,
+    ),  # 3
+    (
+        4,
+        TType.STRING,
+        "image",
+        "UTF8",
+        None,
+    ),  # 4
+    (
+        5,
+        TType.STRING,
+        "flavor",
+        "UTF8",
+        None,
+    ),  # 5
+    (
+        6,
+        TType.STRING,
+        "name",
+        "UTF8",
+        None,
+    ),  # 6
+    (
+        7,
+        TType.STRING,
+        "key_name",
+        "UTF8",
+        None,
+    ),  # 7
+    (
+        8,
+        TType.I32,
+        "batch_idx",
+        None,
+        None,
+    ),  # 8
+    (
+        9,
+        TType.I32,
+        "worker_idx",
+        None,
+        None,
+    ),  # 9
+    (
+        10,
+        TType.STRING,
+        "pub_key",
+        "UTF8",
+        None,
+    ),  # 10
+    (
+        11,
+        TType.STRING,
+        "project_name",
+        "UTF8",
+        None,
+    ),  # 11
+    (
+        12,
+        TType.STRING,
+        "project_id",
+        "UTF8",
+        None,
+    ),  # 12
+    (
+        13,
+        TType.STRING,
+        "slurm_version",
+        "UTF8",
+        None,
+    ),  # 13
 )
 
 
-class get_users_from_backend_result(object):
+class add_cluster_machine_result(object):
     """
     Attributes:
      - success
@@ -14459,17 +18788,12 @@ class get_users_from_backend_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.LIST:
-                    self.success = []
-                    (_etype394, _size391) = iprot.readListBegin()
-                    for _i395 in range(_size391):
-                        _elem396 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        self.success.append(_elem396)
-                    iprot.readListEnd()
+                if ftype == TType.STRING:
+                    self.success = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
                 else:
                     iprot.skip(ftype)
             else:
@@ -14482,16 +18806,15 @@ class get_users_from_backend_result(object):
             oprot.trans.write(
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
-            return
-        oprot.writeStructBegin("get_users_from_backend_result")
-        if self.success is not None:
-            oprot.writeFieldBegin("success", TType.LIST, 0)
-            oprot.writeListBegin(TType.STRING, len(self.success))
-            for iter397 in self.success:
-                oprot.writeString(
-                    iter397.encode("utf-8") if sys.version_info[0] == 2 else iter397
-                )
-            oprot.writeListEnd()
+            return
+        oprot.writeStructBegin("add_cluster_machine_result")
+        if self.success is not None:
+            oprot.writeFieldBegin("success", TType.STRING, 0)
+            oprot.writeString(
+                self.success.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.success
+            )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -14510,33 +18833,30 @@ class get_users_from_backend_result(object):
         return not (self == other)
 
 
-all_structs.append(get_users_from_backend_result)
-get_users_from_backend_result.thrift_spec = (
+all_structs.append(add_cluster_machine_result)
+add_cluster_machine_result.thrift_spec = (
     (
         0,
-        TType.LIST,
+        TType.STRING,
         "success",
-        (TType.STRING, "UTF8", False),
+        "UTF8",
         None,
     ),  # 0
 )
 
 
-class delete_user_from_backend_args(object):
+class get_cluster_info_args(object):
     """
     Attributes:
-     - backend_id
-     - user_id
+     - cluster_id
 
     """
 
     def __init__(
         self,
-        backend_id=None,
-        user_id=None,
+        cluster_id=None,
     ):
-        self.backend_id = backend_id
-        self.user_id = user_id
+        self.cluster_id = cluster_id
 
     def read(self, iprot):
         if (
@@ -14552,13 +18872,8 @@ class delete_user_from_backend_args(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.I64:
-                    self.backend_id = iprot.readI64()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 2:
                 if ftype == TType.STRING:
-                    self.user_id = (
+                    self.cluster_id = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
@@ -14576,17 +18891,13 @@ class delete_user_from_backend_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("delete_user_from_backend_args")
-        if self.backend_id is not None:
-            oprot.writeFieldBegin("backend_id", TType.I64, 1)
-            oprot.writeI64(self.backend_id)
-            oprot.writeFieldEnd()
-        if self.user_id is not None:
-            oprot.writeFieldBegin("user_id", TType.STRING, 2)
+        oprot.writeStructBegin("get_cluster_info_args")
+        if self.cluster_id is not None:
+            oprot.writeFieldBegin("cluster_id", TType.STRING, 1)
             oprot.writeString(
-                self.user_id.encode("utf-8")
+                self.cluster_id.encode("utf-8")
                 if sys.version_info[0] == 2
-                else self.user_id
+                else self.cluster_id
             )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
@@ -14606,27 +18917,20 @@ class delete_user_from_backend_args(object):
         return not (self == other)
 
 
-all_structs.append(delete_user_from_backend_args)
-delete_user_from_backend_args.thrift_spec = (
+all_structs.append(get_cluster_info_args)
+get_cluster_info_args.thrift_spec = (
     None,  # 0
     (
         1,
-        TType.I64,
-        "backend_id",
-        None,
-        None,
-    ),  # 1
-    (
-        2,
         TType.STRING,
-        "user_id",
+        "cluster_id",
         "UTF8",
         None,
-    ),  # 2
+    ),  # 1
 )
 
 
-class delete_user_from_backend_result(object):
+class get_cluster_info_result(object):
     """
     Attributes:
      - success
@@ -14653,22 +18957,9 @@ class delete_user_from_backend_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.MAP:
-                    self.success = {}
-                    (_ktype399, _vtype400, _size398) = iprot.readMapBegin()
-                    for _i402 in range(_size398):
-                        _key403 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        _val404 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        self.success[_key403] = _val404
-                    iprot.readMapEnd()
+                if ftype == TType.STRUCT:
+                    self.success = ClusterInfo()
+                    self.success.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -14682,18 +18973,10 @@ class delete_user_from_backend_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("delete_user_from_backend_result")
+        oprot.writeStructBegin("get_cluster_info_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.MAP, 0)
-            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.success))
-            for kiter405, viter406 in self.success.items():
-                oprot.writeString(
-                    kiter405.encode("utf-8") if sys.version_info[0] == 2 else kiter405
-                )
-                oprot.writeString(
-                    viter406.encode("utf-8") if sys.version_info[0] == 2 else viter406
-                )
-            oprot.writeMapEnd()
+            oprot.writeFieldBegin("success", TType.STRUCT, 0)
+            self.success.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -14712,19 +18995,31 @@ class delete_user_from_backend_result(object):
         return not (self == other)
 
 
-all_structs.append(delete_user_from_backend_result)
-delete_user_from_backend_result.thrift_spec = (
+all_structs.append(get_cluster_info_result)
+get_cluster_info_result.thrift_spec = (
     (
         0,
-        TType.MAP,
+        TType.STRUCT,
         "success",
-        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
+        [ClusterInfo, None],
         None,
     ),  # 0
 )
 
 
-class get_templates_args(object):
+class get_cluster_status_args(object):
+    """
+    Attributes:
+     - cluster_id
+
+    """
+
+    def __init__(
+        self,
+        cluster_id=None,
+    ):
+        self.cluster_id = cluster_id
+
     def read(self, iprot):
         if (
             iprot._fast_decode is not None
@@ -14738,6 +19033,15 @@ class get_templates_args(object):
             (fname, ftype, fid) = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.cluster_id = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -14749,7 +19053,15 @@ class get_templates_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_templates_args")
+        oprot.writeStructBegin("get_cluster_status_args")
+        if self.cluster_id is not None:
+            oprot.writeFieldBegin("cluster_id", TType.STRING, 1)
+            oprot.writeString(
+                self.cluster_id.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.cluster_id
+            )
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -14767,11 +19079,20 @@ class get_templates_args(object):
         return not (self == other)
 
 
-all_structs.append(get_templates_args)
-get_templates_args.thrift_spec = ()
+all_structs.append(get_cluster_status_args)
+get_cluster_status_args.thrift_spec = (
+    None,  # 0
+    (
+        1,
+        TType.STRING,
+        "cluster_id",
+        "UTF8",
+        None,
+    ),  # 1
+)
 
 
-class get_templates_result(object):
+class get_cluster_status_result(object):
     """
     Attributes:
      - success
@@ -14798,27 +19119,22 @@ class get_templates_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.LIST:
-                    self.success = []
-                    (_etype410, _size407) = iprot.readListBegin()
-                    for _i411 in range(_size407):
-                        _elem412 = {}
-                        (_ktype414, _vtype415, _size413) = iprot.readMapBegin()
-                        for _i417 in range(_size413):
-                            _key418 = (
-                                iprot.readString().decode("utf-8", errors="replace")
-                                if sys.version_info[0] == 2
-                                else iprot.readString()
-                            )
-                            _val419 = (
-                                iprot.readString().decode("utf-8", errors="replace")
-                                if sys.version_info[0] == 2
-                                else iprot.readString()
-                            )
-                            _elem412[_key418] = _val419
-                        iprot.readMapEnd()
-                        self.success.append(_elem412)
-                    iprot.readListEnd()
+                if ftype == TType.MAP:
+                    self.success = {}
+                    (_ktype500, _vtype501, _size499) = iprot.readMapBegin()
+                    for _i503 in range(_size499):
+                        _key504 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        _val505 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.success[_key504] = _val505
+                    iprot.readMapEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -14832,25 +19148,18 @@ class get_templates_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_templates_result")
+        oprot.writeStructBegin("get_cluster_status_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.LIST, 0)
-            oprot.writeListBegin(TType.MAP, len(self.success))
-            for iter420 in self.success:
-                oprot.writeMapBegin(TType.STRING, TType.STRING, len(iter420))
-                for kiter421, viter422 in iter420.items():
-                    oprot.writeString(
-                        kiter421.encode("utf-8")
-                        if sys.version_info[0] == 2
-                        else kiter421
-                    )
-                    oprot.writeString(
-                        viter422.encode("utf-8")
-                        if sys.version_info[0] == 2
-                        else viter422
-                    )
-                oprot.writeMapEnd()
-            oprot.writeListEnd()
+            oprot.writeFieldBegin("success", TType.MAP, 0)
+            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.success))
+            for kiter506, viter507 in self.success.items():
+                oprot.writeString(
+                    kiter506.encode("utf-8") if sys.version_info[0] == 2 else kiter506
+                )
+                oprot.writeString(
+                    viter507.encode("utf-8") if sys.version_info[0] == 2 else viter507
+                )
+            oprot.writeMapEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -14869,19 +19178,31 @@ class get_templates_result(object):
         return not (self == other)
 
 
-all_structs.append(get_templates_result)
-get_templates_result.thrift_spec = (
+all_structs.append(get_cluster_status_result)
+get_cluster_status_result.thrift_spec = (
     (
         0,
-        TType.LIST,
+        TType.MAP,
         "success",
-        (TType.MAP, (TType.STRING, "UTF8", TType.STRING, "UTF8", False), False),
+        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
         None,
     ),  # 0
 )
 
 
-class get_allowed_templates_args(object):
+class get_server_args(object):
+    """
+    Attributes:
+     - openstack_id: Id of the server.
+
+    """
+
+    def __init__(
+        self,
+        openstack_id=None,
+    ):
+        self.openstack_id = openstack_id
+
     def read(self, iprot):
         if (
             iprot._fast_decode is not None
@@ -14895,6 +19216,15 @@ class get_allowed_templates_args(object):
             (fname, ftype, fid) = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.openstack_id = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -14905,8 +19235,16 @@ class get_allowed_templates_args(object):
             oprot.trans.write(
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
-            return
-        oprot.writeStructBegin("get_allowed_templates_args")
+            return
+        oprot.writeStructBegin("get_server_args")
+        if self.openstack_id is not None:
+            oprot.writeFieldBegin("openstack_id", TType.STRING, 1)
+            oprot.writeString(
+                self.openstack_id.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.openstack_id
+            )
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -14924,22 +19262,34 @@ class get_allowed_templates_args(object):
         return not (self == other)
 
 
-all_structs.append(get_allowed_templates_args)
-get_allowed_templates_args.thrift_spec = ()
+all_structs.append(get_server_args)
+get_server_args.thrift_spec = (
+    None,  # 0
+    (
+        1,
+        TType.STRING,
+        "openstack_id",
+        "UTF8",
+        None,
+    ),  # 1
+)
 
 
-class get_allowed_templates_result(object):
+class get_server_result(object):
     """
     Attributes:
      - success
+     - e
 
     """
 
     def __init__(
         self,
         success=None,
+        e=None,
     ):
         self.success = success
+        self.e = e
 
     def read(self, iprot):
         if (
@@ -14955,17 +19305,14 @@ class get_allowed_templates_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.LIST:
-                    self.success = []
-                    (_etype426, _size423) = iprot.readListBegin()
-                    for _i427 in range(_size423):
-                        _elem428 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        self.success.append(_elem428)
-                    iprot.readListEnd()
+                if ftype == TType.STRUCT:
+                    self.success = VM()
+                    self.success.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 1:
+                if ftype == TType.STRUCT:
+                    self.e = serverNotFoundException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -14979,15 +19326,14 @@ class get_allowed_templates_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_allowed_templates_result")
+        oprot.writeStructBegin("get_server_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.LIST, 0)
-            oprot.writeListBegin(TType.STRING, len(self.success))
-            for iter429 in self.success:
-                oprot.writeString(
-                    iter429.encode("utf-8") if sys.version_info[0] == 2 else iter429
-                )
-            oprot.writeListEnd()
+            oprot.writeFieldBegin("success", TType.STRUCT, 0)
+            self.success.write(oprot)
+            oprot.writeFieldEnd()
+        if self.e is not None:
+            oprot.writeFieldBegin("e", TType.STRUCT, 1)
+            self.e.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -15006,30 +19352,37 @@ class get_allowed_templates_result(object):
         return not (self == other)
 
 
-all_structs.append(get_allowed_templates_result)
-get_allowed_templates_result.thrift_spec = (
+all_structs.append(get_server_result)
+get_server_result.thrift_spec = (
     (
         0,
-        TType.LIST,
+        TType.STRUCT,
         "success",
-        (TType.STRING, "UTF8", False),
+        [VM, None],
         None,
     ),  # 0
+    (
+        1,
+        TType.STRUCT,
+        "e",
+        [serverNotFoundException, None],
+        None,
+    ),  # 1
 )
 
 
-class get_templates_by_template_args(object):
+class stop_server_args(object):
     """
     Attributes:
-     - template_name
+     - openstack_id: Id of the server.
 
     """
 
     def __init__(
         self,
-        template_name=None,
+        openstack_id=None,
     ):
-        self.template_name = template_name
+        self.openstack_id = openstack_id
 
     def read(self, iprot):
         if (
@@ -15046,7 +19399,7 @@ class get_templates_by_template_args(object):
                 break
             if fid == 1:
                 if ftype == TType.STRING:
-                    self.template_name = (
+                    self.openstack_id = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
@@ -15064,13 +19417,13 @@ class get_templates_by_template_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_templates_by_template_args")
-        if self.template_name is not None:
-            oprot.writeFieldBegin("template_name", TType.STRING, 1)
+        oprot.writeStructBegin("stop_server_args")
+        if self.openstack_id is not None:
+            oprot.writeFieldBegin("openstack_id", TType.STRING, 1)
             oprot.writeString(
-                self.template_name.encode("utf-8")
+                self.openstack_id.encode("utf-8")
                 if sys.version_info[0] == 2
-                else self.template_name
+                else self.openstack_id
             )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
@@ -15090,31 +19443,37 @@ class get_templates_by_template_args(object):
         return not (self == other)
 
 
-all_structs.append(get_templates_by_template_args)
-get_templates_by_template_args.thrift_spec = (
+all_structs.append(stop_server_args)
+stop_server_args.thrift_spec = (
     None,  # 0
     (
         1,
         TType.STRING,
-        "template_name",
+        "openstack_id",
         "UTF8",
         None,
     ),  # 1
 )
 
 
-class get_templates_by_template_result(object):
+class stop_server_result(object):
     """
     Attributes:
      - success
+     - e
+     - c
 
     """
 
     def __init__(
         self,
         success=None,
+        e=None,
+        c=None,
     ):
         self.success = success
+        self.e = e
+        self.c = c
 
     def read(self, iprot):
         if (
@@ -15130,27 +19489,18 @@ class get_templates_by_template_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.LIST:
-                    self.success = []
-                    (_etype433, _size430) = iprot.readListBegin()
-                    for _i434 in range(_size430):
-                        _elem435 = {}
-                        (_ktype437, _vtype438, _size436) = iprot.readMapBegin()
-                        for _i440 in range(_size436):
-                            _key441 = (
-                                iprot.readString().decode("utf-8", errors="replace")
-                                if sys.version_info[0] == 2
-                                else iprot.readString()
-                            )
-                            _val442 = (
-                                iprot.readString().decode("utf-8", errors="replace")
-                                if sys.version_info[0] == 2
-                                else iprot.readString()
-                            )
-                            _elem435[_key441] = _val442
-                        iprot.readMapEnd()
-                        self.success.append(_elem435)
-                    iprot.readListEnd()
+                if ftype == TType.BOOL:
+                    self.success = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 1:
+                if ftype == TType.STRUCT:
+                    self.e = serverNotFoundException.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRUCT:
+                    self.c = conflictException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -15164,25 +19514,18 @@ class get_templates_by_template_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_templates_by_template_result")
+        oprot.writeStructBegin("stop_server_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.LIST, 0)
-            oprot.writeListBegin(TType.MAP, len(self.success))
-            for iter443 in self.success:
-                oprot.writeMapBegin(TType.STRING, TType.STRING, len(iter443))
-                for kiter444, viter445 in iter443.items():
-                    oprot.writeString(
-                        kiter444.encode("utf-8")
-                        if sys.version_info[0] == 2
-                        else kiter444
-                    )
-                    oprot.writeString(
-                        viter445.encode("utf-8")
-                        if sys.version_info[0] == 2
-                        else viter445
-                    )
-                oprot.writeMapEnd()
-            oprot.writeListEnd()
+            oprot.writeFieldBegin("success", TType.BOOL, 0)
+            oprot.writeBool(self.success)
+            oprot.writeFieldEnd()
+        if self.e is not None:
+            oprot.writeFieldBegin("e", TType.STRUCT, 1)
+            self.e.write(oprot)
+            oprot.writeFieldEnd()
+        if self.c is not None:
+            oprot.writeFieldBegin("c", TType.STRUCT, 2)
+            self.c.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -15201,33 +19544,56 @@ class get_templates_by_template_result(object):
         return not (self == other)
 
 
-all_structs.append(get_templates_by_template_result)
-get_templates_by_template_result.thrift_spec = (
+all_structs.append(stop_server_result)
+stop_server_result.thrift_spec = (
     (
         0,
-        TType.LIST,
+        TType.BOOL,
         "success",
-        (TType.MAP, (TType.STRING, "UTF8", TType.STRING, "UTF8", False), False),
+        None,
         None,
     ),  # 0
+    (
+        1,
+        TType.STRUCT,
+        "e",
+        [serverNotFoundException, None],
+        None,
+    ),  # 1
+    (
+        2,
+        TType.STRUCT,
+        "c",
+        [conflictException, None],
+        None,
+    ),  # 2
 )
 
 
-class check_template_args(object):
+class create_snapshot_args(object):
     """
     Attributes:
-     - template_name
-     - template_version
+     - openstack_id: Id of the server
+     - name: Name of new Snapshot
+     - elixir_id: Elixir-Id of the user who requested creation of Snapshot
+     - base_tags: Tags with which the servers image is also tagged ( for connection information at the webapp)
+     - description: Description of the new snapshot
 
     """
 
     def __init__(
         self,
-        template_name=None,
-        template_version=None,
+        openstack_id=None,
+        name=None,
+        elixir_id=None,
+        base_tags=None,
+        description=None,
     ):
-        self.template_name = template_name
-        self.template_version = template_version
+        self.openstack_id = openstack_id
+        self.name = name
+        self.elixir_id = elixir_id
+        self.base_tags = base_tags
+        self.description = description
 
     def read(self, iprot):
         if (
@@ -15244,7 +19610,7 @@ class check_template_args(object):
                 break
             if fid == 1:
                 if ftype == TType.STRING:
-                    self.template_name = (
+                    self.openstack_id = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
@@ -15253,7 +19619,39 @@ class check_template_args(object):
                     iprot.skip(ftype)
             elif fid == 2:
                 if ftype == TType.STRING:
-                    self.template_version = (
+                    self.name = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.STRING:
+                    self.elixir_id = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.LIST:
+                    self.base_tags = []
+                    (_etype511, _size508) = iprot.readListBegin()
+                    for _i512 in range(_size508):
+                        _elem513 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.base_tags.append(_elem513)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 5:
+                if ftype == TType.STRING:
+                    self.description = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
@@ -15270,22 +19668,45 @@ class check_template_args(object):
             oprot.trans.write(
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
-            return
-        oprot.writeStructBegin("check_template_args")
-        if self.template_name is not None:
-            oprot.writeFieldBegin("template_name", TType.STRING, 1)
+            return
+        oprot.writeStructBegin("create_snapshot_args")
+        if self.openstack_id is not None:
+            oprot.writeFieldBegin("openstack_id", TType.STRING, 1)
+            oprot.writeString(
+                self.openstack_id.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.openstack_id
+            )
+            oprot.writeFieldEnd()
+        if self.name is not None:
+            oprot.writeFieldBegin("name", TType.STRING, 2)
             oprot.writeString(
-                self.template_name.encode("utf-8")
+                self.name.encode("utf-8") if sys.version_info[0] == 2 else self.name
+            )
+            oprot.writeFieldEnd()
+        if self.elixir_id is not None:
+            oprot.writeFieldBegin("elixir_id", TType.STRING, 3)
+            oprot.writeString(
+                self.elixir_id.encode("utf-8")
                 if sys.version_info[0] == 2
-                else self.template_name
+                else self.elixir_id
             )
             oprot.writeFieldEnd()
-        if self.template_version is not None:
-            oprot.writeFieldBegin("template_version", TType.STRING, 2)
+        if self.base_tags is not None:
+            oprot.writeFieldBegin("base_tags", TType.LIST, 4)
+            oprot.writeListBegin(TType.STRING, len(self.base_tags))
+            for iter514 in self.base_tags:
+                oprot.writeString(
+                    iter514.encode("utf-8") if sys.version_info[0] == 2 else iter514
+                )
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.description is not None:
+            oprot.writeFieldBegin("description", TType.STRING, 5)
             oprot.writeString(
-                self.template_version.encode("utf-8")
+                self.description.encode("utf-8")
                 if sys.version_info[0] == 2
-                else self.template_version
+                else self.description
             )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
@@ -15305,38 +19726,65 @@ class check_template_args(object):
         return not (self == other)
 
 
-all_structs.append(check_template_args)
-check_template_args.thrift_spec = (
+all_structs.append(create_snapshot_args)
+create_snapshot_args.thrift_spec = (
     None,  # 0
     (
         1,
         TType.STRING,
-        "template_name",
+        "openstack_id",
         "UTF8",
         None,
     ),  # 1
     (
         2,
         TType.STRING,
-        "template_version",
+        "name",
         "UTF8",
         None,
     ),  # 2
+    (
+        3,
+        TType.STRING,
+        "elixir_id",
+        "UTF8",
+        None,
+    ),  # 3
+    (
+        4,
+        TType.LIST,
+        "base_tags",
+        (TType.STRING, "UTF8", False),
+        None,
+    ),  # 4
+    (
+        5,
+        TType.STRING,
+        "description",
+        "UTF8",
+        None,
+    ),  # 5
 )
 
 
-class check_template_result(object):
+class create_snapshot_result(object):
     """
     Attributes:
      - success
+     - e
+     - c
 
     """
 
     def __init__(
         self,
         success=None,
+        e=None,
+        c=None,
     ):
         self.success = success
+        self.e = e
+        self.c = c
 
     def read(self, iprot):
         if (
@@ -15352,22 +19800,22 @@ class check_template_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.MAP:
-                    self.success = {}
-                    (_ktype447, _vtype448, _size446) = iprot.readMapBegin()
-                    for _i450 in range(_size446):
-                        _key451 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        _val452 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        self.success[_key451] = _val452
-                    iprot.readMapEnd()
+                if ftype == TType.STRING:
+                    self.success = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 1:
+                if ftype == TType.STRUCT:
+                    self.e = serverNotFoundException.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRUCT:
+                    self.c = conflictException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -15381,18 +19829,22 @@ class check_template_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("check_template_result")
+        oprot.writeStructBegin("create_snapshot_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.MAP, 0)
-            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.success))
-            for kiter453, viter454 in self.success.items():
-                oprot.writeString(
-                    kiter453.encode("utf-8") if sys.version_info[0] == 2 else kiter453
-                )
-                oprot.writeString(
-                    viter454.encode("utf-8") if sys.version_info[0] == 2 else viter454
-                )
-            oprot.writeMapEnd()
+            oprot.writeFieldBegin("success", TType.STRING, 0)
+            oprot.writeString(
+                self.success.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.success
+            )
+            oprot.writeFieldEnd()
+        if self.e is not None:
+            oprot.writeFieldBegin("e", TType.STRUCT, 1)
+            self.e.write(oprot)
+            oprot.writeFieldEnd()
+        if self.c is not None:
+            oprot.writeFieldBegin("c", TType.STRUCT, 2)
+            self.c.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -15411,31 +19863,33 @@ class check_template_result(object):
         return not (self == other)
 
 
-all_structs.append(check_template_result)
-check_template_result.thrift_spec = (
+all_structs.append(create_snapshot_result)
+create_snapshot_result.thrift_spec = (
     (
         0,
-        TType.MAP,
+        TType.STRING,
         "success",
-        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
+        "UTF8",
         None,
     ),  # 0
+    (
+        1,
+        TType.STRUCT,
+        "e",
+        [serverNotFoundException, None],
+        None,
+    ),  # 1
+    (
+        2,
+        TType.STRUCT,
+        "c",
+        [conflictException, None],
+        None,
+    ),  # 2
 )
 
 
-class add_udp_security_group_args(object):
-    """
-    Attributes:
-     - server_id: OpenStack id of the server
-
-    """
-
-    def __init__(
-        self,
-        server_id=None,
-    ):
-        self.server_id = server_id
-
+class get_limits_args(object):
     def read(self, iprot):
         if (
             iprot._fast_decode is not None
@@ -15449,15 +19903,6 @@ class add_udp_security_group_args(object):
             (fname, ftype, fid) = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 1:
-                if ftype == TType.STRING:
-                    self.server_id = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -15469,15 +19914,7 @@ class add_udp_security_group_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("add_udp_security_group_args")
-        if self.server_id is not None:
-            oprot.writeFieldBegin("server_id", TType.STRING, 1)
-            oprot.writeString(
-                self.server_id.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.server_id
-            )
-            oprot.writeFieldEnd()
+        oprot.writeStructBegin("get_limits_args")
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -15495,37 +19932,22 @@ class add_udp_security_group_args(object):
         return not (self == other)
 
 
-all_structs.append(add_udp_security_group_args)
-add_udp_security_group_args.thrift_spec = (
-    None,  # 0
-    (
-        1,
-        TType.STRING,
-        "server_id",
-        "UTF8",
-        None,
-    ),  # 1
-)
+all_structs.append(get_limits_args)
+get_limits_args.thrift_spec = ()
 
 
-class add_udp_security_group_result(object):
+class get_limits_result(object):
     """
     Attributes:
      - success
-     - r
-     - s
 
     """
 
     def __init__(
         self,
         success=None,
-        r=None,
-        s=None,
     ):
         self.success = success
-        self.r = r
-        self.s = s
 
     def read(self, iprot):
         if (
@@ -15541,18 +19963,22 @@ class add_udp_security_group_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.BOOL:
-                    self.success = iprot.readBool()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 1:
-                if ftype == TType.STRUCT:
-                    self.r = ressourceException.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.STRUCT:
-                    self.s = serverNotFoundException.read(iprot)
+                if ftype == TType.MAP:
+                    self.success = {}
+                    (_ktype516, _vtype517, _size515) = iprot.readMapBegin()
+                    for _i519 in range(_size515):
+                        _key520 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        _val521 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.success[_key520] = _val521
+                    iprot.readMapEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -15561,23 +19987,23 @@ class add_udp_security_group_result(object):
         iprot.readStructEnd()
 
     def write(self, oprot):
-        if oprot._fast_encode is not None and self.thrift_spec is not None:
-            oprot.trans.write(
-                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
-            )
-            return
-        oprot.writeStructBegin("add_udp_security_group_result")
-        if self.success is not None:
-            oprot.writeFieldBegin("success", TType.BOOL, 0)
-            oprot.writeBool(self.success)
-            oprot.writeFieldEnd()
-        if self.r is not None:
-            oprot.writeFieldBegin("r", TType.STRUCT, 1)
-            self.r.write(oprot)
-            oprot.writeFieldEnd()
-        if self.s is not None:
-            oprot.writeFieldBegin("s", TType.STRUCT, 2)
-            self.s.write(oprot)
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
+            )
+            return
+        oprot.writeStructBegin("get_limits_result")
+        if self.success is not None:
+            oprot.writeFieldBegin("success", TType.MAP, 0)
+            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.success))
+            for kiter522, viter523 in self.success.items():
+                oprot.writeString(
+                    kiter522.encode("utf-8") if sys.version_info[0] == 2 else kiter522
+                )
+                oprot.writeString(
+                    viter523.encode("utf-8") if sys.version_info[0] == 2 else viter523
+                )
+            oprot.writeMapEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -15596,33 +20022,40 @@ class add_udp_security_group_result(object):
         return not (self == other)
 
 
-all_structs.append(add_udp_security_group_result)
-add_udp_security_group_result.thrift_spec = (
+all_structs.append(get_limits_result)
+get_limits_result.thrift_spec = (
     (
         0,
-        TType.BOOL,
+        TType.MAP,
         "success",
-        None,
+        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
         None,
     ),  # 0
-    (
-        1,
-        TType.STRUCT,
-        "r",
-        [ressourceException, None],
-        None,
-    ),  # 1
-    (
-        2,
-        TType.STRUCT,
-        "s",
-        [serverNotFoundException, None],
-        None,
-    ),  # 2
 )
 
 
-class get_servers_args(object):
+class start_cluster_args(object):
+    """
+    Attributes:
+     - public_keys
+     - master_instance
+     - worker_instance
+     - user
+
+    """
+
+    def __init__(
+        self,
+        public_keys=None,
+        master_instance=None,
+        worker_instance=None,
+        user=None,
+    ):
+        self.public_keys = public_keys
+        self.master_instance = master_instance
+        self.worker_instance = worker_instance
+        self.user = user
+
     def read(self, iprot):
         if (
             iprot._fast_decode is not None
@@ -15636,6 +20069,46 @@ class get_servers_args(object):
             (fname, ftype, fid) = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
+            if fid == 1:
+                if ftype == TType.LIST:
+                    self.public_keys = []
+                    (_etype527, _size524) = iprot.readListBegin()
+                    for _i528 in range(_size524):
+                        _elem529 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.public_keys.append(_elem529)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRUCT:
+                    self.master_instance = ClusterInstance()
+                    self.master_instance.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.LIST:
+                    self.worker_instance = []
+                    (_etype533, _size530) = iprot.readListBegin()
+                    for _i534 in range(_size530):
+                        _elem535 = ClusterInstance()
+                        _elem535.read(iprot)
+                        self.worker_instance.append(_elem535)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.STRING:
+                    self.user = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -15647,7 +20120,33 @@ class get_servers_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_servers_args")
+        oprot.writeStructBegin("start_cluster_args")
+        if self.public_keys is not None:
+            oprot.writeFieldBegin("public_keys", TType.LIST, 1)
+            oprot.writeListBegin(TType.STRING, len(self.public_keys))
+            for iter536 in self.public_keys:
+                oprot.writeString(
+                    iter536.encode("utf-8") if sys.version_info[0] == 2 else iter536
+                )
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.master_instance is not None:
+            oprot.writeFieldBegin("master_instance", TType.STRUCT, 2)
+            self.master_instance.write(oprot)
+            oprot.writeFieldEnd()
+        if self.worker_instance is not None:
+            oprot.writeFieldBegin("worker_instance", TType.LIST, 3)
+            oprot.writeListBegin(TType.STRUCT, len(self.worker_instance))
+            for iter537 in self.worker_instance:
+                iter537.write(oprot)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.user is not None:
+            oprot.writeFieldBegin("user", TType.STRING, 4)
+            oprot.writeString(
+                self.user.encode("utf-8") if sys.version_info[0] == 2 else self.user
+            )
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -15665,11 +20164,41 @@ class get_servers_args(object):
         return not (self == other)
 
 
-all_structs.append(get_servers_args)
-get_servers_args.thrift_spec = ()
+all_structs.append(start_cluster_args)
+start_cluster_args.thrift_spec = (
+    None,  # 0
+    (
+        1,
+        TType.LIST,
+        "public_keys",
+        (TType.STRING, "UTF8", False),
+        None,
+    ),  # 1
+    (
+        2,
+        TType.STRUCT,
+        "master_instance",
+        [ClusterInstance, None],
+        None,
+    ),  # 2
+    (
+        3,
+        TType.LIST,
+        "worker_instance",
+        (TType.STRUCT, [ClusterInstance, None], False),
+        None,
+    ),  # 3
+    (
+        4,
+        TType.STRING,
+        "user",
+        "UTF8",
+        None,
+    ),  # 4
+)
 
 
-class get_servers_result(object):
+class start_cluster_result(object):
     """
     Attributes:
      - success
@@ -15696,14 +20225,22 @@ class get_servers_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.LIST:
-                    self.success = []
-                    (_etype458, _size455) = iprot.readListBegin()
-                    for _i459 in range(_size455):
-                        _elem460 = VM()
-                        _elem460.read(iprot)
-                        self.success.append(_elem460)
-                    iprot.readListEnd()
+                if ftype == TType.MAP:
+                    self.success = {}
+                    (_ktype539, _vtype540, _size538) = iprot.readMapBegin()
+                    for _i542 in range(_size538):
+                        _key543 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        _val544 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.success[_key543] = _val544
+                    iprot.readMapEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -15717,13 +20254,18 @@ class get_servers_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_servers_result")
+        oprot.writeStructBegin("start_cluster_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.LIST, 0)
-            oprot.writeListBegin(TType.STRUCT, len(self.success))
-            for iter461 in self.success:
-                iter461.write(oprot)
-            oprot.writeListEnd()
+            oprot.writeFieldBegin("success", TType.MAP, 0)
+            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.success))
+            for kiter545, viter546 in self.success.items():
+                oprot.writeString(
+                    kiter545.encode("utf-8") if sys.version_info[0] == 2 else kiter545
+                )
+                oprot.writeString(
+                    viter546.encode("utf-8") if sys.version_info[0] == 2 else viter546
+                )
+            oprot.writeMapEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -15742,30 +20284,30 @@ class get_servers_result(object):
         return not (self == other)
 
 
-all_structs.append(get_servers_result)
-get_servers_result.thrift_spec = (
+all_structs.append(start_cluster_result)
+start_cluster_result.thrift_spec = (
     (
         0,
-        TType.LIST,
+        TType.MAP,
         "success",
-        (TType.STRUCT, [VM, None], False),
+        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
         None,
     ),  # 0
 )
 
 
-class get_server_openstack_ids_args(object):
+class terminate_cluster_args(object):
     """
     Attributes:
-     - filter_tag
+     - cluster_id
 
     """
 
     def __init__(
         self,
-        filter_tag=None,
+        cluster_id=None,
     ):
-        self.filter_tag = filter_tag
+        self.cluster_id = cluster_id
 
     def read(self, iprot):
         if (
@@ -15782,7 +20324,7 @@ class get_server_openstack_ids_args(object):
                 break
             if fid == 1:
                 if ftype == TType.STRING:
-                    self.filter_tag = (
+                    self.cluster_id = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
@@ -15800,13 +20342,13 @@ class get_server_openstack_ids_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_server_openstack_ids_args")
-        if self.filter_tag is not None:
-            oprot.writeFieldBegin("filter_tag", TType.STRING, 1)
+        oprot.writeStructBegin("terminate_cluster_args")
+        if self.cluster_id is not None:
+            oprot.writeFieldBegin("cluster_id", TType.STRING, 1)
             oprot.writeString(
-                self.filter_tag.encode("utf-8")
+                self.cluster_id.encode("utf-8")
                 if sys.version_info[0] == 2
-                else self.filter_tag
+                else self.cluster_id
             )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
@@ -15826,20 +20368,20 @@ class get_server_openstack_ids_args(object):
         return not (self == other)
 
 
-all_structs.append(get_server_openstack_ids_args)
-get_server_openstack_ids_args.thrift_spec = (
+all_structs.append(terminate_cluster_args)
+terminate_cluster_args.thrift_spec = (
     None,  # 0
     (
         1,
         TType.STRING,
-        "filter_tag",
+        "cluster_id",
         "UTF8",
         None,
     ),  # 1
 )
 
 
-class get_server_openstack_ids_result(object):
+class terminate_cluster_result(object):
     """
     Attributes:
      - success
@@ -15866,17 +20408,22 @@ class get_server_openstack_ids_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.LIST:
-                    self.success = []
-                    (_etype465, _size462) = iprot.readListBegin()
-                    for _i466 in range(_size462):
-                        _elem467 = (
+                if ftype == TType.MAP:
+                    self.success = {}
+                    (_ktype548, _vtype549, _size547) = iprot.readMapBegin()
+                    for _i551 in range(_size547):
+                        _key552 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        _val553 = (
                             iprot.readString().decode("utf-8", errors="replace")
                             if sys.version_info[0] == 2
                             else iprot.readString()
                         )
-                        self.success.append(_elem467)
-                    iprot.readListEnd()
+                        self.success[_key552] = _val553
+                    iprot.readMapEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -15890,15 +20437,18 @@ class get_server_openstack_ids_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_server_openstack_ids_result")
+        oprot.writeStructBegin("terminate_cluster_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.LIST, 0)
-            oprot.writeListBegin(TType.STRING, len(self.success))
-            for iter468 in self.success:
+            oprot.writeFieldBegin("success", TType.MAP, 0)
+            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.success))
+            for kiter554, viter555 in self.success.items():
                 oprot.writeString(
-                    iter468.encode("utf-8") if sys.version_info[0] == 2 else iter468
+                    kiter554.encode("utf-8") if sys.version_info[0] == 2 else kiter554
                 )
-            oprot.writeListEnd()
+                oprot.writeString(
+                    viter555.encode("utf-8") if sys.version_info[0] == 2 else viter555
+                )
+            oprot.writeMapEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -15917,30 +20467,30 @@ class get_server_openstack_ids_result(object):
         return not (self == other)
 
 
-all_structs.append(get_server_openstack_ids_result)
-get_server_openstack_ids_result.thrift_spec = (
+all_structs.append(terminate_cluster_result)
+terminate_cluster_result.thrift_spec = (
     (
         0,
-        TType.LIST,
+        TType.MAP,
         "success",
-        (TType.STRING, "UTF8", False),
+        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
         None,
     ),  # 0
 )
 
 
-class get_servers_by_ids_args(object):
+class delete_image_args(object):
     """
     Attributes:
-     - server_ids
+     - image_id: Id of image
 
     """
 
     def __init__(
         self,
-        server_ids=None,
+        image_id=None,
     ):
-        self.server_ids = server_ids
+        self.image_id = image_id
 
     def read(self, iprot):
         if (
@@ -15956,17 +20506,12 @@ class get_servers_by_ids_args(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.LIST:
-                    self.server_ids = []
-                    (_etype472, _size469) = iprot.readListBegin()
-                    for _i473 in range(_size469):
-                        _elem474 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        self.server_ids.append(_elem474)
-                    iprot.readListEnd()
+                if ftype == TType.STRING:
+                    self.image_id = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
                 else:
                     iprot.skip(ftype)
             else:
@@ -15980,15 +20525,14 @@ class get_servers_by_ids_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_servers_by_ids_args")
-        if self.server_ids is not None:
-            oprot.writeFieldBegin("server_ids", TType.LIST, 1)
-            oprot.writeListBegin(TType.STRING, len(self.server_ids))
-            for iter475 in self.server_ids:
-                oprot.writeString(
-                    iter475.encode("utf-8") if sys.version_info[0] == 2 else iter475
-                )
-            oprot.writeListEnd()
+        oprot.writeStructBegin("delete_image_args")
+        if self.image_id is not None:
+            oprot.writeFieldBegin("image_id", TType.STRING, 1)
+            oprot.writeString(
+                self.image_id.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.image_id
+            )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -16007,31 +20551,34 @@ class get_servers_by_ids_args(object):
         return not (self == other)
 
 
-all_structs.append(get_servers_by_ids_args)
-get_servers_by_ids_args.thrift_spec = (
+all_structs.append(delete_image_args)
+delete_image_args.thrift_spec = (
     None,  # 0
     (
         1,
-        TType.LIST,
-        "server_ids",
-        (TType.STRING, "UTF8", False),
+        TType.STRING,
+        "image_id",
+        "UTF8",
         None,
     ),  # 1
 )
 
 
-class get_servers_by_ids_result(object):
+class delete_image_result(object):
     """
     Attributes:
      - success
+     - e
 
     """
 
     def __init__(
         self,
         success=None,
+        e=None,
     ):
         self.success = success
+        self.e = e
 
     def read(self, iprot):
         if (
@@ -16047,14 +20594,13 @@ class get_servers_by_ids_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.LIST:
-                    self.success = []
-                    (_etype479, _size476) = iprot.readListBegin()
-                    for _i480 in range(_size476):
-                        _elem481 = VM()
-                        _elem481.read(iprot)
-                        self.success.append(_elem481)
-                    iprot.readListEnd()
+                if ftype == TType.BOOL:
+                    self.success = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 1:
+                if ftype == TType.STRUCT:
+                    self.e = imageNotFoundException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -16068,13 +20614,14 @@ class get_servers_by_ids_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_servers_by_ids_result")
+        oprot.writeStructBegin("delete_image_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.LIST, 0)
-            oprot.writeListBegin(TType.STRUCT, len(self.success))
-            for iter482 in self.success:
-                iter482.write(oprot)
-            oprot.writeListEnd()
+            oprot.writeFieldBegin("success", TType.BOOL, 0)
+            oprot.writeBool(self.success)
+            oprot.writeFieldEnd()
+        if self.e is not None:
+            oprot.writeFieldBegin("e", TType.STRUCT, 1)
+            self.e.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -16093,30 +20640,40 @@ class get_servers_by_ids_result(object):
         return not (self == other)
 
 
-all_structs.append(get_servers_by_ids_result)
-get_servers_by_ids_result.thrift_spec = (
+all_structs.append(delete_image_result)
+delete_image_result.thrift_spec = (
     (
         0,
-        TType.LIST,
+        TType.BOOL,
         "success",
-        (TType.STRUCT, [VM, None], False),
+        None,
         None,
     ),  # 0
+    (
+        1,
+        TType.STRUCT,
+        "e",
+        [imageNotFoundException, None],
+        None,
+    ),  # 1
 )
 
 
-class check_server_task_state_args(object):
+class delete_volume_attachment_args(object):
     """
     Attributes:
-     - openstack_id
+     - volume_id: Id of the attached volume
+     - server_id: Id of the server where the volume is attached
 
     """
 
     def __init__(
         self,
-        openstack_id=None,
+        volume_id=None,
+        server_id=None,
     ):
-        self.openstack_id = openstack_id
+        self.volume_id = volume_id
+        self.server_id = server_id
 
     def read(self, iprot):
         if (
@@ -16133,7 +20690,16 @@ class check_server_task_state_args(object):
                 break
             if fid == 1:
                 if ftype == TType.STRING:
-                    self.openstack_id = (
+                    self.volume_id = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.server_id = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
@@ -16151,13 +20717,21 @@ class check_server_task_state_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("check_server_task_state_args")
-        if self.openstack_id is not None:
-            oprot.writeFieldBegin("openstack_id", TType.STRING, 1)
+        oprot.writeStructBegin("delete_volume_attachment_args")
+        if self.volume_id is not None:
+            oprot.writeFieldBegin("volume_id", TType.STRING, 1)
             oprot.writeString(
-                self.openstack_id.encode("utf-8")
+                self.volume_id.encode("utf-8")
                 if sys.version_info[0] == 2
-                else self.openstack_id
+                else self.volume_id
+            )
+            oprot.writeFieldEnd()
+        if self.server_id is not None:
+            oprot.writeFieldBegin("server_id", TType.STRING, 2)
+            oprot.writeString(
+                self.server_id.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.server_id
             )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
@@ -16177,31 +20751,44 @@ class check_server_task_state_args(object):
         return not (self == other)
 
 
-all_structs.append(check_server_task_state_args)
-check_server_task_state_args.thrift_spec = (
+all_structs.append(delete_volume_attachment_args)
+delete_volume_attachment_args.thrift_spec = (
     None,  # 0
     (
         1,
         TType.STRING,
-        "openstack_id",
+        "volume_id",
         "UTF8",
         None,
     ),  # 1
+    (
+        2,
+        TType.STRING,
+        "server_id",
+        "UTF8",
+        None,
+    ),  # 2
 )
 
 
-class check_server_task_state_result(object):
+class delete_volume_attachment_result(object):
     """
     Attributes:
      - success
+     - e
+     - c
 
     """
 
     def __init__(
         self,
         success=None,
+        e=None,
+        c=None,
     ):
         self.success = success
+        self.e = e
+        self.c = c
 
     def read(self, iprot):
         if (
@@ -16217,12 +20804,18 @@ class check_server_task_state_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.STRING:
-                    self.success = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
+                if ftype == TType.BOOL:
+                    self.success = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 1:
+                if ftype == TType.STRUCT:
+                    self.e = serverNotFoundException.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRUCT:
+                    self.c = conflictException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -16236,14 +20829,18 @@ class check_server_task_state_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("check_server_task_state_result")
+        oprot.writeStructBegin("delete_volume_attachment_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.STRING, 0)
-            oprot.writeString(
-                self.success.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.success
-            )
+            oprot.writeFieldBegin("success", TType.BOOL, 0)
+            oprot.writeBool(self.success)
+            oprot.writeFieldEnd()
+        if self.e is not None:
+            oprot.writeFieldBegin("e", TType.STRUCT, 1)
+            self.e.write(oprot)
+            oprot.writeFieldEnd()
+        if self.c is not None:
+            oprot.writeFieldBegin("c", TType.STRUCT, 2)
+            self.c.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -16262,30 +20859,44 @@ class check_server_task_state_result(object):
         return not (self == other)
 
 
-all_structs.append(check_server_task_state_result)
-check_server_task_state_result.thrift_spec = (
+all_structs.append(delete_volume_attachment_result)
+delete_volume_attachment_result.thrift_spec = (
     (
         0,
-        TType.STRING,
+        TType.BOOL,
         "success",
-        "UTF8",
+        None,
         None,
     ),  # 0
+    (
+        1,
+        TType.STRUCT,
+        "e",
+        [serverNotFoundException, None],
+        None,
+    ),  # 1
+    (
+        2,
+        TType.STRUCT,
+        "c",
+        [conflictException, None],
+        None,
+    ),  # 2
 )
 
 
-class get_servers_by_bibigrid_id_args(object):
+class delete_volume_args(object):
     """
     Attributes:
-     - bibigrid_id
+     - volume_id
 
     """
 
     def __init__(
         self,
-        bibigrid_id=None,
+        volume_id=None,
     ):
-        self.bibigrid_id = bibigrid_id
+        self.volume_id = volume_id
 
     def read(self, iprot):
         if (
@@ -16302,7 +20913,7 @@ class get_servers_by_bibigrid_id_args(object):
                 break
             if fid == 1:
                 if ftype == TType.STRING:
-                    self.bibigrid_id = (
+                    self.volume_id = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
@@ -16320,13 +20931,13 @@ class get_servers_by_bibigrid_id_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_servers_by_bibigrid_id_args")
-        if self.bibigrid_id is not None:
-            oprot.writeFieldBegin("bibigrid_id", TType.STRING, 1)
+        oprot.writeStructBegin("delete_volume_args")
+        if self.volume_id is not None:
+            oprot.writeFieldBegin("volume_id", TType.STRING, 1)
             oprot.writeString(
-                self.bibigrid_id.encode("utf-8")
+                self.volume_id.encode("utf-8")
                 if sys.version_info[0] == 2
-                else self.bibigrid_id
+                else self.volume_id
             )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
@@ -16346,31 +20957,34 @@ class get_servers_by_bibigrid_id_args(object):
         return not (self == other)
 
 
-all_structs.append(get_servers_by_bibigrid_id_args)
-get_servers_by_bibigrid_id_args.thrift_spec = (
+all_structs.append(delete_volume_args)
+delete_volume_args.thrift_spec = (
     None,  # 0
     (
         1,
         TType.STRING,
-        "bibigrid_id",
+        "volume_id",
         "UTF8",
         None,
     ),  # 1
 )
 
 
-class get_servers_by_bibigrid_id_result(object):
+class delete_volume_result(object):
     """
     Attributes:
      - success
+     - c
 
     """
 
     def __init__(
         self,
         success=None,
+        c=None,
     ):
         self.success = success
+        self.c = c
 
     def read(self, iprot):
         if (
@@ -16386,14 +21000,13 @@ class get_servers_by_bibigrid_id_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.LIST:
-                    self.success = []
-                    (_etype486, _size483) = iprot.readListBegin()
-                    for _i487 in range(_size483):
-                        _elem488 = VM()
-                        _elem488.read(iprot)
-                        self.success.append(_elem488)
-                    iprot.readListEnd()
+                if ftype == TType.BOOL:
+                    self.success = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 1:
+                if ftype == TType.STRUCT:
+                    self.c = conflictException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -16407,13 +21020,14 @@ class get_servers_by_bibigrid_id_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_servers_by_bibigrid_id_result")
+        oprot.writeStructBegin("delete_volume_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.LIST, 0)
-            oprot.writeListBegin(TType.STRUCT, len(self.success))
-            for iter489 in self.success:
-                iter489.write(oprot)
-            oprot.writeListEnd()
+            oprot.writeFieldBegin("success", TType.BOOL, 0)
+            oprot.writeBool(self.success)
+            oprot.writeFieldEnd()
+        if self.c is not None:
+            oprot.writeFieldBegin("c", TType.STRUCT, 1)
+            self.c.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -16432,33 +21046,40 @@ class get_servers_by_bibigrid_id_result(object):
         return not (self == other)
 
 
-all_structs.append(get_servers_by_bibigrid_id_result)
-get_servers_by_bibigrid_id_result.thrift_spec = (
+all_structs.append(delete_volume_result)
+delete_volume_result.thrift_spec = (
     (
         0,
-        TType.LIST,
+        TType.BOOL,
         "success",
-        (TType.STRUCT, [VM, None], False),
+        None,
         None,
     ),  # 0
+    (
+        1,
+        TType.STRUCT,
+        "c",
+        [conflictException, None],
+        None,
+    ),  # 1
 )
 
 
-class add_server_metadata_args(object):
+class attach_volume_to_server_args(object):
     """
     Attributes:
-     - server_id
-     - metadata
+     - openstack_id: Id of server
+     - volume_id: Id of volume
 
     """
 
     def __init__(
         self,
-        server_id=None,
-        metadata=None,
+        openstack_id=None,
+        volume_id=None,
     ):
-        self.server_id = server_id
-        self.metadata = metadata
+        self.openstack_id = openstack_id
+        self.volume_id = volume_id
 
     def read(self, iprot):
         if (
@@ -16475,7 +21096,7 @@ class add_server_metadata_args(object):
                 break
             if fid == 1:
                 if ftype == TType.STRING:
-                    self.server_id = (
+                    self.openstack_id = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
@@ -16483,22 +21104,12 @@ class add_server_metadata_args(object):
                 else:
                     iprot.skip(ftype)
             elif fid == 2:
-                if ftype == TType.MAP:
-                    self.metadata = {}
-                    (_ktype491, _vtype492, _size490) = iprot.readMapBegin()
-                    for _i494 in range(_size490):
-                        _key495 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        _val496 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        self.metadata[_key495] = _val496
-                    iprot.readMapEnd()
+                if ftype == TType.STRING:
+                    self.volume_id = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
                 else:
                     iprot.skip(ftype)
             else:
@@ -16512,26 +21123,22 @@ class add_server_metadata_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("add_server_metadata_args")
-        if self.server_id is not None:
-            oprot.writeFieldBegin("server_id", TType.STRING, 1)
+        oprot.writeStructBegin("attach_volume_to_server_args")
+        if self.openstack_id is not None:
+            oprot.writeFieldBegin("openstack_id", TType.STRING, 1)
             oprot.writeString(
-                self.server_id.encode("utf-8")
+                self.openstack_id.encode("utf-8")
                 if sys.version_info[0] == 2
-                else self.server_id
+                else self.openstack_id
             )
             oprot.writeFieldEnd()
-        if self.metadata is not None:
-            oprot.writeFieldBegin("metadata", TType.MAP, 2)
-            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.metadata))
-            for kiter497, viter498 in self.metadata.items():
-                oprot.writeString(
-                    kiter497.encode("utf-8") if sys.version_info[0] == 2 else kiter497
-                )
-                oprot.writeString(
-                    viter498.encode("utf-8") if sys.version_info[0] == 2 else viter498
-                )
-            oprot.writeMapEnd()
+        if self.volume_id is not None:
+            oprot.writeFieldBegin("volume_id", TType.STRING, 2)
+            oprot.writeString(
+                self.volume_id.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.volume_id
+            )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -16550,38 +21157,44 @@ class add_server_metadata_args(object):
         return not (self == other)
 
 
-all_structs.append(add_server_metadata_args)
-add_server_metadata_args.thrift_spec = (
+all_structs.append(attach_volume_to_server_args)
+attach_volume_to_server_args.thrift_spec = (
     None,  # 0
     (
         1,
         TType.STRING,
-        "server_id",
+        "openstack_id",
         "UTF8",
         None,
     ),  # 1
     (
         2,
-        TType.MAP,
-        "metadata",
-        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
+        TType.STRING,
+        "volume_id",
+        "UTF8",
         None,
     ),  # 2
 )
 
 
-class add_server_metadata_result(object):
+class attach_volume_to_server_result(object):
     """
     Attributes:
+     - success
      - e
+     - c
 
     """
 
     def __init__(
         self,
+        success=None,
         e=None,
+        c=None,
     ):
+        self.success = success
         self.e = e
+        self.c = c
 
     def read(self, iprot):
         if (
@@ -16596,102 +21209,33 @@ class add_server_metadata_result(object):
             (fname, ftype, fid) = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 1:
-                if ftype == TType.STRUCT:
-                    self.e = serverNotFoundException.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            else:
-                iprot.skip(ftype)
-            iprot.readFieldEnd()
-        iprot.readStructEnd()
-
-    def write(self, oprot):
-        if oprot._fast_encode is not None and self.thrift_spec is not None:
-            oprot.trans.write(
-                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
-            )
-            return
-        oprot.writeStructBegin("add_server_metadata_result")
-        if self.e is not None:
-            oprot.writeFieldBegin("e", TType.STRUCT, 1)
-            self.e.write(oprot)
-            oprot.writeFieldEnd()
-        oprot.writeFieldStop()
-        oprot.writeStructEnd()
-
-    def validate(self):
-        return
-
-    def __repr__(self):
-        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
-        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
-
-    def __eq__(self, other):
-        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
-
-    def __ne__(self, other):
-        return not (self == other)
-
-
-all_structs.append(add_server_metadata_result)
-add_server_metadata_result.thrift_spec = (
-    None,  # 0
-    (
-        1,
-        TType.STRUCT,
-        "e",
-        [serverNotFoundException, None],
-        None,
-    ),  # 1
-)
-
-
-class create_resenv_security_group_and_attach_to_server_args(object):
-    """
-    Attributes:
-     - server_id
-     - resenv_template
-
-    """
-
-    def __init__(
-        self,
-        server_id=None,
-        resenv_template=None,
-    ):
-        self.server_id = server_id
-        self.resenv_template = resenv_template
-
-    def read(self, iprot):
-        if (
-            iprot._fast_decode is not None
-            and isinstance(iprot.trans, TTransport.CReadableTransport)
-            and self.thrift_spec is not None
-        ):
-            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
-            return
-        iprot.readStructBegin()
-        while True:
-            (fname, ftype, fid) = iprot.readFieldBegin()
-            if ftype == TType.STOP:
-                break
-            if fid == 1:
-                if ftype == TType.STRING:
-                    self.server_id = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
+            if fid == 0:
+                if ftype == TType.MAP:
+                    self.success = {}
+                    (_ktype557, _vtype558, _size556) = iprot.readMapBegin()
+                    for _i560 in range(_size556):
+                        _key561 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        _val562 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.success[_key561] = _val562
+                    iprot.readMapEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 1:
+                if ftype == TType.STRUCT:
+                    self.e = serverNotFoundException.read(iprot)
                 else:
                     iprot.skip(ftype)
             elif fid == 2:
-                if ftype == TType.STRING:
-                    self.resenv_template = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
+                if ftype == TType.STRUCT:
+                    self.c = conflictException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -16705,22 +21249,26 @@ class create_resenv_security_group_and_attach_to_server_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("create_resenv_security_group_and_attach_to_server_args")
-        if self.server_id is not None:
-            oprot.writeFieldBegin("server_id", TType.STRING, 1)
-            oprot.writeString(
-                self.server_id.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.server_id
-            )
+        oprot.writeStructBegin("attach_volume_to_server_result")
+        if self.success is not None:
+            oprot.writeFieldBegin("success", TType.MAP, 0)
+            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.success))
+            for kiter563, viter564 in self.success.items():
+                oprot.writeString(
+                    kiter563.encode("utf-8") if sys.version_info[0] == 2 else kiter563
+                )
+                oprot.writeString(
+                    viter564.encode("utf-8") if sys.version_info[0] == 2 else viter564
+                )
+            oprot.writeMapEnd()
             oprot.writeFieldEnd()
-        if self.resenv_template is not None:
-            oprot.writeFieldBegin("resenv_template", TType.STRING, 2)
-            oprot.writeString(
-                self.resenv_template.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.resenv_template
-            )
+        if self.e is not None:
+            oprot.writeFieldBegin("e", TType.STRUCT, 1)
+            self.e.write(oprot)
+            oprot.writeFieldEnd()
+        if self.c is not None:
+            oprot.writeFieldBegin("c", TType.STRUCT, 2)
+            self.c.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -16739,38 +21287,44 @@ class create_resenv_security_group_and_attach_to_server_args(object):
         return not (self == other)
 
 
-all_structs.append(create_resenv_security_group_and_attach_to_server_args)
-create_resenv_security_group_and_attach_to_server_args.thrift_spec = (
-    None,  # 0
+all_structs.append(attach_volume_to_server_result)
+attach_volume_to_server_result.thrift_spec = (
+    (
+        0,
+        TType.MAP,
+        "success",
+        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
+        None,
+    ),  # 0
     (
         1,
-        TType.STRING,
-        "server_id",
-        "UTF8",
+        TType.STRUCT,
+        "e",
+        [serverNotFoundException, None],
         None,
     ),  # 1
     (
         2,
-        TType.STRING,
-        "resenv_template",
-        "UTF8",
+        TType.STRUCT,
+        "c",
+        [conflictException, None],
         None,
     ),  # 2
 )
 
 
-class create_resenv_security_group_and_attach_to_server_result(object):
+class check_server_status_args(object):
     """
     Attributes:
-     - e
+     - openstack_id: Id of the server
 
     """
 
     def __init__(
         self,
-        e=None,
+        openstack_id=None,
     ):
-        self.e = e
+        self.openstack_id = openstack_id
 
     def read(self, iprot):
         if (
@@ -16786,8 +21340,12 @@ class create_resenv_security_group_and_attach_to_server_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.STRUCT:
-                    self.e = serverNotFoundException.read(iprot)
+                if ftype == TType.STRING:
+                    self.openstack_id = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
                 else:
                     iprot.skip(ftype)
             else:
@@ -16801,12 +21359,14 @@ class create_resenv_security_group_and_attach_to_server_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin(
-            "create_resenv_security_group_and_attach_to_server_result"
-        )
-        if self.e is not None:
-            oprot.writeFieldBegin("e", TType.STRUCT, 1)
-            self.e.write(oprot)
+        oprot.writeStructBegin("check_server_status_args")
+        if self.openstack_id is not None:
+            oprot.writeFieldBegin("openstack_id", TType.STRING, 1)
+            oprot.writeString(
+                self.openstack_id.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.openstack_id
+            )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -16825,67 +21385,37 @@ class create_resenv_security_group_and_attach_to_server_result(object):
         return not (self == other)
 
 
-all_structs.append(create_resenv_security_group_and_attach_to_server_result)
-create_resenv_security_group_and_attach_to_server_result.thrift_spec = (
+all_structs.append(check_server_status_args)
+check_server_status_args.thrift_spec = (
     None,  # 0
     (
         1,
-        TType.STRUCT,
-        "e",
-        [serverNotFoundException, None],
+        TType.STRING,
+        "openstack_id",
+        "UTF8",
         None,
     ),  # 1
 )
 
 
-class add_cluster_machine_args(object):
+class check_server_status_result(object):
     """
     Attributes:
-     - cluster_id
-     - cluster_user
-     - cluster_group_id
-     - image
-     - flavor
-     - name
-     - key_name
-     - batch_idx
-     - worker_idx
-     - pub_key
-     - project_name
-     - project_id
-     - slurm_version
+     - success
+     - e
+     - r
 
     """
 
     def __init__(
         self,
-        cluster_id=None,
-        cluster_user=None,
-        cluster_group_id=None,
-        image=None,
-        flavor=None,
-        name=None,
-        key_name=None,
-        batch_idx=None,
-        worker_idx=None,
-        pub_key=None,
-        project_name=None,
-        project_id=None,
-        slurm_version=None,
+        success=None,
+        e=None,
+        r=None,
     ):
-        self.cluster_id = cluster_id
-        self.cluster_user = cluster_user
-        self.cluster_group_id = cluster_group_id
-        self.image = image
-        self.flavor = flavor
-        self.name = name
-        self.key_name = key_name
-        self.batch_idx = batch_idx
-        self.worker_idx = worker_idx
-        self.pub_key = pub_key
-        self.project_name = project_name
-        self.project_id = project_id
-        self.slurm_version = slurm_version
+        self.success = success
+        self.e = e
+        self.r = r
 
     def read(self, iprot):
         if (
@@ -16894,119 +21424,26 @@ class add_cluster_machine_args(object):
             and self.thrift_spec is not None
         ):
             iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
-            return
-        iprot.readStructBegin()
-        while True:
-            (fname, ftype, fid) = iprot.readFieldBegin()
-            if ftype == TType.STOP:
-                break
-            if fid == 1:
-                if ftype == TType.STRING:
-                    self.cluster_id = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.STRING:
-                    self.cluster_user = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 3:
-                if ftype == TType.STRING:
-                    self.cluster_group_id = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 4:
-                if ftype == TType.STRING:
-                    self.image = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 5:
-                if ftype == TType.STRING:
-                    self.flavor = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 6:
-                if ftype == TType.STRING:
-                    self.name = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 7:
-                if ftype == TType.STRING:
-                    self.key_name = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 8:
-                if ftype == TType.I32:
-                    self.batch_idx = iprot.readI32()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 9:
-                if ftype == TType.I32:
-                    self.worker_idx = iprot.readI32()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 10:
-                if ftype == TType.STRING:
-                    self.pub_key = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 11:
-                if ftype == TType.STRING:
-                    self.project_name = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.STRUCT:
+                    self.success = VM()
+                    self.success.read(iprot)
                 else:
                     iprot.skip(ftype)
-            elif fid == 12:
-                if ftype == TType.STRING:
-                    self.project_id = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
+            elif fid == 1:
+                if ftype == TType.STRUCT:
+                    self.e = serverNotFoundException.read(iprot)
                 else:
                     iprot.skip(ftype)
-            elif fid == 13:
-                if ftype == TType.STRING:
-                    self.slurm_version = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
+            elif fid == 2:
+                if ftype == TType.STRUCT:
+                    self.r = ressourceException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -17020,96 +21457,18 @@ class add_cluster_machine_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("add_cluster_machine_args")
-        if self.cluster_id is not None:
-            oprot.writeFieldBegin("cluster_id", TType.STRING, 1)
-            oprot.writeString(
-                self.cluster_id.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.cluster_id
-            )
-            oprot.writeFieldEnd()
-        if self.cluster_user is not None:
-            oprot.writeFieldBegin("cluster_user", TType.STRING, 2)
-            oprot.writeString(
-                self.cluster_user.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.cluster_user
-            )
-            oprot.writeFieldEnd()
-        if self.cluster_group_id is not None:
-            oprot.writeFieldBegin("cluster_group_id", TType.STRING, 3)
-            oprot.writeString(
-                self.cluster_group_id.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.cluster_group_id
-            )
-            oprot.writeFieldEnd()
-        if self.image is not None:
-            oprot.writeFieldBegin("image", TType.STRING, 4)
-            oprot.writeString(
-                self.image.encode("utf-8") if sys.version_info[0] == 2 else self.image
-            )
-            oprot.writeFieldEnd()
-        if self.flavor is not None:
-            oprot.writeFieldBegin("flavor", TType.STRING, 5)
-            oprot.writeString(
-                self.flavor.encode("utf-8") if sys.version_info[0] == 2 else self.flavor
-            )
-            oprot.writeFieldEnd()
-        if self.name is not None:
-            oprot.writeFieldBegin("name", TType.STRING, 6)
-            oprot.writeString(
-                self.name.encode("utf-8") if sys.version_info[0] == 2 else self.name
-            )
-            oprot.writeFieldEnd()
-        if self.key_name is not None:
-            oprot.writeFieldBegin("key_name", TType.STRING, 7)
-            oprot.writeString(
-                self.key_name.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.key_name
-            )
-            oprot.writeFieldEnd()
-        if self.batch_idx is not None:
-            oprot.writeFieldBegin("batch_idx", TType.I32, 8)
-            oprot.writeI32(self.batch_idx)
-            oprot.writeFieldEnd()
-        if self.worker_idx is not None:
-            oprot.writeFieldBegin("worker_idx", TType.I32, 9)
-            oprot.writeI32(self.worker_idx)
-            oprot.writeFieldEnd()
-        if self.pub_key is not None:
-            oprot.writeFieldBegin("pub_key", TType.STRING, 10)
-            oprot.writeString(
-                self.pub_key.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.pub_key
-            )
-            oprot.writeFieldEnd()
-        if self.project_name is not None:
-            oprot.writeFieldBegin("project_name", TType.STRING, 11)
-            oprot.writeString(
-                self.project_name.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.project_name
-            )
+        oprot.writeStructBegin("check_server_status_result")
+        if self.success is not None:
+            oprot.writeFieldBegin("success", TType.STRUCT, 0)
+            self.success.write(oprot)
             oprot.writeFieldEnd()
-        if self.project_id is not None:
-            oprot.writeFieldBegin("project_id", TType.STRING, 12)
-            oprot.writeString(
-                self.project_id.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.project_id
-            )
+        if self.e is not None:
+            oprot.writeFieldBegin("e", TType.STRUCT, 1)
+            self.e.write(oprot)
             oprot.writeFieldEnd()
-        if self.slurm_version is not None:
-            oprot.writeFieldBegin("slurm_version", TType.STRING, 13)
-            oprot.writeString(
-                self.slurm_version.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.slurm_version
-            )
+        if self.r is not None:
+            oprot.writeFieldBegin("r", TType.STRUCT, 2)
+            self.r.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -17128,115 +21487,157 @@ class add_cluster_machine_args(object):
         return not (self == other)
 
 
-all_structs.append(add_cluster_machine_args)
-add_cluster_machine_args.thrift_spec = (
-    None,  # 0
+all_structs.append(check_server_status_result)
+check_server_status_result.thrift_spec = (
+    (
+        0,
+        TType.STRUCT,
+        "success",
+        [VM, None],
+        None,
+    ),  # 0
     (
         1,
-        TType.STRING,
-        "cluster_id",
-        "UTF8",
+        TType.STRUCT,
+        "e",
+        [serverNotFoundException, None],
         None,
     ),  # 1
     (
         2,
-        TType.STRING,
-        "cluster_user",
-        "UTF8",
+        TType.STRUCT,
+        "r",
+        [ressourceException, None],
         None,
     ),  # 2
+)
+
+
+class setUserPassword_args(object):
+    """
+    Attributes:
+     - user: Elixir-Id of the user which wants to set a password
+     - password: New password
+
+    """
+
+    def __init__(
+        self,
+        user=None,
+        password=None,
+    ):
+        self.user = user
+        self.password = password
+
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.user = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.password = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(
+                oprot._fast_encode(self, [self.__class__, self.thrift_spec])
+            )
+            return
+        oprot.writeStructBegin("setUserPassword_args")
+        if self.user is not None:
+            oprot.writeFieldBegin("user", TType.STRING, 1)
+            oprot.writeString(
+                self.user.encode("utf-8") if sys.version_info[0] == 2 else self.user
+            )
+            oprot.writeFieldEnd()
+        if self.password is not None:
+            oprot.writeFieldBegin("password", TType.STRING, 2)
+            oprot.writeString(
+                self.password.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.password
+            )
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ["%s=%r" % (key, value) for key, value in self.__dict__.items()]
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+all_structs.append(setUserPassword_args)
+setUserPassword_args.thrift_spec = (
+    None,  # 0
     (
-        3,
-        TType.STRING,
-        "cluster_group_id",
-        "UTF8",
-        None,
-    ),  # 3
-    (
-        4,
-        TType.STRING,
-        "image",
-        "UTF8",
-        None,
-    ),  # 4
-    (
-        5,
-        TType.STRING,
-        "flavor",
-        "UTF8",
-        None,
-    ),  # 5
-    (
-        6,
-        TType.STRING,
-        "name",
-        "UTF8",
-        None,
-    ),  # 6
-    (
-        7,
-        TType.STRING,
-        "key_name",
-        "UTF8",
-        None,
-    ),  # 7
-    (
-        8,
-        TType.I32,
-        "batch_idx",
-        None,
-        None,
-    ),  # 8
-    (
-        9,
-        TType.I32,
-        "worker_idx",
-        None,
-        None,
-    ),  # 9
-    (
-        10,
-        TType.STRING,
-        "pub_key",
-        "UTF8",
-        None,
-    ),  # 10
-    (
-        11,
-        TType.STRING,
-        "project_name",
-        "UTF8",
-        None,
-    ),  # 11
-    (
-        12,
+        1,
         TType.STRING,
-        "project_id",
+        "user",
         "UTF8",
         None,
-    ),  # 12
+    ),  # 1
     (
-        13,
+        2,
         TType.STRING,
-        "slurm_version",
+        "password",
         "UTF8",
         None,
-    ),  # 13
+    ),  # 2
 )
 
 
-class add_cluster_machine_result(object):
+class setUserPassword_result(object):
     """
     Attributes:
      - success
+     - e
 
     """
 
     def __init__(
         self,
         success=None,
+        e=None,
     ):
         self.success = success
+        self.e = e
 
     def read(self, iprot):
         if (
@@ -17260,6 +21661,11 @@ class add_cluster_machine_result(object):
                     )
                 else:
                     iprot.skip(ftype)
+            elif fid == 1:
+                if ftype == TType.STRUCT:
+                    self.e = otherException.read(iprot)
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -17271,7 +21677,7 @@ class add_cluster_machine_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("add_cluster_machine_result")
+        oprot.writeStructBegin("setUserPassword_result")
         if self.success is not None:
             oprot.writeFieldBegin("success", TType.STRING, 0)
             oprot.writeString(
@@ -17280,6 +21686,10 @@ class add_cluster_machine_result(object):
                 else self.success
             )
             oprot.writeFieldEnd()
+        if self.e is not None:
+            oprot.writeFieldBegin("e", TType.STRUCT, 1)
+            self.e.write(oprot)
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -17297,8 +21707,8 @@ class add_cluster_machine_result(object):
         return not (self == other)
 
 
-all_structs.append(add_cluster_machine_result)
-add_cluster_machine_result.thrift_spec = (
+all_structs.append(setUserPassword_result)
+setUserPassword_result.thrift_spec = (
     (
         0,
         TType.STRING,
@@ -17306,21 +21716,28 @@ add_cluster_machine_result.thrift_spec = (
         "UTF8",
         None,
     ),  # 0
+    (
+        1,
+        TType.STRUCT,
+        "e",
+        [otherException, None],
+        None,
+    ),  # 1
 )
 
 
-class get_cluster_info_args(object):
+class resume_server_args(object):
     """
     Attributes:
-     - cluster_id
+     - openstack_id: Id of the server
 
     """
 
     def __init__(
         self,
-        cluster_id=None,
+        openstack_id=None,
     ):
-        self.cluster_id = cluster_id
+        self.openstack_id = openstack_id
 
     def read(self, iprot):
         if (
@@ -17337,7 +21754,7 @@ class get_cluster_info_args(object):
                 break
             if fid == 1:
                 if ftype == TType.STRING:
-                    self.cluster_id = (
+                    self.openstack_id = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
@@ -17355,13 +21772,13 @@ class get_cluster_info_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_cluster_info_args")
-        if self.cluster_id is not None:
-            oprot.writeFieldBegin("cluster_id", TType.STRING, 1)
+        oprot.writeStructBegin("resume_server_args")
+        if self.openstack_id is not None:
+            oprot.writeFieldBegin("openstack_id", TType.STRING, 1)
             oprot.writeString(
-                self.cluster_id.encode("utf-8")
+                self.openstack_id.encode("utf-8")
                 if sys.version_info[0] == 2
-                else self.cluster_id
+                else self.openstack_id
             )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
@@ -17381,31 +21798,37 @@ class get_cluster_info_args(object):
         return not (self == other)
 
 
-all_structs.append(get_cluster_info_args)
-get_cluster_info_args.thrift_spec = (
+all_structs.append(resume_server_args)
+resume_server_args.thrift_spec = (
     None,  # 0
     (
         1,
         TType.STRING,
-        "cluster_id",
+        "openstack_id",
         "UTF8",
         None,
     ),  # 1
 )
 
 
-class get_cluster_info_result(object):
+class resume_server_result(object):
     """
     Attributes:
      - success
+     - e
+     - c
 
     """
 
     def __init__(
         self,
         success=None,
+        e=None,
+        c=None,
     ):
         self.success = success
+        self.e = e
+        self.c = c
 
     def read(self, iprot):
         if (
@@ -17421,9 +21844,18 @@ class get_cluster_info_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
+                if ftype == TType.BOOL:
+                    self.success = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 1:
                 if ftype == TType.STRUCT:
-                    self.success = ClusterInfo()
-                    self.success.read(iprot)
+                    self.e = serverNotFoundException.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRUCT:
+                    self.c = conflictException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -17437,10 +21869,18 @@ class get_cluster_info_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_cluster_info_result")
+        oprot.writeStructBegin("resume_server_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.STRUCT, 0)
-            self.success.write(oprot)
+            oprot.writeFieldBegin("success", TType.BOOL, 0)
+            oprot.writeBool(self.success)
+            oprot.writeFieldEnd()
+        if self.e is not None:
+            oprot.writeFieldBegin("e", TType.STRUCT, 1)
+            self.e.write(oprot)
+            oprot.writeFieldEnd()
+        if self.c is not None:
+            oprot.writeFieldBegin("c", TType.STRUCT, 2)
+            self.c.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -17459,30 +21899,50 @@ class get_cluster_info_result(object):
         return not (self == other)
 
 
-all_structs.append(get_cluster_info_result)
-get_cluster_info_result.thrift_spec = (
+all_structs.append(resume_server_result)
+resume_server_result.thrift_spec = (
     (
         0,
-        TType.STRUCT,
+        TType.BOOL,
         "success",
-        [ClusterInfo, None],
+        None,
         None,
     ),  # 0
+    (
+        1,
+        TType.STRUCT,
+        "e",
+        [serverNotFoundException, None],
+        None,
+    ),  # 1
+    (
+        2,
+        TType.STRUCT,
+        "c",
+        [conflictException, None],
+        None,
+    ),  # 2
 )
 
 
-class get_cluster_status_args(object):
+class create_volume_args(object):
     """
     Attributes:
-     - cluster_id
+     - volume_name: Name of volume
+     - volume_storage: Diskspace in GB for new volume
+     - metadata: Metadata for the new volume
 
     """
 
     def __init__(
         self,
-        cluster_id=None,
+        volume_name=None,
+        volume_storage=None,
+        metadata=None,
     ):
-        self.cluster_id = cluster_id
+        self.volume_name = volume_name
+        self.volume_storage = volume_storage
+        self.metadata = metadata
 
     def read(self, iprot):
         if (
@@ -17499,13 +21959,37 @@ class get_cluster_status_args(object):
                 break
             if fid == 1:
                 if ftype == TType.STRING:
-                    self.cluster_id = (
+                    self.volume_name = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
                     )
                 else:
                     iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.I32:
+                    self.volume_storage = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.MAP:
+                    self.metadata = {}
+                    (_ktype566, _vtype567, _size565) = iprot.readMapBegin()
+                    for _i569 in range(_size565):
+                        _key570 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        _val571 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.metadata[_key570] = _val571
+                    iprot.readMapEnd()
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -17517,15 +22001,31 @@ class get_cluster_status_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_cluster_status_args")
-        if self.cluster_id is not None:
-            oprot.writeFieldBegin("cluster_id", TType.STRING, 1)
+        oprot.writeStructBegin("create_volume_args")
+        if self.volume_name is not None:
+            oprot.writeFieldBegin("volume_name", TType.STRING, 1)
             oprot.writeString(
-                self.cluster_id.encode("utf-8")
+                self.volume_name.encode("utf-8")
                 if sys.version_info[0] == 2
-                else self.cluster_id
+                else self.volume_name
             )
             oprot.writeFieldEnd()
+        if self.volume_storage is not None:
+            oprot.writeFieldBegin("volume_storage", TType.I32, 2)
+            oprot.writeI32(self.volume_storage)
+            oprot.writeFieldEnd()
+        if self.metadata is not None:
+            oprot.writeFieldBegin("metadata", TType.MAP, 3)
+            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.metadata))
+            for kiter572, viter573 in self.metadata.items():
+                oprot.writeString(
+                    kiter572.encode("utf-8") if sys.version_info[0] == 2 else kiter572
+                )
+                oprot.writeString(
+                    viter573.encode("utf-8") if sys.version_info[0] == 2 else viter573
+                )
+            oprot.writeMapEnd()
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -17543,31 +22043,48 @@ class get_cluster_status_args(object):
         return not (self == other)
 
 
-all_structs.append(get_cluster_status_args)
-get_cluster_status_args.thrift_spec = (
+all_structs.append(create_volume_args)
+create_volume_args.thrift_spec = (
     None,  # 0
     (
         1,
         TType.STRING,
-        "cluster_id",
+        "volume_name",
         "UTF8",
         None,
-    ),  # 1
+    ),  # 1
+    (
+        2,
+        TType.I32,
+        "volume_storage",
+        None,
+        None,
+    ),  # 2
+    (
+        3,
+        TType.MAP,
+        "metadata",
+        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
+        None,
+    ),  # 3
 )
 
 
-class get_cluster_status_result(object):
+class create_volume_result(object):
     """
     Attributes:
      - success
+     - r
 
     """
 
     def __init__(
         self,
         success=None,
+        r=None,
     ):
         self.success = success
+        self.r = r
 
     def read(self, iprot):
         if (
@@ -17585,22 +22102,27 @@ class get_cluster_status_result(object):
             if fid == 0:
                 if ftype == TType.MAP:
                     self.success = {}
-                    (_ktype500, _vtype501, _size499) = iprot.readMapBegin()
-                    for _i503 in range(_size499):
-                        _key504 = (
+                    (_ktype575, _vtype576, _size574) = iprot.readMapBegin()
+                    for _i578 in range(_size574):
+                        _key579 = (
                             iprot.readString().decode("utf-8", errors="replace")
                             if sys.version_info[0] == 2
                             else iprot.readString()
                         )
-                        _val505 = (
+                        _val580 = (
                             iprot.readString().decode("utf-8", errors="replace")
                             if sys.version_info[0] == 2
                             else iprot.readString()
                         )
-                        self.success[_key504] = _val505
+                        self.success[_key579] = _val580
                     iprot.readMapEnd()
                 else:
                     iprot.skip(ftype)
+            elif fid == 1:
+                if ftype == TType.STRUCT:
+                    self.r = ressourceException.read(iprot)
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -17612,19 +22134,23 @@ class get_cluster_status_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_cluster_status_result")
+        oprot.writeStructBegin("create_volume_result")
         if self.success is not None:
             oprot.writeFieldBegin("success", TType.MAP, 0)
             oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.success))
-            for kiter506, viter507 in self.success.items():
+            for kiter581, viter582 in self.success.items():
                 oprot.writeString(
-                    kiter506.encode("utf-8") if sys.version_info[0] == 2 else kiter506
+                    kiter581.encode("utf-8") if sys.version_info[0] == 2 else kiter581
                 )
                 oprot.writeString(
-                    viter507.encode("utf-8") if sys.version_info[0] == 2 else viter507
+                    viter582.encode("utf-8") if sys.version_info[0] == 2 else viter582
                 )
             oprot.writeMapEnd()
             oprot.writeFieldEnd()
+        if self.r is not None:
+            oprot.writeFieldBegin("r", TType.STRUCT, 1)
+            self.r.write(oprot)
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -17642,8 +22168,8 @@ class get_cluster_status_result(object):
         return not (self == other)
 
 
-all_structs.append(get_cluster_status_result)
-get_cluster_status_result.thrift_spec = (
+all_structs.append(create_volume_result)
+create_volume_result.thrift_spec = (
     (
         0,
         TType.MAP,
@@ -17651,21 +22177,31 @@ get_cluster_status_result.thrift_spec = (
         (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
         None,
     ),  # 0
+    (
+        1,
+        TType.STRUCT,
+        "r",
+        [ressourceException, None],
+        None,
+    ),  # 1
 )
 
 
-class get_server_args(object):
+class reboot_server_args(object):
     """
     Attributes:
-     - openstack_id: Id of the server.
+     - server_id: Id of the server
+     - reboot_type: HARD or SOFT
 
     """
 
     def __init__(
         self,
-        openstack_id=None,
+        server_id=None,
+        reboot_type=None,
     ):
-        self.openstack_id = openstack_id
+        self.server_id = server_id
+        self.reboot_type = reboot_type
 
     def read(self, iprot):
         if (
@@ -17682,7 +22218,16 @@ class get_server_args(object):
                 break
             if fid == 1:
                 if ftype == TType.STRING:
-                    self.openstack_id = (
+                    self.server_id = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.reboot_type = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
@@ -17700,13 +22245,21 @@ class get_server_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_server_args")
-        if self.openstack_id is not None:
-            oprot.writeFieldBegin("openstack_id", TType.STRING, 1)
+        oprot.writeStructBegin("reboot_server_args")
+        if self.server_id is not None:
+            oprot.writeFieldBegin("server_id", TType.STRING, 1)
             oprot.writeString(
-                self.openstack_id.encode("utf-8")
+                self.server_id.encode("utf-8")
                 if sys.version_info[0] == 2
-                else self.openstack_id
+                else self.server_id
+            )
+            oprot.writeFieldEnd()
+        if self.reboot_type is not None:
+            oprot.writeFieldBegin("reboot_type", TType.STRING, 2)
+            oprot.writeString(
+                self.reboot_type.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.reboot_type
             )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
@@ -17726,24 +22279,32 @@ class get_server_args(object):
         return not (self == other)
 
 
-all_structs.append(get_server_args)
-get_server_args.thrift_spec = (
+all_structs.append(reboot_server_args)
+reboot_server_args.thrift_spec = (
     None,  # 0
     (
         1,
         TType.STRING,
-        "openstack_id",
+        "server_id",
         "UTF8",
         None,
     ),  # 1
+    (
+        2,
+        TType.STRING,
+        "reboot_type",
+        "UTF8",
+        None,
+    ),  # 2
 )
 
 
-class get_server_result(object):
+class reboot_server_result(object):
     """
     Attributes:
      - success
      - e
+     - c
 
     """
 
@@ -17751,9 +22312,11 @@ class get_server_result(object):
         self,
         success=None,
         e=None,
+        c=None,
     ):
         self.success = success
         self.e = e
+        self.c = c
 
     def read(self, iprot):
         if (
@@ -17769,9 +22332,8 @@ class get_server_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.STRUCT:
-                    self.success = VM()
-                    self.success.read(iprot)
+                if ftype == TType.BOOL:
+                    self.success = iprot.readBool()
                 else:
                     iprot.skip(ftype)
             elif fid == 1:
@@ -17779,6 +22341,11 @@ class get_server_result(object):
                     self.e = serverNotFoundException.read(iprot)
                 else:
                     iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRUCT:
+                    self.c = conflictException.read(iprot)
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -17790,15 +22357,19 @@ class get_server_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_server_result")
+        oprot.writeStructBegin("reboot_server_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.STRUCT, 0)
-            self.success.write(oprot)
+            oprot.writeFieldBegin("success", TType.BOOL, 0)
+            oprot.writeBool(self.success)
             oprot.writeFieldEnd()
         if self.e is not None:
             oprot.writeFieldBegin("e", TType.STRUCT, 1)
             self.e.write(oprot)
             oprot.writeFieldEnd()
+        if self.c is not None:
+            oprot.writeFieldBegin("c", TType.STRUCT, 2)
+            self.c.write(oprot)
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -17816,13 +22387,13 @@ class get_server_result(object):
         return not (self == other)
 
 
-all_structs.append(get_server_result)
-get_server_result.thrift_spec = (
+all_structs.append(reboot_server_result)
+reboot_server_result.thrift_spec = (
     (
         0,
-        TType.STRUCT,
+        TType.BOOL,
         "success",
-        [VM, None],
+        None,
         None,
     ),  # 0
     (
@@ -17832,21 +22403,28 @@ get_server_result.thrift_spec = (
         [serverNotFoundException, None],
         None,
     ),  # 1
+    (
+        2,
+        TType.STRUCT,
+        "c",
+        [conflictException, None],
+        None,
+    ),  # 2
 )
 
 
-class stop_server_args(object):
+class get_vms_ports_args(object):
     """
     Attributes:
-     - openstack_id: Id of the server.
+     - openstack_ids: Ids of the servers, all servers of the project if empty
 
     """
 
     def __init__(
         self,
-        openstack_id=None,
+        openstack_ids=None,
     ):
-        self.openstack_id = openstack_id
+        self.openstack_ids = openstack_ids
 
     def read(self, iprot):
         if (
@@ -17862,12 +22440,17 @@ class stop_server_args(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.STRING:
-                    self.openstack_id = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
+                if ftype == TType.LIST:
+                    self.openstack_ids = []
+                    (_etype586, _size583) = iprot.readListBegin()
+                    for _i587 in range(_size583):
+                        _elem588 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.openstack_ids.append(_elem588)
+                    iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -17881,14 +22464,15 @@ class stop_server_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("stop_server_args")
-        if self.openstack_id is not None:
-            oprot.writeFieldBegin("openstack_id", TType.STRING, 1)
-            oprot.writeString(
-                self.openstack_id.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.openstack_id
-            )
+        oprot.writeStructBegin("get_vms_ports_args")
+        if self.openstack_ids is not None:
+            oprot.writeFieldBegin("openstack_ids", TType.LIST, 1)
+            oprot.writeListBegin(TType.STRING, len(self.openstack_ids))
+            for iter589 in self.openstack_ids:
+                oprot.writeString(
+                    iter589.encode("utf-8") if sys.version_info[0] == 2 else iter589
+                )
+            oprot.writeListEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -17907,37 +22491,31 @@ class stop_server_args(object):
         return not (self == other)
 
 
-all_structs.append(stop_server_args)
-stop_server_args.thrift_spec = (
+all_structs.append(get_vms_ports_args)
+get_vms_ports_args.thrift_spec = (
     None,  # 0
     (
         1,
-        TType.STRING,
-        "openstack_id",
-        "UTF8",
+        TType.LIST,
+        "openstack_ids",
+        (TType.STRING, "UTF8", False),
         None,
     ),  # 1
 )
 
 
-class stop_server_result(object):
+class get_vms_ports_result(object):
     """
     Attributes:
      - success
-     - e
-     - c
 
     """
 
     def __init__(
         self,
         success=None,
-        e=None,
-        c=None,
     ):
         self.success = success
-        self.e = e
-        self.c = c
 
     def read(self, iprot):
         if (
@@ -17953,18 +22531,32 @@ class stop_server_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.BOOL:
-                    self.success = iprot.readBool()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 1:
-                if ftype == TType.STRUCT:
-                    self.e = serverNotFoundException.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.STRUCT:
-                    self.c = conflictException.read(iprot)
+                if ftype == TType.MAP:
+                    self.success = {}
+                    (_ktype591, _vtype592, _size590) = iprot.readMapBegin()
+                    for _i594 in range(_size590):
+                        _key595 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        _val596 = {}
+                        (_ktype598, _vtype599, _size597) = iprot.readMapBegin()
+                        for _i601 in range(_size597):
+                            _key602 = (
+                                iprot.readString().decode("utf-8", errors="replace")
+                                if sys.version_info[0] == 2
+                                else iprot.readString()
+                            )
+                            _val603 = (
+                                iprot.readString().decode("utf-8", errors="replace")
+                                if sys.version_info[0] == 2
+                                else iprot.readString()
+                            )
+                            _val596[_key602] = _val603
+                        iprot.readMapEnd()
+                        self.success[_key595] = _val596
+                    iprot.readMapEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -17978,18 +22570,28 @@ class stop_server_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("stop_server_result")
+        oprot.writeStructBegin("get_vms_ports_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.BOOL, 0)
-            oprot.writeBool(self.success)
-            oprot.writeFieldEnd()
-        if self.e is not None:
-            oprot.writeFieldBegin("e", TType.STRUCT, 1)
-            self.e.write(oprot)
-            oprot.writeFieldEnd()
-        if self.c is not None:
-            oprot.writeFieldBegin("c", TType.STRUCT, 2)
-            self.c.write(oprot)
+            oprot.writeFieldBegin("success", TType.MAP, 0)
+            oprot.writeMapBegin(TType.STRING, TType.MAP, len(self.success))
+            for kiter604, viter605 in self.success.items():
+                oprot.writeString(
+                    kiter604.encode("utf-8") if sys.version_info[0] == 2 else kiter604
+                )
+                oprot.writeMapBegin(TType.STRING, TType.STRING, len(viter605))
+                for kiter606, viter607 in viter605.items():
+                    oprot.writeString(
+                        kiter606.encode("utf-8")
+                        if sys.version_info[0] == 2
+                        else kiter606
+                    )
+                    oprot.writeString(
+                        viter607.encode("utf-8")
+                        if sys.version_info[0] == 2
+                        else viter607
+                    )
+                oprot.writeMapEnd()
+            oprot.writeMapEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -18008,56 +22610,45 @@ class stop_server_result(object):
         return not (self == other)
 
 
-all_structs.append(stop_server_result)
-stop_server_result.thrift_spec = (
-    (
-        0,
-        TType.BOOL,
-        "success",
-        None,
-        None,
-    ),  # 0
-    (
-        1,
-        TType.STRUCT,
-        "e",
-        [serverNotFoundException, None],
-        None,
-    ),  # 1
+all_structs.append(get_vms_ports_result)
+get_vms_ports_result.thrift_spec = (
     (
-        2,
-        TType.STRUCT,
-        "c",
-        [conflictException, None],
+        0,
+        TType.MAP,
+        "success",
+        (
+            TType.STRING,
+            "UTF8",
+            TType.MAP,
+            (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
+            False,
+        ),
         None,
-    ),  # 2
+    ),  # 0
 )
 
 
-class create_snapshot_args(object):
+class get_playbook_log_chunk_args(object):
     """
     Attributes:
-     - openstack_id: Id of the server
-     - name: Name of new Snapshot
-     - elixir_id: Elixir-Id of the user who requested creation of Snapshot
-     - base_tags: Tags with which the servers image is also tagged ( for connection information at the webapp)
-     - description: Description of the new snapshot
+     - openstack_id: Id of the server the playbook runs for
+     - stream: stdout or stderr
+     - offset: Byte offset to start reading at
+     - max_bytes: Maximum size of the chunk in bytes
 
     """
 
     def __init__(
         self,
         openstack_id=None,
-        name=None,
-        elixir_id=None,
-        base_tags=None,
-        description=None,
+        stream=None,
+        offset=None,
+        max_bytes=None,
     ):
         self.openstack_id = openstack_id
-        self.name = name
-        self.elixir_id = elixir_id
-        self.base_tags = base_tags
-        self.description = description
+        self.stream = stream
+        self.offset = offset
+        self.max_bytes = max_bytes
 
     def read(self, iprot):
         if (
@@ -18083,7 +22674,7 @@ class create_snapshot_args(object):
                     iprot.skip(ftype)
             elif fid == 2:
                 if ftype == TType.STRING:
-                    self.name = (
+                    self.stream = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
@@ -18091,35 +22682,13 @@ class create_snapshot_args(object):
                 else:
                     iprot.skip(ftype)
             elif fid == 3:
-                if ftype == TType.STRING:
-                    self.elixir_id = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
+                if ftype == TType.I64:
+                    self.offset = iprot.readI64()
                 else:
                     iprot.skip(ftype)
             elif fid == 4:
-                if ftype == TType.LIST:
-                    self.base_tags = []
-                    (_etype511, _size508) = iprot.readListBegin()
-                    for _i512 in range(_size508):
-                        _elem513 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        self.base_tags.append(_elem513)
-                    iprot.readListEnd()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 5:
-                if ftype == TType.STRING:
-                    self.description = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
+                if ftype == TType.I32:
+                    self.max_bytes = iprot.readI32()
                 else:
                     iprot.skip(ftype)
             else:
@@ -18133,7 +22702,7 @@ class create_snapshot_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("create_snapshot_args")
+        oprot.writeStructBegin("get_playbook_log_chunk_args")
         if self.openstack_id is not None:
             oprot.writeFieldBegin("openstack_id", TType.STRING, 1)
             oprot.writeString(
@@ -18142,36 +22711,19 @@ class create_snapshot_args(object):
                 else self.openstack_id
             )
             oprot.writeFieldEnd()
-        if self.name is not None:
-            oprot.writeFieldBegin("name", TType.STRING, 2)
-            oprot.writeString(
-                self.name.encode("utf-8") if sys.version_info[0] == 2 else self.name
-            )
-            oprot.writeFieldEnd()
-        if self.elixir_id is not None:
-            oprot.writeFieldBegin("elixir_id", TType.STRING, 3)
+        if self.stream is not None:
+            oprot.writeFieldBegin("stream", TType.STRING, 2)
             oprot.writeString(
-                self.elixir_id.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.elixir_id
+                self.stream.encode("utf-8") if sys.version_info[0] == 2 else self.stream
             )
             oprot.writeFieldEnd()
-        if self.base_tags is not None:
-            oprot.writeFieldBegin("base_tags", TType.LIST, 4)
-            oprot.writeListBegin(TType.STRING, len(self.base_tags))
-            for iter514 in self.base_tags:
-                oprot.writeString(
-                    iter514.encode("utf-8") if sys.version_info[0] == 2 else iter514
-                )
-            oprot.writeListEnd()
+        if self.offset is not None:
+            oprot.writeFieldBegin("offset", TType.I64, 3)
+            oprot.writeI64(self.offset)
             oprot.writeFieldEnd()
-        if self.description is not None:
-            oprot.writeFieldBegin("description", TType.STRING, 5)
-            oprot.writeString(
-                self.description.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.description
-            )
+        if self.max_bytes is not None:
+            oprot.writeFieldBegin("max_bytes", TType.I32, 4)
+            oprot.writeI32(self.max_bytes)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -18190,8 +22742,8 @@ class create_snapshot_args(object):
         return not (self == other)
 
 
-all_structs.append(create_snapshot_args)
-create_snapshot_args.thrift_spec = (
+all_structs.append(get_playbook_log_chunk_args)
+get_playbook_log_chunk_args.thrift_spec = (
     None,  # 0
     (
         1,
@@ -18203,52 +22755,42 @@ create_snapshot_args.thrift_spec = (
     (
         2,
         TType.STRING,
-        "name",
+        "stream",
         "UTF8",
         None,
     ),  # 2
     (
         3,
-        TType.STRING,
-        "elixir_id",
-        "UTF8",
+        TType.I64,
+        "offset",
+        None,
         None,
     ),  # 3
     (
         4,
-        TType.LIST,
-        "base_tags",
-        (TType.STRING, "UTF8", False),
+        TType.I32,
+        "max_bytes",
         None,
-    ),  # 4
-    (
-        5,
-        TType.STRING,
-        "description",
-        "UTF8",
         None,
-    ),  # 5
+    ),  # 4
 )
 
 
-class create_snapshot_result(object):
+class get_playbook_log_chunk_result(object):
     """
     Attributes:
      - success
-     - e
-     - c
+     - o
 
     """
 
     def __init__(
         self,
         success=None,
-        e=None,
-        c=None,
+        o=None,
     ):
         self.success = success
-        self.e = e
-        self.c = c
+        self.o = o
 
     def read(self, iprot):
         if (
@@ -18264,22 +22806,27 @@ class create_snapshot_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.STRING:
-                    self.success = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
+                if ftype == TType.MAP:
+                    self.success = {}
+                    (_ktype609, _vtype610, _size608) = iprot.readMapBegin()
+                    for _i612 in range(_size608):
+                        _key613 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        _val614 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.success[_key613] = _val614
+                    iprot.readMapEnd()
                 else:
                     iprot.skip(ftype)
             elif fid == 1:
                 if ftype == TType.STRUCT:
-                    self.e = serverNotFoundException.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.STRUCT:
-                    self.c = conflictException.read(iprot)
+                    self.o = otherException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -18293,22 +22840,22 @@ class create_snapshot_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("create_snapshot_result")
+        oprot.writeStructBegin("get_playbook_log_chunk_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.STRING, 0)
-            oprot.writeString(
-                self.success.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.success
-            )
-            oprot.writeFieldEnd()
-        if self.e is not None:
-            oprot.writeFieldBegin("e", TType.STRUCT, 1)
-            self.e.write(oprot)
+            oprot.writeFieldBegin("success", TType.MAP, 0)
+            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.success))
+            for kiter615, viter616 in self.success.items():
+                oprot.writeString(
+                    kiter615.encode("utf-8") if sys.version_info[0] == 2 else kiter615
+                )
+                oprot.writeString(
+                    viter616.encode("utf-8") if sys.version_info[0] == 2 else viter616
+                )
+            oprot.writeMapEnd()
             oprot.writeFieldEnd()
-        if self.c is not None:
-            oprot.writeFieldBegin("c", TType.STRUCT, 2)
-            self.c.write(oprot)
+        if self.o is not None:
+            oprot.writeFieldBegin("o", TType.STRUCT, 1)
+            self.o.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -18327,33 +22874,38 @@ class create_snapshot_result(object):
         return not (self == other)
 
 
-all_structs.append(create_snapshot_result)
-create_snapshot_result.thrift_spec = (
+all_structs.append(get_playbook_log_chunk_result)
+get_playbook_log_chunk_result.thrift_spec = (
     (
         0,
-        TType.STRING,
+        TType.MAP,
         "success",
-        "UTF8",
+        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
         None,
     ),  # 0
     (
         1,
         TType.STRUCT,
-        "e",
-        [serverNotFoundException, None],
+        "o",
+        [otherException, None],
         None,
     ),  # 1
-    (
-        2,
-        TType.STRUCT,
-        "c",
-        [conflictException, None],
-        None,
-    ),  # 2
 )
 
 
-class get_limits_args(object):
+class check_servers_status_args(object):
+    """
+    Attributes:
+     - openstack_ids: Ids of the servers
+
+    """
+
+    def __init__(
+        self,
+        openstack_ids=None,
+    ):
+        self.openstack_ids = openstack_ids
+
     def read(self, iprot):
         if (
             iprot._fast_decode is not None
@@ -18367,6 +22919,20 @@ class get_limits_args(object):
             (fname, ftype, fid) = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
+            if fid == 1:
+                if ftype == TType.LIST:
+                    self.openstack_ids = []
+                    (_etype620, _size617) = iprot.readListBegin()
+                    for _i621 in range(_size617):
+                        _elem622 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.openstack_ids.append(_elem622)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -18378,7 +22944,16 @@ class get_limits_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_limits_args")
+        oprot.writeStructBegin("check_servers_status_args")
+        if self.openstack_ids is not None:
+            oprot.writeFieldBegin("openstack_ids", TType.LIST, 1)
+            oprot.writeListBegin(TType.STRING, len(self.openstack_ids))
+            for iter623 in self.openstack_ids:
+                oprot.writeString(
+                    iter623.encode("utf-8") if sys.version_info[0] == 2 else iter623
+                )
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -18396,11 +22971,20 @@ class get_limits_args(object):
         return not (self == other)
 
 
-all_structs.append(get_limits_args)
-get_limits_args.thrift_spec = ()
+all_structs.append(check_servers_status_args)
+check_servers_status_args.thrift_spec = (
+    None,  # 0
+    (
+        1,
+        TType.LIST,
+        "openstack_ids",
+        (TType.STRING, "UTF8", False),
+        None,
+    ),  # 1
+)
 
 
-class get_limits_result(object):
+class check_servers_status_result(object):
     """
     Attributes:
      - success
@@ -18427,22 +23011,14 @@ class get_limits_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.MAP:
-                    self.success = {}
-                    (_ktype516, _vtype517, _size515) = iprot.readMapBegin()
-                    for _i519 in range(_size515):
-                        _key520 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        _val521 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        self.success[_key520] = _val521
-                    iprot.readMapEnd()
+                if ftype == TType.LIST:
+                    self.success = []
+                    (_etype627, _size624) = iprot.readListBegin()
+                    for _i628 in range(_size624):
+                        _elem629 = VM()
+                        _elem629.read(iprot)
+                        self.success.append(_elem629)
+                    iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -18456,18 +23032,13 @@ class get_limits_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("get_limits_result")
+        oprot.writeStructBegin("check_servers_status_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.MAP, 0)
-            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.success))
-            for kiter522, viter523 in self.success.items():
-                oprot.writeString(
-                    kiter522.encode("utf-8") if sys.version_info[0] == 2 else kiter522
-                )
-                oprot.writeString(
-                    viter523.encode("utf-8") if sys.version_info[0] == 2 else viter523
-                )
-            oprot.writeMapEnd()
+            oprot.writeFieldBegin("success", TType.LIST, 0)
+            oprot.writeListBegin(TType.STRUCT, len(self.success))
+            for iter630 in self.success:
+                iter630.write(oprot)
+            oprot.writeListEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -18486,39 +23057,30 @@ class get_limits_result(object):
         return not (self == other)
 
 
-all_structs.append(get_limits_result)
-get_limits_result.thrift_spec = (
+all_structs.append(check_servers_status_result)
+check_servers_status_result.thrift_spec = (
     (
         0,
-        TType.MAP,
+        TType.LIST,
         "success",
-        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
+        (TType.STRUCT, [VM, None], False),
         None,
     ),  # 0
 )
 
 
-class start_cluster_args(object):
+class delete_server_async_args(object):
     """
-    Attributes:
-     - public_keys
-     - master_instance
-     - worker_instance
-     - user
+    Attributes:
+     - openstack_id: Id of the server
 
     """
 
     def __init__(
         self,
-        public_keys=None,
-        master_instance=None,
-        worker_instance=None,
-        user=None,
+        openstack_id=None,
     ):
-        self.public_keys = public_keys
-        self.master_instance = master_instance
-        self.worker_instance = worker_instance
-        self.user = user
+        self.openstack_id = openstack_id
 
     def read(self, iprot):
         if (
@@ -18534,39 +23096,8 @@ class start_cluster_args(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.LIST:
-                    self.public_keys = []
-                    (_etype527, _size524) = iprot.readListBegin()
-                    for _i528 in range(_size524):
-                        _elem529 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        self.public_keys.append(_elem529)
-                    iprot.readListEnd()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.STRUCT:
-                    self.master_instance = ClusterInstance()
-                    self.master_instance.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 3:
-                if ftype == TType.LIST:
-                    self.worker_instance = []
-                    (_etype533, _size530) = iprot.readListBegin()
-                    for _i534 in range(_size530):
-                        _elem535 = ClusterInstance()
-                        _elem535.read(iprot)
-                        self.worker_instance.append(_elem535)
-                    iprot.readListEnd()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 4:
                 if ftype == TType.STRING:
-                    self.user = (
+                    self.openstack_id = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
@@ -18584,31 +23115,13 @@ class start_cluster_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("start_cluster_args")
-        if self.public_keys is not None:
-            oprot.writeFieldBegin("public_keys", TType.LIST, 1)
-            oprot.writeListBegin(TType.STRING, len(self.public_keys))
-            for iter536 in self.public_keys:
-                oprot.writeString(
-                    iter536.encode("utf-8") if sys.version_info[0] == 2 else iter536
-                )
-            oprot.writeListEnd()
-            oprot.writeFieldEnd()
-        if self.master_instance is not None:
-            oprot.writeFieldBegin("master_instance", TType.STRUCT, 2)
-            self.master_instance.write(oprot)
-            oprot.writeFieldEnd()
-        if self.worker_instance is not None:
-            oprot.writeFieldBegin("worker_instance", TType.LIST, 3)
-            oprot.writeListBegin(TType.STRUCT, len(self.worker_instance))
-            for iter537 in self.worker_instance:
-                iter537.write(oprot)
-            oprot.writeListEnd()
-            oprot.writeFieldEnd()
-        if self.user is not None:
-            oprot.writeFieldBegin("user", TType.STRING, 4)
+        oprot.writeStructBegin("delete_server_async_args")
+        if self.openstack_id is not None:
+            oprot.writeFieldBegin("openstack_id", TType.STRING, 1)
             oprot.writeString(
-                self.user.encode("utf-8") if sys.version_info[0] == 2 else self.user
+                self.openstack_id.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.openstack_id
             )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
@@ -18628,41 +23141,20 @@ class start_cluster_args(object):
         return not (self == other)
 
 
-all_structs.append(start_cluster_args)
-start_cluster_args.thrift_spec = (
+all_structs.append(delete_server_async_args)
+delete_server_async_args.thrift_spec = (
     None,  # 0
     (
         1,
-        TType.LIST,
-        "public_keys",
-        (TType.STRING, "UTF8", False),
-        None,
-    ),  # 1
-    (
-        2,
-        TType.STRUCT,
-        "master_instance",
-        [ClusterInstance, None],
-        None,
-    ),  # 2
-    (
-        3,
-        TType.LIST,
-        "worker_instance",
-        (TType.STRUCT, [ClusterInstance, None], False),
-        None,
-    ),  # 3
-    (
-        4,
         TType.STRING,
-        "user",
+        "openstack_id",
         "UTF8",
         None,
-    ),  # 4
+    ),  # 1
 )
 
 
-class start_cluster_result(object):
+class delete_server_async_result(object):
     """
     Attributes:
      - success
@@ -18689,22 +23181,12 @@ class start_cluster_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.MAP:
-                    self.success = {}
-                    (_ktype539, _vtype540, _size538) = iprot.readMapBegin()
-                    for _i542 in range(_size538):
-                        _key543 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        _val544 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        self.success[_key543] = _val544
-                    iprot.readMapEnd()
+                if ftype == TType.STRING:
+                    self.success = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
                 else:
                     iprot.skip(ftype)
             else:
@@ -18718,18 +23200,14 @@ class start_cluster_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("start_cluster_result")
+        oprot.writeStructBegin("delete_server_async_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.MAP, 0)
-            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.success))
-            for kiter545, viter546 in self.success.items():
-                oprot.writeString(
-                    kiter545.encode("utf-8") if sys.version_info[0] == 2 else kiter545
-                )
-                oprot.writeString(
-                    viter546.encode("utf-8") if sys.version_info[0] == 2 else viter546
-                )
-            oprot.writeMapEnd()
+            oprot.writeFieldBegin("success", TType.STRING, 0)
+            oprot.writeString(
+                self.success.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.success
+            )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -18748,30 +23226,30 @@ class start_cluster_result(object):
         return not (self == other)
 
 
-all_structs.append(start_cluster_result)
-start_cluster_result.thrift_spec = (
+all_structs.append(delete_server_async_result)
+delete_server_async_result.thrift_spec = (
     (
         0,
-        TType.MAP,
+        TType.STRING,
         "success",
-        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
+        "UTF8",
         None,
     ),  # 0
 )
 
 
-class terminate_cluster_args(object):
+class delete_servers_async_args(object):
     """
     Attributes:
-     - cluster_id
+     - openstack_ids: Ids of the servers
 
     """
 
     def __init__(
         self,
-        cluster_id=None,
+        openstack_ids=None,
     ):
-        self.cluster_id = cluster_id
+        self.openstack_ids = openstack_ids
 
     def read(self, iprot):
         if (
@@ -18787,12 +23265,17 @@ class terminate_cluster_args(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.STRING:
-                    self.cluster_id = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
+                if ftype == TType.LIST:
+                    self.openstack_ids = []
+                    (_etype634, _size631) = iprot.readListBegin()
+                    for _i635 in range(_size631):
+                        _elem636 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.openstack_ids.append(_elem636)
+                    iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -18806,14 +23289,15 @@ class terminate_cluster_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("terminate_cluster_args")
-        if self.cluster_id is not None:
-            oprot.writeFieldBegin("cluster_id", TType.STRING, 1)
-            oprot.writeString(
-                self.cluster_id.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.cluster_id
-            )
+        oprot.writeStructBegin("delete_servers_async_args")
+        if self.openstack_ids is not None:
+            oprot.writeFieldBegin("openstack_ids", TType.LIST, 1)
+            oprot.writeListBegin(TType.STRING, len(self.openstack_ids))
+            for iter637 in self.openstack_ids:
+                oprot.writeString(
+                    iter637.encode("utf-8") if sys.version_info[0] == 2 else iter637
+                )
+            oprot.writeListEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -18832,20 +23316,20 @@ class terminate_cluster_args(object):
         return not (self == other)
 
 
-all_structs.append(terminate_cluster_args)
-terminate_cluster_args.thrift_spec = (
+all_structs.append(delete_servers_async_args)
+delete_servers_async_args.thrift_spec = (
     None,  # 0
     (
         1,
-        TType.STRING,
-        "cluster_id",
-        "UTF8",
+        TType.LIST,
+        "openstack_ids",
+        (TType.STRING, "UTF8", False),
         None,
     ),  # 1
 )
 
 
-class terminate_cluster_result(object):
+class delete_servers_async_result(object):
     """
     Attributes:
      - success
@@ -18874,19 +23358,19 @@ class terminate_cluster_result(object):
             if fid == 0:
                 if ftype == TType.MAP:
                     self.success = {}
-                    (_ktype548, _vtype549, _size547) = iprot.readMapBegin()
-                    for _i551 in range(_size547):
-                        _key552 = (
+                    (_ktype639, _vtype640, _size638) = iprot.readMapBegin()
+                    for _i642 in range(_size638):
+                        _key643 = (
                             iprot.readString().decode("utf-8", errors="replace")
                             if sys.version_info[0] == 2
                             else iprot.readString()
                         )
-                        _val553 = (
+                        _val644 = (
                             iprot.readString().decode("utf-8", errors="replace")
                             if sys.version_info[0] == 2
                             else iprot.readString()
                         )
-                        self.success[_key552] = _val553
+                        self.success[_key643] = _val644
                     iprot.readMapEnd()
                 else:
                     iprot.skip(ftype)
@@ -18901,16 +23385,16 @@ class terminate_cluster_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("terminate_cluster_result")
+        oprot.writeStructBegin("delete_servers_async_result")
         if self.success is not None:
             oprot.writeFieldBegin("success", TType.MAP, 0)
             oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.success))
-            for kiter554, viter555 in self.success.items():
+            for kiter645, viter646 in self.success.items():
                 oprot.writeString(
-                    kiter554.encode("utf-8") if sys.version_info[0] == 2 else kiter554
+                    kiter645.encode("utf-8") if sys.version_info[0] == 2 else kiter645
                 )
                 oprot.writeString(
-                    viter555.encode("utf-8") if sys.version_info[0] == 2 else viter555
+                    viter646.encode("utf-8") if sys.version_info[0] == 2 else viter646
                 )
             oprot.writeMapEnd()
             oprot.writeFieldEnd()
@@ -18931,8 +23415,8 @@ class terminate_cluster_result(object):
         return not (self == other)
 
 
-all_structs.append(terminate_cluster_result)
-terminate_cluster_result.thrift_spec = (
+all_structs.append(delete_servers_async_result)
+delete_servers_async_result.thrift_spec = (
     (
         0,
         TType.MAP,
@@ -18943,18 +23427,18 @@ terminate_cluster_result.thrift_spec = (
 )
 
 
-class delete_image_args(object):
+class get_job_status_args(object):
     """
     Attributes:
-     - image_id: Id of image
+     - job_id: Id of the job
 
     """
 
     def __init__(
         self,
-        image_id=None,
+        job_id=None,
     ):
-        self.image_id = image_id
+        self.job_id = job_id
 
     def read(self, iprot):
         if (
@@ -18971,7 +23455,7 @@ class delete_image_args(object):
                 break
             if fid == 1:
                 if ftype == TType.STRING:
-                    self.image_id = (
+                    self.job_id = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
@@ -18989,13 +23473,11 @@ class delete_image_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("delete_image_args")
-        if self.image_id is not None:
-            oprot.writeFieldBegin("image_id", TType.STRING, 1)
+        oprot.writeStructBegin("get_job_status_args")
+        if self.job_id is not None:
+            oprot.writeFieldBegin("job_id", TType.STRING, 1)
             oprot.writeString(
-                self.image_id.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.image_id
+                self.job_id.encode("utf-8") if sys.version_info[0] == 2 else self.job_id
             )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
@@ -19015,34 +23497,31 @@ class delete_image_args(object):
         return not (self == other)
 
 
-all_structs.append(delete_image_args)
-delete_image_args.thrift_spec = (
+all_structs.append(get_job_status_args)
+get_job_status_args.thrift_spec = (
     None,  # 0
     (
         1,
         TType.STRING,
-        "image_id",
+        "job_id",
         "UTF8",
         None,
     ),  # 1
 )
 
 
-class delete_image_result(object):
+class get_job_status_result(object):
     """
     Attributes:
      - success
-     - e
 
     """
 
     def __init__(
         self,
         success=None,
-        e=None,
     ):
         self.success = success
-        self.e = e
 
     def read(self, iprot):
         if (
@@ -19058,13 +23537,22 @@ class delete_image_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.BOOL:
-                    self.success = iprot.readBool()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 1:
-                if ftype == TType.STRUCT:
-                    self.e = imageNotFoundException.read(iprot)
+                if ftype == TType.MAP:
+                    self.success = {}
+                    (_ktype648, _vtype649, _size647) = iprot.readMapBegin()
+                    for _i651 in range(_size647):
+                        _key652 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        _val653 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.success[_key652] = _val653
+                    iprot.readMapEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -19078,14 +23566,18 @@ class delete_image_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("delete_image_result")
+        oprot.writeStructBegin("get_job_status_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.BOOL, 0)
-            oprot.writeBool(self.success)
-            oprot.writeFieldEnd()
-        if self.e is not None:
-            oprot.writeFieldBegin("e", TType.STRUCT, 1)
-            self.e.write(oprot)
+            oprot.writeFieldBegin("success", TType.MAP, 0)
+            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.success))
+            for kiter654, viter655 in self.success.items():
+                oprot.writeString(
+                    kiter654.encode("utf-8") if sys.version_info[0] == 2 else kiter654
+                )
+                oprot.writeString(
+                    viter655.encode("utf-8") if sys.version_info[0] == 2 else viter655
+                )
+            oprot.writeMapEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -19104,40 +23596,30 @@ class delete_image_result(object):
         return not (self == other)
 
 
-all_structs.append(delete_image_result)
-delete_image_result.thrift_spec = (
+all_structs.append(get_job_status_result)
+get_job_status_result.thrift_spec = (
     (
         0,
-        TType.BOOL,
-        "success",
-        None,
-        None,
-    ),  # 0
-    (
-        1,
-        TType.STRUCT,
-        "e",
-        [imageNotFoundException, None],
+        TType.MAP,
+        "success",
+        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
         None,
-    ),  # 1
+    ),  # 0
 )
 
 
-class delete_volume_attachment_args(object):
+class get_jobs_status_args(object):
     """
     Attributes:
-     - volume_id: Id of the attached volume
-     - server_id: Id of the server where the volume is attached
+     - job_ids: Ids of the jobs
 
     """
 
     def __init__(
         self,
-        volume_id=None,
-        server_id=None,
+        job_ids=None,
     ):
-        self.volume_id = volume_id
-        self.server_id = server_id
+        self.job_ids = job_ids
 
     def read(self, iprot):
         if (
@@ -19153,21 +23635,17 @@ class delete_volume_attachment_args(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.STRING:
-                    self.volume_id = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.STRING:
-                    self.server_id = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
+                if ftype == TType.LIST:
+                    self.job_ids = []
+                    (_etype659, _size656) = iprot.readListBegin()
+                    for _i660 in range(_size656):
+                        _elem661 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.job_ids.append(_elem661)
+                    iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -19181,22 +23659,15 @@ class delete_volume_attachment_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("delete_volume_attachment_args")
-        if self.volume_id is not None:
-            oprot.writeFieldBegin("volume_id", TType.STRING, 1)
-            oprot.writeString(
-                self.volume_id.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.volume_id
-            )
-            oprot.writeFieldEnd()
-        if self.server_id is not None:
-            oprot.writeFieldBegin("server_id", TType.STRING, 2)
-            oprot.writeString(
-                self.server_id.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.server_id
-            )
+        oprot.writeStructBegin("get_jobs_status_args")
+        if self.job_ids is not None:
+            oprot.writeFieldBegin("job_ids", TType.LIST, 1)
+            oprot.writeListBegin(TType.STRING, len(self.job_ids))
+            for iter662 in self.job_ids:
+                oprot.writeString(
+                    iter662.encode("utf-8") if sys.version_info[0] == 2 else iter662
+                )
+            oprot.writeListEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -19215,44 +23686,31 @@ class delete_volume_attachment_args(object):
         return not (self == other)
 
 
-all_structs.append(delete_volume_attachment_args)
-delete_volume_attachment_args.thrift_spec = (
+all_structs.append(get_jobs_status_args)
+get_jobs_status_args.thrift_spec = (
     None,  # 0
     (
         1,
-        TType.STRING,
-        "volume_id",
-        "UTF8",
+        TType.LIST,
+        "job_ids",
+        (TType.STRING, "UTF8", False),
         None,
     ),  # 1
-    (
-        2,
-        TType.STRING,
-        "server_id",
-        "UTF8",
-        None,
-    ),  # 2
 )
 
 
-class delete_volume_attachment_result(object):
+class get_jobs_status_result(object):
     """
     Attributes:
      - success
-     - e
-     - c
 
     """
 
     def __init__(
         self,
         success=None,
-        e=None,
-        c=None,
     ):
         self.success = success
-        self.e = e
-        self.c = c
 
     def read(self, iprot):
         if (
@@ -19268,18 +23726,32 @@ class delete_volume_attachment_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.BOOL:
-                    self.success = iprot.readBool()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 1:
-                if ftype == TType.STRUCT:
-                    self.e = serverNotFoundException.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.STRUCT:
-                    self.c = conflictException.read(iprot)
+                if ftype == TType.MAP:
+                    self.success = {}
+                    (_ktype664, _vtype665, _size663) = iprot.readMapBegin()
+                    for _i667 in range(_size663):
+                        _key668 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        _val669 = {}
+                        (_ktype671, _vtype672, _size670) = iprot.readMapBegin()
+                        for _i674 in range(_size670):
+                            _key675 = (
+                                iprot.readString().decode("utf-8", errors="replace")
+                                if sys.version_info[0] == 2
+                                else iprot.readString()
+                            )
+                            _val676 = (
+                                iprot.readString().decode("utf-8", errors="replace")
+                                if sys.version_info[0] == 2
+                                else iprot.readString()
+                            )
+                            _val669[_key675] = _val676
+                        iprot.readMapEnd()
+                        self.success[_key668] = _val669
+                    iprot.readMapEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -19293,18 +23765,28 @@ class delete_volume_attachment_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("delete_volume_attachment_result")
+        oprot.writeStructBegin("get_jobs_status_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.BOOL, 0)
-            oprot.writeBool(self.success)
-            oprot.writeFieldEnd()
-        if self.e is not None:
-            oprot.writeFieldBegin("e", TType.STRUCT, 1)
-            self.e.write(oprot)
-            oprot.writeFieldEnd()
-        if self.c is not None:
-            oprot.writeFieldBegin("c", TType.STRUCT, 2)
-            self.c.write(oprot)
+            oprot.writeFieldBegin("success", TType.MAP, 0)
+            oprot.writeMapBegin(TType.STRING, TType.MAP, len(self.success))
+            for kiter677, viter678 in self.success.items():
+                oprot.writeString(
+                    kiter677.encode("utf-8") if sys.version_info[0] == 2 else kiter677
+                )
+                oprot.writeMapBegin(TType.STRING, TType.STRING, len(viter678))
+                for kiter679, viter680 in viter678.items():
+                    oprot.writeString(
+                        kiter679.encode("utf-8")
+                        if sys.version_info[0] == 2
+                        else kiter679
+                    )
+                    oprot.writeString(
+                        viter680.encode("utf-8")
+                        if sys.version_info[0] == 2
+                        else viter680
+                    )
+                oprot.writeMapEnd()
+            oprot.writeMapEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -19323,44 +23805,66 @@ class delete_volume_attachment_result(object):
         return not (self == other)
 
 
-all_structs.append(delete_volume_attachment_result)
-delete_volume_attachment_result.thrift_spec = (
+all_structs.append(get_jobs_status_result)
+get_jobs_status_result.thrift_spec = (
     (
         0,
-        TType.BOOL,
+        TType.MAP,
         "success",
-        None,
+        (
+            TType.STRING,
+            "UTF8",
+            TType.MAP,
+            (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
+            False,
+        ),
         None,
     ),  # 0
-    (
-        1,
-        TType.STRUCT,
-        "e",
-        [serverNotFoundException, None],
-        None,
-    ),  # 1
-    (
-        2,
-        TType.STRUCT,
-        "c",
-        [conflictException, None],
-        None,
-    ),  # 2
 )
 
 
-class delete_volume_args(object):
+class start_server_async_args(object):
     """
     Attributes:
-     - volume_id
+     - flavor: Name of the  Flavor to use.
+     - image: Name of the image to use.
+     - public_key: Public Key to use
+     - servername: Name for the new server
+     - metadata: Metadata for the new instance
+     - diskspace: Diskspace in GB for additional volume.
+     - volumename: Name of additional Volume
+     - https: Boolean for https security rule
+     - http: Boolean for http security rule
+     - resenv: Names of the research environments
+     - idempotency_key: Key of the request, retries with the same key get the job of the first request
 
     """
 
     def __init__(
         self,
-        volume_id=None,
+        flavor=None,
+        image=None,
+        public_key=None,
+        servername=None,
+        metadata=None,
+        diskspace=None,
+        volumename=None,
+        https=None,
+        http=None,
+        resenv=None,
+        idempotency_key=None,
     ):
-        self.volume_id = volume_id
+        self.flavor = flavor
+        self.image = image
+        self.public_key = public_key
+        self.servername = servername
+        self.metadata = metadata
+        self.diskspace = diskspace
+        self.volumename = volumename
+        self.https = https
+        self.http = http
+        self.resenv = resenv
+        self.idempotency_key = idempotency_key
 
     def read(self, iprot):
         if (
@@ -19377,7 +23881,104 @@ class delete_volume_args(object):
                 break
             if fid == 1:
                 if ftype == TType.STRING:
-                    self.volume_id = (
+                    self.flavor = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.image = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.STRING:
+                    self.public_key = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.STRING:
+                    self.servername = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 5:
+                if ftype == TType.MAP:
+                    self.metadata = {}
+                    (_ktype682, _vtype683, _size681) = iprot.readMapBegin()
+                    for _i685 in range(_size681):
+                        _key686 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        _val687 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.metadata[_key686] = _val687
+                    iprot.readMapEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 6:
+                if ftype == TType.STRING:
+                    self.diskspace = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 7:
+                if ftype == TType.STRING:
+                    self.volumename = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 8:
+                if ftype == TType.BOOL:
+                    self.https = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 9:
+                if ftype == TType.BOOL:
+                    self.http = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 10:
+                if ftype == TType.LIST:
+                    self.resenv = []
+                    (_etype691, _size688) = iprot.readListBegin()
+                    for _i692 in range(_size688):
+                        _elem693 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.resenv.append(_elem693)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 11:
+                if ftype == TType.STRING:
+                    self.idempotency_key = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
@@ -19395,13 +23996,86 @@ class delete_volume_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("delete_volume_args")
-        if self.volume_id is not None:
-            oprot.writeFieldBegin("volume_id", TType.STRING, 1)
+        oprot.writeStructBegin("start_server_async_args")
+        if self.flavor is not None:
+            oprot.writeFieldBegin("flavor", TType.STRING, 1)
             oprot.writeString(
-                self.volume_id.encode("utf-8")
+                self.flavor.encode("utf-8") if sys.version_info[0] == 2 else self.flavor
+            )
+            oprot.writeFieldEnd()
+        if self.image is not None:
+            oprot.writeFieldBegin("image", TType.STRING, 2)
+            oprot.writeString(
+                self.image.encode("utf-8") if sys.version_info[0] == 2 else self.image
+            )
+            oprot.writeFieldEnd()
+        if self.public_key is not None:
+            oprot.writeFieldBegin("public_key", TType.STRING, 3)
+            oprot.writeString(
+                self.public_key.encode("utf-8")
                 if sys.version_info[0] == 2
-                else self.volume_id
+                else self.public_key
+            )
+            oprot.writeFieldEnd()
+        if self.servername is not None:
+            oprot.writeFieldBegin("servername", TType.STRING, 4)
+            oprot.writeString(
+                self.servername.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.servername
+            )
+            oprot.writeFieldEnd()
+        if self.metadata is not None:
+            oprot.writeFieldBegin("metadata", TType.MAP, 5)
+            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.metadata))
+            for kiter694, viter695 in self.metadata.items():
+                oprot.writeString(
+                    kiter694.encode("utf-8") if sys.version_info[0] == 2 else kiter694
+                )
+                oprot.writeString(
+                    viter695.encode("utf-8") if sys.version_info[0] == 2 else viter695
+                )
+            oprot.writeMapEnd()
+            oprot.writeFieldEnd()
+        if self.diskspace is not None:
+            oprot.writeFieldBegin("diskspace", TType.STRING, 6)
+            oprot.writeString(
+                self.diskspace.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.diskspace
+            )
+            oprot.writeFieldEnd()
+        if self.volumename is not None:
+            oprot.writeFieldBegin("volumename", TType.STRING, 7)
+            oprot.writeString(
+                self.volumename.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.volumename
+            )
+            oprot.writeFieldEnd()
+        if self.https is not None:
+            oprot.writeFieldBegin("https", TType.BOOL, 8)
+            oprot.writeBool(self.https)
+            oprot.writeFieldEnd()
+        if self.http is not None:
+            oprot.writeFieldBegin("http", TType.BOOL, 9)
+            oprot.writeBool(self.http)
+            oprot.writeFieldEnd()
+        if self.resenv is not None:
+            oprot.writeFieldBegin("resenv", TType.LIST, 10)
+            oprot.writeListBegin(TType.STRING, len(self.resenv))
+            for iter696 in self.resenv:
+                oprot.writeString(
+                    iter696.encode("utf-8") if sys.version_info[0] == 2 else iter696
+                )
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.idempotency_key is not None:
+            oprot.writeFieldBegin("idempotency_key", TType.STRING, 11)
+            oprot.writeString(
+                self.idempotency_key.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.idempotency_key
             )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
@@ -19421,34 +24095,101 @@ class delete_volume_args(object):
         return not (self == other)
 
 
-all_structs.append(delete_volume_args)
-delete_volume_args.thrift_spec = (
+all_structs.append(start_server_async_args)
+start_server_async_args.thrift_spec = (
     None,  # 0
     (
         1,
         TType.STRING,
-        "volume_id",
+        "flavor",
         "UTF8",
         None,
     ),  # 1
+    (
+        2,
+        TType.STRING,
+        "image",
+        "UTF8",
+        None,
+    ),  # 2
+    (
+        3,
+        TType.STRING,
+        "public_key",
+        "UTF8",
+        None,
+    ),  # 3
+    (
+        4,
+        TType.STRING,
+        "servername",
+        "UTF8",
+        None,
+    ),  # 4
+    (
+        5,
+        TType.MAP,
+        "metadata",
+        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
+        None,
+    ),  # 5
+    (
+        6,
+        TType.STRING,
+        "diskspace",
+        "UTF8",
+        None,
+    ),  # 6
+    (
+        7,
+        TType.STRING,
+        "volumename",
+        "UTF8",
+        None,
+    ),  # 7
+    (
+        8,
+        TType.BOOL,
+        "https",
+        None,
+        None,
+    ),  # 8
+    (
+        9,
+        TType.BOOL,
+        "http",
+        None,
+        None,
+    ),  # 9
+    (
+        10,
+        TType.LIST,
+        "resenv",
+        (TType.STRING, "UTF8", False),
+        None,
+    ),  # 10
+    (
+        11,
+        TType.STRING,
+        "idempotency_key",
+        "UTF8",
+        None,
+    ),  # 11
 )
 
 
-class delete_volume_result(object):
+class start_server_async_result(object):
     """
     Attributes:
      - success
-     - c
 
     """
 
     def __init__(
         self,
         success=None,
-        c=None,
     ):
         self.success = success
-        self.c = c
 
     def read(self, iprot):
         if (
@@ -19464,13 +24205,12 @@ class delete_volume_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.BOOL:
-                    self.success = iprot.readBool()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 1:
-                if ftype == TType.STRUCT:
-                    self.c = conflictException.read(iprot)
+                if ftype == TType.STRING:
+                    self.success = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
                 else:
                     iprot.skip(ftype)
             else:
@@ -19484,14 +24224,14 @@ class delete_volume_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("delete_volume_result")
+        oprot.writeStructBegin("start_server_async_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.BOOL, 0)
-            oprot.writeBool(self.success)
-            oprot.writeFieldEnd()
-        if self.c is not None:
-            oprot.writeFieldBegin("c", TType.STRUCT, 1)
-            self.c.write(oprot)
+            oprot.writeFieldBegin("success", TType.STRING, 0)
+            oprot.writeString(
+                self.success.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.success
+            )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -19510,40 +24250,57 @@ class delete_volume_result(object):
         return not (self == other)
 
 
-all_structs.append(delete_volume_result)
-delete_volume_result.thrift_spec = (
+all_structs.append(start_server_async_result)
+start_server_async_result.thrift_spec = (
     (
         0,
-        TType.BOOL,
+        TType.STRING,
         "success",
-        None,
+        "UTF8",
         None,
     ),  # 0
-    (
-        1,
-        TType.STRUCT,
-        "c",
-        [conflictException, None],
-        None,
-    ),  # 1
 )
 
 
-class attach_volume_to_server_args(object):
+class start_server_with_custom_key_async_args(object):
     """
     Attributes:
-     - openstack_id: Id of server
-     - volume_id: Id of volume
+     - flavor: Name of the  Flavor to use.
+     - image: Name of the image to use.
+     - servername: Name for the new server
+     - metadata: Metadata for the new instance
+     - http: Boolean for http security rule
+     - https: Boolean for https security rule
+     - resenv: Names of the research environments
+     - volume_ids_path_new: Volumes to format and mount
+     - volume_ids_path_attach: Volumes to mount
+     - idempotency_key: Key of the request, retries with the same key get the job of the first request
 
     """
 
     def __init__(
         self,
-        openstack_id=None,
-        volume_id=None,
+        flavor=None,
+        image=None,
+        servername=None,
+        metadata=None,
+        http=None,
+        https=None,
+        resenv=None,
+        volume_ids_path_new=None,
+        volume_ids_path_attach=None,
+        idempotency_key=None,
     ):
-        self.openstack_id = openstack_id
-        self.volume_id = volume_id
+        self.flavor = flavor
+        self.image = image
+        self.servername = servername
+        self.metadata = metadata
+        self.http = http
+        self.https = https
+        self.resenv = resenv
+        self.volume_ids_path_new = volume_ids_path_new
+        self.volume_ids_path_attach = volume_ids_path_attach
+        self.idempotency_key = idempotency_key
 
     def read(self, iprot):
         if (
@@ -19560,16 +24317,125 @@ class attach_volume_to_server_args(object):
                 break
             if fid == 1:
                 if ftype == TType.STRING:
-                    self.openstack_id = (
+                    self.flavor = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.image = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.STRING:
+                    self.servername = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
                     )
                 else:
                     iprot.skip(ftype)
-            elif fid == 2:
+            elif fid == 4:
+                if ftype == TType.MAP:
+                    self.metadata = {}
+                    (_ktype698, _vtype699, _size697) = iprot.readMapBegin()
+                    for _i701 in range(_size697):
+                        _key702 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        _val703 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.metadata[_key702] = _val703
+                    iprot.readMapEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 5:
+                if ftype == TType.BOOL:
+                    self.http = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 6:
+                if ftype == TType.BOOL:
+                    self.https = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 7:
+                if ftype == TType.LIST:
+                    self.resenv = []
+                    (_etype707, _size704) = iprot.readListBegin()
+                    for _i708 in range(_size704):
+                        _elem709 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.resenv.append(_elem709)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 8:
+                if ftype == TType.LIST:
+                    self.volume_ids_path_new = []
+                    (_etype713, _size710) = iprot.readListBegin()
+                    for _i714 in range(_size710):
+                        _elem715 = {}
+                        (_ktype717, _vtype718, _size716) = iprot.readMapBegin()
+                        for _i720 in range(_size716):
+                            _key721 = (
+                                iprot.readString().decode("utf-8", errors="replace")
+                                if sys.version_info[0] == 2
+                                else iprot.readString()
+                            )
+                            _val722 = (
+                                iprot.readString().decode("utf-8", errors="replace")
+                                if sys.version_info[0] == 2
+                                else iprot.readString()
+                            )
+                            _elem715[_key721] = _val722
+                        iprot.readMapEnd()
+                        self.volume_ids_path_new.append(_elem715)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 9:
+                if ftype == TType.LIST:
+                    self.volume_ids_path_attach = []
+                    (_etype726, _size723) = iprot.readListBegin()
+                    for _i727 in range(_size723):
+                        _elem728 = {}
+                        (_ktype730, _vtype731, _size729) = iprot.readMapBegin()
+                        for _i733 in range(_size729):
+                            _key734 = (
+                                iprot.readString().decode("utf-8", errors="replace")
+                                if sys.version_info[0] == 2
+                                else iprot.readString()
+                            )
+                            _val735 = (
+                                iprot.readString().decode("utf-8", errors="replace")
+                                if sys.version_info[0] == 2
+                                else iprot.readString()
+                            )
+                            _elem728[_key734] = _val735
+                        iprot.readMapEnd()
+                        self.volume_ids_path_attach.append(_elem728)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 10:
                 if ftype == TType.STRING:
-                    self.volume_id = (
+                    self.idempotency_key = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
@@ -19587,21 +24453,100 @@ class attach_volume_to_server_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("attach_volume_to_server_args")
-        if self.openstack_id is not None:
-            oprot.writeFieldBegin("openstack_id", TType.STRING, 1)
+        oprot.writeStructBegin("start_server_with_custom_key_async_args")
+        if self.flavor is not None:
+            oprot.writeFieldBegin("flavor", TType.STRING, 1)
             oprot.writeString(
-                self.openstack_id.encode("utf-8")
+                self.flavor.encode("utf-8") if sys.version_info[0] == 2 else self.flavor
+            )
+            oprot.writeFieldEnd()
+        if self.image is not None:
+            oprot.writeFieldBegin("image", TType.STRING, 2)
+            oprot.writeString(
+                self.image.encode("utf-8") if sys.version_info[0] == 2 else self.image
+            )
+            oprot.writeFieldEnd()
+        if self.servername is not None:
+            oprot.writeFieldBegin("servername", TType.STRING, 3)
+            oprot.writeString(
+                self.servername.encode("utf-8")
                 if sys.version_info[0] == 2
-                else self.openstack_id
+                else self.servername
             )
             oprot.writeFieldEnd()
-        if self.volume_id is not None:
-            oprot.writeFieldBegin("volume_id", TType.STRING, 2)
+        if self.metadata is not None:
+            oprot.writeFieldBegin("metadata", TType.MAP, 4)
+            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.metadata))
+            for kiter736, viter737 in self.metadata.items():
+                oprot.writeString(
+                    kiter736.encode("utf-8") if sys.version_info[0] == 2 else kiter736
+                )
+                oprot.writeString(
+                    viter737.encode("utf-8") if sys.version_info[0] == 2 else viter737
+                )
+            oprot.writeMapEnd()
+            oprot.writeFieldEnd()
+        if self.http is not None:
+            oprot.writeFieldBegin("http", TType.BOOL, 5)
+            oprot.writeBool(self.http)
+            oprot.writeFieldEnd()
+        if self.https is not None:
+            oprot.writeFieldBegin("https", TType.BOOL, 6)
+            oprot.writeBool(self.https)
+            oprot.writeFieldEnd()
+        if self.resenv is not None:
+            oprot.writeFieldBegin("resenv", TType.LIST, 7)
+            oprot.writeListBegin(TType.STRING, len(self.resenv))
+            for iter738 in self.resenv:
+                oprot.writeString(
+                    iter738.encode("utf-8") if sys.version_info[0] == 2 else iter738
+                )
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.volume_ids_path_new is not None:
+            oprot.writeFieldBegin("volume_ids_path_new", TType.LIST, 8)
+            oprot.writeListBegin(TType.MAP, len(self.volume_ids_path_new))
+            for iter739 in self.volume_ids_path_new:
+                oprot.writeMapBegin(TType.STRING, TType.STRING, len(iter739))
+                for kiter740, viter741 in iter739.items():
+                    oprot.writeString(
+                        kiter740.encode("utf-8")
+                        if sys.version_info[0] == 2
+                        else kiter740
+                    )
+                    oprot.writeString(
+                        viter741.encode("utf-8")
+                        if sys.version_info[0] == 2
+                        else viter741
+                    )
+                oprot.writeMapEnd()
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.volume_ids_path_attach is not None:
+            oprot.writeFieldBegin("volume_ids_path_attach", TType.LIST, 9)
+            oprot.writeListBegin(TType.MAP, len(self.volume_ids_path_attach))
+            for iter742 in self.volume_ids_path_attach:
+                oprot.writeMapBegin(TType.STRING, TType.STRING, len(iter742))
+                for kiter743, viter744 in iter742.items():
+                    oprot.writeString(
+                        kiter743.encode("utf-8")
+                        if sys.version_info[0] == 2
+                        else kiter743
+                    )
+                    oprot.writeString(
+                        viter744.encode("utf-8")
+                        if sys.version_info[0] == 2
+                        else viter744
+                    )
+                oprot.writeMapEnd()
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.idempotency_key is not None:
+            oprot.writeFieldBegin("idempotency_key", TType.STRING, 10)
             oprot.writeString(
-                self.volume_id.encode("utf-8")
+                self.idempotency_key.encode("utf-8")
                 if sys.version_info[0] == 2
-                else self.volume_id
+                else self.idempotency_key
             )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
@@ -19621,44 +24566,94 @@ class attach_volume_to_server_args(object):
         return not (self == other)
 
 
-all_structs.append(attach_volume_to_server_args)
-attach_volume_to_server_args.thrift_spec = (
+all_structs.append(start_server_with_custom_key_async_args)
+start_server_with_custom_key_async_args.thrift_spec = (
     None,  # 0
     (
         1,
         TType.STRING,
-        "openstack_id",
+        "flavor",
         "UTF8",
         None,
     ),  # 1
     (
         2,
         TType.STRING,
-        "volume_id",
+        "image",
         "UTF8",
         None,
     ),  # 2
+    (
+        3,
+        TType.STRING,
+        "servername",
+        "UTF8",
+        None,
+    ),  # 3
+    (
+        4,
+        TType.MAP,
+        "metadata",
+        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
+        None,
+    ),  # 4
+    (
+        5,
+        TType.BOOL,
+        "http",
+        None,
+        None,
+    ),  # 5
+    (
+        6,
+        TType.BOOL,
+        "https",
+        None,
+        None,
+    ),  # 6
+    (
+        7,
+        TType.LIST,
+        "resenv",
+        (TType.STRING, "UTF8", False),
+        None,
+    ),  # 7
+    (
+        8,
+        TType.LIST,
+        "volume_ids_path_new",
+        (TType.MAP, (TType.STRING, "UTF8", TType.STRING, "UTF8", False), False),
+        None,
+    ),  # 8
+    (
+        9,
+        TType.LIST,
+        "volume_ids_path_attach",
+        (TType.MAP, (TType.STRING, "UTF8", TType.STRING, "UTF8", False), False),
+        None,
+    ),  # 9
+    (
+        10,
+        TType.STRING,
+        "idempotency_key",
+        "UTF8",
+        None,
+    ),  # 10
 )
 
 
-class attach_volume_to_server_result(object):
+class start_server_with_custom_key_async_result(object):
     """
     Attributes:
      - success
-     - e
-     - c
 
     """
 
     def __init__(
         self,
         success=None,
-        e=None,
-        c=None,
     ):
         self.success = success
-        self.e = e
-        self.c = c
 
     def read(self, iprot):
         if (
@@ -19674,32 +24669,12 @@ class attach_volume_to_server_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.MAP:
-                    self.success = {}
-                    (_ktype557, _vtype558, _size556) = iprot.readMapBegin()
-                    for _i560 in range(_size556):
-                        _key561 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        _val562 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        self.success[_key561] = _val562
-                    iprot.readMapEnd()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 1:
-                if ftype == TType.STRUCT:
-                    self.e = serverNotFoundException.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.STRUCT:
-                    self.c = conflictException.read(iprot)
+                if ftype == TType.STRING:
+                    self.success = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
                 else:
                     iprot.skip(ftype)
             else:
@@ -19713,26 +24688,14 @@ class attach_volume_to_server_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("attach_volume_to_server_result")
+        oprot.writeStructBegin("start_server_with_custom_key_async_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.MAP, 0)
-            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.success))
-            for kiter563, viter564 in self.success.items():
-                oprot.writeString(
-                    kiter563.encode("utf-8") if sys.version_info[0] == 2 else kiter563
-                )
-                oprot.writeString(
-                    viter564.encode("utf-8") if sys.version_info[0] == 2 else viter564
-                )
-            oprot.writeMapEnd()
-            oprot.writeFieldEnd()
-        if self.e is not None:
-            oprot.writeFieldBegin("e", TType.STRUCT, 1)
-            self.e.write(oprot)
-            oprot.writeFieldEnd()
-        if self.c is not None:
-            oprot.writeFieldBegin("c", TType.STRUCT, 2)
-            self.c.write(oprot)
+            oprot.writeFieldBegin("success", TType.STRING, 0)
+            oprot.writeString(
+                self.success.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.success
+            )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -19751,44 +24714,63 @@ class attach_volume_to_server_result(object):
         return not (self == other)
 
 
-all_structs.append(attach_volume_to_server_result)
-attach_volume_to_server_result.thrift_spec = (
+all_structs.append(start_server_with_custom_key_async_result)
+start_server_with_custom_key_async_result.thrift_spec = (
     (
         0,
-        TType.MAP,
+        TType.STRING,
         "success",
-        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
+        "UTF8",
         None,
     ),  # 0
-    (
-        1,
-        TType.STRUCT,
-        "e",
-        [serverNotFoundException, None],
-        None,
-    ),  # 1
-    (
-        2,
-        TType.STRUCT,
-        "c",
-        [conflictException, None],
-        None,
-    ),  # 2
 )
 
 
-class check_server_status_args(object):
+class start_server_without_playbook_async_args(object):
     """
     Attributes:
-     - openstack_id: Id of the server
+     - flavor: Name of the  Flavor to use.
+     - image: Name of the image to use.
+     - public_key: Public Key to use
+     - servername: Name for the new server
+     - metadata: Metadata for the new instance
+     - https: Boolean for https security rule
+     - http: Boolean for http security rule
+     - resenv: Names of the research environments
+     - volume_ids_path_new: Volumes to format and mount
+     - volume_ids_path_attach: Volumes to mount
+     - additional_keys: Additional public keys to add
+     - idempotency_key: Key of the request, retries with the same key get the job of the first request
 
     """
 
     def __init__(
         self,
-        openstack_id=None,
+        flavor=None,
+        image=None,
+        public_key=None,
+        servername=None,
+        metadata=None,
+        https=None,
+        http=None,
+        resenv=None,
+        volume_ids_path_new=None,
+        volume_ids_path_attach=None,
+        additional_keys=None,
+        idempotency_key=None,
     ):
-        self.openstack_id = openstack_id
+        self.flavor = flavor
+        self.image = image
+        self.public_key = public_key
+        self.servername = servername
+        self.metadata = metadata
+        self.https = https
+        self.http = http
+        self.resenv = resenv
+        self.volume_ids_path_new = volume_ids_path_new
+        self.volume_ids_path_attach = volume_ids_path_attach
+        self.additional_keys = additional_keys
+        self.idempotency_key = idempotency_key
 
     def read(self, iprot):
         if (
@@ -19805,7 +24787,148 @@ class check_server_status_args(object):
                 break
             if fid == 1:
                 if ftype == TType.STRING:
-                    self.openstack_id = (
+                    self.flavor = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.image = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.STRING:
+                    self.public_key = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.STRING:
+                    self.servername = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 5:
+                if ftype == TType.MAP:
+                    self.metadata = {}
+                    (_ktype746, _vtype747, _size745) = iprot.readMapBegin()
+                    for _i749 in range(_size745):
+                        _key750 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        _val751 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.metadata[_key750] = _val751
+                    iprot.readMapEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 6:
+                if ftype == TType.BOOL:
+                    self.https = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 7:
+                if ftype == TType.BOOL:
+                    self.http = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 8:
+                if ftype == TType.LIST:
+                    self.resenv = []
+                    (_etype755, _size752) = iprot.readListBegin()
+                    for _i756 in range(_size752):
+                        _elem757 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.resenv.append(_elem757)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 9:
+                if ftype == TType.LIST:
+                    self.volume_ids_path_new = []
+                    (_etype761, _size758) = iprot.readListBegin()
+                    for _i762 in range(_size758):
+                        _elem763 = {}
+                        (_ktype765, _vtype766, _size764) = iprot.readMapBegin()
+                        for _i768 in range(_size764):
+                            _key769 = (
+                                iprot.readString().decode("utf-8", errors="replace")
+                                if sys.version_info[0] == 2
+                                else iprot.readString()
+                            )
+                            _val770 = (
+                                iprot.readString().decode("utf-8", errors="replace")
+                                if sys.version_info[0] == 2
+                                else iprot.readString()
+                            )
+                            _elem763[_key769] = _val770
+                        iprot.readMapEnd()
+                        self.volume_ids_path_new.append(_elem763)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 10:
+                if ftype == TType.LIST:
+                    self.volume_ids_path_attach = []
+                    (_etype774, _size771) = iprot.readListBegin()
+                    for _i775 in range(_size771):
+                        _elem776 = {}
+                        (_ktype778, _vtype779, _size777) = iprot.readMapBegin()
+                        for _i781 in range(_size777):
+                            _key782 = (
+                                iprot.readString().decode("utf-8", errors="replace")
+                                if sys.version_info[0] == 2
+                                else iprot.readString()
+                            )
+                            _val783 = (
+                                iprot.readString().decode("utf-8", errors="replace")
+                                if sys.version_info[0] == 2
+                                else iprot.readString()
+                            )
+                            _elem776[_key782] = _val783
+                        iprot.readMapEnd()
+                        self.volume_ids_path_attach.append(_elem776)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 11:
+                if ftype == TType.LIST:
+                    self.additional_keys = []
+                    (_etype787, _size784) = iprot.readListBegin()
+                    for _i788 in range(_size784):
+                        _elem789 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.additional_keys.append(_elem789)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 12:
+                if ftype == TType.STRING:
+                    self.idempotency_key = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
@@ -19823,13 +24946,117 @@ class check_server_status_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("check_server_status_args")
-        if self.openstack_id is not None:
-            oprot.writeFieldBegin("openstack_id", TType.STRING, 1)
+        oprot.writeStructBegin("start_server_without_playbook_async_args")
+        if self.flavor is not None:
+            oprot.writeFieldBegin("flavor", TType.STRING, 1)
             oprot.writeString(
-                self.openstack_id.encode("utf-8")
+                self.flavor.encode("utf-8") if sys.version_info[0] == 2 else self.flavor
+            )
+            oprot.writeFieldEnd()
+        if self.image is not None:
+            oprot.writeFieldBegin("image", TType.STRING, 2)
+            oprot.writeString(
+                self.image.encode("utf-8") if sys.version_info[0] == 2 else self.image
+            )
+            oprot.writeFieldEnd()
+        if self.public_key is not None:
+            oprot.writeFieldBegin("public_key", TType.STRING, 3)
+            oprot.writeString(
+                self.public_key.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.public_key
+            )
+            oprot.writeFieldEnd()
+        if self.servername is not None:
+            oprot.writeFieldBegin("servername", TType.STRING, 4)
+            oprot.writeString(
+                self.servername.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.servername
+            )
+            oprot.writeFieldEnd()
+        if self.metadata is not None:
+            oprot.writeFieldBegin("metadata", TType.MAP, 5)
+            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.metadata))
+            for kiter790, viter791 in self.metadata.items():
+                oprot.writeString(
+                    kiter790.encode("utf-8") if sys.version_info[0] == 2 else kiter790
+                )
+                oprot.writeString(
+                    viter791.encode("utf-8") if sys.version_info[0] == 2 else viter791
+                )
+            oprot.writeMapEnd()
+            oprot.writeFieldEnd()
+        if self.https is not None:
+            oprot.writeFieldBegin("https", TType.BOOL, 6)
+            oprot.writeBool(self.https)
+            oprot.writeFieldEnd()
+        if self.http is not None:
+            oprot.writeFieldBegin("http", TType.BOOL, 7)
+            oprot.writeBool(self.http)
+            oprot.writeFieldEnd()
+        if self.resenv is not None:
+            oprot.writeFieldBegin("resenv", TType.LIST, 8)
+            oprot.writeListBegin(TType.STRING, len(self.resenv))
+            for iter792 in self.resenv:
+                oprot.writeString(
+                    iter792.encode("utf-8") if sys.version_info[0] == 2 else iter792
+                )
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.volume_ids_path_new is not None:
+            oprot.writeFieldBegin("volume_ids_path_new", TType.LIST, 9)
+            oprot.writeListBegin(TType.MAP, len(self.volume_ids_path_new))
+            for iter793 in self.volume_ids_path_new:
+                oprot.writeMapBegin(TType.STRING, TType.STRING, len(iter793))
+                for kiter794, viter795 in iter793.items():
+                    oprot.writeString(
+                        kiter794.encode("utf-8")
+                        if sys.version_info[0] == 2
+                        else kiter794
+                    )
+                    oprot.writeString(
+                        viter795.encode("utf-8")
+                        if sys.version_info[0] == 2
+                        else viter795
+                    )
+                oprot.writeMapEnd()
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.volume_ids_path_attach is not None:
+            oprot.writeFieldBegin("volume_ids_path_attach", TType.LIST, 10)
+            oprot.writeListBegin(TType.MAP, len(self.volume_ids_path_attach))
+            for iter796 in self.volume_ids_path_attach:
+                oprot.writeMapBegin(TType.STRING, TType.STRING, len(iter796))
+                for kiter797, viter798 in iter796.items():
+                    oprot.writeString(
+                        kiter797.encode("utf-8")
+                        if sys.version_info[0] == 2
+                        else kiter797
+                    )
+                    oprot.writeString(
+                        viter798.encode("utf-8")
+                        if sys.version_info[0] == 2
+                        else viter798
+                    )
+                oprot.writeMapEnd()
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.additional_keys is not None:
+            oprot.writeFieldBegin("additional_keys", TType.LIST, 11)
+            oprot.writeListBegin(TType.STRING, len(self.additional_keys))
+            for iter799 in self.additional_keys:
+                oprot.writeString(
+                    iter799.encode("utf-8") if sys.version_info[0] == 2 else iter799
+                )
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.idempotency_key is not None:
+            oprot.writeFieldBegin("idempotency_key", TType.STRING, 12)
+            oprot.writeString(
+                self.idempotency_key.encode("utf-8")
                 if sys.version_info[0] == 2
-                else self.openstack_id
+                else self.idempotency_key
             )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
@@ -19849,37 +25076,108 @@ class check_server_status_args(object):
         return not (self == other)
 
 
-all_structs.append(check_server_status_args)
-check_server_status_args.thrift_spec = (
+all_structs.append(start_server_without_playbook_async_args)
+start_server_without_playbook_async_args.thrift_spec = (
     None,  # 0
     (
         1,
         TType.STRING,
-        "openstack_id",
+        "flavor",
         "UTF8",
         None,
     ),  # 1
+    (
+        2,
+        TType.STRING,
+        "image",
+        "UTF8",
+        None,
+    ),  # 2
+    (
+        3,
+        TType.STRING,
+        "public_key",
+        "UTF8",
+        None,
+    ),  # 3
+    (
+        4,
+        TType.STRING,
+        "servername",
+        "UTF8",
+        None,
+    ),  # 4
+    (
+        5,
+        TType.MAP,
+        "metadata",
+        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
+        None,
+    ),  # 5
+    (
+        6,
+        TType.BOOL,
+        "https",
+        None,
+        None,
+    ),  # 6
+    (
+        7,
+        TType.BOOL,
+        "http",
+        None,
+        None,
+    ),  # 7
+    (
+        8,
+        TType.LIST,
+        "resenv",
+        (TType.STRING, "UTF8", False),
+        None,
+    ),  # 8
+    (
+        9,
+        TType.LIST,
+        "volume_ids_path_new",
+        (TType.MAP, (TType.STRING, "UTF8", TType.STRING, "UTF8", False), False),
+        None,
+    ),  # 9
+    (
+        10,
+        TType.LIST,
+        "volume_ids_path_attach",
+        (TType.MAP, (TType.STRING, "UTF8", TType.STRING, "UTF8", False), False),
+        None,
+    ),  # 10
+    (
+        11,
+        TType.LIST,
+        "additional_keys",
+        (TType.STRING, "UTF8", False),
+        None,
+    ),  # 11
+    (
+        12,
+        TType.STRING,
+        "idempotency_key",
+        "UTF8",
+        None,
+    ),  # 12
 )
 
 
-class check_server_status_result(object):
+class start_server_without_playbook_async_result(object):
     """
     Attributes:
      - success
-     - e
-     - r
 
     """
 
     def __init__(
         self,
         success=None,
-        e=None,
-        r=None,
     ):
         self.success = success
-        self.e = e
-        self.r = r
 
     def read(self, iprot):
         if (
@@ -19895,19 +25193,12 @@ class check_server_status_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.STRUCT:
-                    self.success = VM()
-                    self.success.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 1:
-                if ftype == TType.STRUCT:
-                    self.e = serverNotFoundException.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.STRUCT:
-                    self.r = ressourceException.read(iprot)
+                if ftype == TType.STRING:
+                    self.success = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
                 else:
                     iprot.skip(ftype)
             else:
@@ -19921,18 +25212,14 @@ class check_server_status_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("check_server_status_result")
+        oprot.writeStructBegin("start_server_without_playbook_async_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.STRUCT, 0)
-            self.success.write(oprot)
-            oprot.writeFieldEnd()
-        if self.e is not None:
-            oprot.writeFieldBegin("e", TType.STRUCT, 1)
-            self.e.write(oprot)
-            oprot.writeFieldEnd()
-        if self.r is not None:
-            oprot.writeFieldBegin("r", TType.STRUCT, 2)
-            self.r.write(oprot)
+            oprot.writeFieldBegin("success", TType.STRING, 0)
+            oprot.writeString(
+                self.success.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.success
+            )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -19951,47 +25238,60 @@ class check_server_status_result(object):
         return not (self == other)
 
 
-all_structs.append(check_server_status_result)
-check_server_status_result.thrift_spec = (
+all_structs.append(start_server_without_playbook_async_result)
+start_server_without_playbook_async_result.thrift_spec = (
     (
         0,
-        TType.STRUCT,
+        TType.STRING,
         "success",
-        [VM, None],
+        "UTF8",
         None,
     ),  # 0
-    (
-        1,
-        TType.STRUCT,
-        "e",
-        [serverNotFoundException, None],
-        None,
-    ),  # 1
-    (
-        2,
-        TType.STRUCT,
-        "r",
-        [ressourceException, None],
-        None,
-    ),  # 2
 )
 
 
-class setUserPassword_args(object):
+class start_server_with_mounted_volume_async_args(object):
     """
     Attributes:
-     - user: Elixir-Id of the user which wants to set a password
-     - password: New password
+     - flavor: Name of the  Flavor to use.
+     - image: Name of the image to use.
+     - public_key: Public Key to use
+     - servername: Name for the new server
+     - metadata: Metadata for the new instance
+     - https: Boolean for https security rule
+     - http: Boolean for http security rule
+     - resenv: Names of the research environments
+     - volume_ids_path_new: Volumes to format and mount
+     - volume_ids_path_attach: Volumes to mount
+     - idempotency_key: Key of the request, retries with the same key get the job of the first request
 
     """
 
     def __init__(
         self,
-        user=None,
-        password=None,
+        flavor=None,
+        image=None,
+        public_key=None,
+        servername=None,
+        metadata=None,
+        https=None,
+        http=None,
+        resenv=None,
+        volume_ids_path_new=None,
+        volume_ids_path_attach=None,
+        idempotency_key=None,
     ):
-        self.user = user
-        self.password = password
+        self.flavor = flavor
+        self.image = image
+        self.public_key = public_key
+        self.servername = servername
+        self.metadata = metadata
+        self.https = https
+        self.http = http
+        self.resenv = resenv
+        self.volume_ids_path_new = volume_ids_path_new
+        self.volume_ids_path_attach = volume_ids_path_attach
+        self.idempotency_key = idempotency_key
 
     def read(self, iprot):
         if (
@@ -20008,16 +25308,134 @@ class setUserPassword_args(object):
                 break
             if fid == 1:
                 if ftype == TType.STRING:
-                    self.user = (
+                    self.flavor = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.image = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.STRING:
+                    self.public_key = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.STRING:
+                    self.servername = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
                     )
                 else:
                     iprot.skip(ftype)
-            elif fid == 2:
+            elif fid == 5:
+                if ftype == TType.MAP:
+                    self.metadata = {}
+                    (_ktype801, _vtype802, _size800) = iprot.readMapBegin()
+                    for _i804 in range(_size800):
+                        _key805 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        _val806 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.metadata[_key805] = _val806
+                    iprot.readMapEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 6:
+                if ftype == TType.BOOL:
+                    self.https = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 7:
+                if ftype == TType.BOOL:
+                    self.http = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 8:
+                if ftype == TType.LIST:
+                    self.resenv = []
+                    (_etype810, _size807) = iprot.readListBegin()
+                    for _i811 in range(_size807):
+                        _elem812 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.resenv.append(_elem812)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 9:
+                if ftype == TType.LIST:
+                    self.volume_ids_path_new = []
+                    (_etype816, _size813) = iprot.readListBegin()
+                    for _i817 in range(_size813):
+                        _elem818 = {}
+                        (_ktype820, _vtype821, _size819) = iprot.readMapBegin()
+                        for _i823 in range(_size819):
+                            _key824 = (
+                                iprot.readString().decode("utf-8", errors="replace")
+                                if sys.version_info[0] == 2
+                                else iprot.readString()
+                            )
+                            _val825 = (
+                                iprot.readString().decode("utf-8", errors="replace")
+                                if sys.version_info[0] == 2
+                                else iprot.readString()
+                            )
+                            _elem818[_key824] = _val825
+                        iprot.readMapEnd()
+                        self.volume_ids_path_new.append(_elem818)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 10:
+                if ftype == TType.LIST:
+                    self.volume_ids_path_attach = []
+                    (_etype829, _size826) = iprot.readListBegin()
+                    for _i830 in range(_size826):
+                        _elem831 = {}
+                        (_ktype833, _vtype834, _size832) = iprot.readMapBegin()
+                        for _i836 in range(_size832):
+                            _key837 = (
+                                iprot.readString().decode("utf-8", errors="replace")
+                                if sys.version_info[0] == 2
+                                else iprot.readString()
+                            )
+                            _val838 = (
+                                iprot.readString().decode("utf-8", errors="replace")
+                                if sys.version_info[0] == 2
+                                else iprot.readString()
+                            )
+                            _elem831[_key837] = _val838
+                        iprot.readMapEnd()
+                        self.volume_ids_path_attach.append(_elem831)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 11:
                 if ftype == TType.STRING:
-                    self.password = (
+                    self.idempotency_key = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
@@ -20035,19 +25453,108 @@ class setUserPassword_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("setUserPassword_args")
-        if self.user is not None:
-            oprot.writeFieldBegin("user", TType.STRING, 1)
+        oprot.writeStructBegin("start_server_with_mounted_volume_async_args")
+        if self.flavor is not None:
+            oprot.writeFieldBegin("flavor", TType.STRING, 1)
             oprot.writeString(
-                self.user.encode("utf-8") if sys.version_info[0] == 2 else self.user
+                self.flavor.encode("utf-8") if sys.version_info[0] == 2 else self.flavor
             )
             oprot.writeFieldEnd()
-        if self.password is not None:
-            oprot.writeFieldBegin("password", TType.STRING, 2)
+        if self.image is not None:
+            oprot.writeFieldBegin("image", TType.STRING, 2)
             oprot.writeString(
-                self.password.encode("utf-8")
+                self.image.encode("utf-8") if sys.version_info[0] == 2 else self.image
+            )
+            oprot.writeFieldEnd()
+        if self.public_key is not None:
+            oprot.writeFieldBegin("public_key", TType.STRING, 3)
+            oprot.writeString(
+                self.public_key.encode("utf-8")
                 if sys.version_info[0] == 2
-                else self.password
+                else self.public_key
+            )
+            oprot.writeFieldEnd()
+        if self.servername is not None:
+            oprot.writeFieldBegin("servername", TType.STRING, 4)
+            oprot.writeString(
+                self.servername.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.servername
+            )
+            oprot.writeFieldEnd()
+        if self.metadata is not None:
+            oprot.writeFieldBegin("metadata", TType.MAP, 5)
+            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.metadata))
+            for kiter839, viter840 in self.metadata.items():
+                oprot.writeString(
+                    kiter839.encode("utf-8") if sys.version_info[0] == 2 else kiter839
+                )
+                oprot.writeString(
+                    viter840.encode("utf-8") if sys.version_info[0] == 2 else viter840
+                )
+            oprot.writeMapEnd()
+            oprot.writeFieldEnd()
+        if self.https is not None:
+            oprot.writeFieldBegin("https", TType.BOOL, 6)
+            oprot.writeBool(self.https)
+            oprot.writeFieldEnd()
+        if self.http is not None:
+            oprot.writeFieldBegin("http", TType.BOOL, 7)
+            oprot.writeBool(self.http)
+            oprot.writeFieldEnd()
+        if self.resenv is not None:
+            oprot.writeFieldBegin("resenv", TType.LIST, 8)
+            oprot.writeListBegin(TType.STRING, len(self.resenv))
+            for iter841 in self.resenv:
+                oprot.writeString(
+                    iter841.encode("utf-8") if sys.version_info[0] == 2 else iter841
+                )
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.volume_ids_path_new is not None:
+            oprot.writeFieldBegin("volume_ids_path_new", TType.LIST, 9)
+            oprot.writeListBegin(TType.MAP, len(self.volume_ids_path_new))
+            for iter842 in self.volume_ids_path_new:
+                oprot.writeMapBegin(TType.STRING, TType.STRING, len(iter842))
+                for kiter843, viter844 in iter842.items():
+                    oprot.writeString(
+                        kiter843.encode("utf-8")
+                        if sys.version_info[0] == 2
+                        else kiter843
+                    )
+                    oprot.writeString(
+                        viter844.encode("utf-8")
+                        if sys.version_info[0] == 2
+                        else viter844
+                    )
+                oprot.writeMapEnd()
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.volume_ids_path_attach is not None:
+            oprot.writeFieldBegin("volume_ids_path_attach", TType.LIST, 10)
+            oprot.writeListBegin(TType.MAP, len(self.volume_ids_path_attach))
+            for iter845 in self.volume_ids_path_attach:
+                oprot.writeMapBegin(TType.STRING, TType.STRING, len(iter845))
+                for kiter846, viter847 in iter845.items():
+                    oprot.writeString(
+                        kiter846.encode("utf-8")
+                        if sys.version_info[0] == 2
+                        else kiter846
+                    )
+                    oprot.writeString(
+                        viter847.encode("utf-8")
+                        if sys.version_info[0] == 2
+                        else viter847
+                    )
+                oprot.writeMapEnd()
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.idempotency_key is not None:
+            oprot.writeFieldBegin("idempotency_key", TType.STRING, 11)
+            oprot.writeString(
+                self.idempotency_key.encode("utf-8")
+                if sys.version_info[0] == 2
+                else self.idempotency_key
             )
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
@@ -20067,41 +25574,101 @@ class setUserPassword_args(object):
         return not (self == other)
 
 
-all_structs.append(setUserPassword_args)
-setUserPassword_args.thrift_spec = (
+all_structs.append(start_server_with_mounted_volume_async_args)
+start_server_with_mounted_volume_async_args.thrift_spec = (
     None,  # 0
     (
         1,
         TType.STRING,
-        "user",
+        "flavor",
         "UTF8",
         None,
     ),  # 1
     (
         2,
         TType.STRING,
-        "password",
+        "image",
         "UTF8",
         None,
     ),  # 2
+    (
+        3,
+        TType.STRING,
+        "public_key",
+        "UTF8",
+        None,
+    ),  # 3
+    (
+        4,
+        TType.STRING,
+        "servername",
+        "UTF8",
+        None,
+    ),  # 4
+    (
+        5,
+        TType.MAP,
+        "metadata",
+        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
+        None,
+    ),  # 5
+    (
+        6,
+        TType.BOOL,
+        "https",
+        None,
+        None,
+    ),  # 6
+    (
+        7,
+        TType.BOOL,
+        "http",
+        None,
+        None,
+    ),  # 7
+    (
+        8,
+        TType.LIST,
+        "resenv",
+        (TType.STRING, "UTF8", False),
+        None,
+    ),  # 8
+    (
+        9,
+        TType.LIST,
+        "volume_ids_path_new",
+        (TType.MAP, (TType.STRING, "UTF8", TType.STRING, "UTF8", False), False),
+        None,
+    ),  # 9
+    (
+        10,
+        TType.LIST,
+        "volume_ids_path_attach",
+        (TType.MAP, (TType.STRING, "UTF8", TType.STRING, "UTF8", False), False),
+        None,
+    ),  # 10
+    (
+        11,
+        TType.STRING,
+        "idempotency_key",
+        "UTF8",
+        None,
+    ),  # 11
 )
 
 
-class setUserPassword_result(object):
+class start_server_with_mounted_volume_async_result(object):
     """
     Attributes:
      - success
-     - e
 
     """
 
     def __init__(
         self,
         success=None,
-        e=None,
     ):
         self.success = success
-        self.e = e
 
     def read(self, iprot):
         if (
@@ -20125,11 +25692,6 @@ class setUserPassword_result(object):
                     )
                 else:
                     iprot.skip(ftype)
-            elif fid == 1:
-                if ftype == TType.STRUCT:
-                    self.e = otherException.read(iprot)
-                else:
-                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -20141,7 +25703,7 @@ class setUserPassword_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("setUserPassword_result")
+        oprot.writeStructBegin("start_server_with_mounted_volume_async_result")
         if self.success is not None:
             oprot.writeFieldBegin("success", TType.STRING, 0)
             oprot.writeString(
@@ -20150,10 +25712,6 @@ class setUserPassword_result(object):
                 else self.success
             )
             oprot.writeFieldEnd()
-        if self.e is not None:
-            oprot.writeFieldBegin("e", TType.STRUCT, 1)
-            self.e.write(oprot)
-            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -20171,8 +25729,8 @@ class setUserPassword_result(object):
         return not (self == other)
 
 
-all_structs.append(setUserPassword_result)
-setUserPassword_result.thrift_spec = (
+all_structs.append(start_server_with_mounted_volume_async_result)
+start_server_with_mounted_volume_async_result.thrift_spec = (
     (
         0,
         TType.STRING,
@@ -20180,28 +25738,39 @@ setUserPassword_result.thrift_spec = (
         "UTF8",
         None,
     ),  # 0
-    (
-        1,
-        TType.STRUCT,
-        "e",
-        [otherException, None],
-        None,
-    ),  # 1
 )
 
 
-class resume_server_args(object):
+class start_servers_with_custom_key_args(object):
     """
     Attributes:
-     - openstack_id: Id of the server
+     - flavor: Name of the  Flavor to use.
+     - image: Name of the image to use.
+     - servernames: Names of the new servers
+     - metadatas: Metadata of the new servers, in the order of servernames
+     - http: Boolean for http security rule
+     - https: Boolean for https security rule
+     - resenv: Names of the research environments
 
     """
 
     def __init__(
         self,
-        openstack_id=None,
+        flavor=None,
+        image=None,
+        servernames=None,
+        metadatas=None,
+        http=None,
+        https=None,
+        resenv=None,
     ):
-        self.openstack_id = openstack_id
+        self.flavor = flavor
+        self.image = image
+        self.servernames = servernames
+        self.metadatas = metadatas
+        self.http = http
+        self.https = https
+        self.resenv = resenv
 
     def read(self, iprot):
         if (
@@ -20218,13 +25787,84 @@ class resume_server_args(object):
                 break
             if fid == 1:
                 if ftype == TType.STRING:
-                    self.openstack_id = (
+                    self.flavor = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.image = (
                         iprot.readString().decode("utf-8", errors="replace")
                         if sys.version_info[0] == 2
                         else iprot.readString()
                     )
                 else:
                     iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.LIST:
+                    self.servernames = []
+                    (_etype851, _size848) = iprot.readListBegin()
+                    for _i852 in range(_size848):
+                        _elem853 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.servernames.append(_elem853)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.LIST:
+                    self.metadatas = []
+                    (_etype857, _size854) = iprot.readListBegin()
+                    for _i858 in range(_size854):
+                        _elem859 = {}
+                        (_ktype861, _vtype862, _size860) = iprot.readMapBegin()
+                        for _i864 in range(_size860):
+                            _key865 = (
+                                iprot.readString().decode("utf-8", errors="replace")
+                                if sys.version_info[0] == 2
+                                else iprot.readString()
+                            )
+                            _val866 = (
+                                iprot.readString().decode("utf-8", errors="replace")
+                                if sys.version_info[0] == 2
+                                else iprot.readString()
+                            )
+                            _elem859[_key865] = _val866
+                        iprot.readMapEnd()
+                        self.metadatas.append(_elem859)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 5:
+                if ftype == TType.BOOL:
+                    self.http = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 6:
+                if ftype == TType.BOOL:
+                    self.https = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 7:
+                if ftype == TType.LIST:
+                    self.resenv = []
+                    (_etype870, _size867) = iprot.readListBegin()
+                    for _i871 in range(_size867):
+                        _elem872 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.resenv.append(_elem872)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -20236,15 +25876,64 @@ class resume_server_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("resume_server_args")
-        if self.openstack_id is not None:
-            oprot.writeFieldBegin("openstack_id", TType.STRING, 1)
+        oprot.writeStructBegin("start_servers_with_custom_key_args")
+        if self.flavor is not None:
+            oprot.writeFieldBegin("flavor", TType.STRING, 1)
             oprot.writeString(
-                self.openstack_id.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.openstack_id
+                self.flavor.encode("utf-8") if sys.version_info[0] == 2 else self.flavor
+            )
+            oprot.writeFieldEnd()
+        if self.image is not None:
+            oprot.writeFieldBegin("image", TType.STRING, 2)
+            oprot.writeString(
+                self.image.encode("utf-8") if sys.version_info[0] == 2 else self.image
             )
             oprot.writeFieldEnd()
+        if self.servernames is not None:
+            oprot.writeFieldBegin("servernames", TType.LIST, 3)
+            oprot.writeListBegin(TType.STRING, len(self.servernames))
+            for iter873 in self.servernames:
+                oprot.writeString(
+                    iter873.encode("utf-8") if sys.version_info[0] == 2 else iter873
+                )
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.metadatas is not None:
+            oprot.writeFieldBegin("metadatas", TType.LIST, 4)
+            oprot.writeListBegin(TType.MAP, len(self.metadatas))
+            for iter874 in self.metadatas:
+                oprot.writeMapBegin(TType.STRING, TType.STRING, len(iter874))
+                for kiter875, viter876 in iter874.items():
+                    oprot.writeString(
+                        kiter875.encode("utf-8")
+                        if sys.version_info[0] == 2
+                        else kiter875
+                    )
+                    oprot.writeString(
+                        viter876.encode("utf-8")
+                        if sys.version_info[0] == 2
+                        else viter876
+                    )
+                oprot.writeMapEnd()
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.http is not None:
+            oprot.writeFieldBegin("http", TType.BOOL, 5)
+            oprot.writeBool(self.http)
+            oprot.writeFieldEnd()
+        if self.https is not None:
+            oprot.writeFieldBegin("https", TType.BOOL, 6)
+            oprot.writeBool(self.https)
+            oprot.writeFieldEnd()
+        if self.resenv is not None:
+            oprot.writeFieldBegin("resenv", TType.LIST, 7)
+            oprot.writeListBegin(TType.STRING, len(self.resenv))
+            for iter877 in self.resenv:
+                oprot.writeString(
+                    iter877.encode("utf-8") if sys.version_info[0] == 2 else iter877
+                )
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -20262,37 +25951,85 @@ class resume_server_args(object):
         return not (self == other)
 
 
-all_structs.append(resume_server_args)
-resume_server_args.thrift_spec = (
+all_structs.append(start_servers_with_custom_key_args)
+start_servers_with_custom_key_args.thrift_spec = (
     None,  # 0
     (
         1,
         TType.STRING,
-        "openstack_id",
+        "flavor",
         "UTF8",
         None,
     ),  # 1
+    (
+        2,
+        TType.STRING,
+        "image",
+        "UTF8",
+        None,
+    ),  # 2
+    (
+        3,
+        TType.LIST,
+        "servernames",
+        (TType.STRING, "UTF8", False),
+        None,
+    ),  # 3
+    (
+        4,
+        TType.LIST,
+        "metadatas",
+        (TType.MAP, (TType.STRING, "UTF8", TType.STRING, "UTF8", False), False),
+        None,
+    ),  # 4
+    (
+        5,
+        TType.BOOL,
+        "http",
+        None,
+        None,
+    ),  # 5
+    (
+        6,
+        TType.BOOL,
+        "https",
+        None,
+        None,
+    ),  # 6
+    (
+        7,
+        TType.LIST,
+        "resenv",
+        (TType.STRING, "UTF8", False),
+        None,
+    ),  # 7
 )
 
 
-class resume_server_result(object):
+class start_servers_with_custom_key_result(object):
     """
     Attributes:
      - success
-     - e
-     - c
+     - i
+     - f
+     - n
+     - o
 
     """
 
     def __init__(
         self,
         success=None,
-        e=None,
-        c=None,
+        i=None,
+        f=None,
+        n=None,
+        o=None,
     ):
         self.success = success
-        self.e = e
-        self.c = c
+        self.i = i
+        self.f = f
+        self.n = n
+        self.o = o
 
     def read(self, iprot):
         if (
@@ -20308,18 +26045,47 @@ class resume_server_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.BOOL:
-                    self.success = iprot.readBool()
+                if ftype == TType.LIST:
+                    self.success = []
+                    (_etype881, _size878) = iprot.readListBegin()
+                    for _i882 in range(_size878):
+                        _elem883 = {}
+                        (_ktype885, _vtype886, _size884) = iprot.readMapBegin()
+                        for _i888 in range(_size884):
+                            _key889 = (
+                                iprot.readString().decode("utf-8", errors="replace")
+                                if sys.version_info[0] == 2
+                                else iprot.readString()
+                            )
+                            _val890 = (
+                                iprot.readString().decode("utf-8", errors="replace")
+                                if sys.version_info[0] == 2
+                                else iprot.readString()
+                            )
+                            _elem883[_key889] = _val890
+                        iprot.readMapEnd()
+                        self.success.append(_elem883)
+                    iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
             elif fid == 1:
                 if ftype == TType.STRUCT:
-                    self.e = serverNotFoundException.read(iprot)
+                    self.i = imageNotFoundException.read(iprot)
                 else:
                     iprot.skip(ftype)
             elif fid == 2:
                 if ftype == TType.STRUCT:
-                    self.c = conflictException.read(iprot)
+                    self.f = flavorNotFoundException.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.STRUCT:
+                    self.n = networkNotFoundException.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.STRUCT:
+                    self.o = otherException.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -20333,18 +26099,41 @@ class resume_server_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("resume_server_result")
+        oprot.writeStructBegin("start_servers_with_custom_key_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.BOOL, 0)
-            oprot.writeBool(self.success)
+            oprot.writeFieldBegin("success", TType.LIST, 0)
+            oprot.writeListBegin(TType.MAP, len(self.success))
+            for iter891 in self.success:
+                oprot.writeMapBegin(TType.STRING, TType.STRING, len(iter891))
+                for kiter892, viter893 in iter891.items():
+                    oprot.writeString(
+                        kiter892.encode("utf-8")
+                        if sys.version_info[0] == 2
+                        else kiter892
+                    )
+                    oprot.writeString(
+                        viter893.encode("utf-8")
+                        if sys.version_info[0] == 2
+                        else viter893
+                    )
+                oprot.writeMapEnd()
+            oprot.writeListEnd()
             oprot.writeFieldEnd()
-        if self.e is not None:
-            oprot.writeFieldBegin("e", TType.STRUCT, 1)
-            self.e.write(oprot)
+        if self.i is not None:
+            oprot.writeFieldBegin("i", TType.STRUCT, 1)
+            self.i.write(oprot)
             oprot.writeFieldEnd()
-        if self.c is not None:
-            oprot.writeFieldBegin("c", TType.STRUCT, 2)
-            self.c.write(oprot)
+        if self.f is not None:
+            oprot.writeFieldBegin("f", TType.STRUCT, 2)
+            self.f.write(oprot)
+            oprot.writeFieldEnd()
+        if self.n is not None:
+            oprot.writeFieldBegin("n", TType.STRUCT, 3)
+            self.n.write(oprot)
+            oprot.writeFieldEnd()
+        if self.o is not None:
+            oprot.writeFieldBegin("o", TType.STRUCT, 4)
+            self.o.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -20363,95 +26152,79 @@ class resume_server_result(object):
         return not (self == other)
 
 
-all_structs.append(resume_server_result)
-resume_server_result.thrift_spec = (
+all_structs.append(start_servers_with_custom_key_result)
+start_servers_with_custom_key_result.thrift_spec = (
     (
         0,
-        TType.BOOL,
+        TType.LIST,
         "success",
-        None,
+        (TType.MAP, (TType.STRING, "UTF8", TType.STRING, "UTF8", False), False),
         None,
     ),  # 0
     (
         1,
         TType.STRUCT,
-        "e",
-        [serverNotFoundException, None],
+        "i",
+        [imageNotFoundException, None],
         None,
     ),  # 1
     (
         2,
         TType.STRUCT,
-        "c",
-        [conflictException, None],
+        "f",
+        [flavorNotFoundException, None],
         None,
     ),  # 2
+    (
+        3,
+        TType.STRUCT,
+        "n",
+        [networkNotFoundException, None],
+        None,
+    ),  # 3
+    (
+        4,
+        TType.STRUCT,
+        "o",
+        [otherException, None],
+        None,
+    ),  # 4
 )
 
 
-class create_volume_args(object):
+class acknowledge_job_args(object):
     """
     Attributes:
-     - volume_name: Name of volume
-     - volume_storage: Diskspace in GB for new volume
-     - metadata: Metadata for the new volume
+     - job_id: Id of the job
 
     """
 
-    def __init__(
-        self,
-        volume_name=None,
-        volume_storage=None,
-        metadata=None,
-    ):
-        self.volume_name = volume_name
-        self.volume_storage = volume_storage
-        self.metadata = metadata
-
-    def read(self, iprot):
-        if (
-            iprot._fast_decode is not None
-            and isinstance(iprot.trans, TTransport.CReadableTransport)
-            and self.thrift_spec is not None
-        ):
-            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
-            return
-        iprot.readStructBegin()
-        while True:
-            (fname, ftype, fid) = iprot.readFieldBegin()
-            if ftype == TType.STOP:
-                break
-            if fid == 1:
-                if ftype == TType.STRING:
-                    self.volume_name = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.I32:
-                    self.volume_storage = iprot.readI32()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 3:
-                if ftype == TType.MAP:
-                    self.metadata = {}
-                    (_ktype566, _vtype567, _size565) = iprot.readMapBegin()
-                    for _i569 in range(_size565):
-                        _key570 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        _val571 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        self.metadata[_key570] = _val571
-                    iprot.readMapEnd()
+    def __init__(
+        self,
+        job_id=None,
+    ):
+        self.job_id = job_id
+
+    def read(self, iprot):
+        if (
+            iprot._fast_decode is not None
+            and isinstance(iprot.trans, TTransport.CReadableTransport)
+            and self.thrift_spec is not None
+        ):
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.job_id = (
+                        iprot.readString().decode("utf-8", errors="replace")
+                        if sys.version_info[0] == 2
+                        else iprot.readString()
+                    )
                 else:
                     iprot.skip(ftype)
             else:
@@ -20465,31 +26238,13 @@ class create_volume_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("create_volume_args")
-        if self.volume_name is not None:
-            oprot.writeFieldBegin("volume_name", TType.STRING, 1)
+        oprot.writeStructBegin("acknowledge_job_args")
+        if self.job_id is not None:
+            oprot.writeFieldBegin("job_id", TType.STRING, 1)
             oprot.writeString(
-                self.volume_name.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.volume_name
+                self.job_id.encode("utf-8") if sys.version_info[0] == 2 else self.job_id
             )
             oprot.writeFieldEnd()
-        if self.volume_storage is not None:
-            oprot.writeFieldBegin("volume_storage", TType.I32, 2)
-            oprot.writeI32(self.volume_storage)
-            oprot.writeFieldEnd()
-        if self.metadata is not None:
-            oprot.writeFieldBegin("metadata", TType.MAP, 3)
-            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.metadata))
-            for kiter572, viter573 in self.metadata.items():
-                oprot.writeString(
-                    kiter572.encode("utf-8") if sys.version_info[0] == 2 else kiter572
-                )
-                oprot.writeString(
-                    viter573.encode("utf-8") if sys.version_info[0] == 2 else viter573
-                )
-            oprot.writeMapEnd()
-            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -20507,48 +26262,31 @@ class create_volume_args(object):
         return not (self == other)
 
 
-all_structs.append(create_volume_args)
-create_volume_args.thrift_spec = (
+all_structs.append(acknowledge_job_args)
+acknowledge_job_args.thrift_spec = (
     None,  # 0
     (
         1,
         TType.STRING,
-        "volume_name",
+        "job_id",
         "UTF8",
         None,
     ),  # 1
-    (
-        2,
-        TType.I32,
-        "volume_storage",
-        None,
-        None,
-    ),  # 2
-    (
-        3,
-        TType.MAP,
-        "metadata",
-        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
-        None,
-    ),  # 3
 )
 
 
-class create_volume_result(object):
+class acknowledge_job_result(object):
     """
     Attributes:
      - success
-     - r
 
     """
 
     def __init__(
         self,
         success=None,
-        r=None,
     ):
         self.success = success
-        self.r = r
 
     def read(self, iprot):
         if (
@@ -20564,27 +26302,8 @@ class create_volume_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.MAP:
-                    self.success = {}
-                    (_ktype575, _vtype576, _size574) = iprot.readMapBegin()
-                    for _i578 in range(_size574):
-                        _key579 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        _val580 = (
-                            iprot.readString().decode("utf-8", errors="replace")
-                            if sys.version_info[0] == 2
-                            else iprot.readString()
-                        )
-                        self.success[_key579] = _val580
-                    iprot.readMapEnd()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 1:
-                if ftype == TType.STRUCT:
-                    self.r = ressourceException.read(iprot)
+                if ftype == TType.BOOL:
+                    self.success = iprot.readBool()
                 else:
                     iprot.skip(ftype)
             else:
@@ -20598,22 +26317,10 @@ class create_volume_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("create_volume_result")
+        oprot.writeStructBegin("acknowledge_job_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.MAP, 0)
-            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.success))
-            for kiter581, viter582 in self.success.items():
-                oprot.writeString(
-                    kiter581.encode("utf-8") if sys.version_info[0] == 2 else kiter581
-                )
-                oprot.writeString(
-                    viter582.encode("utf-8") if sys.version_info[0] == 2 else viter582
-                )
-            oprot.writeMapEnd()
-            oprot.writeFieldEnd()
-        if self.r is not None:
-            oprot.writeFieldBegin("r", TType.STRUCT, 1)
-            self.r.write(oprot)
+            oprot.writeFieldBegin("success", TType.BOOL, 0)
+            oprot.writeBool(self.success)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -20632,41 +26339,19 @@ class create_volume_result(object):
         return not (self == other)
 
 
-all_structs.append(create_volume_result)
-create_volume_result.thrift_spec = (
+all_structs.append(acknowledge_job_result)
+acknowledge_job_result.thrift_spec = (
     (
         0,
-        TType.MAP,
+        TType.BOOL,
         "success",
-        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
         None,
-    ),  # 0
-    (
-        1,
-        TType.STRUCT,
-        "r",
-        [ressourceException, None],
         None,
-    ),  # 1
+    ),  # 0
 )
 
 
-class reboot_server_args(object):
-    """
-    Attributes:
-     - server_id: Id of the server
-     - reboot_type: HARD or SOFT
-
-    """
-
-    def __init__(
-        self,
-        server_id=None,
-        reboot_type=None,
-    ):
-        self.server_id = server_id
-        self.reboot_type = reboot_type
-
+class get_server_stats_args(object):
     def read(self, iprot):
         if (
             iprot._fast_decode is not None
@@ -20680,24 +26365,6 @@ class reboot_server_args(object):
             (fname, ftype, fid) = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 1:
-                if ftype == TType.STRING:
-                    self.server_id = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.STRING:
-                    self.reboot_type = (
-                        iprot.readString().decode("utf-8", errors="replace")
-                        if sys.version_info[0] == 2
-                        else iprot.readString()
-                    )
-                else:
-                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -20709,23 +26376,7 @@ class reboot_server_args(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("reboot_server_args")
-        if self.server_id is not None:
-            oprot.writeFieldBegin("server_id", TType.STRING, 1)
-            oprot.writeString(
-                self.server_id.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.server_id
-            )
-            oprot.writeFieldEnd()
-        if self.reboot_type is not None:
-            oprot.writeFieldBegin("reboot_type", TType.STRING, 2)
-            oprot.writeString(
-                self.reboot_type.encode("utf-8")
-                if sys.version_info[0] == 2
-                else self.reboot_type
-            )
-            oprot.writeFieldEnd()
+        oprot.writeStructBegin("get_server_stats_args")
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -20743,44 +26394,22 @@ class reboot_server_args(object):
         return not (self == other)
 
 
-all_structs.append(reboot_server_args)
-reboot_server_args.thrift_spec = (
-    None,  # 0
-    (
-        1,
-        TType.STRING,
-        "server_id",
-        "UTF8",
-        None,
-    ),  # 1
-    (
-        2,
-        TType.STRING,
-        "reboot_type",
-        "UTF8",
-        None,
-    ),  # 2
-)
+all_structs.append(get_server_stats_args)
+get_server_stats_args.thrift_spec = ()
 
 
-class reboot_server_result(object):
+class get_server_stats_result(object):
     """
     Attributes:
      - success
-     - e
-     - c
 
     """
 
     def __init__(
         self,
         success=None,
-        e=None,
-        c=None,
     ):
         self.success = success
-        self.e = e
-        self.c = c
 
     def read(self, iprot):
         if (
@@ -20796,18 +26425,22 @@ class reboot_server_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.BOOL:
-                    self.success = iprot.readBool()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 1:
-                if ftype == TType.STRUCT:
-                    self.e = serverNotFoundException.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.STRUCT:
-                    self.c = conflictException.read(iprot)
+                if ftype == TType.MAP:
+                    self.success = {}
+                    (_ktype895, _vtype896, _size894) = iprot.readMapBegin()
+                    for _i898 in range(_size894):
+                        _key899 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        _val900 = (
+                            iprot.readString().decode("utf-8", errors="replace")
+                            if sys.version_info[0] == 2
+                            else iprot.readString()
+                        )
+                        self.success[_key899] = _val900
+                    iprot.readMapEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -20821,18 +26454,18 @@ class reboot_server_result(object):
                 oprot._fast_encode(self, [self.__class__, self.thrift_spec])
             )
             return
-        oprot.writeStructBegin("reboot_server_result")
+        oprot.writeStructBegin("get_server_stats_result")
         if self.success is not None:
-            oprot.writeFieldBegin("success", TType.BOOL, 0)
-            oprot.writeBool(self.success)
-            oprot.writeFieldEnd()
-        if self.e is not None:
-            oprot.writeFieldBegin("e", TType.STRUCT, 1)
-            self.e.write(oprot)
-            oprot.writeFieldEnd()
-        if self.c is not None:
-            oprot.writeFieldBegin("c", TType.STRUCT, 2)
-            self.c.write(oprot)
+            oprot.writeFieldBegin("success", TType.MAP, 0)
+            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.success))
+            for kiter901, viter902 in self.success.items():
+                oprot.writeString(
+                    kiter901.encode("utf-8") if sys.version_info[0] == 2 else kiter901
+                )
+                oprot.writeString(
+                    viter902.encode("utf-8") if sys.version_info[0] == 2 else viter902
+                )
+            oprot.writeMapEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -20851,29 +26484,15 @@ class reboot_server_result(object):
         return not (self == other)
 
 
-all_structs.append(reboot_server_result)
-reboot_server_result.thrift_spec = (
+all_structs.append(get_server_stats_result)
+get_server_stats_result.thrift_spec = (
     (
         0,
-        TType.BOOL,
+        TType.MAP,
         "success",
-        None,
+        (TType.STRING, "UTF8", TType.STRING, "UTF8", False),
         None,
     ),  # 0
-    (
-        1,
-        TType.STRUCT,
-        "e",
-        [serverNotFoundException, None],
-        None,
-    ),  # 1
-    (
-        2,
-        TType.STRUCT,
-        "c",
-        [conflictException, None],
-        None,
-    ),  # 2
 )
 fix_spec(all_structs)
 del all_structs
@@ -1,21 +1,67 @@
 import logging
 import os
 import shlex
-import shutil
 import subprocess
+import weakref
 from tempfile import NamedTemporaryFile, TemporaryDirectory
 
-import redis
 import ruamel.yaml
 
+try:
+    from ancon.StateStore import StateStore
+except Exception:
+    from .StateStore import StateStore
+
 CONDA = "conda"
 OPTIONAL = "optional"
 MOSH = "mosh"
 
 ALL_TEMPLATES = [CONDA]
 
+STDOUT = "stdout"
+STDERR = "stderr"
+
 CLOUD_SITE = ""
 
+# bytes of a character following its first byte
+LOG_READ_AHEAD = 3
+
+
+def decode_log_chunk(data, offset, max_bytes, at_end, complete):
+    """
+    Decode a chunk of a log read at a byte offset.
+
+    The chunk never splits a character: a character cut off at max_bytes is
+    completed from the bytes read ahead. A character cut off at the end of a
+    log which is still written is left for the next chunk. Only bytes which
+    are no valid UTF-8 are replaced.
+
+    :param data: Bytes read at offset, up to max_bytes + LOG_READ_AHEAD
+    :param offset: Byte offset the chunk was read at
+    :param max_bytes: Maximum size of the chunk in bytes
+    :param at_end: Whether data ends at the end of the log
+    :param complete: Whether the log is written completely
+    :return: (chunk, next_offset, eof)
+    """
+    end = min(max_bytes, len(data))
+    # complete the character cut off at max_bytes
+    while end < len(data) and data[end] & 0xC0 == 0x80:
+        end += 1
+    eof = at_end and end == len(data)
+    if eof and not complete:
+        # the writer may be in the middle of the last character
+        start = end - 1
+        while start > max(end - LOG_READ_AHEAD - 1, 0) and data[start] & 0xC0 == 0x80:
+            start -= 1
+        if start >= 0 and data[start] >= 0xC0:
+            lead = data[start]
+            length = 2 if lead < 0xE0 else 3 if lead < 0xF0 else 4
+            if start + length > end:
+                end = start
+                eof = False
+    data = data[:end]
+    return data.decode("utf-8", errors="replace"), offset + len(data), eof
+
 
 class Playbook(object):
     ACTIVE = "ACTIVE"
@@ -32,10 +78,11 @@ class Playbook(object):
         loaded_metadata_keys,
         cloud_site,
         logger,
+        templates,
     ):
         self.loaded_metadata_keys = loaded_metadata_keys
         self.cloud_site = cloud_site
-        self.redis = redis.Redis(connection_pool=pool)  # redis connection
+        self.state_store = StateStore(pool=pool)  # state of the vm in redis
         self.yaml_exec = ruamel.yaml.YAML()  # yaml writer/reader
         self.vars_files = []  # _vars_file.yml to read
         self.tasks = []  # task list
@@ -48,9 +95,15 @@ class Playbook(object):
         self.playbooks_information = playbooks_information
         self.stdout = ""
         self.stderr = ""
+        self.stopped = False
         # init temporary directories and mandatory generic files
         self.ancon_dir = "/code/VirtualMachineService/ancon"  # path to this directory
         self.playbooks_dir = self.ancon_dir + "/playbooks"  # path to source playbooks
+        self.templates = templates.acquire()  # prepared snapshot of playbooks_dir
+        # released when the playbook is cleaned up, stopped or garbage collected
+        self._release_templates = weakref.finalize(
+            self, templates.release, self.templates
+        )
         self.directory = TemporaryDirectory(dir=self.ancon_dir)
         self.private_key = NamedTemporaryFile(
             mode="w+", dir=self.directory.name, delete=False, prefix="key_"
@@ -88,36 +141,32 @@ class Playbook(object):
             self.copy_and_init(k, v)
 
         # init yml to change public keys as last task
-        shutil.copy(self.playbooks_dir + "/change_key.yml", self.directory.name)
-        shutil.copy(
-            self.playbooks_dir + "/change_key_vars_file.yml", self.directory.name
-        )
-        with open(
-            self.directory.name + "/change_key_vars_file.yml", mode="r"
-        ) as key_file:
-            data_ck = self.yaml_exec.load(key_file)
-            data_ck["change_key_vars"]["key"] = public_key.strip('"')
-        with open(
-            self.directory.name + "/change_key_vars_file.yml", mode="w"
-        ) as key_file:
-            self.yaml_exec.dump(data_ck, key_file)
+        self.link_file("change_key.yml")
+        data_ck = self.templates.load_yaml("change_key_vars_file.yml")
+        data_ck["change_key_vars"]["key"] = public_key.strip('"')
+        self.write_yaml("change_key_vars_file.yml", data_ck)
         self.add_to_playbook_always_lists("change_key")
 
         # write all vars_files and tasks in generic_playbook
-        shutil.copy(
-            self.playbooks_dir + "/" + self.playbook_exec_name, self.directory.name
-        )
-        with open(
-            self.directory.name + "/" + self.playbook_exec_name, mode="r"
-        ) as generic_playbook:
-            data_gp = self.yaml_exec.load(generic_playbook)
-            data_gp[0]["vars_files"] = self.vars_files
-            data_gp[0]["tasks"][0]["block"] = self.tasks
-            data_gp[0]["tasks"][0]["always"] = self.always_tasks
-        with open(
-            self.directory.name + "/" + self.playbook_exec_name, mode="w"
-        ) as generic_playbook:
-            self.yaml_exec.dump(data_gp, generic_playbook)
+        data_gp = self.templates.load_yaml(self.playbook_exec_name)
+        data_gp[0]["vars_files"] = self.vars_files
+        data_gp[0]["tasks"][0]["block"] = self.tasks
+        data_gp[0]["tasks"][0]["always"] = self.always_tasks
+        self.write_yaml(self.playbook_exec_name, data_gp)
+
+    def link_file(self, name):
+        path = os.path.join(self.directory.name, name)
+        if os.path.lexists(path):
+            os.unlink(path)
+        os.symlink(os.path.join(self.templates.path, name), path)
+
+    def write_yaml(self, name, data):
+        path = os.path.join(self.directory.name, name)
+        # replace the link to the template by a file of its own
+        if os.path.lexists(path):
+            os.unlink(path)
+        with open(path, mode="w") as yaml_file:
+            self.yaml_exec.dump(data, yaml_file)
 
     def copy_and_init(self, playbook_name, playbook_vars):
         def load_vars():
@@ -153,12 +202,8 @@ class Playbook(object):
 
             self.logger.info(f"Playbook Data - {data}")
 
-        # copy whole directory
-        shutil.copytree(
-            f"{self.playbooks_dir}/{playbook_name}",
-            self.directory.name,
-            dirs_exist_ok=True,
-        )
+        # link whole directory
+        self.templates.link(playbook_name, self.directory.name)
 
         site_specific_yml = f"/{playbook_name}{'-' + self.cloud_site}.yml"
         playbook_name_local = playbook_name
@@ -168,15 +213,10 @@ class Playbook(object):
         playbook_var_yml = f"/{playbook_name}_vars_file.yml"
 
         try:
-            with open(self.directory.name + playbook_var_yml, mode="r") as variables:
-                data = self.yaml_exec.load(variables)
-                load_vars()
-            with open(self.directory.name + playbook_var_yml, mode="w") as variables:
-                self.yaml_exec.dump(data, variables)
+            data = self.templates.load_yaml(playbook_name + playbook_var_yml)
+            load_vars()
+            self.write_yaml(playbook_var_yml.lstrip("/"), data)
             self.add_to_playbook_lists(playbook_name_local, playbook_name)
-        except shutil.Error as e:
-            self.logger.exception(e)
-            self.add_tasks_only(playbook_name_local)
         except IOError as e:
             self.logger.exception(e)
             self.add_tasks_only(playbook_name_local)
@@ -244,36 +284,53 @@ class Playbook(object):
             )
         elif done != 0:
             self.logger.info(f"Playbook for (openstack_id) {openstack_id} has failed.")
-            self.redis.hset(openstack_id, "status", self.PLAYBOOK_FAILED)
+            self.state_store.set_status(openstack_id, self.PLAYBOOK_FAILED)
             self.returncode = self.process.returncode
             self.process.wait()
         else:
             self.logger.info(
                 f"Playbook for (openstack_id) {openstack_id} is successful."
             )
-            self.redis.hset(openstack_id, "status", self.ACTIVE)
+            self.state_store.set_status(openstack_id, self.ACTIVE)
             self.returncode = self.process.returncode
             self.process.wait()
         return done
 
     def get_logs(self):
         self.log_file_stdout.seek(0, 0)
-        lines_stdout = self.log_file_stdout.readlines()
-        for line in lines_stdout:
-            self.stdout += line
+        self.stdout = self.log_file_stdout.read()
         self.log_file_stderr.seek(0, 0)
-        line_stderr = self.log_file_stderr.readlines()
-        for line in line_stderr:
-            self.stderr += line
+        self.stderr = self.log_file_stderr.read()
         return self.returncode, self.stdout, self.stderr
 
+    def read_log(self, stream, offset, max_bytes, complete):
+        """
+        Read a chunk of a log file.
+
+        :param stream: "stdout" or "stderr"
+        :param offset: Byte offset to start reading at
+        :param max_bytes: Maximum size of the chunk in bytes
+        :param complete: Whether the process has finished writing the log
+        :return: (chunk, next_offset, eof)
+        """
+        log_file = self.log_file_stdout if stream == STDOUT else self.log_file_stderr
+        # own file handle, the log files are written by the running process
+        with open(log_file.name, mode="rb") as f:
+            f.seek(offset)
+            data = f.read(max_bytes + LOG_READ_AHEAD)
+            at_end = f.read(1) == b""
+        return decode_log_chunk(data, offset, max_bytes, at_end, complete)
+
     def cleanup(self, openstack_id):
         # self.directory.cleanup()
-        self.redis.delete(openstack_id)
+        self._release_templates()
+        self.state_store.delete(openstack_id)
 
     def stop(self, openstack_id):
-        self.process.terminate()
+        self.stopped = True
+        if self.process is not None:
+            self.process.terminate()
         rc, stdout, stderr = self.get_logs()
         logs_to_save = {"returncode": rc, "stdout": stdout, "stderr": stderr}
-        self.redis.hmset(f"pb_logs_{openstack_id}", logs_to_save)
-        self.cleanup(openstack_id)
+        self.state_store.save_logs_and_delete(openstack_id, logs_to_save)
+        self._release_templates()
@@ -0,0 +1,152 @@
+import threading
+from collections import OrderedDict, deque
+
+try:
+    from ancon.StateStore import StateStore
+except Exception:
+    from .StateStore import StateStore
+
+DEFAULT_MAX_CONCURRENT_PLAYBOOKS = 10
+
+
+class PlaybookExecutor(object):
+    """
+    Runs playbooks with a limited concurrency.
+
+    Playbooks which can not be started right away are queued per project.
+    The queue is served round robin over the projects, so a project starting
+    many vms at once does not block the playbooks of other projects.
+    The position of a queued playbook is written to the field
+    "queue_position" of the redis hash of its vm, 0 means running.
+    """
+
+    def __init__(
+        self,
+        pool,
+        logger,
+        supervisor,
+        max_concurrent_playbooks=DEFAULT_MAX_CONCURRENT_PLAYBOOKS,
+    ):
+        """
+        :param pool: Redis connection pool
+        :param logger: Logger to use
+        :param supervisor: PlaybookSupervisor which watches the started playbooks
+        :param max_concurrent_playbooks: Maximum number of running playbooks
+        """
+        self.state_store = StateStore(pool=pool)
+        self.logger = logger
+        self.supervisor = supervisor
+        self.max_concurrent_playbooks = max_concurrent_playbooks
+        self._running = set()
+        self._queues = OrderedDict()  # project_id -> deque of (openstack_id, playbook)
+        self._lock = threading.Lock()
+
+    def submit(self, openstack_id, playbook, project_id=""):
+        """
+        Start a playbook or queue it if too many playbooks are running.
+
+        :param openstack_id: Id of the server the playbook runs for
+        :param playbook: Playbook to run
+        :param project_id: Project of the server, used for fair queueing
+        """
+        with self._lock:
+            if len(self._running) < self.max_concurrent_playbooks:
+                self._start(openstack_id, playbook)
+                return
+            self._queues.setdefault(project_id, deque()).append(
+                (openstack_id, playbook)
+            )
+            self.logger.info(
+                f"Queued playbook for (openstack_id) {openstack_id} "
+                f"of project {project_id}"
+            )
+            self._update_queue_positions()
+
+    def _start(self, openstack_id, playbook):
+        """Start a playbook. Needs self._lock."""
+        self.logger.info(f"Start playbook for (openstack_id) {openstack_id}")
+        self._running.add(openstack_id)
+        self.state_store.set_queue_positions({openstack_id: 0})
+        try:
+            playbook.run_it()
+        except Exception as e:
+            self.logger.exception(
+                f"Starting playbook for (openstack_id) {openstack_id} failed: {e}"
+            )
+            self._running.discard(openstack_id)
+            self.state_store.set_status(openstack_id, playbook.PLAYBOOK_FAILED)
+            return
+        self.supervisor.watch(openstack_id, playbook, on_exit=self._finished)
+
+    def _finished(self, openstack_id):
+        with self._lock:
+            self._running.discard(openstack_id)
+            while len(self._running) < self.max_concurrent_playbooks:
+                queued = self._next()
+                if queued is None:
+                    break
+                next_id, playbook = queued
+                # the playbook was stopped or the vm deleted while it was queued
+                if playbook.stopped or not self.state_store.exists(next_id):
+                    self.logger.info(
+                        f"Drop queued playbook for (openstack_id) {next_id}"
+                    )
+                    continue
+                self._start(next_id, playbook)
+            self._update_queue_positions()
+
+    def _next(self):
+        """Pop the next queued playbook round robin. Needs self._lock."""
+        while self._queues:
+            project_id, queue = self._queues.popitem(last=False)
+            if queue:
+                queued = queue.popleft()
+                if queue:
+                    self._queues[project_id] = queue
+                return queued
+        return None
+
+    def _queue_order(self):
+        """Queued server ids in the order they will be started. Needs self._lock."""
+        queues = [list(queue) for queue in self._queues.values()]
+        order = []
+        for i in range(max((len(queue) for queue in queues), default=0)):
+            for queue in queues:
+                if i < len(queue):
+                    order.append(queue[i][0])
+        return order
+
+    def _update_queue_positions(self):
+        """Write the queue positions to redis. Needs self._lock."""
+        self.state_store.set_queue_positions(
+            {
+                openstack_id: position
+                for position, openstack_id in enumerate(self._queue_order(), start=1)
+            }
+        )
+
+    def remove(self, openstack_id):
+        """
+        Remove a queued playbook.
+
+        :param openstack_id: Id of the server
+        :return: True if the playbook was queued, False if not
+        """
+        with self._lock:
+            for project_id, queue in list(self._queues.items()):
+                for queued in queue:
+                    if queued[0] == openstack_id:
+                        queue.remove(queued)
+                        if not queue:
+                            del self._queues[project_id]
+                        self._update_queue_positions()
+                        return True
+        return False
+
+    def stats(self):
+        with self._lock:
+            return {
+                "running": len(self._running),
+                "queued": sum(len(queue) for queue in self._queues.values()),
+                "max_concurrent_playbooks": self.max_concurrent_playbooks,
+            }
@@ -0,0 +1,100 @@
+import json
+import threading
+
+try:
+    from ancon.StateStore import StateStore
+except Exception:
+    from .StateStore import StateStore
+
+DEFAULT_PLAYBOOK_EVENTS_CHANNEL = "playbook_events"
+
+
+class PlaybookSupervisor(object):
+    """
+    Waits for running playbooks to finish.
+
+    Every playbook process gets a watcher thread, which reaps the process as
+    soon as it exits, updates the status of the vm in redis and publishes a
+    completion event on the playbook events channel.
+    Playbooks are stopped and cleaned up through the supervisor, so a watcher
+    never writes the status of a playbook whose state was deleted.
+    """
+
+    def __init__(self, pool, logger, channel=DEFAULT_PLAYBOOK_EVENTS_CHANNEL):
+        self.state_store = StateStore(pool=pool)
+        self.logger = logger
+        self.channel = channel
+        self._watched = {}  # openstack_id -> playbook
+        self._lock = threading.Lock()
+
+    def watch(self, openstack_id, playbook, on_exit=None):
+        """
+        Start watching the process of a started playbook.
+
+        :param openstack_id: Id of the server the playbook runs for
+        :param playbook: Playbook after run_it was called
+        :param on_exit: Optional callable, called with the openstack_id
+                after the process exited
+        """
+        with self._lock:
+            self._watched[openstack_id] = playbook
+        watcher = threading.Thread(
+            target=self._wait_for,
+            args=(openstack_id, playbook, on_exit),
+            name=f"playbook-{openstack_id}",
+            daemon=True,
+        )
+        watcher.start()
+
+    def _wait_for(self, openstack_id, playbook, on_exit):
+        try:
+            playbook.process.wait()
+            with self._lock:
+                if self._watched.get(openstack_id, None) is not playbook:
+                    self.logger.info(
+                        f"Playbook for (openstack_id) {openstack_id} stopped."
+                    )
+                    return
+                playbook.check_status(openstack_id)
+            event = {
+                "openstack_id": openstack_id,
+                "status": self.state_store.get_status(openstack_id),
+                "returncode": playbook.returncode,
+            }
+            self.state_store.publish(self.channel, json.dumps(event))
+            self.logger.info(f"Published playbook event {event}")
+        except Exception as e:
+            self.logger.exception(
+                f"Watching playbook for (openstack_id) {openstack_id} failed: {e}"
+            )
+        finally:
+            with self._lock:
+                self._unwatch(openstack_id, playbook)
+            if on_exit is not None:
+                on_exit(openstack_id)
+
+    def stop(self, openstack_id, playbook):
+        """
+        Stop a playbook and delete the state of its server.
+
+        :param openstack_id: Id of the server the playbook runs for
+        :param playbook: The playbook, watched or not
+        """
+        with self._lock:
+            self._unwatch(openstack_id, playbook)
+            playbook.stop(openstack_id)
+
+    def cleanup(self, openstack_id, playbook):
+        """
+        Clean up a finished playbook and delete the state of its server.
+
+        :param openstack_id: Id of the server the playbook ran for
+        :param playbook: The playbook, watched or not
+        """
+        with self._lock:
+            self._unwatch(openstack_id, playbook)
+            playbook.cleanup(openstack_id)
+
+    def _unwatch(self, openstack_id, playbook):
+        if self._watched.get(openstack_id, None) is playbook:
+            del self._watched[openstack_id]
@@ -0,0 +1,150 @@
+import copy
+import glob
+import os
+import shutil
+import threading
+from tempfile import mkdtemp
+
+import ruamel.yaml
+
+SNAPSHOT_PREFIX = "templates_"
+
+
+class PlaybookTemplatesSnapshot(object):
+    """
+    Read-only copy of the playbooks directory.
+
+    Workspaces of playbooks link to the files of a snapshot instead of
+    copying them. The yaml files are parsed only once per snapshot.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.users = 0  # playbooks using the snapshot, see PlaybookTemplates
+        self.retired = False  # a newer snapshot was taken
+        self.yaml_exec = ruamel.yaml.YAML()
+        self._yaml_data = {}
+        self._lock = threading.Lock()
+
+    def load_yaml(self, relative_path):
+        """
+        Get the content of a yaml file of the snapshot.
+
+        :param relative_path: Path of the file in the snapshot
+        :return: Deep copy of the parsed yaml, which can be changed freely
+        :raises IOError: If the file does not exist
+        """
+        with self._lock:
+            if relative_path not in self._yaml_data:
+                with open(os.path.join(self.path, relative_path), mode="r") as f:
+                    self._yaml_data[relative_path] = self.yaml_exec.load(f)
+            return copy.deepcopy(self._yaml_data[relative_path])
+
+    def link(self, relative_path, workspace):
+        """
+        Link the content of a directory of the snapshot into a workspace.
+
+        Directories which exist in the workspace already are merged, existing
+        files are replaced, like shutil.copytree with dirs_exist_ok does.
+
+        :param relative_path: Directory in the snapshot, e.g. the playbook name
+        :param workspace: Directory to link into
+        """
+        self._link_tree(os.path.join(self.path, relative_path), workspace)
+
+    def _link_tree(self, source, target):
+        for name in os.listdir(source):
+            source_entry = os.path.join(source, name)
+            target_entry = os.path.join(target, name)
+            if not os.path.lexists(target_entry):
+                os.symlink(source_entry, target_entry)
+            elif os.path.isdir(source_entry) and os.path.isdir(target_entry):
+                if os.path.islink(target_entry):
+                    # merging into a linked directory, replace it by a real one
+                    linked = os.readlink(target_entry)
+                    os.unlink(target_entry)
+                    os.mkdir(target_entry)
+                    self._link_tree(linked, target_entry)
+                self._link_tree(source_entry, target_entry)
+            else:
+                if os.path.isdir(target_entry) and not os.path.islink(target_entry):
+                    shutil.rmtree(target_entry)
+                else:
+                    os.unlink(target_entry)
+                os.symlink(source_entry, target_entry)
+
+
+class PlaybookTemplates(object):
+    """
+    Prepared snapshots of the playbooks directory.
+
+    A new snapshot is taken after every update of the playbooks. Playbooks
+    keep using the snapshot they were created with, so an outdated snapshot
+    is removed when the last playbook using it released it.
+    """
+
+    def __init__(self, playbooks_dir, snapshots_dir, logger):
+        """
+        :param playbooks_dir: Directory with the playbooks of all templates
+        :param snapshots_dir: Directory the snapshots are created in
+        :param logger: Logger to use
+        """
+        self.playbooks_dir = playbooks_dir
+        self.snapshots_dir = snapshots_dir
+        self.logger = logger
+        self._current = None
+        self._lock = threading.Lock()
+        self._remove_stale_snapshots()
+
+    def _remove_stale_snapshots(self):
+        for path in glob.glob(os.path.join(self.snapshots_dir, SNAPSHOT_PREFIX + "*")):
+            shutil.rmtree(path, ignore_errors=True)
+
+    def refresh(self):
+        """Take a new snapshot of the playbooks directory."""
+        path = mkdtemp(prefix=SNAPSHOT_PREFIX, dir=self.snapshots_dir)
+        shutil.copytree(self.playbooks_dir, path, dirs_exist_ok=True)
+        snapshot = PlaybookTemplatesSnapshot(path)
+        with self._lock:
+            outdated = self._current
+            self._current = snapshot
+            if outdated is not None:
+                outdated.retired = True
+                if outdated.users:
+                    outdated = None
+        if outdated is not None:
+            self._remove(outdated)
+        self.logger.info(f"Prepared playbook templates in {path}")
+
+    def _remove(self, snapshot):
+        shutil.rmtree(snapshot.path, ignore_errors=True)
+        self.logger.info(f"Removed playbook templates in {snapshot.path}")
+
+    def acquire(self):
+        """
+        Get the current snapshot for a playbook, see release.
+
+        A snapshot is taken on first use if there is none yet.
+
+        :return: PlaybookTemplatesSnapshot
+        """
+        with self._lock:
+            snapshot = self._current
+        if snapshot is None:
+            self.refresh()
+        with self._lock:
+            snapshot = self._current
+            snapshot.users += 1
+        return snapshot
+
+    def release(self, snapshot):
+        """
+        Mark a snapshot from acquire as no longer used by a playbook.
+
+        :param snapshot: PlaybookTemplatesSnapshot
+        """
+        with self._lock:
+            snapshot.users -= 1
+            unused = snapshot.retired and snapshot.users == 0
+        if unused:
+            self._remove(snapshot)
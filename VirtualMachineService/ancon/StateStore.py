@@ -0,0 +1,110 @@
+import redis
+
+KEY = "key"
+NAME = "name"
+STATUS = "status"
+PROJECT_ID = "project_id"
+QUEUE_POSITION = "queue_position"
+
+LOGS_PREFIX = "pb_logs_"
+
+
+class StateStore(object):
+    """
+    Access to the playbook and server state in redis.
+
+    The state of a server is kept in a redis hash named by its openstack_id.
+    Reads and writes of several fields or servers are sent in one round trip.
+    """
+
+    def __init__(self, pool):
+        """
+        :param pool: Redis connection pool
+        """
+        self.redis = redis.Redis(connection_pool=pool)
+
+    @staticmethod
+    def _decode(value):
+        return value.decode("utf-8") if value is not None else None
+
+    def create(self, openstack_id, key, name, status, project_id=""):
+        self.redis.hset(
+            openstack_id,
+            mapping={KEY: key, NAME: name, STATUS: status, PROJECT_ID: project_id},
+        )
+
+    def exists(self, openstack_id):
+        return self.redis.exists(openstack_id) == 1
+
+    def get_fields(self, openstack_id, *fields):
+        """
+        Get some fields of a server.
+
+        :param openstack_id: Id of the server
+        :param fields: Names of the fields
+        :return: {field: value}, the value is None for a missing field or server
+        """
+        values = self.redis.hmget(openstack_id, fields)
+        return {field: self._decode(value) for field, value in zip(fields, values)}
+
+    def get_status(self, openstack_id):
+        """
+        :param openstack_id: Id of the server
+        :return: Status of the server, None if the server has no state
+        """
+        return self._decode(self.redis.hget(openstack_id, STATUS))
+
+    def get_statuses(self, openstack_ids):
+        """
+        Get the status of many servers in one round trip.
+
+        :param openstack_ids: Ids of the servers
+        :return: {openstack_id: status}, None for servers without state
+        """
+        pipeline = self.redis.pipeline(transaction=False)
+        for openstack_id in openstack_ids:
+            pipeline.hget(openstack_id, STATUS)
+        return {
+            openstack_id: self._decode(status)
+            for openstack_id, status in zip(openstack_ids, pipeline.execute())
+        }
+
+    def set_status(self, openstack_id, status):
+        self.redis.hset(openstack_id, STATUS, status)
+
+    def set_queue_positions(self, positions):
+        """
+        :param positions: {openstack_id: queue position}
+        """
+        if not positions:
+            return
+        pipeline = self.redis.pipeline(transaction=False)
+        for openstack_id, position in positions.items():
+            pipeline.hset(openstack_id, QUEUE_POSITION, position)
+        pipeline.execute()
+
+    def delete(self, openstack_id):
+        self.redis.delete(openstack_id)
+
+    def save_logs_and_delete(self, openstack_id, logs):
+        """
+        Save the logs of a playbook and delete the state of its server.
+
+        :param openstack_id: Id of the server
+        :param logs: {"returncode": rc, "stdout": stdout, "stderr": stderr}
+        """
+        pipeline = self.redis.pipeline(transaction=True)
+        pipeline.hset(f"{LOGS_PREFIX}{openstack_id}", mapping=logs)
+        pipeline.delete(openstack_id)
+        pipeline.execute()
+
+    def get_log(self, openstack_id, stream):
+        """
+        :param openstack_id: Id of the server
+        :param stream: "stdout" or "stderr"
+        :return: Saved log of a stopped playbook as bytes, None if not saved
+        """
+        return self.redis.hget(f"{LOGS_PREFIX}{openstack_id}", stream)
+
+    def publish(self, channel, message):
+        self.redis.publish(channel, message)
@@ -0,0 +1,104 @@
+"""
+This Module implements pooled keep-alive HTTP sessions.
+
+Every endpoint (FORC, BiBiGrid) gets its own connection pool, which is
+shared by all threads of the server, so TCP and TLS connections are reused
+instead of being opened for every request.
+"""
+
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 0.5
+RETRY_STATUS_CODES = (502, 503, 504)
+
+
+class HttpSessionPool(object):
+    """
+    Keeps one keep-alive connection pool per registered endpoint.
+
+    requests.Session objects are not guaranteed to be thread-safe, so every
+    thread gets its own session per endpoint. All sessions of an endpoint
+    share the same HTTPAdapter and with it the same urllib3 connection pool.
+    """
+
+    def __init__(
+        self,
+        pool_size=DEFAULT_POOL_SIZE,
+        retries=DEFAULT_RETRIES,
+        backoff_factor=DEFAULT_BACKOFF_FACTOR,
+    ):
+        """
+        :param pool_size: Number of connections kept alive per endpoint
+        :param retries: Retries for failed connects and 502/503/504 responses.
+                Only idempotent methods are retried.
+        :param backoff_factor: Backoff factor between retries in seconds
+        """
+        self.pool_size = pool_size
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self._endpoints = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def register(self, name, headers=None, verify=True):
+        """
+        Register an endpoint.
+
+        :param name: Name of the endpoint, e.g. "forc"
+        :param headers: Headers which are sent with every request, e.g. auth headers
+        :param verify: Verify TLS certificates
+        """
+        retry = Retry(
+            total=self.retries,
+            connect=self.retries,
+            read=0,
+            status=self.retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=RETRY_STATUS_CODES,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_maxsize=self.pool_size, max_retries=retry)
+        with self._lock:
+            self._endpoints[name] = (adapter, dict(headers or {}), verify)
+
+    def session(self, name):
+        """
+        Get the session of the current thread for an endpoint.
+
+        :param name: Name of a registered endpoint
+        :return: requests.Session
+        """
+        sessions = getattr(self._local, "sessions", None)
+        if sessions is None:
+            sessions = self._local.sessions = {}
+        session = sessions.get(name, None)
+        if session is None:
+            with self._lock:
+                adapter, headers, verify = self._endpoints[name]
+            session = requests.Session()
+            session.headers.update(headers)
+            session.verify = verify
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            sessions[name] = session
+        return session
+
+    def get(self, name, url, **kwargs):
+        return self.session(name).get(url, **kwargs)
+
+    def post(self, name, url, **kwargs):
+        return self.session(name).post(url, **kwargs)
+
+    def delete(self, name, url, **kwargs):
+        return self.session(name).delete(url, **kwargs)
+
+    def close(self):
+        with self._lock:
+            for adapter, _, _ in self._endpoints.values():
+                adapter.close()
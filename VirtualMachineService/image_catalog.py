@@ -0,0 +1,202 @@
+"""
+This Module implements an in-memory catalog of the Glance images.
+
+The catalog is refreshed in the background and indexed, so the image
+endpoints of the VirtualMachineHandler do not have to list all images
+from OpenStack for every request.
+"""
+
+import threading
+import time
+
+from openstack.exceptions import DuplicateResource
+
+DEFAULT_IMAGE_CATALOG_TTL = 300
+DEFAULT_IMAGE_CATALOG_NEGATIVE_TTL = 30
+
+
+class _ImageIndex(object):
+    """Immutable snapshot of the image list and its indexes."""
+
+    def __init__(self, images):
+        self.images = images
+        self.by_id = {}
+        self.by_name = {}
+        self.by_visibility = {}
+        self.by_tag = {}
+        self.by_os_version = {}
+        self.by_slurm_version = {}
+        self.active_tagged = []
+        for image in images:
+            self.by_id[image["id"]] = image
+            self.by_name.setdefault(image.get("name"), []).append(image)
+            self.by_visibility.setdefault(image.get("visibility"), []).append(image)
+            tags = image.get("tags", None) or []
+            for tag in tags:
+                self.by_tag.setdefault(tag, []).append(image)
+            self.by_os_version.setdefault(image.get("os_version", None), []).append(
+                image
+            )
+            properties = image.get("properties", None) or {}
+            slurm_version = properties.get("slurm_version", None)
+            if slurm_version:
+                self.by_slurm_version.setdefault(slurm_version, []).append(image)
+            if tags and image.get("status") == "active":
+                self.active_tagged.append(image)
+
+
+class ImageCatalog(object):
+    """
+    Keeps the Glance image list in memory.
+
+    The list is reloaded by a background thread every ``ttl`` seconds and
+    on the next lookup after an explicit :meth:`invalidate`.
+    """
+
+    def __init__(
+        self,
+        list_images,
+        logger,
+        ttl=DEFAULT_IMAGE_CATALOG_TTL,
+        negative_ttl=DEFAULT_IMAGE_CATALOG_NEGATIVE_TTL,
+    ):
+        """
+        :param list_images: Callable returning all images, e.g. conn.list_images
+        :param logger: Logger to use
+        :param ttl: Seconds after which the catalog is reloaded
+        :param negative_ttl: Seconds a name or id which was not found is
+                remembered as missing
+        """
+        self._list_images = list_images
+        self.logger = logger
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._missing = {}  # name or id -> expires_at
+        self._index = _ImageIndex([])
+        self._loaded_at = None
+        self._generation = 0
+        # guards _generation and _loaded_at
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """
+        Load the catalog and start the background refresh.
+
+        A failed first load does not prevent the start, the catalog is
+        loaded by the next lookup or the background refresh.
+        """
+        try:
+            self.refresh()
+        except Exception as e:
+            self.logger.exception(f"Loading image catalog failed: {e}")
+        self._thread = threading.Thread(
+            target=self._refresh_loop, name="image-catalog", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _refresh_loop(self):
+        while not self._stop.wait(self.ttl):
+            try:
+                self.refresh()
+            except Exception as e:
+                self.logger.exception(f"Refreshing image catalog failed: {e}")
+
+    def refresh(self):
+        """Reload all images from OpenStack and rebuild the indexes."""
+        with self._refresh_lock:
+            self._load()
+
+    def _load(self):
+        with self._lock:
+            generation = self._generation
+        started_at = time.monotonic()
+        index = _ImageIndex(list(self._list_images()))
+        self._index = index
+        with self._lock:
+            # keep the catalog stale if it was invalidated during the listing
+            if generation == self._generation:
+                self._loaded_at = started_at
+            self._missing.clear()
+        self.logger.info(f"Image catalog loaded {len(index.images)} images")
+
+    def invalidate(self):
+        """Mark the catalog as stale, so the next lookup reloads it."""
+        self.logger.info("Invalidate image catalog")
+        with self._lock:
+            self._generation += 1
+            self._loaded_at = None
+
+    def _is_stale(self):
+        loaded_at = self._loaded_at
+        return loaded_at is None or time.monotonic() - loaded_at > self.ttl
+
+    def _current(self):
+        if self._is_stale():
+            with self._refresh_lock:
+                # another thread may have reloaded while we were waiting
+                if self._is_stale():
+                    self._load()
+        return self._index
+
+    def images(self):
+        return list(self._current().images)
+
+    def active_tagged_images(self):
+        return list(self._current().active_tagged)
+
+    def get(self, image_id):
+        return self._current().by_id.get(image_id, None)
+
+    def find(self, name_or_id):
+        """
+        Find an image by id or name.
+
+        If several images have the name, the only active one of them is
+        returned.
+
+        :param name_or_id: Id or name of the image
+        :return: The image, None if the catalog does not know it
+        :raises DuplicateResource: If the name is ambiguous
+        """
+        index = self._current()
+        image = index.by_id.get(name_or_id, None)
+        if image is not None:
+            return image
+        images = index.by_name.get(name_or_id, [])
+        if len(images) > 1:
+            images = [image for image in images if image.get("status") == "active"]
+            if len(images) != 1:
+                raise DuplicateResource(f"Multiple matches found for {name_or_id}")
+        return images[0] if images else None
+
+    def is_missing(self, name_or_id):
+        """
+        :param name_or_id: Id or name of an image
+        :return: If the image was not found within the last negative_ttl seconds
+        """
+        with self._lock:
+            expires_at = self._missing.get(name_or_id, None)
+        return expires_at is not None and expires_at > time.monotonic()
+
+    def set_missing(self, name_or_id):
+        """Remember a name or id which was not found in OpenStack either."""
+        with self._lock:
+            self._missing[name_or_id] = time.monotonic() + self.negative_ttl
+
+    def by_visibility(self, visibility):
+        return list(self._current().by_visibility.get(visibility, []))
+
+    def by_tag(self, tag):
+        return list(self._current().by_tag.get(tag, []))
+
+    def by_os_version(self, os_version):
+        return list(self._current().by_os_version.get(os_version, []))
+
+    def by_slurm_version(self, slurm_version):
+        return list(self._current().by_slurm_version.get(slurm_version, []))
@@ -0,0 +1,262 @@
+"""
+This Module implements background jobs with their state kept in redis.
+
+Long running operations like deleting servers are submitted as jobs, so the
+Thrift call returns as soon as the job is persisted. The portal polls the
+state of the jobs.
+"""
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from uuid import uuid4
+
+import redis
+
+DEFAULT_JOB_WORKERS = 10
+DEFAULT_JOB_TTL = 24 * 60 * 60
+
+JOB_PREFIX = "job_"
+IDEMPOTENCY_PREFIX = "job_idempotency_"
+
+QUEUED = "QUEUED"
+RUNNING = "RUNNING"
+DONE = "DONE"
+FAILED = "FAILED"
+
+JOB_ID = "job_id"
+TYPE = "type"
+TARGET = "target"
+STATUS = "status"
+REQUEST = "request"
+RESULT = "result"
+SECRET = "secret"
+ERROR = "error"
+CREATED_AT = "created_at"
+UPDATED_AT = "updated_at"
+
+
+class JobManager(object):
+    """
+    Runs jobs on a pool of worker threads.
+
+    The state of a job is kept in the redis hash "job_<job_id>" with the
+    fields job_id, type, target, status, request, result, error, created_at
+    and updated_at. Finished jobs expire after ``ttl`` seconds.
+    A job submitted with an idempotency key which was used within ``ttl``
+    seconds is not submitted again, the id of the first job is returned.
+    The same holds for a job without key whose target has an unfinished job
+    of the same type.
+    Secret fields of a result, like a private key, are kept apart until the
+    job is acknowledged or expires, so a client can read them again if a
+    response got lost.
+    """
+
+    def __init__(self, pool, logger, workers=DEFAULT_JOB_WORKERS, ttl=DEFAULT_JOB_TTL):
+        """
+        :param pool: Redis connection pool
+        :param logger: Logger to use
+        :param workers: Number of jobs running at the same time
+        :param ttl: Seconds the state of a finished job is kept
+        """
+        self.redis = redis.Redis(connection_pool=pool)
+        self.logger = logger
+        self.ttl = ttl
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="job"
+        )
+        self._unfinished = {}  # (type, target) -> job_id
+        self._lock = threading.Lock()
+        self._fail_interrupted_jobs()
+
+    @staticmethod
+    def _key(job_id):
+        return f"{JOB_PREFIX}{job_id}"
+
+    def _fail_interrupted_jobs(self):
+        """Mark the jobs which were unfinished when the client stopped as failed."""
+        for key in self.redis.scan_iter(match=f"{JOB_PREFIX}*"):
+            if key.startswith(IDEMPOTENCY_PREFIX.encode()):
+                continue
+            if self.redis.hget(key, STATUS) in (QUEUED.encode(), RUNNING.encode()):
+                job_id = key.decode("utf-8")[len(JOB_PREFIX) :]
+                self.logger.warning(f"Job {job_id} was interrupted")
+                self._update(
+                    job_id,
+                    {STATUS: FAILED, ERROR: "Interrupted by a restart"},
+                    expire=True,
+                )
+
+    def _update(self, job_id, fields, expire=False):
+        fields = dict(fields, **{UPDATED_AT: str(time.time())})
+        pipeline = self.redis.pipeline(transaction=True)
+        pipeline.hset(self._key(job_id), mapping=fields)
+        if expire:
+            pipeline.expire(self._key(job_id), self.ttl)
+        pipeline.execute()
+
+    def submit(
+        self,
+        job_type,
+        target,
+        function,
+        args=(),
+        kwargs=None,
+        request=None,
+        idempotency_key=None,
+        secret_fields=(),
+    ):
+        """
+        Persist a job and run it in the background.
+
+        :param job_type: Type of the job, e.g. delete_server
+        :param target: Id or name of the resource the job works on
+        :param function: Callable doing the work, its return value is stored
+                as the result of the job
+        :param args: Positional arguments for function
+        :param kwargs: Keyword arguments for function
+        :param request: Optional dict describing the request, stored as json
+        :param idempotency_key: Optional key of the request, retries with
+                the same key get the job of the first request
+        :param secret_fields: Keys of a dict result which are returned until
+                the job is acknowledged
+        :return: Id of the job
+        """
+        with self._lock:
+            if not idempotency_key:
+                job_id = self._unfinished.get((job_type, target), None)
+                if job_id is not None:
+                    self.logger.info(f"{job_type} job for {target} exists: {job_id}")
+                    return job_id
+            job_id = str(uuid4())
+            now = str(time.time())
+            job = {
+                JOB_ID: job_id,
+                TYPE: job_type,
+                TARGET: target,
+                STATUS: QUEUED,
+                CREATED_AT: now,
+                UPDATED_AT: now,
+            }
+            if request is not None:
+                job[REQUEST] = json.dumps(request)
+            self.redis.hset(self._key(job_id), mapping=job)
+            if idempotency_key:
+                first_job_id = self._claim(idempotency_key, job_id)
+                if first_job_id != job_id:
+                    self.redis.delete(self._key(job_id))
+                    self.logger.info(
+                        f"{job_type} job with idempotency key {idempotency_key} "
+                        f"exists: {first_job_id}"
+                    )
+                    return first_job_id
+            else:
+                self._unfinished[(job_type, target)] = job_id
+        self.logger.info(f"Submitted {job_type} job {job_id} for {target}")
+        self._executor.submit(
+            self._run,
+            job_id,
+            job_type,
+            target,
+            function,
+            args,
+            kwargs or {},
+            secret_fields,
+        )
+        return job_id
+
+    def _claim(self, idempotency_key, job_id):
+        """
+        Bind an idempotency key to a job, unless it is bound already.
+
+        :return: Id of the job the key is bound to
+        """
+        key = f"{IDEMPOTENCY_PREFIX}{idempotency_key}"
+        while not self.redis.set(key, job_id, nx=True, ex=self.ttl):
+            first_job_id = self.redis.get(key)
+            # the key may have expired in between
+            if first_job_id is not None:
+                return first_job_id.decode("utf-8")
+        return job_id
+
+    @staticmethod
+    def _format_result(result):
+        if isinstance(result, (dict, list)):
+            return json.dumps(result)
+        return str(result)
+
+    def _run(self, job_id, job_type, target, function, args, kwargs, secret_fields):
+        try:
+            self._update(job_id, {STATUS: RUNNING})
+            result = function(*args, **kwargs)
+            secret = {}
+            if isinstance(result, dict):
+                secret = {
+                    field: result[field] for field in secret_fields if field in result
+                }
+                result = {
+                    field: value
+                    for field, value in result.items()
+                    if field not in secret
+                }
+            if result is False:
+                fields = {STATUS: FAILED, RESULT: self._format_result(result)}
+            else:
+                fields = {STATUS: DONE, RESULT: self._format_result(result)}
+            if secret:
+                fields[SECRET] = json.dumps(secret)
+        except Exception as e:
+            self.logger.exception(f"{job_type} job {job_id} for {target} failed: {e}")
+            fields = {STATUS: FAILED, ERROR: getattr(e, "Reason", None) or str(e)}
+        finally:
+            with self._lock:
+                self._unfinished.pop((job_type, target), None)
+        try:
+            self._update(job_id, fields, expire=True)
+        except Exception as e:
+            self.logger.exception(f"Could not save state of job {job_id}: {e}")
+        self.logger.info(f"{job_type} job {job_id} for {target}: {fields[STATUS]}")
+
+    def get(self, job_id):
+        """
+        :param job_id: Id of the job
+        :return: {field: value} of the job, empty if the job is unknown
+        """
+        return self.get_many([job_id])[job_id]
+
+    def get_many(self, job_ids):
+        """
+        Get the state of many jobs in one round trip.
+
+        :param job_ids: Ids of the jobs
+        :return: {job_id: {field: value}}, empty for unknown jobs
+        """
+        pipeline = self.redis.pipeline(transaction=False)
+        for job_id in job_ids:
+            pipeline.hgetall(self._key(job_id))
+        jobs = {}
+        for job_id, job in zip(job_ids, pipeline.execute()):
+            job = {
+                field.decode("utf-8"): value.decode("utf-8")
+                for field, value in job.items()
+            }
+            secret = job.pop(SECRET, None)
+            if secret is not None:
+                result = json.loads(job[RESULT])
+                result.update(json.loads(secret))
+                job[RESULT] = json.dumps(result)
+            jobs[job_id] = job
+        return jobs
+
+    def acknowledge(self, job_id):
+        """
+        Delete the secret fields of a job result, once the client has them.
+
+        :param job_id: Id of the job
+        :return: True if the job exists
+        """
+        pipeline = self.redis.pipeline(transaction=True)
+        pipeline.exists(self._key(job_id))
+        pipeline.hdel(self._key(job_id), SECRET)
+        return pipeline.execute()[0] == 1
@@ -0,0 +1,109 @@
+"""
+This Module implements the gateway port formulas.
+
+A formula like ``30000 + x + y * 256`` maps the last two octets of the fixed
+ip of a server (``x`` the last, ``y`` the second last) to the port the gateway
+forwards to it. The formula is validated and compiled once, so computing a
+port does not evaluate the config string again.
+"""
+
+import ast
+
+FORMULA_VARIABLES = ("x", "y")
+ALLOWED_OPERATORS = (
+    ast.Add,
+    ast.Sub,
+    ast.Mult,
+    ast.Div,
+    ast.FloorDiv,
+    ast.Mod,
+    ast.Pow,
+    ast.UAdd,
+    ast.USub,
+)
+
+
+class PortFormula(object):
+    """
+    A restricted arithmetic expression in ``x`` and ``y``.
+
+    Only integer constants, the variables x and y, parentheses and the
+    operators + - * / // % ** are allowed.
+    """
+
+    def __init__(self, expression):
+        """
+        :param expression: The formula, e.g. "30000 + x + y * 256"
+        :raises ValueError: If the formula is not a valid port formula
+        """
+        self.expression = str(expression)
+        try:
+            tree = ast.parse(self.expression.strip(), mode="eval")
+        except SyntaxError as e:
+            raise ValueError(f"Invalid port formula '{self.expression}': {e}")
+        self._validate(tree.body)
+        function = ast.Expression(
+            body=ast.Lambda(
+                args=ast.arguments(
+                    posonlyargs=[],
+                    args=[ast.arg(arg=name) for name in FORMULA_VARIABLES],
+                    kwonlyargs=[],
+                    kw_defaults=[],
+                    defaults=[],
+                ),
+                body=tree.body,
+            )
+        )
+        ast.fix_missing_locations(function)
+        code = compile(function, f"<port formula {self.expression}>", "eval")
+        self._function = eval(code, {"__builtins__": {}})
+
+    def _validate(self, node):
+        if isinstance(node, ast.BinOp) and isinstance(node.op, ALLOWED_OPERATORS):
+            self._validate(node.left)
+            self._validate(node.right)
+        elif isinstance(node, ast.UnaryOp) and isinstance(node.op, ALLOWED_OPERATORS):
+            self._validate(node.operand)
+        elif isinstance(node, ast.Name) and node.id in FORMULA_VARIABLES:
+            return
+        elif (
+            isinstance(node, ast.Constant)
+            and isinstance(node.value, int)
+            and not isinstance(node.value, bool)
+        ):
+            return
+        else:
+            raise ValueError(
+                f"Invalid port formula '{self.expression}': "
+                f"'{ast.unparse(node)}' is not allowed"
+            )
+
+    def __call__(self, x, y):
+        return int(self._function(x, y))
+
+    def port_for_ip(self, fixed_ip):
+        """
+        Calculate the port of a fixed ip.
+
+        :param fixed_ip: Fixed ip of the server, e.g. "192.168.1.17"
+        :return: Port
+        """
+        octets = fixed_ip.split(".")
+        return int(self._function(int(octets[-1]), int(octets[-2])))
+
+    def ports_for_ips(self, fixed_ips):
+        """
+        Calculate the ports of many fixed ips.
+
+        :param fixed_ips: List of fixed ips
+        :return: List of ports, in the order of fixed_ips
+        """
+        function = self._function
+        ports = []
+        for fixed_ip in fixed_ips:
+            octets = fixed_ip.split(".")
+            ports.append(int(function(int(octets[-1]), int(octets[-2]))))
+        return ports
+
+    def __str__(self):
+        return self.expression
@@ -0,0 +1,34 @@
+"""
+This Module implements a rate limiter for calls to OpenStack.
+
+Threads take a slot before each call. The slots are spaced evenly, so bursts
+of calls, e.g. from a batch launch, are spread over time.
+"""
+
+import threading
+import time
+
+DEFAULT_BATCH_LAUNCH_RATE = 5
+
+
+class RateLimiter(object):
+    """Allows at most ``rate`` calls per second, shared by all threads."""
+
+    def __init__(self, rate=DEFAULT_BATCH_LAUNCH_RATE):
+        """
+        :param rate: Calls per second, no limit if 0 or less
+        """
+        self.interval = 1.0 / rate if rate > 0 else 0
+        self._next_slot = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until the calling thread may make its call."""
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
@@ -0,0 +1,138 @@
+"""
+This Module implements a background prober for TCP ports.
+
+The probes run concurrently on an asyncio event loop in a background thread
+and their results are cached per (host, port), so the server threads never
+block on a connect.
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+import time
+
+DEFAULT_REACHABILITY_TTL = 10
+DEFAULT_REACHABILITY_TIMEOUT = 5
+DEFAULT_MAX_CONCURRENT_PROBES = 100
+
+
+class ReachabilityProber(object):
+    """
+    Checks if TCP ports are open and caches the results.
+
+    A lookup always answers from the cache. If the cached result is missing or
+    older than ``ttl`` seconds, a new probe is scheduled in the background.
+    """
+
+    def __init__(
+        self,
+        logger,
+        ttl=DEFAULT_REACHABILITY_TTL,
+        timeout=DEFAULT_REACHABILITY_TIMEOUT,
+        max_concurrent_probes=DEFAULT_MAX_CONCURRENT_PROBES,
+    ):
+        """
+        :param logger: Logger to use
+        :param ttl: Seconds a probe result is considered fresh
+        :param timeout: Connect timeout of a probe in seconds
+        :param max_concurrent_probes: Maximum number of simultaneous connects
+        """
+        self.logger = logger
+        self.ttl = ttl
+        self.timeout = timeout
+        self.max_concurrent_probes = max_concurrent_probes
+        self._results = {}
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._loop = asyncio.new_event_loop()
+        self._semaphore = None
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=self._run_loop, name="reachability-prober", daemon=True
+        )
+        self._thread.start()
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self._loop)
+        self._semaphore = asyncio.Semaphore(self.max_concurrent_probes)
+        self._loop.run_forever()
+
+    def stop(self):
+        self._loop.call_soon_threadsafe(self._loop.stop)
+
+    async def _probe(self, host, port):
+        try:
+            async with self._semaphore:
+                try:
+                    _, writer = await asyncio.wait_for(
+                        asyncio.open_connection(host, port), timeout=self.timeout
+                    )
+                    writer.close()
+                    reachable = True
+                except (OSError, asyncio.TimeoutError):
+                    reachable = False
+                except Exception as e:
+                    self.logger.exception(f"Probe of {host}:{port} failed: {e}")
+                    reachable = False
+            self.logger.info(
+                f"Checked SSH Connection {host}:{port} Result = {reachable}"
+            )
+            with self._lock:
+                self._results[(host, port)] = (reachable, time.monotonic())
+            return reachable
+        finally:
+            # a probe which did not finish must not block the next ones
+            with self._lock:
+                self._pending.pop((host, port), None)
+
+    def _schedule(self, host, port):
+        """Schedule a probe unless one is already running. Needs self._lock."""
+        future = self._pending.get((host, port), None)
+        if future is None:
+            future = asyncio.run_coroutine_threadsafe(
+                self._probe(host, port), self._loop
+            )
+            self._pending[(host, port)] = future
+        return future
+
+    def is_reachable(self, host, port):
+        """
+        Get the last known reachability of host:port without blocking.
+
+        :param host: Host to connect
+        :param port: Port to connect
+        :return: True or False, None if host:port was never probed
+        """
+        with self._lock:
+            result = self._results.get((host, port), None)
+            if result is None or time.monotonic() - result[1] > self.ttl:
+                self._schedule(host, port)
+        return result[0] if result else None
+
+    def probe_many(self, targets):
+        """
+        Get the reachability of many host:port pairs.
+
+        Fresh results are taken from the cache, all others are probed
+        concurrently. Waits at most for the connect timeout.
+
+        :param targets: Iterable of (host, port)
+        :return: {(host, port): True or False}, None if a probe did not
+                finish in time
+        """
+        targets = set(targets)
+        futures = []
+        with self._lock:
+            now = time.monotonic()
+            for target in targets:
+                result = self._results.get(target, None)
+                if result is None or now - result[1] > self.ttl:
+                    futures.append(self._schedule(*target))
+        if futures:
+            concurrent.futures.wait(futures, timeout=self.timeout + 1)
+        with self._lock:
+            return {
+                target: self._results.get(target, (None, None))[0] for target in targets
+            }
@@ -0,0 +1,100 @@
+"""
+This Module implements a cache for resolving OpenStack resources by name or id.
+
+Flavors and networks rarely change, but every launch resolved them
+with one or more API calls. The resolver keeps the resolved objects for a
+while and also remembers names which could not be resolved.
+"""
+
+import threading
+import time
+
+DEFAULT_RESOLVER_TTL = 300
+DEFAULT_RESOLVER_NEGATIVE_TTL = 30
+
+
+class ResourceResolver(object):
+    """
+    Caches the results of a lookup function per name or id.
+
+    A resolved object is cached under the requested key and under its own
+    id and name for ``ttl`` seconds. Keys which could not be resolved are
+    cached for ``negative_ttl`` seconds. If a key which was missing is found
+    later, the resources changed and the whole cache is dropped.
+    """
+
+    def __init__(
+        self,
+        resolve,
+        logger,
+        kind,
+        ttl=DEFAULT_RESOLVER_TTL,
+        negative_ttl=DEFAULT_RESOLVER_NEGATIVE_TTL,
+    ):
+        """
+        :param resolve: Callable taking a name or id, returning the object or None
+        :param logger: Logger to use
+        :param kind: Kind of the resources, used in log messages
+        :param ttl: Seconds a resolved object is cached
+        :param negative_ttl: Seconds a key which could not be resolved is cached
+        """
+        self._resolve = resolve
+        self.logger = logger
+        self.kind = kind
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._entries = {}  # key -> (resource or None, expires_at)
+        self._missed = set()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """
+        Resolve a name or id.
+
+        :param key: Name or id of the resource
+        :return: The resource, None if it does not exist
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key, None)
+        if entry is not None and entry[1] > now:
+            return entry[0]
+
+        resource = self._resolve(key)
+        with self._lock:
+            if resource is None:
+                self._missed.add(key)
+                self._entries[key] = (None, now + self.negative_ttl)
+                return None
+            if key in self._missed:
+                self.logger.info(
+                    f"{self.kind} {key} was missing and is found now, "
+                    f"invalidate {self.kind} cache"
+                )
+                self._entries.clear()
+                self._missed.clear()
+            expires_at = now + self.ttl
+            for alias in (key, resource.get("id"), resource.get("name")):
+                if alias:
+                    self._entries[alias] = (resource, expires_at)
+        return resource
+
+    def invalidate(self, key=None):
+        """
+        Drop cached entries, so the next lookups resolve again.
+
+        :param key: Name or id to drop, all entries if None
+        """
+        with self._lock:
+            if key is None:
+                self.logger.info(f"Invalidate {self.kind} cache")
+                self._entries.clear()
+                self._missed.clear()
+                return
+            entry = self._entries.pop(key, None)
+            self._missed.discard(key)
+            if entry is not None and entry[0] is not None:
+                # drop the other aliases of the resource as well
+                for alias, cached in list(self._entries.items()):
+                    if cached[0] is entry[0]:
+                        del self._entries[alias]
@@ -0,0 +1,116 @@
+"""
+This Module implements a cache for the bash scripts passed as user data.
+
+The scripts are templates with placeholders like KEYS_TO_ADD. They are read
+once, reloaded when the file changes and rendered scripts are memoized, so
+launches with the same volumes or keys reuse the encoded user data.
+"""
+
+import os
+import re
+import threading
+from collections import OrderedDict
+
+from oslo_utils import encodeutils
+
+DEFAULT_RENDER_CACHE_SIZE = 256
+
+
+class _CompiledTemplate(object):
+    """Text of a template split at its placeholders."""
+
+    def __init__(self, text, placeholders):
+        if placeholders:
+            pattern = re.compile(
+                "|".join(
+                    re.escape(placeholder)
+                    for placeholder in sorted(placeholders, key=len, reverse=True)
+                )
+            )
+            self.parts = pattern.split(text)
+            self.placeholders = pattern.findall(text)
+        else:
+            self.parts = [text]
+            self.placeholders = []
+
+    def render(self, values):
+        rendered = [self.parts[0]]
+        for placeholder, part in zip(self.placeholders, self.parts[1:]):
+            rendered.append(values[placeholder])
+            rendered.append(part)
+        return "".join(rendered)
+
+
+class ScriptTemplates(object):
+    """
+    Renders the script templates of a directory.
+
+    A template file is read again if its modification time changed. Rendered
+    scripts are kept for the last ``cache_size`` distinct inputs.
+    """
+
+    def __init__(self, directory, cache_size=DEFAULT_RENDER_CACHE_SIZE):
+        """
+        :param directory: Directory with the templates
+        :param cache_size: Number of rendered scripts to keep
+        """
+        self.directory = directory
+        self.cache_size = cache_size
+        self._texts = {}  # name -> (mtime, text)
+        self._compiled = {}  # (name, mtime, placeholders) -> _CompiledTemplate
+        self._rendered = OrderedDict()  # (name, mtime, values) -> bytes
+        self._lock = threading.Lock()
+
+    def _load(self, name):
+        """Get (mtime, text) of a template, reading it if it changed."""
+        path = os.path.join(self.directory, name)
+        mtime = os.stat(path).st_mtime_ns
+        with self._lock:
+            cached = self._texts.get(name, None)
+        if cached is not None and cached[0] == mtime:
+            return cached
+        with open(path, "r") as file:
+            loaded = (mtime, file.read())
+        with self._lock:
+            self._texts[name] = loaded
+            # drop what was compiled and rendered from the old text
+            for key in [key for key in self._compiled if key[0] == name]:
+                del self._compiled[key]
+            for key in [key for key in self._rendered if key[0] == name]:
+                del self._rendered[key]
+        return loaded
+
+    def render(self, name, **values):
+        """
+        Render a template.
+
+        :param name: File name of the template, e.g. mount.sh
+        :param values: Text for each placeholder, e.g. KEYS_TO_ADD="(...)"
+        :return: Rendered script, encoded as user data
+        """
+        mtime, text = self._load(name)
+        key = (name, mtime, tuple(sorted(values.items())))
+        with self._lock:
+            rendered = self._rendered.get(key, None)
+            if rendered is not None:
+                self._rendered.move_to_end(key)
+                return rendered
+            compiled_key = (name, mtime, frozenset(values))
+            compiled = self._compiled.get(compiled_key, None)
+        if compiled is None:
+            compiled = _CompiledTemplate(text, values.keys())
+        rendered = encodeutils.safe_encode(compiled.render(values).encode("utf-8"))
+        with self._lock:
+            self._compiled[compiled_key] = compiled
+            self._rendered[key] = rendered
+            while len(self._rendered) > self.cache_size:
+                self._rendered.popitem(last=False)
+        return rendered
+
+    @staticmethod
+    def bash_array(items):
+        """
+        :param items: Strings, which must not need quoting
+        :return: Bash array literal like (a b )
+        """
+        return "(" + "".join(f"{item} " for item in items) + ")"
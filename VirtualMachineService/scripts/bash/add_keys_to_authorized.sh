@@ -1,8 +1,13 @@
 #!/bin/bash
 declare -a keys_to_add=KEYS_TO_ADD
 echo "Found keys: ${#keys_to_add[*]}"
+mkdir -p /home/ubuntu/.ssh
+touch /home/ubuntu/.ssh/authorized_keys
 for ix in ${!keys_to_add[*]}
 do
     printf "\n%s" "${keys_to_add[$ix]}" >> /home/ubuntu/.ssh/authorized_keys
 
 done
+chown -R ubuntu:ubuntu /home/ubuntu/.ssh
+chmod 700 /home/ubuntu/.ssh
+chmod 600 /home/ubuntu/.ssh/authorized_keys
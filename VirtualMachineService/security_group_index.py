@@ -0,0 +1,116 @@
+"""
+This Module implements an in-memory index of the security groups of the project.
+
+Looking up a security group by name lists the security groups on the
+server side. The index loads them once, is kept current when the
+VirtualMachineHandler creates or deletes groups and is reloaded every
+``ttl`` seconds to see changes made elsewhere.
+"""
+
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+
+DEFAULT_SECURITY_GROUP_INDEX_TTL = 60
+NAME_LOCKS = 64
+
+
+class SecurityGroupIndex(object):
+    """
+    Maps names and ids of security groups to the groups.
+
+    Creating a group is done while holding the lock of its name, so
+    concurrent launches do not create the same group twice. Names share a
+    fixed number of locks.
+    """
+
+    def __init__(
+        self, list_security_groups, logger, ttl=DEFAULT_SECURITY_GROUP_INDEX_TTL
+    ):
+        """
+        :param list_security_groups: Callable returning all security groups,
+                e.g. conn.list_security_groups
+        :param logger: Logger to use
+        :param ttl: Seconds after which the groups are loaded again
+        """
+        self._list_security_groups = list_security_groups
+        self.logger = logger
+        self.ttl = ttl
+        self._by_name = None
+        self._by_id = None
+        self._loaded_at = None
+        self._lock = threading.Lock()
+        self._name_locks = [threading.RLock() for _ in range(NAME_LOCKS)]
+
+    def _load(self):
+        """Load the security groups. Needs self._lock."""
+        by_name = {}
+        by_id = {}
+        for security_group in self._list_security_groups():
+            by_id[security_group["id"]] = security_group
+            # keep the first group if a name is used twice
+            by_name.setdefault(security_group["name"], security_group)
+        self._by_name = by_name
+        self._by_id = by_id
+        self._loaded_at = time.monotonic()
+        self.logger.info(f"Security group index loaded {len(by_id)} groups")
+
+    def _ensure_loaded(self):
+        """Needs self._lock."""
+        if self._by_id is None or time.monotonic() - self._loaded_at > self.ttl:
+            self._load()
+
+    def get(self, name_or_id):
+        """
+        :param name_or_id: Name or id of the security group
+        :return: The security group, None if there is none
+        """
+        with self._lock:
+            self._ensure_loaded()
+            return self._by_id.get(name_or_id, None) or self._by_name.get(
+                name_or_id, None
+            )
+
+    def add(self, security_group):
+        with self._lock:
+            self._ensure_loaded()
+            self._by_id[security_group["id"]] = security_group
+            self._by_name.setdefault(security_group["name"], security_group)
+
+    def remove(self, security_group):
+        with self._lock:
+            if self._by_id is None:
+                return
+            self._by_id.pop(security_group["id"], None)
+            indexed = self._by_name.get(security_group["name"], None)
+            if indexed is not None and indexed["id"] == security_group["id"]:
+                del self._by_name[security_group["name"]]
+                # another group with the same name may exist
+                for other in self._by_id.values():
+                    if other["name"] == security_group["name"]:
+                        self._by_name[other["name"]] = other
+                        break
+
+    def invalidate(self):
+        """Drop the index, so the next lookup loads the groups again."""
+        self.logger.info("Invalidate security group index")
+        with self._lock:
+            self._by_name = None
+            self._by_id = None
+
+    @contextmanager
+    def lock(self, name):
+        """
+        Hold the lock of a security group name.
+
+        The lock is reentrant, so a thread holding it may call functions
+        which take it again.
+
+        :param name: Name of the security group
+        """
+        name_lock = self._name_locks[
+            zlib.crc32(name.encode("utf-8")) % len(self._name_locks)
+        ]
+        with name_lock:
+            yield
@@ -0,0 +1,128 @@
+"""
+This Module implements fake FORC and BiBiGrid HTTP endpoints for the benchmark.
+
+The servers answer the requests the VirtualMachineHandler sends on startup
+and for the benchmarked methods. Every response is delayed by the
+configured latency.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DEFAULT_LATENCY = 0.05
+DEFAULT_FORC_VERSIONS = ("1.0.0",)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    # keep-alive, like the sessions of the HttpSessionPool
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _respond(self, method):
+        length = int(self.headers.get("Content-Length", 0) or 0)
+        if length:
+            self.rfile.read(length)
+        if self.server.latency > 0:
+            time.sleep(self.server.latency)
+        status, body = self.server.route(method, self.path.split("?", 1)[0])
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        self._respond("GET")
+
+    def do_POST(self):
+        self._respond("POST")
+
+    def do_DELETE(self):
+        self._respond("DELETE")
+
+
+class FakeHttpServer(ThreadingHTTPServer):
+    """HTTP server on a free local port, serving in a daemon thread."""
+
+    daemon_threads = True
+
+    def __init__(self, latency=DEFAULT_LATENCY):
+        """
+        :param latency: Seconds every response is delayed
+        """
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.latency = latency
+        self._thread = None
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_port}/"
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=self.serve_forever, name=type(self).__name__, daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def route(self, method, path):
+        """
+        :param method: HTTP method of the request
+        :param path: Path of the request, without query
+        :return: (status code, json body)
+        """
+        return 404, {"error": f"No fake for {method} {path}"}
+
+
+class FakeForc(FakeHttpServer):
+    """FORC backend offering the given templates."""
+
+    def __init__(
+        self, templates, versions=DEFAULT_FORC_VERSIONS, latency=DEFAULT_LATENCY
+    ):
+        """
+        :param templates: Names of the templates FORC offers
+        :param versions: Versions offered of every template
+        :param latency: Seconds every response is delayed
+        """
+        super().__init__(latency=latency)
+        self.templates = list(templates)
+        self.versions = list(versions)
+
+    def route(self, method, path):
+        parts = [part for part in path.split("/") if part]
+        if method == "GET" and parts == ["templates"]:
+            return 200, [
+                {"name": name, "version": version}
+                for name in self.templates
+                for version in self.versions
+            ]
+        if method == "GET" and len(parts) == 3 and parts[0] == "templates":
+            if parts[1] in self.templates and parts[2] in self.versions:
+                return 200, {"name": parts[1], "version": parts[2]}
+        if method == "GET" and parts and parts[0] == "backends":
+            return 200, []
+        return super().route(method, path)
+
+
+class FakeBibigrid(FakeHttpServer):
+    """BiBiGrid server knowing one running cluster per requested id."""
+
+    def route(self, method, path):
+        parts = [part for part in path.split("/") if part]
+        if method == "GET" and parts == ["server", "health"]:
+            return 200, {"status": "ok"}
+        if method == "GET" and parts[:2] == ["bibigrid", "info"] and len(parts) == 3:
+            return 200, {"info": "RUNNING", "msg": "", "log": ""}
+        if method == "GET" and parts[:2] == ["bibigrid", "log"] and len(parts) == 3:
+            return 200, {"log": "", "msg": ""}
+        return super().route(method, path)
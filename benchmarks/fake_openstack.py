@@ -0,0 +1,300 @@
+"""
+This Module implements an in-memory stand-in for the OpenStack connection.
+
+It answers the calls the VirtualMachineHandler makes on
+openstack.connection.Connection with SDK resource objects. Every call waits
+for the configured latency first, like a request to the OpenStack APIs.
+"""
+
+import threading
+import time
+from uuid import uuid4
+
+from openstack.block_storage.v3.volume import Volume
+from openstack.compute.v2.flavor import Flavor
+from openstack.compute.v2.keypair import Keypair
+from openstack.compute.v2.server import Server
+from openstack.exceptions import ConflictException
+from openstack.image.v2.image import Image
+from openstack.network.v2.network import Network
+from openstack.network.v2.security_group import SecurityGroup
+
+DEFAULT_LATENCY = 0.05
+DEFAULT_SERVERS = 200
+DEFAULT_IMAGES = 50
+DEFAULT_VOLUMES = 100
+
+NETWORK_NAME = "portalexternalnetwork"
+FLAVOR_NAME = "de.NBI default"
+IMAGE_NAME = "Ubuntu-22.04-0"
+
+
+class FakeOpenStack(object):
+    """Resources of the fake project, shared by all proxies."""
+
+    def __init__(
+        self,
+        latency=DEFAULT_LATENCY,
+        servers=DEFAULT_SERVERS,
+        images=DEFAULT_IMAGES,
+        volumes=DEFAULT_VOLUMES,
+        templates=(),
+    ):
+        """
+        :param latency: Seconds every call waits
+        :param servers: Number of servers of the project
+        :param images: Number of images, each tenth is tagged with a template
+        :param volumes: Number of volumes, attached to the first servers
+        :param templates: Names of research environment templates
+        """
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.calls = {}
+        self.flavors = {}
+        self.networks = {}
+        self.images = {}
+        self.volumes = {}
+        self.servers = {}
+        self.security_groups = {}
+        self.keypairs = {}
+
+        flavor = Flavor(
+            id=str(uuid4()),
+            name=FLAVOR_NAME,
+            vcpus=4,
+            ram=8192,
+            disk=50,
+            ephemeral=0,
+            extra_specs={},
+        )
+        self.flavors[flavor.id] = flavor
+        network = Network(id=str(uuid4()), name=NETWORK_NAME)
+        self.networks[network.id] = network
+
+        templates = list(templates)
+        for i in range(images):
+            tags = ["portalclient"]
+            if templates and i % 10 == 0:
+                tags.append(templates[i // 10 % len(templates)])
+            image = Image(
+                id=str(uuid4()),
+                name=IMAGE_NAME if i == 0 else f"Image-{i}",
+                status="active",
+                visibility="public",
+                min_disk=20,
+                min_ram=1024,
+                os_version="22.04",
+                os_distro="ubuntu",
+                created_at="2024-01-01T00:00:00Z",
+                updated_at="2024-01-01T00:00:00Z",
+                tags=tags,
+                properties={"description": f"Image {i}", "image_type": "image"},
+            )
+            self.images[image.id] = image
+
+        image_ids = list(self.images)
+        for i in range(servers):
+            server = self.new_server(
+                name=f"server-{i}",
+                image_id=image_ids[i % len(image_ids)],
+                flavor=flavor,
+                index=i,
+            )
+            if i < volumes:
+                volume = Volume(
+                    id=str(uuid4()),
+                    name=f"volume-{i}",
+                    size=10 + i % 90,
+                    status="in-use",
+                    attachments=[{"device": "/dev/vdb", "server_id": server.id}],
+                )
+                self.volumes[volume.id] = volume
+                server.attached_volumes = [{"id": volume.id}]
+            self.servers[server.id] = server
+
+    def new_server(self, name, image_id, flavor, index, metadata=None, key_name=None):
+        fixed_ip = f"192.168.{index // 254 % 254}.{index % 254 + 1}"
+        return Server(
+            id=str(uuid4()),
+            name=name,
+            status="ACTIVE",
+            task_state=None,
+            flavor={
+                "original_name": flavor.name,
+                "vcpus": flavor.vcpus,
+                "ram": flavor.ram,
+                "disk": flavor.disk,
+            },
+            image={"id": image_id},
+            attached_volumes=[],
+            addresses={NETWORK_NAME: [{"OS-EXT-IPS:type": "fixed", "addr": fixed_ip}]},
+            metadata=metadata or {},
+            project_id="benchmark",
+            key_name=key_name,
+            created_at="2024-01-01T00:00:00Z",
+        )
+
+    def add_security_group(self, name, description=None):
+        security_group = SecurityGroup(
+            id=str(uuid4()), name=name, description=description
+        )
+        with self.lock:
+            self.security_groups[security_group.id] = security_group
+        return security_group
+
+    def call(self, name):
+        """Count a call and wait for the latency of a request."""
+        with self.lock:
+            self.calls[name] = self.calls.get(name, 0) + 1
+        if self.latency > 0:
+            time.sleep(self.latency)
+
+    @staticmethod
+    def find(resources, name_or_id):
+        resource = resources.get(name_or_id, None)
+        if resource is not None:
+            return resource
+        for resource in list(resources.values()):
+            if resource.name == name_or_id:
+                return resource
+        return None
+
+
+class _Compute(object):
+    def __init__(self, cloud):
+        self.cloud = cloud
+
+    def find_flavor(self, name_or_id, ignore_missing=True):
+        self.cloud.call("compute.find_flavor")
+        return self.cloud.find(self.cloud.flavors, name_or_id)
+
+    def create_keypair(self, name, public_key):
+        self.cloud.call("compute.create_keypair")
+        with self.cloud.lock:
+            if name in self.cloud.keypairs:
+                raise ConflictException(f"Key pair {name} already exists")
+            keypair = Keypair(id=name, name=name, public_key=public_key)
+            self.cloud.keypairs[name] = keypair
+        return keypair
+
+    def find_keypair(self, name_or_id, ignore_missing=True):
+        self.cloud.call("compute.find_keypair")
+        return self.cloud.keypairs.get(name_or_id, None)
+
+    def delete_keypair(self, keypair, ignore_missing=True):
+        self.cloud.call("compute.delete_keypair")
+        with self.cloud.lock:
+            self.cloud.keypairs.pop(keypair, None)
+
+
+class _Network(object):
+    def __init__(self, cloud):
+        self.cloud = cloud
+
+    def find_network(self, name_or_id, ignore_missing=True):
+        self.cloud.call("network.find_network")
+        return self.cloud.find(self.cloud.networks, name_or_id)
+
+    def create_security_group_rules(self, data):
+        self.cloud.call("network.create_security_group_rules")
+        return [dict(rule, id=str(uuid4())) for rule in data]
+
+    def ports(self, security_group_ids=None, **query):
+        self.cloud.call("network.ports")
+        return iter([])
+
+
+class _BlockStorage(object):
+    def __init__(self, cloud):
+        self.cloud = cloud
+
+    def volumes(self, details=True, **query):
+        self.cloud.call("block_storage.volumes")
+        return iter(list(self.cloud.volumes.values()))
+
+    def find_volume(self, name_or_id, ignore_missing=True):
+        self.cloud.call("block_storage.find_volume")
+        return self.cloud.find(self.cloud.volumes, name_or_id)
+
+
+class FakeConnection(object):
+    """
+    Stand-in for openstack.connection.Connection.
+
+    Only the calls the benchmarked handler methods need are implemented.
+    """
+
+    def __init__(self, cloud):
+        """
+        :param cloud: FakeOpenStack with the resources
+        """
+        self.cloud = cloud
+        self.compute = _Compute(cloud)
+        self.network = _Network(cloud)
+        self.block_storage = _BlockStorage(cloud)
+
+    def authorize(self):
+        self.cloud.call("authorize")
+
+    def list_images(self):
+        self.cloud.call("list_images")
+        return list(self.cloud.images.values())
+
+    def get_image(self, name_or_id):
+        self.cloud.call("get_image")
+        return self.cloud.find(self.cloud.images, name_or_id)
+
+    def list_flavors(self, get_extra=False):
+        self.cloud.call("list_flavors")
+        return list(self.cloud.flavors.values())
+
+    def list_servers(self, filters=None):
+        self.cloud.call("list_servers")
+        return list(self.cloud.servers.values())
+
+    def get_server_by_id(self, id):
+        self.cloud.call("get_server_by_id")
+        return self.cloud.servers.get(id, None)
+
+    def create_server(
+        self,
+        name,
+        image,
+        flavor,
+        network=None,
+        key_name=None,
+        meta=None,
+        userdata=None,
+        security_groups=None,
+        **kwargs,
+    ):
+        self.cloud.call("create_server")
+        with self.cloud.lock:
+            server = self.cloud.new_server(
+                name=name,
+                image_id=image,
+                flavor=self.cloud.flavors[flavor],
+                index=len(self.cloud.servers),
+                metadata=meta,
+                key_name=key_name,
+            )
+            server.status = "BUILD"
+            self.cloud.servers[server.id] = server
+        return server
+
+    def list_security_groups(self, filters=None):
+        self.cloud.call("list_security_groups")
+        return list(self.cloud.security_groups.values())
+
+    def get_security_group(self, name_or_id, filters=None):
+        self.cloud.call("get_security_group")
+        return self.cloud.find(self.cloud.security_groups, name_or_id)
+
+    def create_security_group(self, name, description, project_id=None):
+        self.cloud.call("create_security_group")
+        return self.cloud.add_security_group(name, description)
+
+    def delete_security_group(self, name_or_id):
+        self.cloud.call("delete_security_group")
+        with self.cloud.lock:
+            return self.cloud.security_groups.pop(name_or_id, None) is not None
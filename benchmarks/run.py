@@ -0,0 +1,433 @@
+"""
+Load benchmark of the Thrift server.
+
+Starts the real Thrift server of VirtualMachineServer with a
+VirtualMachineHandler talking to in-process fakes of OpenStack, FORC,
+BiBiGrid and Redis. Portal clients replay a weighted mix of calls for a
+fixed time and the latency percentiles and throughput per method are
+reported.
+
+Usage (needs fakeredis, see benchmarks/requirements.txt):
+
+    python3 benchmarks/run.py --duration 30 --concurrency 10
+"""
+
+import logging
+import math
+import os
+import random
+import socket
+import sys
+import tempfile
+import threading
+import time
+from uuid import uuid4
+
+import click
+import yaml
+from fakeredis import TcpFakeServer
+from thrift.protocol import TBinaryProtocol
+from thrift.transport import TSocket, TTransport
+
+sys.path.insert(
+    1,
+    os.path.join(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        "VirtualMachineService",
+    ),
+)
+
+from ancon.ResearchEnvironmentMetadata import ResearchEnvironmentMetadata  # noqa: E402
+from fake_http import FakeBibigrid, FakeForc  # noqa: E402
+from fake_openstack import (  # noqa: E402
+    FLAVOR_NAME,
+    IMAGE_NAME,
+    NETWORK_NAME,
+    FakeConnection,
+    FakeOpenStack,
+)
+from VirtualMachineHandler import (  # noqa: E402
+    FORC_VERSIONS,
+    NEEDS_FORC_SUPPORT,
+    TEMPLATE_NAME,
+    VirtualMachineHandler,
+)
+from VirtualMachineServer import (  # noqa: E402
+    SERVER_MODE_NONBLOCKING,
+    SERVER_MODE_THREADPOOL,
+    create_server,
+)
+from VirtualMachineService import Client  # noqa: E402
+
+TEMPLATES = ["rstudio", "theiaide"]
+TEMPLATE_PORTS = {"rstudio": 8787, "theiaide": 8080}
+PUBLIC_KEY = "ssh-ed25519 AAAAC3NzaC1lZDI1NTE5AAAAIBenchmarkKeyBenchmarkKeyBenchmarkKey"
+ELIXIR_ID = "benchmark@elixir-europe.org"
+DEFAULT_MIX = "get_servers=20,check_server_status=50,get_Images=25,start_server=5"
+
+
+class BenchmarkHandler(VirtualMachineHandler):
+    """Handler using the fake OpenStack and fake FORC templates."""
+
+    cloud = None
+
+    def create_connection(self):
+        self.LOG.info("Using fake OpenStack connection")
+        return FakeConnection(self.cloud)
+
+    def update_playbooks(self):
+        # nothing is downloaded, the templates are offered by the fake FORC
+        self.ALL_TEMPLATES = list(TEMPLATES)
+        for name in TEMPLATES:
+            template_metadata = {
+                TEMPLATE_NAME: name,
+                NEEDS_FORC_SUPPORT: True,
+                FORC_VERSIONS: ["1.0.0"],
+            }
+            self.update_forc_allowed(template_metadata)
+            self.loaded_resenv_metadata[name] = ResearchEnvironmentMetadata(
+                name=name,
+                port=TEMPLATE_PORTS[name],
+                security_group_name=name,
+                security_group_description=name,
+                security_group_ssh=True,
+                direction="ingress",
+                protocol="tcp",
+                information_for_display=name,
+                needs_forc_support=True,
+                json_string="{}",
+            )
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_redis():
+    server = TcpFakeServer(("127.0.0.1", 0), server_type="redis")
+    server.daemon_threads = True
+    threading.Thread(
+        target=server.serve_forever, name="fake-redis", daemon=True
+    ).start()
+    return server.server_address[1]
+
+
+def write_config(directory, cloud, forc, bibigrid, redis_port, threads, server_mode):
+    forc_group = cloud.add_security_group("forc", "FORC remote group")
+    gateway_group = cloud.add_security_group("gateway", "Gateway group")
+    cfg = {
+        "logger": {"log_file": os.path.join(directory, "portal_client_debug.log")},
+        "redis": {"host": "127.0.0.1", "port": redis_port},
+        "openstack_connection": {
+            "gateway_security_group_id": gateway_group.id,
+            "threads": threads,
+            "server_mode": server_mode,
+            "host": "127.0.0.1",
+            "port": free_port(),
+            # probes of the ssh ports are refused right away
+            "gateway_ip": "127.0.0.1",
+            "use_gateway": True,
+            "network": NETWORK_NAME,
+            "production": False,
+            "floating_ip_network": "external",
+            "use_ssl": False,
+            "ssh_port_calc_formular": "30000 + x + y * 256",
+            "udp_port_calc_formular": "30000 + x + y * 256",
+        },
+        "bibigrid": {
+            "host": "127.0.0.1",
+            "port": bibigrid.server_port,
+            "https": False,
+            "sub_network": "portalexternalsubnetwork",
+            "bibigrid_modes": ["slurm"],
+        },
+        "forc": {
+            "forc_url": forc.url,
+            "forc_https": False,
+            "github_playbooks_repo": "https://example.org/resenvs.zip",
+            "forc_remote_id": forc_group.id,
+        },
+        "cloud_site": "benchmark",
+    }
+    path = os.path.join(directory, "config.yml")
+    with open(path, "w") as ymlfile:
+        yaml.safe_dump(cfg, ymlfile)
+    return path, cfg
+
+
+def wait_for_port(port, timeout=10):
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=1).close()
+            return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.05)
+
+
+def parse_mix(mix):
+    """
+    :param mix: Weights like get_servers=20,start_server=5
+    :return: {method: weight}
+    """
+    weights = {}
+    for entry in mix.split(","):
+        method, _, weight = entry.partition("=")
+        method = method.strip()
+        if method not in CALLS:
+            raise click.BadParameter(
+                f"Unknown method {method}, choose from {', '.join(CALLS)}",
+                param_hint="--mix",
+            )
+        weights[method] = float(weight or 1)
+    return weights
+
+
+def call_get_servers(client, rng, server_ids):
+    client.get_servers()
+
+
+def call_check_server_status(client, rng, server_ids):
+    client.check_server_status(rng.choice(server_ids))
+
+
+def call_get_images(client, rng, server_ids):
+    client.get_Images()
+
+
+def call_start_server(client, rng, server_ids):
+    result = client.start_server(
+        flavor=FLAVOR_NAME,
+        image=IMAGE_NAME,
+        public_key=PUBLIC_KEY,
+        servername=f"benchmark-{uuid4().hex[:8]}",
+        metadata={
+            "project_name": "benchmark",
+            "project_id": str(rng.randrange(10)),
+            "elixir_id": ELIXIR_ID,
+        },
+        diskspace="0",
+        volumename="",
+        https=False,
+        http=False,
+        resenv=[rng.choice(TEMPLATES)],
+    )
+    if not result:
+        raise RuntimeError("start_server returned no server")
+
+
+def call_get_cluster_status(client, rng, server_ids):
+    client.get_cluster_status(cluster_id=f"cluster{rng.randrange(10)}")
+
+
+CALLS = {
+    "get_servers": call_get_servers,
+    "check_server_status": call_check_server_status,
+    "get_Images": call_get_images,
+    "start_server": call_start_server,
+    "get_cluster_status": call_get_cluster_status,
+}
+
+
+class Worker(threading.Thread):
+    """Portal client calling the methods of the mix until the deadline."""
+
+    def __init__(self, index, port, framed, weights, server_ids, seed, stop):
+        super().__init__(name=f"client-{index}", daemon=True)
+        self.port = port
+        self.framed = framed
+        self.methods = list(weights)
+        self.weights = list(weights.values())
+        self.server_ids = server_ids
+        self.rng = random.Random(seed + index)
+        self.stop = stop
+        self.recording = False
+        self.latencies = {method: [] for method in self.methods}
+        self.errors = {method: 0 for method in self.methods}
+        self.transport = None
+        self.client = None
+
+    def connect(self):
+        if self.transport is not None:
+            self.transport.close()
+        sock = TSocket.TSocket("127.0.0.1", self.port)
+        if self.framed:
+            self.transport = TTransport.TFramedTransport(sock)
+        else:
+            self.transport = TTransport.TBufferedTransport(sock)
+        self.client = Client(TBinaryProtocol.TBinaryProtocol(self.transport))
+        self.transport.open()
+
+    def run(self):
+        self.connect()
+        while not self.stop.is_set():
+            method = self.rng.choices(self.methods, self.weights)[0]
+            started_at = time.perf_counter()
+            try:
+                CALLS[method](self.client, self.rng, self.server_ids)
+                failed = False
+            except TTransport.TTransportException:
+                failed = True
+                self.connect()
+            except Exception:
+                failed = True
+            elapsed = time.perf_counter() - started_at
+            if self.recording:
+                self.latencies[method].append(elapsed)
+                if failed:
+                    self.errors[method] += 1
+        self.transport.close()
+
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return float("nan")
+    rank = max(1, math.ceil(p / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def report(workers, weights, duration, cloud):
+    click.echo(
+        f"{'method':<22}{'calls':>8}{'errors':>8}{'p50 ms':>10}"
+        f"{'p99 ms':>10}{'max ms':>10}{'rps':>9}"
+    )
+    total = 0
+    for method in weights:
+        latencies = sorted(
+            latency for worker in workers for latency in worker.latencies[method]
+        )
+        errors = sum(worker.errors[method] for worker in workers)
+        total += len(latencies)
+        click.echo(
+            f"{method:<22}{len(latencies):>8}{errors:>8}"
+            f"{percentile(latencies, 50) * 1000:>10.1f}"
+            f"{percentile(latencies, 99) * 1000:>10.1f}"
+            f"{(latencies[-1] if latencies else float('nan')) * 1000:>10.1f}"
+            f"{len(latencies) / duration:>9.1f}"
+        )
+    click.echo(f"{'total':<22}{total:>8}{'':>48}{total / duration:>9.1f}")
+    click.echo("\nOpenStack calls during the run:")
+    for name, count in sorted(cloud.calls.items(), key=lambda item: -item[1]):
+        click.echo(f"  {name:<38}{count:>8}")
+
+
+@click.command()
+@click.option("--duration", default=30.0, help="Seconds the load is recorded.")
+@click.option("--warmup", default=3.0, help="Seconds of load before recording.")
+@click.option("--concurrency", default=10, help="Number of portal clients.")
+@click.option("--mix", default=DEFAULT_MIX, help="Weights of the called methods.")
+@click.option(
+    "--openstack-latency", default=50.0, help="Milliseconds per OpenStack call."
+)
+@click.option(
+    "--http-latency", default=50.0, help="Milliseconds per FORC/BiBiGrid request."
+)
+@click.option("--servers", default=200, help="Servers in the fake project.")
+@click.option("--images", default=50, help="Images in the fake project.")
+@click.option("--volumes", default=100, help="Volumes attached to the servers.")
+@click.option("--threads", default=30, help="Worker threads of the server.")
+@click.option(
+    "--server-mode",
+    type=click.Choice([SERVER_MODE_THREADPOOL, SERVER_MODE_NONBLOCKING]),
+    default=SERVER_MODE_THREADPOOL,
+)
+@click.option("--seed", default=0, help="Seed of the call sequence.")
+def benchmark(
+    duration,
+    warmup,
+    concurrency,
+    mix,
+    openstack_latency,
+    http_latency,
+    servers,
+    images,
+    volumes,
+    threads,
+    server_mode,
+    seed,
+):
+    weights = parse_mix(mix)
+    for var in [
+        "OS_USERNAME",
+        "OS_PASSWORD",
+        "OS_PROJECT_NAME",
+        "OS_PROJECT_ID",
+        "OS_USER_DOMAIN_NAME",
+        "OS_AUTH_URL",
+        "OS_PROJECT_DOMAIN_ID",
+        "FORC_API_KEY",
+    ]:
+        os.environ.setdefault(var, "benchmark")
+
+    cloud = FakeOpenStack(
+        latency=openstack_latency / 1000,
+        servers=servers,
+        images=images,
+        volumes=volumes,
+        templates=TEMPLATES,
+    )
+    forc = FakeForc(templates=TEMPLATES, latency=http_latency / 1000).start()
+    bibigrid = FakeBibigrid(latency=http_latency / 1000).start()
+    redis_port = start_redis()
+
+    directory = tempfile.mkdtemp(prefix="portal-client-benchmark-")
+    config, cfg = write_config(
+        directory, cloud, forc, bibigrid, redis_port, threads, server_mode
+    )
+    BenchmarkHandler.cloud = cloud
+    handler = BenchmarkHandler(config)
+    # the file log is kept, the console only shows problems
+    for log_handler in handler.LOG.handlers:
+        if type(log_handler) is logging.StreamHandler:
+            log_handler.setLevel(logging.WARNING)
+
+    server = create_server(cfg, handler)
+    threading.Thread(target=server.serve, name="thrift-server", daemon=True).start()
+    port = cfg["openstack_connection"]["port"]
+    wait_for_port(port)
+    click.echo(
+        f"Benchmark {concurrency} clients for {duration}s, mix {mix}, "
+        f"OpenStack latency {openstack_latency}ms, HTTP latency {http_latency}ms, "
+        f"log in {directory}"
+    )
+
+    stop = threading.Event()
+    server_ids = list(cloud.servers)
+    workers = [
+        Worker(
+            index=i,
+            port=port,
+            framed=server_mode == SERVER_MODE_NONBLOCKING,
+            weights=weights,
+            server_ids=server_ids,
+            seed=seed,
+            stop=stop,
+        )
+        for i in range(concurrency)
+    ]
+    for worker in workers:
+        worker.start()
+    time.sleep(warmup)
+    with cloud.lock:
+        cloud.calls.clear()
+    for worker in workers:
+        worker.recording = True
+    started_at = time.monotonic()
+    time.sleep(duration)
+    for worker in workers:
+        worker.recording = False
+    elapsed = time.monotonic() - started_at
+    stop.set()
+    for worker in workers:
+        worker.join()
+    report(workers, weights, elapsed, cloud)
+    forc.stop()
+    bibigrid.stop()
+
+
+if __name__ == "__main__":
+    benchmark()
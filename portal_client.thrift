@@ -822,4 +822,286 @@ service VirtualMachineService {
 
     throws (1:serverNotFoundException e, 2: conflictException c)
 
+    /**
+     * Get Ip and Ports of many servers
+     * Returns:  {openstack_id: {'fixed_ip': ip, 'port': port, 'udp': udp}}
+     */
+    map<string,map<string,string>> get_vms_ports(
+
+    /** Ids of the servers, all servers of the project if empty */
+    1:list<string> openstack_ids)
+
+    /**
+     * Get a chunk of the log of a playbook run, starting at a byte offset.
+     * Returns: {'data': chunk, 'next_offset': offset to continue with,
+     *           'eof': 'true' if the end of the log was reached,
+     *           'running': 'true' if the playbook is still running}
+     */
+    map<string,string> get_playbook_log_chunk(
+
+    /** Id of the server the playbook runs for */
+    1:string openstack_id,
+
+    /** stdout or stderr */
+    2:string stream,
+
+    /** Byte offset to start reading at */
+    3:i64 offset,
+
+    /** Maximum size of the chunk in bytes */
+    4:int max_bytes)
+
+    throws (1:otherException o)
+
+    /**
+     * Check status of many servers.
+     * Returns: List of server instances, in the order of openstack_ids
+     */
+    list<VM> check_servers_status(
+
+    /** Ids of the servers */
+    1:list<string> openstack_ids)
+
+    /**
+     * Delete a server in the background.
+     * Returns: Id of the delete job
+     */
+    string delete_server_async(
+
+    /** Id of the server */
+    1:string openstack_id)
+
+    /**
+     * Delete many servers in the background.
+     * Returns: {openstack_id: id of the delete job}
+     */
+    map<string,string> delete_servers_async(
+
+    /** Ids of the servers */
+    1:list<string> openstack_ids)
+
+    /**
+     * Get the state of a background job.
+     * Returns: {'job_id', 'type', 'target', 'status', 'result', 'error', 'created_at', 'updated_at'}
+     *          status is QUEUED, RUNNING, DONE, FAILED or NOT_FOUND
+     */
+    map<string,string> get_job_status(
+
+    /** Id of the job */
+    1:string job_id)
+
+    /**
+     * Get the state of many background jobs.
+     * Returns: {job_id: state of the job, see get_job_status}
+     */
+    map<string,map<string,string>> get_jobs_status(
+
+    /** Ids of the jobs */
+    1:list<string> job_ids)
+
+    /**
+     * Start a new server in the background.
+     * Returns: Id of the launch job, see get_job_status. Its result is the result of start_server
+     */
+    string start_server_async(
+
+    /** Name of the  Flavor to use. */
+    1:string flavor,
+
+    /** Name of the image to use. */
+    2:string image,
+
+    /** Public Key to use */
+    3:string public_key,
+
+    /** Name for the new server */
+    4:string servername,
+
+    /** Metadata for the new instance */
+    5:map<string,string> metadata,
+
+    /** Diskspace in GB for additional volume. */
+    6:string diskspace,
+
+    /** Name of additional Volume */
+    7:string volumename,
+
+    /** Boolean for https security rule */
+    8:bool https,
+
+    /** Boolean for http security rule */
+    9:bool http,
+
+    /** Names of the research environments */
+    10:list<string> resenv,
+
+    /** Key of the request, retries with the same key get the job of the first request */
+    11:string idempotency_key)
+
+    /**
+     * Start a new server with custom key for ansible in the background.
+     * Returns: Id of the launch job, see get_job_status. Its result is the result of start_server_with_custom_key. The private key is part of the result until the job is acknowledged with acknowledge_job
+     */
+    string start_server_with_custom_key_async(
+
+    /** Name of the  Flavor to use. */
+    1:string flavor,
+
+    /** Name of the image to use. */
+    2:string image,
+
+    /** Name for the new server */
+    3:string servername,
+
+    /** Metadata for the new instance */
+    4:map<string,string> metadata,
+
+    /** Boolean for http security rule */
+    5:bool http,
+
+    /** Boolean for https security rule */
+    6:bool https,
+
+    /** Names of the research environments */
+    7:list<string> resenv,
+
+    /** Volumes to format and mount */
+    8:list<map<string,string>> volume_ids_path_new,
+
+    /** Volumes to mount */
+    9:list<map<string,string>> volume_ids_path_attach,
+
+    /** Key of the request, retries with the same key get the job of the first request */
+    10:string idempotency_key)
+
+    /**
+     * Start a new server without playbook in the background.
+     * Returns: Id of the launch job, see get_job_status. Its result is the result of start_server_without_playbook
+     */
+    string start_server_without_playbook_async(
+
+    /** Name of the  Flavor to use. */
+    1:string flavor,
+
+    /** Name of the image to use. */
+    2:string image,
+
+    /** Public Key to use */
+    3:string public_key,
+
+    /** Name for the new server */
+    4:string servername,
+
+    /** Metadata for the new instance */
+    5:map<string,string> metadata,
+
+    /** Boolean for https security rule */
+    6:bool https,
+
+    /** Boolean for http security rule */
+    7:bool http,
+
+    /** Names of the research environments */
+    8:list<string> resenv,
+
+    /** Volumes to format and mount */
+    9:list<map<string,string>> volume_ids_path_new,
+
+    /** Volumes to mount */
+    10:list<map<string,string>> volume_ids_path_attach,
+
+    /** Additional public keys to add */
+    11:list<string> additional_keys,
+
+    /** Key of the request, retries with the same key get the job of the first request */
+    12:string idempotency_key)
+
+    /**
+     * Start a new server with volumes in the background.
+     * Returns: Id of the launch job, see get_job_status. Its result is the result of start_server_with_mounted_volume
+     */
+    string start_server_with_mounted_volume_async(
+
+    /** Name of the  Flavor to use. */
+    1:string flavor,
+
+    /** Name of the image to use. */
+    2:string image,
+
+    /** Public Key to use */
+    3:string public_key,
+
+    /** Name for the new server */
+    4:string servername,
+
+    /** Metadata for the new instance */
+    5:map<string,string> metadata,
+
+    /** Boolean for https security rule */
+    6:bool https,
+
+    /** Boolean for http security rule */
+    7:bool http,
+
+    /** Names of the research environments */
+    8:list<string> resenv,
+
+    /** Volumes to format and mount */
+    9:list<map<string,string>> volume_ids_path_new,
+
+    /** Volumes to mount */
+    10:list<map<string,string>> volume_ids_path_attach,
+
+    /** Key of the request, retries with the same key get the job of the first request */
+    11:string idempotency_key)
+
+    /**
+     * Start many servers with custom keys from one spec, e.g. for a course.
+     * The image, flavor, network and security groups are resolved once.
+     * Returns: List in the order of servernames, with
+     *          {'servername', 'openstackid', 'private_key'} for started servers
+     *          and {'servername', 'error'} for servers which failed to start
+     */
+    list<map<string,string>> start_servers_with_custom_key(
+
+    /** Name of the  Flavor to use. */
+    1:string flavor,
+
+    /** Name of the image to use. */
+    2:string image,
+
+    /** Names of the new servers */
+    3:list<string> servernames,
+
+    /** Metadata of the new servers, in the order of servernames */
+    4:list<map<string,string>> metadatas,
+
+    /** Boolean for http security rule */
+    5:bool http,
+
+    /** Boolean for https security rule */
+    6:bool https,
+
+    /** Names of the research environments */
+    7:list<string> resenv)
+
+    throws (1:imageNotFoundException i, 2:flavorNotFoundException f, 3:networkNotFoundException n, 4:otherException o)
+
+    /**
+     * Acknowledge the result of a background job.
+     * Secret parts of the result, like a private key, are deleted and not returned by get_job_status anymore.
+     * Returns: True if the job exists, False if it is unknown or expired
+     */
+    bool acknowledge_job(
+
+    /** Id of the job */
+    1:string job_id)
+
+    /**
+     * Get the statistics of the Thrift server, e.g. for monitoring.
+     * Returns: {'server_mode', 'queue_depth', 'max_queue_size', 'rejected'}
+     *          the queue statistics are only known in the nonblocking server mode
+     */
+    map<string,string> get_server_stats()
+
 }